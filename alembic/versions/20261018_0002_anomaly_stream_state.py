@@ -0,0 +1,45 @@
+"""
+Add anomaly_stream_state table
+
+Revision ID: 0002_anomaly_stream_state
+Revises: 0001_initial
+Create Date: 2026-10-18
+
+Sustainable Economic Development Analytics Hub
+
+Stores Welford running statistics per tenant/KPI/region so newly ingested
+quarters can be scored for anomalies without rescanning full history.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_anomaly_stream_state"
+down_revision: str | None = "0001_initial"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create anomaly_stream_state table."""
+    op.create_table(
+        "anomaly_stream_state",
+        sa.Column("tenant_id", sa.String(50), primary_key=True),
+        sa.Column("kpi_id", sa.String(100), primary_key=True),
+        sa.Column("region", sa.String(100), primary_key=True),
+        sa.Column("count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("mean", sa.Float, nullable=False, server_default="0"),
+        sa.Column("m2", sa.Float, nullable=False, server_default="0"),
+        sa.Column("last_year", sa.Integer),
+        sa.Column("last_quarter", sa.Integer),
+        sa.Column("updated_at", sa.DateTime),
+    )
+
+
+def downgrade() -> None:
+    """Drop anomaly_stream_state table."""
+    op.drop_table("anomaly_stream_state")
@@ -7,7 +7,11 @@ Provides REST API endpoints for the React frontend dashboard.
 These endpoints match the frontend's expected API contract.
 """
 
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from analytics_hub_platform.api.dependencies import (
     IndicatorRepository,
@@ -15,16 +19,20 @@ from analytics_hub_platform.api.dependencies import (
     get_indicator_repository,
 )
 from analytics_hub_platform.config.config import get_config
+from analytics_hub_platform.domain.llm_service import get_llm_service
 from analytics_hub_platform.domain.models import FilterParams
 from analytics_hub_platform.domain.services import (
+    get_analytics_insights,
     get_available_periods,
     get_available_regions,
     get_data_quality_metrics,
     get_executive_snapshot,
     get_kpi_timeseries,
+    get_multivariate_anomalies,
     get_regional_comparison,
     get_sustainability_summary,
 )
+from analytics_hub_platform.infrastructure.settings import get_settings
 from fastapi import Depends
 from pydantic import BaseModel
 
@@ -176,6 +184,7 @@ class InsightsResponse(BaseModel):
     """Insights response."""
     period: str
     insights: list[InsightSchema]
+    partial: bool = False  # True if analytics insights were cut short or are still warming up
 
 
 class TimeSeriesPointSchema(BaseModel):
@@ -192,6 +201,12 @@ class TimeSeriesResponse(BaseModel):
     data: list[TimeSeriesPointSchema]
 
 
+# Maximum number of insight-engine findings appended to /dashboard/insights
+ANALYTICS_INSIGHT_LIMIT = 5
+# Maximum number of cross-KPI (multivariate) anomalies appended to /dashboard/insights
+MULTIVARIATE_ANOMALY_LIMIT = 3
+
+
 # =============================================================================
 # REGION COORDINATES (for map visualization)
 # =============================================================================
@@ -593,9 +608,93 @@ def create_dashboard_router() -> APIRouter:
                     )
                 )
 
+        # Add pattern/anomaly insights from the insight engine, bounded by a deadline
+        settings = get_settings()
+        report = await run_in_threadpool(
+            get_analytics_insights,
+            df,
+            filters,
+            settings.insights_max_workers,
+            settings.insights_deadline_seconds,
+        )
+        for insight in report.insights[:ANALYTICS_INSIGHT_LIMIT]:
+            insights.append(
+                InsightSchema(
+                    id=insight.id,
+                    type=insight.type.value,
+                    title=insight.title,
+                    description=insight.description,
+                    kpi_id=insight.kpi_id,
+                    value=insight.metric_value,
+                )
+            )
+
+        # Regions whose overall KPI mix is unusual (shared per-tenant Isolation Forest).
+        # Only a cached model is scored here; a missing one is fitted in the background
+        # and the section is skipped until it is ready.
+        anomalies = await run_in_threadpool(
+            get_multivariate_anomalies, df, filters, fit_in_background=True
+        )
+        for anomaly in (anomalies or [])[:MULTIVARIATE_ANOMALY_LIMIT]:
+            kpi_name = anomaly.kpi_id.replace("_", " ")
+            insights.append(
+                InsightSchema(
+                    id=f"multivariate_{anomaly.region_id}_{anomaly.kpi_id}",
+                    type="anomaly",
+                    title=f"Unusual KPI pattern in {anomaly.region_id}",
+                    description=(
+                        f"The combination of indicators in {anomaly.region_id} is unusual for "
+                        f"this period, driven mostly by {kpi_name} "
+                        f"({anomaly.direction}, z={anomaly.z_score:.2f})."
+                    ),
+                    kpi_id=anomaly.kpi_id,
+                    value=anomaly.actual_value,
+                )
+            )
+
         return InsightsResponse(
             period=f"Q{quarter} {year}",
             insights=insights,
+            partial=report.partial or anomalies is None,
+        )
+
+    @router.get("/recommendations/stream", response_class=StreamingResponse)
+    async def stream_recommendations(
+        year: int | None = Query(default=None, description="Year"),
+        quarter: int | None = Query(default=None, ge=1, le=4, description="Quarter (1-4)"),
+        region: str | None = Query(default=None, description="Region filter"),
+        language: str = Query(default="en", description="Language code (en/ar)"),
+        tenant_id: str = Depends(get_current_tenant),
+        repo: IndicatorRepository = Depends(get_indicator_repository),
+    ) -> StreamingResponse:
+        """
+        Stream AI strategic recommendations as server-sent events.
+
+        Emits executive_summary, key_insight, recommendation and risk_alert
+        events as the model produces them, then a final done event with the
+        complete response.
+        """
+        df = repo.get_all_indicators(tenant_id)
+
+        if year is None or quarter is None:
+            year, quarter = _get_default_period(repo, tenant_id)
+
+        filters = FilterParams(tenant_id=tenant_id, year=year, quarter=quarter, region=region)
+        snapshot = await run_in_threadpool(get_executive_snapshot, df, filters, language)
+        kpi_data = {
+            "period": snapshot.get("period", f"Q{quarter} {year}"),
+            "metrics": snapshot.get("metrics", {}),
+        }
+        llm = get_llm_service()
+
+        async def events() -> AsyncIterator[str]:
+            async for event in llm.astream_recommendations(kpi_data, [], [], language):
+                yield event.to_sse()
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
     @router.get("/timeseries", response_model=TimeSeriesResponse)
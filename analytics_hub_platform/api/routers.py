@@ -7,33 +7,42 @@ FastAPI route definitions for REST API endpoints.
 """
 
 import logging
+import os
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel, ConfigDict, Field
+from starlette.concurrency import run_in_threadpool
 
 from analytics_hub_platform.api.dependencies import (
     FilterDependency,
     IndicatorRepository,
     PaginationParams,
     get_current_tenant,
+    get_current_user,
     get_filters,
     get_indicator_repository,
     get_pagination,
     require_analyst,
 )
 from analytics_hub_platform.config.config import REGIONS, get_config
-from analytics_hub_platform.domain.models import FilterParams
+from analytics_hub_platform.domain.models import FilterParams, User
 from analytics_hub_platform.domain.services import (
     get_data_quality_metrics,
     get_sustainability_summary,
 )
+from analytics_hub_platform.infrastructure.audit import log_audit_event
 from analytics_hub_platform.infrastructure.exceptions import (
     AnalyticsHubError,
     DataError,
     NotFoundError,
     ValidationError,
 )
+from analytics_hub_platform.infrastructure.observability import get_health_checker, get_metrics
+from analytics_hub_platform.infrastructure.profiler import ProfilerBusyError, SamplingProfiler
+from analytics_hub_platform.infrastructure.security import has_permission
+from analytics_hub_platform.infrastructure.settings import get_settings
 
 
 # Response Models
@@ -274,6 +283,105 @@ def create_api_router() -> APIRouter:
             version="1.0.0",
         )
 
+    # Liveness probe: the process is serving requests (no dependency checks)
+    @router.get(
+        "/health/live",
+        tags=["System"],
+        summary="Liveness probe",
+    )
+    async def liveness():
+        """Report that the API process is up; never touches dependencies."""
+        return {"status": "ok", "timestamp": datetime.now(timezone.utc).isoformat()}
+
+    # Readiness probe: dependencies reachable (checks cached for a short TTL)
+    @router.get(
+        "/health/ready",
+        tags=["System"],
+        summary="Readiness probe",
+        responses={503: {"description": "A readiness check failed"}},
+    )
+    async def readiness():
+        """Run the registered health checks and report whether traffic can be served."""
+        summary = await run_in_threadpool(get_health_checker().get_summary)
+        status_code = (
+            status.HTTP_200_OK
+            if summary["status"] == "healthy"
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        return JSONResponse(summary, status_code=status_code)
+
+    # Prometheus scrape endpoint (aggregates all workers in multi-process mode)
+    @router.get(
+        "/metrics",
+        response_class=PlainTextResponse,
+        tags=["System"],
+        summary="Prometheus metrics",
+    )
+    async def metrics():
+        """Export metrics in Prometheus text format."""
+        return PlainTextResponse(
+            get_metrics().export_prometheus() + "\n",
+            media_type="text/plain; version=0.0.4",
+        )
+
+    # Live sampling profiler (admin only)
+    @router.post(
+        "/admin/profile",
+        response_class=PlainTextResponse,
+        tags=["System"],
+        summary="Profile the live process",
+        responses={403: {"description": "Requires the run_profiler permission"}},
+    )
+    async def profile_process(
+        seconds: float = Query(default=10.0, gt=0, description="Sampling duration in seconds"),
+        interval_ms: float = Query(default=10.0, ge=1, le=1000, description="Sample interval"),
+        include_idle: bool = Query(default=False, description="Keep stacks of idle threads"),
+        user: User = Depends(get_current_user),
+    ):
+        """
+        Sample every thread's stack for a fixed time and return the profile.
+
+        The response is a collapsed-stack file ("frame;frame count" per line)
+        for flamegraph.pl, speedscope or inferno. Only this worker process is
+        profiled, and one profile runs at a time.
+        """
+        if not has_permission(user, "run_profiler"):
+            logger.warning(f"Profiler access denied for user {user.email}")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions for this resource",
+            )
+
+        max_seconds = get_settings().profiler_max_seconds
+        if seconds > max_seconds:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Profile duration is limited to {max_seconds:g} seconds",
+            )
+
+        log_audit_event(
+            "run_profiler",
+            tenant_id=user.tenant_id,
+            user_id=user.id,
+            resource_type="process",
+            resource_id=str(os.getpid()),
+            details={"seconds": seconds, "interval_ms": interval_ms},
+        )
+        profiler = SamplingProfiler(interval_ms=interval_ms, include_idle=include_idle)
+        try:
+            result = await run_in_threadpool(profiler.run, seconds)
+        except ProfilerBusyError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+
+        filename = f"profile-{result.started_at:%Y%m%dT%H%M%SZ}-{os.getpid()}.collapsed"
+        return PlainTextResponse(
+            result.to_collapsed(),
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "X-Profile-Samples": str(result.samples),
+            },
+        )
+
     # Indicators CRUD
     @router.get(
         "/indicators",
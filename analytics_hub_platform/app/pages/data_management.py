@@ -130,6 +130,18 @@ def render_upload_section() -> None:
                         st.metric("Skipped", result.rows_skipped)
 
                     st.caption(f"Batch ID: `{result.batch_id}`")
+
+                    if result.anomalies:
+                        st.warning(
+                            f"⚠️ {len(result.anomalies)} anomalies detected in the imported data"
+                        )
+                        with st.expander("Detected Anomalies"):
+                            for anomaly in result.anomalies:
+                                st.write(
+                                    f"  • **{anomaly['kpi_id']}** ({anomaly['region_id']}, "
+                                    f"{anomaly['year']} Q{anomaly['quarter']}): "
+                                    f"{anomaly['description']}"
+                                )
             else:
                 st.error(f"❌ {result.message}")
 
@@ -18,6 +18,8 @@ import numpy as np
 import pandas as pd
 from scipy import stats as scipy_stats
 
+from analytics_hub_platform.infrastructure.caching import get_cache, make_cache_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +54,14 @@ class ChangePointType(str, Enum):
     VARIANCE_CHANGE = "variance_change"
 
 
+class ChangePointMethod(str, Enum):
+    """Algorithm used for change point detection."""
+
+    WINDOW = "window"  # Adjacent-window z-test at every index
+    PELT = "pelt"  # Pruned Exact Linear Time segmentation
+    BINARY_SEGMENTATION = "binary_segmentation"
+
+
 @dataclass
 class TrendAnalysisResult:
     """Result of trend analysis."""
@@ -68,6 +78,55 @@ class TrendAnalysisResult:
     total_change_pct: float
 
 
+@dataclass
+class BatchTrendResult:
+    """
+    Columnar trend statistics for many series analyzed in one call.
+
+    Element ``i`` of every array describes ``series_ids[i]``. Series with
+    fewer than four observations get the insufficient-data defaults used by
+    ``TrendAnalyzer.analyze`` (zero slope, r² of 0, p-value of 1, STABLE).
+    """
+
+    series_ids: list[Any]
+    slope: np.ndarray
+    intercept: np.ndarray
+    r_squared: np.ndarray
+    p_value: np.ndarray
+    std_err: np.ndarray
+    n_obs: np.ndarray
+    direction: np.ndarray  # TrendDirection values
+
+    def __len__(self) -> int:
+        return len(self.series_ids)
+
+    @property
+    def annual_change_rate(self) -> np.ndarray:
+        """Slope per year (4 quarters per year)."""
+        return self.slope * 4
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the statistics as a DataFrame indexed by series id."""
+        index = (
+            pd.MultiIndex.from_tuples(self.series_ids)
+            if self.series_ids and isinstance(self.series_ids[0], tuple)
+            else pd.Index(self.series_ids)
+        )
+        return pd.DataFrame(
+            {
+                "slope": self.slope,
+                "intercept": self.intercept,
+                "r_squared": self.r_squared,
+                "p_value": self.p_value,
+                "std_err": self.std_err,
+                "n_obs": self.n_obs,
+                "direction": self.direction,
+                "annual_change_rate": self.annual_change_rate,
+            },
+            index=index,
+        )
+
+
 @dataclass
 class SeasonalityResult:
     """Result of seasonality analysis."""
@@ -120,6 +179,125 @@ class ForecastComparison:
     agreement_score: float  # How much methods agree
 
 
+@dataclass
+class BatchForecast:
+    """
+    Forecasts for many series produced by one array-native call.
+
+    Arrays have shape (n_series, quarters_ahead); column ``h`` is the
+    forecast ``h + 1`` quarters after the last input column. Rows with fewer
+    than two observations are NaN.
+    """
+
+    predicted: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+
+    def __len__(self) -> int:
+        return self.predicted.shape[0]
+
+
+@dataclass(frozen=True)
+class PreparedSeries:
+    """
+    A KPI series sorted by period once and shared across analyzers.
+
+    Analyzers and detectors accept either a DataFrame with year, quarter,
+    value columns or a PreparedSeries; passing the prepared form avoids
+    re-sorting and copying the same frame in every stage.
+    """
+
+    values: np.ndarray
+    years: np.ndarray
+    quarters: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PreparedSeries":
+        """Sort a year/quarter/value frame chronologically (stable) into arrays."""
+        years = df["year"].to_numpy()
+        quarters = df["quarter"].to_numpy()
+        order = np.lexsort((quarters, years))
+        return cls(
+            values=df["value"].to_numpy(dtype=float)[order],
+            years=years[order],
+            quarters=quarters[order],
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.values) == 0
+
+    def subset(self, mask: np.ndarray) -> "PreparedSeries":
+        """Return the observations selected by a boolean mask, keeping order."""
+        return PreparedSeries(
+            values=self.values[mask], years=self.years[mask], quarters=self.quarters[mask]
+        )
+
+
+def prepare_series(data: "pd.DataFrame | PreparedSeries") -> PreparedSeries:
+    """Return ``data`` as a PreparedSeries, sorting it only if it is a DataFrame."""
+    if isinstance(data, PreparedSeries):
+        return data
+    return PreparedSeries.from_frame(data)
+
+
+@dataclass
+class _BatchRegression:
+    """Per-row least-squares line through the observed points of a 2-D array."""
+
+    n_obs: np.ndarray
+    first_obs: np.ndarray  # Column of each row's first observation
+    slope: np.ndarray
+    intercept: np.ndarray
+    r: np.ndarray
+    std_err: np.ndarray
+
+
+def _batch_linregress(values: np.ndarray) -> _BatchRegression:
+    """
+    Closed form of ``scipy.stats.linregress`` for every row of a 2-D array.
+
+    Rows are series and columns consecutive periods (the column position is
+    the time index); NaN marks a missing observation. Rows with fewer than
+    three observations get NaN or infinite statistics for callers to mask.
+
+    Args:
+        values: Array of shape (n_series, n_periods)
+
+    Returns:
+        _BatchRegression with one entry per row
+    """
+    mask = np.isfinite(values)
+    n_obs = mask.sum(axis=1)
+    time_idx = np.broadcast_to(np.arange(values.shape[1], dtype=float), values.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = np.where(mask, time_idx, 0.0).sum(axis=1) / n_obs
+        y_mean = np.where(mask, values, 0.0).sum(axis=1) / n_obs
+        dx = np.where(mask, time_idx - x_mean[:, None], 0.0)
+        dy = np.where(mask, values - y_mean[:, None], 0.0)
+        ssxm = (dx * dx).sum(axis=1)
+        ssym = (dy * dy).sum(axis=1)
+        ssxym = (dx * dy).sum(axis=1)
+
+        slope = ssxym / ssxm
+        # A flat series has no trend: r = 0
+        r = np.clip(np.where(ssym == 0, 0.0, ssxym / np.sqrt(ssxm * ssym)), -1.0, 1.0)
+        std_err = np.sqrt((1 - r**2) * ssym / ssxm / (n_obs - 2))
+
+    return _BatchRegression(
+        n_obs=n_obs,
+        first_obs=mask.argmax(axis=1),
+        slope=slope,
+        intercept=y_mean - slope * x_mean,
+        r=r,
+        std_err=std_err,
+    )
+
+
 # =============================================================================
 # TREND ANALYSIS
 # =============================================================================
@@ -136,12 +314,12 @@ class TrendAnalyzer:
         self.significance_level = significance_level
         self.min_r_squared = min_r_squared_for_trend
 
-    def analyze(self, df: pd.DataFrame) -> TrendAnalysisResult:
+    def analyze(self, df: pd.DataFrame | PreparedSeries) -> TrendAnalysisResult:
         """
         Perform comprehensive trend analysis.
 
         Args:
-            df: DataFrame with year, quarter, value columns
+            df: DataFrame with year, quarter, value columns, or a PreparedSeries
 
         Returns:
             TrendAnalysisResult with trend metrics
@@ -150,8 +328,8 @@ class TrendAnalyzer:
             return self._insufficient_data_result()
 
         # Sort and create time index
-        df = df.sort_values(["year", "quarter"]).reset_index(drop=True)
-        values = df["value"].to_numpy(dtype=float)
+        series = prepare_series(df)
+        values = series.values
         time_idx = np.arange(len(values))
 
         # Use index-based access to avoid tuple unpacking type issues
@@ -192,7 +370,7 @@ class TrendAnalyzer:
 
         # Generate interpretation
         interpretation = self._generate_interpretation(
-            direction, slope, r_squared, total_change_pct, len(df)
+            direction, slope, r_squared, total_change_pct, len(values)
         )
 
         return TrendAnalysisResult(
@@ -208,6 +386,72 @@ class TrendAnalyzer:
             total_change_pct=round(total_change_pct, 2),
         )
 
+    def analyze_batch(
+        self,
+        values: np.ndarray,
+        series_ids: list[Any] | None = None,
+    ) -> BatchTrendResult:
+        """
+        Fit a linear trend to every row of a 2-D array in one vectorized pass.
+
+        Rows are series (e.g. KPI x region) and columns are consecutive
+        periods; NaN marks a missing observation. Statistics are the closed
+        form of ``scipy.stats.linregress`` over each row's observed points,
+        using the column position as the time index.
+
+        Args:
+            values: Array of shape (n_series, n_periods)
+            series_ids: Optional identifiers for the rows (defaults to 0..n-1)
+
+        Returns:
+            BatchTrendResult with one entry per row
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        if series_ids is None:
+            series_ids = list(range(values.shape[0]))
+
+        fit = _batch_linregress(values)
+        r = fit.r
+        n_obs = fit.n_obs
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # A flat series has r = 0 and therefore p = 1
+            dof = n_obs - 2
+            t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+            p_value = 2 * scipy_stats.t.sf(np.abs(t_stat), dof)
+
+        sufficient = n_obs >= 4
+        slope = np.where(sufficient, fit.slope, 0.0)
+        intercept = np.where(sufficient, fit.intercept, 0.0)
+        r_squared = np.where(sufficient, r**2, 0.0)
+        p_value = np.where(sufficient, p_value, 1.0)
+        std_err = np.where(sufficient, fit.std_err, 0.0)
+
+        # Same rules as analyze(), applied element-wise
+        direction = np.select(
+            [
+                ~(p_value <= self.significance_level),
+                r_squared < self.min_r_squared,
+                slope > 0,
+            ],
+            [
+                TrendDirection.STABLE.value,
+                TrendDirection.VOLATILE.value,
+                TrendDirection.INCREASING.value,
+            ],
+            default=TrendDirection.DECREASING.value,
+        )
+
+        return BatchTrendResult(
+            series_ids=list(series_ids),
+            slope=slope,
+            intercept=intercept,
+            r_squared=r_squared,
+            p_value=p_value,
+            std_err=std_err,
+            n_obs=n_obs,
+            direction=direction,
+        )
+
     def _insufficient_data_result(self) -> TrendAnalysisResult:
         """Return result for insufficient data."""
         return TrendAnalysisResult(
@@ -261,12 +505,12 @@ class SeasonalityAnalyzer:
     def __init__(self, min_years: int = 2):
         self.min_years = min_years
 
-    def analyze(self, df: pd.DataFrame) -> SeasonalityResult:
+    def analyze(self, df: pd.DataFrame | PreparedSeries) -> SeasonalityResult:
         """
         Analyze seasonality in the time series.
 
         Args:
-            df: DataFrame with year, quarter, value columns
+            df: DataFrame with year, quarter, value columns, or a PreparedSeries
 
         Returns:
             SeasonalityResult with seasonal patterns
@@ -276,21 +520,97 @@ class SeasonalityAnalyzer:
                 "Insufficient data for seasonality analysis"
             )
 
-        df = df.sort_values(["year", "quarter"]).reset_index(drop=True)
+        series = prepare_series(df)
 
-        # Calculate quarterly averages
-        quarterly_means = df.groupby("quarter")["value"].mean()
-        overall_mean = df["value"].mean()
+        # Calculate quarterly averages (missing values are skipped)
+        observed = ~np.isnan(series.values)
+        values = series.values[observed]
+        quarters, quarter_idx = np.unique(series.quarters[observed], return_inverse=True)
+        quarterly_means = np.bincount(quarter_idx, weights=values) / np.bincount(quarter_idx)
+        overall_mean = float(values.mean()) if len(values) else float("nan")
 
+        return self._result_from_quarter_means(quarters, quarterly_means, overall_mean)
+
+    def analyze_frame(
+        self,
+        df: pd.DataFrame,
+        kpi_columns: list[str],
+        region_column: str | None = "region",
+    ) -> dict[tuple[str, Any], SeasonalityResult]:
+        """
+        Analyze seasonality of every KPI (per region) in a wide frame at once.
+
+        Quarterly sums and counts for all KPIs and regions come from a single
+        ``groupby([region, "quarter"])``; each series' result is then built
+        exactly as ``analyze`` would build it from that series' observations.
+
+        Args:
+            df: Wide DataFrame with quarter, optional region and KPI columns
+            kpi_columns: KPI columns to analyze
+            region_column: Region column, or None to treat the frame as one series
+
+        Returns:
+            Mapping of (kpi, region) to SeasonalityResult (region is None
+            when ``region_column`` is None)
+        """
+        if region_column is None:
+            keys = ["quarter"]
+        else:
+            keys = [region_column, "quarter"]
+        stats = df.groupby(keys, sort=True)[kpi_columns].agg(["sum", "count"])
+        sums = stats.xs("sum", axis=1, level=1)[kpi_columns].to_numpy(dtype=float)
+        counts = stats.xs("count", axis=1, level=1)[kpi_columns].to_numpy(dtype=float)
+
+        quarters_all = stats.index.get_level_values("quarter").to_numpy()
+        if region_column is None:
+            regions = np.full(len(stats), None, dtype=object)
+        else:
+            regions = stats.index.get_level_values(region_column).to_numpy()
+
+        results: dict[tuple[str, Any], SeasonalityResult] = {}
+        # Rows are sorted by region, so each region is one contiguous block
+        boundaries = np.flatnonzero(regions[1:] != regions[:-1]) + 1
+        for rows in np.split(np.arange(len(stats)), boundaries):
+            if len(rows) == 0:
+                continue
+            region = regions[rows[0]]
+            for col, kpi in enumerate(kpi_columns):
+                series_sums = sums[rows, col]
+                series_counts = counts[rows, col]
+                n_obs = int(series_counts.sum())
+                if n_obs == 0 or n_obs < self.min_years * 4:
+                    results[(kpi, region)] = self._no_seasonality_result(
+                        "Insufficient data for seasonality analysis"
+                    )
+                    continue
+                present = series_counts > 0
+                results[(kpi, region)] = self._result_from_quarter_means(
+                    quarters_all[rows][present],
+                    series_sums[present] / series_counts[present],
+                    float(series_sums.sum() / n_obs),
+                )
+        return results
+
+    def _result_from_quarter_means(
+        self,
+        quarters: np.ndarray,
+        quarterly_means: np.ndarray,
+        overall_mean: float,
+    ) -> SeasonalityResult:
+        """Build a SeasonalityResult from per-quarter and overall means."""
         if overall_mean == 0:
             return self._no_seasonality_result("Cannot analyze: zero mean")
 
         # Calculate seasonal indices (ratio to overall mean)
-        seasonal_indices = (quarterly_means / overall_mean).to_dict()
+        seasonal_indices = {
+            int(q): float(m / overall_mean) for q, m in zip(quarters, quarterly_means, strict=True)
+        }
 
         # Calculate seasonality strength
         # Using coefficient of variation of quarterly means
-        quarterly_std = quarterly_means.std()
+        quarterly_std = (
+            float(np.std(quarterly_means, ddof=1)) if len(quarterly_means) > 1 else float("nan")
+        )
         seasonality_strength = quarterly_std / overall_mean if overall_mean else 0
 
         # Normalize to 0-1 range (cap at 0.5 variation = 100% strength)
@@ -303,8 +623,8 @@ class SeasonalityAnalyzer:
             seasonality_type = SeasonalityType.QUARTERLY
 
         # Find peak and trough quarters
-        peak_quarter = int(quarterly_means.idxmax())
-        trough_quarter = int(quarterly_means.idxmin())
+        peak_quarter = int(quarters[np.argmax(quarterly_means)])
+        trough_quarter = int(quarters[np.argmin(quarterly_means)])
 
         # Generate interpretation
         interpretation = self._generate_interpretation(
@@ -368,25 +688,36 @@ class SeasonalityAnalyzer:
 
 
 class ChangePointDetector:
-    """Detects structural changes in time series."""
+    """
+    Detects structural changes in time series.
+
+    The default window method compares the ``min_segment_size`` observations
+    before and after every index. PELT and binary segmentation instead
+    partition the whole series into constant-mean segments, trading each
+    extra segment against ``penalty``; they suit long monthly or daily series.
+    All methods work from prefix sums, so window statistics and segment costs
+    are O(1) each.
+    """
 
     def __init__(
         self,
         min_segment_size: int = 4,
         significance_threshold: float = 2.0,  # Z-score threshold
+        method: ChangePointMethod | str = ChangePointMethod.WINDOW,
+        penalty: float | None = None,
     ):
         self.min_segment_size = min_segment_size
         self.significance_threshold = significance_threshold
+        self.method = ChangePointMethod(method)
+        # Cost penalty per change point for segmentation methods (None = BIC-style)
+        self.penalty = penalty
 
-    def detect(self, df: pd.DataFrame) -> list[ChangePoint]:
+    def detect(self, df: pd.DataFrame | PreparedSeries) -> list[ChangePoint]:
         """
         Detect change points in the time series.
 
-        Uses CUSUM-like approach for level shifts and
-        variance ratio tests for variance changes.
-
         Args:
-            df: DataFrame with year, quarter, value columns
+            df: DataFrame with year, quarter, value columns, or a PreparedSeries
 
         Returns:
             List of detected change points
@@ -394,55 +725,202 @@ class ChangePointDetector:
         if df.empty or len(df) < 2 * self.min_segment_size:
             return []
 
-        df = df.sort_values(["year", "quarter"]).reset_index(drop=True)
-        values = df["value"].to_numpy(dtype=float)
-        n = len(values)
+        series = prepare_series(df)
 
-        change_points = []
+        if self.method == ChangePointMethod.WINDOW:
+            return self._detect_window(series)
 
-        # Detect level shifts using sliding window comparison
-        for i in range(self.min_segment_size, n - self.min_segment_size):
-            before = values[max(0, i - self.min_segment_size) : i]
-            after = values[i : min(n, i + self.min_segment_size)]
+        # Segmentation needs a complete series; non-finite points are dropped
+        series = series.subset(np.isfinite(series.values))
+        if len(series) < 2 * self.min_segment_size:
+            return []
 
-            before_mean = np.mean(before)
-            after_mean = np.mean(after)
-            pooled_std = np.std(np.concatenate([before, after]))
+        if self.method == ChangePointMethod.PELT:
+            breakpoints = self._pelt(series.values)
+        else:
+            breakpoints = self._binary_segmentation(series.values)
+        return self._segment_change_points(series, breakpoints)
 
-            if pooled_std == 0:
-                continue
+    def _detect_window(self, series: PreparedSeries) -> list[ChangePoint]:
+        """Level-shift z-test of adjacent windows, vectorized with prefix sums."""
+        m = self.min_segment_size
+        values = series.values
+        n = len(values)
 
-            z_score = abs(after_mean - before_mean) / (
-                pooled_std / np.sqrt(len(before))
-            )
+        # Windows touching a missing/infinite value are skipped
+        finite = np.isfinite(values)
+        offset = values[finite].mean() if finite.any() else 0.0
+        centered = np.where(finite, values - offset, 0.0)
+        sums = np.concatenate(([0.0], np.cumsum(centered)))
+        squares = np.concatenate(([0.0], np.cumsum(centered**2)))
+        bad = np.concatenate(([0], np.cumsum(~finite)))
+
+        idx = np.arange(m, n - m)
+        before_sum = sums[idx] - sums[idx - m]
+        after_sum = sums[idx + m] - sums[idx]
+        window_sum = before_sum + after_sum
+        window_sq = squares[idx + m] - squares[idx - m]
+        pooled_var = np.maximum(window_sq / (2 * m) - (window_sum / (2 * m)) ** 2, 0.0)
+
+        # Treat round-off residue on flat windows as zero variance
+        tolerance = 1e-12 * np.maximum(window_sq / (2 * m), np.finfo(float).tiny)
+        valid = (bad[idx + m] - bad[idx - m] == 0) & (pooled_var > tolerance)
+
+        pooled_std = np.sqrt(pooled_var)
+        shift = (after_sum - before_sum) / m
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = np.abs(shift) / (pooled_std / np.sqrt(m))
 
-            if z_score > self.significance_threshold:
-                row = df.iloc[i]
-                magnitude = after_mean - before_mean
-                confidence = min(1.0, z_score / 5)  # Normalize confidence
-
-                change_points.append(
-                    ChangePoint(
-                        year=int(row["year"]),
-                        quarter=int(row["quarter"]),
-                        index=i,
-                        type=ChangePointType.LEVEL_SHIFT,
-                        magnitude=round(float(magnitude), 4),
-                        before_mean=round(float(before_mean), 4),
-                        after_mean=round(float(after_mean), 4),
-                        confidence=round(float(confidence), 4),
-                        description=self._describe_change(
-                            float(before_mean),
-                            float(after_mean),
-                            row["year"],
-                            row["quarter"],
-                        ),
-                    )
+        change_points = []
+        for k in np.flatnonzero(valid & (z_scores > self.significance_threshold)):
+            i = int(idx[k])
+            change_points.append(
+                self._make_change_point(
+                    series,
+                    i,
+                    before_mean=before_sum[k] / m + offset,
+                    after_mean=after_sum[k] / m + offset,
+                    z_score=float(z_scores[k]),
                 )
+            )
 
         # Filter overlapping change points (keep highest confidence)
         return self._filter_overlapping(change_points)
 
+    @staticmethod
+    def _noise_sigma(values: np.ndarray) -> float:
+        """Robust noise level from the MAD of first differences."""
+        diffs = np.diff(values)
+        # Differencing removes the level shifts themselves from the estimate
+        sigma = 1.4826 * float(np.median(np.abs(diffs - np.median(diffs)))) / np.sqrt(2)
+        return sigma if sigma > 0 else float(np.std(values))
+
+    def _resolve_penalty(self, values: np.ndarray) -> float:
+        """Penalty per change point; defaults to a conservative BIC-style 4·σ²·log(n)."""
+        if self.penalty is not None:
+            return float(self.penalty)
+        variance = max(self._noise_sigma(values) ** 2, np.finfo(float).eps)
+        return 4.0 * variance * np.log(len(values))
+
+    def _pelt(self, values: np.ndarray) -> list[int]:
+        """
+        Optimal mean-shift segmentation with PELT pruning.
+
+        Minimizes the total within-segment sum of squares plus ``penalty`` per
+        change point. Candidates that can no longer start an optimal last
+        segment are pruned, giving near-linear run time when changes occur
+        throughout the series (very long change-free stretches prune less).
+
+        A candidate s beaten at time t is only dominated once t itself can
+        start the last segment, so the pruning takes effect at t + min_segment_size.
+        """
+        m = self.min_segment_size
+        n = len(values)
+        penalty = self._resolve_penalty(values)
+        sums = np.concatenate(([0.0], np.cumsum(values - values.mean())))
+        squares = np.concatenate(([0.0], np.cumsum((values - values.mean()) ** 2)))
+
+        best = np.full(n + 1, np.inf)
+        best[0] = -penalty
+        last_break = np.zeros(n + 1, dtype=int)
+        candidates = np.array([], dtype=int)
+        pending_prunes: dict[int, np.ndarray] = {}
+
+        for t in range(m, n + 1):
+            pruned = pending_prunes.pop(t, None)
+            if pruned is not None:
+                candidates = candidates[~np.isin(candidates, pruned)]
+            start = t - m
+            if start == 0 or start >= m:
+                candidates = np.append(candidates, start)
+            lengths = t - candidates
+            seg_sum = sums[t] - sums[candidates]
+            costs = best[candidates] + (squares[t] - squares[candidates]) - seg_sum**2 / lengths
+            k = int(np.argmin(costs))
+            best[t] = costs[k] + penalty
+            last_break[t] = candidates[k]
+            beaten = candidates[costs > best[t]]
+            if len(beaten):
+                pending_prunes[t + m] = beaten
+
+        breakpoints = []
+        t = n
+        while t > 0:
+            t = int(last_break[t])
+            if t > 0:
+                breakpoints.append(t)
+        return sorted(breakpoints)
+
+    def _binary_segmentation(self, values: np.ndarray) -> list[int]:
+        """Recursively split at the largest cost reduction while it beats the penalty."""
+        m = self.min_segment_size
+        penalty = self._resolve_penalty(values)
+        sums = np.concatenate(([0.0], np.cumsum(values - values.mean())))
+        squares = np.concatenate(([0.0], np.cumsum((values - values.mean()) ** 2)))
+
+        def cost(start: np.ndarray | int, end: np.ndarray | int) -> np.ndarray:
+            seg_sum = sums[end] - sums[start]
+            return (squares[end] - squares[start]) - seg_sum**2 / (end - start)
+
+        breakpoints = []
+        segments = [(0, len(values))]
+        while segments:
+            start, end = segments.pop()
+            if end - start < 2 * m:
+                continue
+            splits = np.arange(start + m, end - m + 1)
+            gains = cost(start, end) - cost(start, splits) - cost(splits, end)
+            k = int(np.argmax(gains))
+            if gains[k] > penalty:
+                split = int(splits[k])
+                breakpoints.append(split)
+                segments.extend([(start, split), (split, end)])
+        return sorted(breakpoints)
+
+    def _segment_change_points(
+        self, series: PreparedSeries, breakpoints: list[int]
+    ) -> list[ChangePoint]:
+        """Describe the shift in mean across each segment boundary."""
+        values = series.values
+        bounds = [0, *breakpoints, len(values)]
+        sigma = self._noise_sigma(values)
+
+        change_points = []
+        for prev, i, nxt in zip(bounds, bounds[1:-1], bounds[2:], strict=False):
+            before_mean = float(values[prev:i].mean())
+            after_mean = float(values[i:nxt].mean())
+            std_err = sigma * np.sqrt(1 / (i - prev) + 1 / (nxt - i))
+            z_score = abs(after_mean - before_mean) / std_err if std_err > 0 else np.inf
+            change_points.append(
+                self._make_change_point(series, i, before_mean, after_mean, z_score)
+            )
+        return change_points
+
+    def _make_change_point(
+        self,
+        series: PreparedSeries,
+        index: int,
+        before_mean: float,
+        after_mean: float,
+        z_score: float,
+    ) -> ChangePoint:
+        """Build a level-shift ChangePoint at ``index``."""
+        year, quarter = int(series.years[index]), int(series.quarters[index])
+        confidence = min(1.0, z_score / 5)  # Normalize confidence
+        return ChangePoint(
+            year=year,
+            quarter=quarter,
+            index=index,
+            type=ChangePointType.LEVEL_SHIFT,
+            magnitude=round(float(after_mean - before_mean), 4),
+            before_mean=round(float(before_mean), 4),
+            after_mean=round(float(after_mean), 4),
+            confidence=round(float(confidence), 4),
+            description=self._describe_change(
+                float(before_mean), float(after_mean), year, quarter
+            ),
+        )
+
     def _describe_change(
         self,
         before_mean: float,
@@ -504,12 +982,21 @@ class PatternRecognizer:
         self.seasonality_analyzer = SeasonalityAnalyzer()
         self.change_point_detector = ChangePointDetector()
 
-    def analyze(self, df: pd.DataFrame) -> PatternRecognitionResult:
+    def analyze(
+        self,
+        df: pd.DataFrame | PreparedSeries,
+        seasonality: SeasonalityResult | None = None,
+    ) -> PatternRecognitionResult:
         """
         Perform comprehensive pattern recognition.
 
+        The series is sorted once and the prepared arrays are shared by the
+        trend, seasonality and change point stages.
+
         Args:
-            df: DataFrame with year, quarter, value columns
+            df: DataFrame with year, quarter, value columns, or a PreparedSeries
+            seasonality: Precomputed result (e.g. from compute_seasonal_indices)
+                used instead of analyzing the series' seasonality again
 
         Returns:
             PatternRecognitionResult with all detected patterns
@@ -517,13 +1004,14 @@ class PatternRecognizer:
         if df.empty or len(df) < 4:
             return self._insufficient_data_result()
 
-        df = df.sort_values(["year", "quarter"]).reset_index(drop=True)
-        values = df["value"].to_numpy(dtype=float) # type: ignore
+        series = prepare_series(df)
+        values = series.values
 
         # Run all analyzers
-        trend = self.trend_analyzer.analyze(df)
-        seasonality = self.seasonality_analyzer.analyze(df)
-        change_points = self.change_point_detector.detect(df)
+        trend = self.trend_analyzer.analyze(series)
+        if seasonality is None:
+            seasonality = self.seasonality_analyzer.analyze(series)
+        change_points = self.change_point_detector.detect(series)
 
         # Calculate additional metrics
         volatility = float(np.std(values) / np.mean(values)) if np.mean(values) != 0 else 0
@@ -649,6 +1137,7 @@ class LinearForecaster:
         self._last_year = 0
         self._last_quarter = 0
         self._min_year = 0
+        self._batch_fitted = False
 
     def fit(self, df: pd.DataFrame) -> "LinearForecaster":
         """Fit linear model."""
@@ -663,7 +1152,9 @@ class LinearForecaster:
         _result = scipy_stats.linregress(time_idx, values)
         self.slope = float(_result[0])  # type: ignore[index]
         self.intercept = float(_result[1])  # type: ignore[index]
-        self.std_error = float(_result[4])  # type: ignore[index]
+        # linregress reports NaN for a constant series; it fits exactly
+        std_error = float(_result[4])  # type: ignore[index]
+        self.std_error = std_error if np.isfinite(std_error) else 0.0
 
         last_row = df.iloc[-1]
         self._last_year = int(last_row["year"])
@@ -689,12 +1180,8 @@ class LinearForecaster:
                 current_quarter = 1
                 current_year += 1
 
-            time_idx = (
-                (current_year - self._min_year) * 4
-                + current_quarter
-                - (self._min_year * 4 + 1)
-                + self._n_points
-            )
+            # Fitted on positions 0..n-1, so step i+1 ahead is position n+i
+            time_idx = self._n_points + i
 
             pred = self.intercept + self.slope * time_idx
             std = self.std_error * np.sqrt(1 + 1 / self._n_points + (time_idx - self._n_points / 2) ** 2)
@@ -709,6 +1196,54 @@ class LinearForecaster:
 
         return predictions
 
+    def fit_many(self, values: np.ndarray) -> "LinearForecaster":
+        """
+        Fit a linear trend to every row of a 2-D array in one vectorized pass.
+
+        Rows are series and columns are consecutive quarters ending at the
+        same last period; NaN marks a missing observation (e.g. leading
+        padding for shorter series). Shares the closed-form regression of
+        ``TrendAnalyzer.analyze_batch``.
+
+        Args:
+            values: Array of shape (n_series, n_periods)
+
+        Returns:
+            self, for chaining with predict_many
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        fit = _batch_linregress(values)
+
+        # Two points fit exactly (linregress reports a zero standard error)
+        std_error = np.where(fit.n_obs == 2, 0.0, fit.std_err)
+        sufficient = fit.n_obs >= 2
+        self._batch_slope = np.where(sufficient, fit.slope, np.nan)
+        self._batch_intercept = np.where(sufficient, fit.intercept, np.nan)
+        self._batch_std_error = np.where(sufficient, std_error, np.nan)
+        self._batch_n_obs = fit.n_obs
+        self._batch_n_periods = values.shape[1]
+        self._batch_first_obs = fit.first_obs
+        self._batch_fitted = True
+
+        return self
+
+    def predict_many(self, quarters_ahead: int = 4) -> BatchForecast:
+        """Generate predictions for every series fitted by fit_many."""
+        if not self._batch_fitted:
+            raise ValueError("Model must be fitted with fit_many first")
+
+        # Column index of each forecast period
+        time_idx = self._batch_n_periods + np.arange(quarters_ahead)
+        pred = self._batch_intercept[:, None] + self._batch_slope[:, None] * time_idx
+
+        # Same interval as predict(), with positions counted from each row's first observation
+        n = self._batch_n_obs[:, None]
+        rel_idx = time_idx - self._batch_first_obs[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = self._batch_std_error[:, None] * np.sqrt(1 + 1 / n + (rel_idx - n / 2) ** 2)
+
+        return BatchForecast(predicted=pred, lower=pred - 1.96 * std, upper=pred + 1.96 * std)
+
 
 class ExponentialSmoothingForecaster:
     """Simple exponential smoothing forecaster."""
@@ -720,6 +1255,7 @@ class ExponentialSmoothingForecaster:
         self._last_year = 0
         self._last_quarter = 0
         self._std = 0.0
+        self._batch_fitted = False
 
     def fit(self, df: pd.DataFrame) -> "ExponentialSmoothingForecaster":
         """Fit exponential smoothing model."""
@@ -773,6 +1309,54 @@ class ExponentialSmoothingForecaster:
 
         return predictions
 
+    def fit_many(self, values: np.ndarray) -> "ExponentialSmoothingForecaster":
+        """
+        Smooth every row of a 2-D array without a per-step loop.
+
+        The smoothed level is a weighted sum of the observations: the k-th
+        most recent gets ``alpha * (1 - alpha) ** k`` and the first keeps the
+        remaining ``(1 - alpha) ** (n - 1)``, which is exactly what the
+        recursive update in fit() produces. NaN marks a missing observation.
+
+        Args:
+            values: Array of shape (n_series, n_periods)
+
+        Returns:
+            self, for chaining with predict_many
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=float))
+        mask = np.isfinite(values)
+        n_obs = mask.sum(axis=1)
+
+        # Number of observations after each one in its row
+        order = np.cumsum(mask, axis=1) - 1
+        age = n_obs[:, None] - 1 - order
+        decay = (1 - self.alpha) ** np.where(mask, age, 0)
+        weights = np.where(order == 0, decay, self.alpha * decay)
+        weights = np.where(mask, weights, 0.0)
+
+        sufficient = n_obs >= 2
+        level = (weights * np.where(mask, values, 0.0)).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(mask, values, 0.0).sum(axis=1) / n_obs
+            std = np.sqrt((np.where(mask, values - mean[:, None], 0.0) ** 2).sum(axis=1) / n_obs)
+
+        self._batch_level = np.where(sufficient, level, np.nan)
+        self._batch_std = np.where(sufficient, std, np.nan)
+        self._batch_fitted = True
+
+        return self
+
+    def predict_many(self, quarters_ahead: int = 4) -> BatchForecast:
+        """Generate flat predictions for every series fitted by fit_many."""
+        if not self._batch_fitted:
+            raise ValueError("Model must be fitted with fit_many first")
+
+        pred = np.repeat(self._batch_level[:, None], quarters_ahead, axis=1)
+        std = self._batch_std[:, None] * np.sqrt(np.arange(1, quarters_ahead + 1)) * 0.5
+
+        return BatchForecast(predicted=pred, lower=pred - 1.96 * std, upper=pred + 1.96 * std)
+
 
 class EnsembleForecaster:
     """
@@ -781,12 +1365,23 @@ class EnsembleForecaster:
     Uses weighted average of:
     - Linear regression
     - Exponential smoothing
-    - Gradient Boosting (if available)
+
+    Weights default to an equal split; backtesting
+    (``BacktestReport.ensemble_weights``) can derive them from measured
+    accuracy.
     """
 
-    def __init__(self):
+    def __init__(self, weights: dict[str, float] | None = None):
         self.linear = LinearForecaster()
         self.exp_smooth = ExponentialSmoothingForecaster()
+        weights = weights or {"linear": 0.5, "exponential_smoothing": 0.5}
+        total = weights.get("linear", 0.0) + weights.get("exponential_smoothing", 0.0)
+        if total <= 0:
+            raise ValueError("Ensemble weights must sum to a positive value")
+        self.weights = {
+            "linear": weights.get("linear", 0.0) / total,
+            "exponential_smoothing": weights.get("exponential_smoothing", 0.0) / total,
+        }
         self._is_fitted = False
 
     def fit(self, df: pd.DataFrame) -> "EnsembleForecaster":
@@ -804,15 +1399,17 @@ class EnsembleForecaster:
         linear_preds = self.linear.predict(quarters_ahead)
         exp_preds = self.exp_smooth.predict(quarters_ahead)
 
-        # Simple average (can be weighted based on historical performance)
+        # Weighted average (weights can come from backtested accuracy)
+        w_linear = self.weights["linear"]
+        w_exp = self.weights["exponential_smoothing"]
         ensemble = []
         for i in range(quarters_ahead):
             lp = linear_preds[i]
             ep = exp_preds[i]
 
-            avg_pred = (lp["predicted_value"] + ep["predicted_value"]) / 2
-            avg_lower = (lp["confidence_lower"] + ep["confidence_lower"]) / 2
-            avg_upper = (lp["confidence_upper"] + ep["confidence_upper"]) / 2
+            avg_pred = w_linear * lp["predicted_value"] + w_exp * ep["predicted_value"]
+            avg_lower = w_linear * lp["confidence_lower"] + w_exp * ep["confidence_lower"]
+            avg_upper = w_linear * lp["confidence_upper"] + w_exp * ep["confidence_upper"]
 
             ensemble.append({
                 "year": lp["year"],
@@ -824,6 +1421,29 @@ class EnsembleForecaster:
 
         return ensemble
 
+    def fit_many(self, values: np.ndarray) -> "EnsembleForecaster":
+        """
+        Fit all component models on every row of a 2-D array.
+
+        See ``LinearForecaster.fit_many`` for the array layout.
+        """
+        self.linear.fit_many(values)
+        self.exp_smooth.fit_many(values)
+        return self
+
+    def predict_many(self, quarters_ahead: int = 4) -> BatchForecast:
+        """Generate weighted ensemble predictions for every fitted series."""
+        linear = self.linear.predict_many(quarters_ahead)
+        exp = self.exp_smooth.predict_many(quarters_ahead)
+
+        w_linear = self.weights["linear"]
+        w_exp = self.weights["exponential_smoothing"]
+        return BatchForecast(
+            predicted=w_linear * linear.predicted + w_exp * exp.predicted,
+            lower=w_linear * linear.lower + w_exp * exp.lower,
+            upper=w_linear * linear.upper + w_exp * exp.upper,
+        )
+
     def compare_methods(
         self, quarters_ahead: int = 4
     ) -> ForecastComparison:
@@ -854,7 +1474,7 @@ class EnsembleForecaster:
             },
             best_method="ensemble",
             consensus_forecast=ensemble_preds,
-            method_weights={"linear": 0.5, "exponential_smoothing": 0.5},
+            method_weights={k: round(v, 4) for k, v in self.weights.items()},
             agreement_score=round(agreement, 4),
         )
 
@@ -864,12 +1484,12 @@ class EnsembleForecaster:
 # =============================================================================
 
 
-def analyze_patterns(df: pd.DataFrame) -> PatternRecognitionResult:
+def analyze_patterns(df: pd.DataFrame | PreparedSeries) -> PatternRecognitionResult:
     """
     Convenience function for pattern recognition.
 
     Args:
-        df: DataFrame with year, quarter, value columns
+        df: DataFrame with year, quarter, value columns, or a PreparedSeries
 
     Returns:
         PatternRecognitionResult
@@ -892,6 +1512,63 @@ def analyze_trend(df: pd.DataFrame) -> TrendAnalysisResult:
     return analyzer.analyze(df)
 
 
+def analyze_trends(
+    df: pd.DataFrame,
+    kpi_columns: list[str],
+    region_column: str | None = "region",
+) -> BatchTrendResult:
+    """
+    Analyze the trend of every KPI (per region) in a wide frame in one call.
+
+    Observations are aligned on the frame's sorted (year, quarter) periods,
+    so a region missing a period leaves a gap rather than shifting the
+    time index.
+
+    Args:
+        df: Wide DataFrame with year, quarter, optional region and KPI columns
+        kpi_columns: KPI columns to analyze (missing columns are ignored)
+        region_column: Region column, or None to treat each KPI as one series
+
+    Returns:
+        BatchTrendResult keyed by (kpi_id, region) tuples, or by kpi_id
+        when there is no region column
+    """
+    kpis = [k for k in kpi_columns if k in df.columns]
+    analyzer = TrendAnalyzer()
+    if df.empty or not kpis:
+        return analyzer.analyze_batch(np.empty((0, 0)), [])
+
+    periods = df[["year", "quarter"]].drop_duplicates().sort_values(["year", "quarter"])
+    period_pos = pd.Series(
+        np.arange(len(periods)), index=pd.MultiIndex.from_frame(periods)
+    )
+    positions = period_pos.loc[pd.MultiIndex.from_frame(df[["year", "quarter"]])].to_numpy()
+
+    if region_column is not None and region_column in df.columns:
+        regions, region_idx = np.unique(df[region_column].astype(str), return_inverse=True)
+    else:
+        regions, region_idx = None, np.zeros(len(df), dtype=int)
+    n_regions = 1 if regions is None else len(regions)
+
+    # Duplicate (series, period) rows are averaged, as a groupby would
+    sums = np.zeros((len(kpis), n_regions, len(periods)))
+    counts = np.zeros_like(sums)
+    for k, kpi in enumerate(kpis):
+        kpi_values = df[kpi].to_numpy(dtype=float)
+        observed = np.isfinite(kpi_values)
+        np.add.at(sums[k], (region_idx[observed], positions[observed]), kpi_values[observed])
+        np.add.at(counts[k], (region_idx[observed], positions[observed]), 1)
+
+    with np.errstate(invalid="ignore"):
+        matrix = (sums / counts).reshape(len(kpis) * n_regions, len(periods))
+
+    if regions is None:
+        series_ids: list[Any] = list(kpis)
+    else:
+        series_ids = [(kpi, str(region)) for kpi in kpis for region in regions]
+    return analyzer.analyze_batch(matrix, series_ids)
+
+
 def analyze_seasonality(df: pd.DataFrame) -> SeasonalityResult:
     """
     Convenience function for seasonality analysis.
@@ -906,6 +1583,40 @@ def analyze_seasonality(df: pd.DataFrame) -> SeasonalityResult:
     return analyzer.analyze(df)
 
 
+def compute_seasonal_indices(
+    df: pd.DataFrame,
+    kpi_columns: list[str],
+    region_column: str | None = "region",
+    data_version: str | None = None,
+) -> dict[tuple[str, Any], SeasonalityResult]:
+    """
+    Tenant-wide seasonality for every KPI (per region), cached per data version.
+
+    Args:
+        df: Wide DataFrame with quarter, optional region and KPI columns
+        kpi_columns: KPI columns to analyze
+        region_column: Region column, or None to treat the frame as one series
+        data_version: Identifier of the data snapshot (default: a hash of the
+            analyzed columns)
+
+    Returns:
+        Mapping of (kpi, region) to SeasonalityResult
+    """
+    if data_version is None:
+        columns = ["quarter", *kpi_columns] + ([region_column] if region_column else [])
+        data_version = str(pd.util.hash_pandas_object(df[columns], index=False).sum())
+
+    cache = get_cache()
+    cache_key = f"seasonality:{make_cache_key(data_version, kpi_columns, region_column)}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = SeasonalityAnalyzer().analyze_frame(df, kpi_columns, region_column)
+    cache.set(cache_key, result)
+    return result
+
+
 def detect_change_points(df: pd.DataFrame) -> list[ChangePoint]:
     """
     Convenience function for change point detection.
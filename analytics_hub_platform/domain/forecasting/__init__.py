@@ -1,7 +1,15 @@
 """Forecasting subpackage."""
 
+from .backtesting import BacktestReport, MethodScore, run_backtest
 from .forecaster import KPIForecaster
+from .service import ForecastService, ServedForecast, get_forecast_service
 
 __all__ = [
+    "BacktestReport",
+    "ForecastService",
     "KPIForecaster",
+    "MethodScore",
+    "ServedForecast",
+    "get_forecast_service",
+    "run_backtest",
 ]
@@ -0,0 +1,349 @@
+"""
+Forecast Backtesting Module
+Sustainable Economic Development Analytics Hub
+
+Walk-forward (rolling-origin) evaluation of the forecasting models:
+- LinearForecaster, ExponentialSmoothingForecaster, EnsembleForecaster
+- KPIForecaster (gradient boosting)
+
+Each series is refit at successive forecast origins and scored on the
+quarters that follow. The report records accuracy (MAPE), interval
+coverage and fit/predict wall time per series and method, derives
+ensemble weights from the measured accuracy and picks the cheapest
+adequate model per series.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from analytics_hub_platform.domain.advanced_analytics import (
+    EnsembleForecaster,
+    ExponentialSmoothingForecaster,
+    LinearForecaster,
+)
+from analytics_hub_platform.domain.ml_services import KPIForecaster
+from analytics_hub_platform.infrastructure.exceptions import MLError
+
+logger = logging.getLogger(__name__)
+
+
+# Factories for the models that can be backtested, keyed by method name
+FORECASTER_FACTORIES: dict[str, Callable[[], Any]] = {
+    "linear": LinearForecaster,
+    "exponential_smoothing": ExponentialSmoothingForecaster,
+    "ensemble": EnsembleForecaster,
+    "gradient_boosting": lambda: KPIForecaster(model_type="gradient_boosting"),
+}
+
+# Methods combined by EnsembleForecaster
+ENSEMBLE_COMPONENTS = ("linear", "exponential_smoothing")
+
+
+# =============================================================================
+# MODELS
+# =============================================================================
+
+
+@dataclass
+class MethodScore:
+    """Backtest results for one forecasting method on one series."""
+
+    series_id: str
+    method: str
+    n_origins: int
+    n_forecasts: int
+    mape: float  # Mean absolute percentage error (%)
+    coverage: float  # Share of actuals inside the confidence interval
+    fit_seconds: float  # Total fit time across origins
+    predict_seconds: float  # Total predict time across origins
+    failures: int = 0  # Origins where the model could not be fitted
+
+    @property
+    def total_seconds(self) -> float:
+        return self.fit_seconds + self.predict_seconds
+
+
+@dataclass
+class BacktestReport:
+    """Walk-forward backtest results for many series and methods."""
+
+    scores: list[MethodScore]
+    horizon: int
+    min_train_size: int
+    step: int
+    elapsed_seconds: float = 0.0
+    skipped_series: list[str] = field(default_factory=list)
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per (series, method)."""
+        if not self.scores:
+            return pd.DataFrame(columns=list(MethodScore.__dataclass_fields__))
+        return pd.DataFrame([asdict(s) for s in self.scores])
+
+    def summary(self) -> pd.DataFrame:
+        """Aggregate accuracy and cost per method, best MAPE first."""
+        frame = self.to_frame()
+        if frame.empty:
+            return frame
+        summary = frame.groupby("method").agg(
+            series=("series_id", "nunique"),
+            forecasts=("n_forecasts", "sum"),
+            mape=("mape", "mean"),
+            median_mape=("mape", "median"),
+            coverage=("coverage", "mean"),
+            fit_seconds=("fit_seconds", "sum"),
+            predict_seconds=("predict_seconds", "sum"),
+            failures=("failures", "sum"),
+        )
+        return summary.sort_values("mape")
+
+    def ensemble_weights(
+        self, components: tuple[str, ...] = ENSEMBLE_COMPONENTS
+    ) -> dict[str, float]:
+        """
+        Derive ensemble weights proportional to inverse mean MAPE.
+
+        Falls back to equal weights when a component has no finite score.
+        """
+        frame = self.to_frame()
+        inverse = {}
+        for method in components:
+            mape = frame.loc[frame["method"] == method, "mape"].mean() if not frame.empty else np.nan
+            inverse[method] = 1.0 / max(float(mape), 1e-9) if np.isfinite(mape) else np.nan
+
+        if any(not np.isfinite(v) for v in inverse.values()):
+            return {method: round(1.0 / len(components), 4) for method in components}
+
+        total = sum(inverse.values())
+        return {method: round(value / total, 4) for method, value in inverse.items()}
+
+    def best_methods(self, tolerance: float = 0.1) -> dict[str, str]:
+        """
+        Pick the cheapest adequate method per series.
+
+        A method is adequate when its MAPE is within ``tolerance`` (relative)
+        of the best MAPE for that series; the fastest adequate method wins.
+
+        Args:
+            tolerance: Allowed relative MAPE gap to the most accurate method
+
+        Returns:
+            Mapping of series id to method name
+        """
+        choices: dict[str, str] = {}
+        by_series: dict[str, list[MethodScore]] = {}
+        for score in self.scores:
+            if np.isfinite(score.mape):
+                by_series.setdefault(score.series_id, []).append(score)
+
+        for series_id, scores in by_series.items():
+            best_mape = min(s.mape for s in scores)
+            adequate = [s for s in scores if s.mape <= best_mape * (1 + tolerance) + 1e-12]
+            choices[series_id] = min(adequate, key=lambda s: s.total_seconds).method
+        return choices
+
+
+# =============================================================================
+# BACKTESTING
+# =============================================================================
+
+
+def rolling_origins(n_points: int, min_train_size: int, step: int = 1) -> list[int]:
+    """
+    Forecast origins for walk-forward evaluation.
+
+    An origin ``k`` trains on the first ``k`` observations and is scored on
+    the observations that follow it (up to the forecast horizon).
+    """
+    return list(range(min_train_size, n_points, max(1, step)))
+
+
+def backtest_series(
+    series_id: str,
+    df: pd.DataFrame,
+    methods: list[str] | None = None,
+    min_train_size: int = 8,
+    horizon: int = 4,
+    step: int = 1,
+) -> list[MethodScore]:
+    """
+    Walk-forward evaluation of each method on a single series.
+
+    Args:
+        series_id: Identifier reported in the scores
+        df: DataFrame with year, quarter, value columns
+        methods: Method names from FORECASTER_FACTORIES (default: all)
+        min_train_size: Observations in the first training window
+        horizon: Quarters forecast from each origin
+        step: Observations the origin advances between refits
+
+    Returns:
+        One MethodScore per method
+    """
+    methods = methods or list(FORECASTER_FACTORIES)
+    df = df.sort_values(["year", "quarter"]).reset_index(drop=True)
+    actual = df["value"].to_numpy(dtype=float)
+    origins = rolling_origins(len(df), min_train_size, step)
+
+    scores = []
+    for method in methods:
+        factory = FORECASTER_FACTORIES[method]
+        abs_pct_errors: list[float] = []
+        covered = 0
+        n_forecasts = 0
+        fit_seconds = 0.0
+        predict_seconds = 0.0
+        failures = 0
+
+        for origin in origins:
+            steps = min(horizon, len(df) - origin)
+            model = factory()
+            try:
+                started = time.perf_counter()
+                model.fit(df.iloc[:origin])
+                fit_seconds += time.perf_counter() - started
+
+                started = time.perf_counter()
+                predictions = model.predict(steps)
+                predict_seconds += time.perf_counter() - started
+            except (ValueError, MLError) as e:
+                logger.debug(f"Backtest {method} failed on {series_id} at origin {origin}: {e}")
+                failures += 1
+                continue
+
+            for offset, prediction in enumerate(predictions):
+                value = actual[origin + offset]
+                n_forecasts += 1
+                if value != 0:
+                    abs_pct_errors.append(abs(value - prediction["predicted_value"]) / abs(value))
+                if prediction["confidence_lower"] <= value <= prediction["confidence_upper"]:
+                    covered += 1
+
+        scores.append(
+            MethodScore(
+                series_id=series_id,
+                method=method,
+                n_origins=len(origins),
+                n_forecasts=n_forecasts,
+                mape=round(float(np.mean(abs_pct_errors)) * 100, 4)
+                if abs_pct_errors
+                else float("nan"),
+                coverage=round(covered / n_forecasts, 4) if n_forecasts else float("nan"),
+                fit_seconds=round(fit_seconds, 6),
+                predict_seconds=round(predict_seconds, 6),
+                failures=failures,
+            )
+        )
+
+    return scores
+
+
+def _backtest_task(args: tuple) -> list[MethodScore]:
+    """Process-pool entry point for backtest_series."""
+    return backtest_series(*args)
+
+
+def run_backtest(
+    series: dict[str, pd.DataFrame],
+    methods: list[str] | None = None,
+    min_train_size: int = 8,
+    horizon: int = 4,
+    step: int = 1,
+    max_workers: int | None = None,
+) -> BacktestReport:
+    """
+    Walk-forward backtest of every method across many series.
+
+    Series are evaluated in parallel worker processes when ``max_workers``
+    is greater than 1 (model fitting is CPU-bound).
+
+    Args:
+        series: Mapping of series id to year/quarter/value DataFrame
+        methods: Method names from FORECASTER_FACTORIES (default: all)
+        min_train_size: Observations in the first training window
+        horizon: Quarters forecast from each origin
+        step: Observations the origin advances between refits
+        max_workers: Worker processes (None or 1 = run in this process)
+
+    Returns:
+        BacktestReport with one score per series and method
+    """
+    methods = methods or list(FORECASTER_FACTORIES)
+    unknown = set(methods) - set(FORECASTER_FACTORIES)
+    if unknown:
+        raise ValueError(f"Unknown forecasting method(s): {', '.join(sorted(unknown))}")
+
+    started = time.perf_counter()
+    skipped = [sid for sid, df in series.items() if len(df) <= min_train_size]
+    tasks = [
+        (sid, df, methods, min_train_size, horizon, step)
+        for sid, df in series.items()
+        if len(df) > min_train_size
+    ]
+
+    scores: list[MethodScore] = []
+    if max_workers is not None and max_workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for result in executor.map(_backtest_task, tasks):
+                scores.extend(result)
+    else:
+        for task in tasks:
+            scores.extend(_backtest_task(task))
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Backtested {len(tasks)} series x {len(methods)} methods in {elapsed:.2f}s "
+        f"({len(skipped)} series too short)"
+    )
+    return BacktestReport(
+        scores=scores,
+        horizon=horizon,
+        min_train_size=min_train_size,
+        step=step,
+        elapsed_seconds=round(elapsed, 4),
+        skipped_series=skipped,
+    )
+
+
+def split_indicator_series(
+    df: pd.DataFrame,
+    kpi_columns: list[str] | None = None,
+    region_column: str | None = "region",
+) -> dict[str, pd.DataFrame]:
+    """
+    Split a wide indicator frame into year/quarter/value series.
+
+    Args:
+        df: Wide DataFrame with year, quarter, optional region and KPI columns
+        kpi_columns: KPI columns to split (default: all numeric non-key columns)
+        region_column: Region column, or None to average regions per period
+
+    Returns:
+        Mapping of "kpi" or "kpi/region" to a sorted series frame
+    """
+    if kpi_columns is None:
+        keys = {"year", "quarter", "id", region_column}
+        kpi_columns = [
+            c for c in df.select_dtypes(include="number").columns if c not in keys
+        ]
+
+    series: dict[str, pd.DataFrame] = {}
+    group_cols = ["year", "quarter"]
+    if region_column is not None and region_column in df.columns:
+        for region, region_df in df.groupby(region_column):
+            for kpi in kpi_columns:
+                frame = region_df[group_cols + [kpi]].dropna().rename(columns={kpi: "value"})
+                series[f"{kpi}/{region}"] = frame.sort_values(group_cols).reset_index(drop=True)
+    else:
+        national = df.groupby(group_cols)[kpi_columns].mean().reset_index()
+        for kpi in kpi_columns:
+            frame = national[group_cols + [kpi]].dropna().rename(columns={kpi: "value"})
+            series[kpi] = frame.reset_index(drop=True)
+    return series
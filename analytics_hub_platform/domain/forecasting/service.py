@@ -0,0 +1,260 @@
+"""
+Forecast Service Module
+Sustainable Economic Development Analytics Hub
+
+Request-time forecasting with a latency budget.
+
+The gradient boosting KPIForecaster (with quantile interval models) is the
+most accurate model but too slow to fit inside a page render. The service:
+- serves a cached gradient boosting forecast when one is fresh
+- otherwise starts the fit in a background executor and waits for it up to
+  the latency budget
+- if the budget runs out, returns an instant EnsembleForecaster result and
+  caches the gradient boosting forecast when the background fit completes,
+  so the next request for the same series gets it
+- remembers failed fits briefly, so a series the model rejects is served
+  the fallback without being resubmitted on every request
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from analytics_hub_platform.domain.advanced_analytics import EnsembleForecaster
+from analytics_hub_platform.domain.ml_services import KPIForecaster
+from analytics_hub_platform.infrastructure.caching import CacheManager
+from analytics_hub_platform.infrastructure.exceptions import MLError
+from analytics_hub_platform.infrastructure.settings import get_settings
+from analytics_hub_platform.infrastructure.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_MODEL = "ensemble"
+
+
+@dataclass
+class ServedForecast:
+    """Forecast served by ForecastService."""
+
+    predictions: list[dict[str, Any]]
+    model_type: str  # Model that produced the predictions
+    requested_model: str
+    from_cache: bool = False
+    pending: bool = False  # Requested model still training in the background
+    elapsed_seconds: float = 0.0
+
+    @property
+    def is_fallback(self) -> bool:
+        return self.model_type != self.requested_model
+
+
+def series_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Stable digest of a year/quarter/value series.
+
+    Two frames with the same observations (in any row order) share a
+    fingerprint, so cached forecasts survive re-aggregation of the data.
+    """
+    ordered = df.sort_values(["year", "quarter"])
+    digest = hashlib.sha256()
+    for column in ("year", "quarter", "value"):
+        digest.update(ordered[column].to_numpy(dtype=float).tobytes())
+    return digest.hexdigest()[:32]
+
+
+@traced(attributes={"component": "ml"})
+def _fit_and_predict(
+    df: pd.DataFrame, model_type: str, quarters_ahead: int
+) -> list[dict[str, Any]]:
+    """Fit a KPIForecaster and return its predictions (runs in the executor)."""
+    forecaster = KPIForecaster(model_type=model_type)
+    forecaster.fit(df)
+    return forecaster.predict(quarters_ahead=quarters_ahead)
+
+
+class ForecastService:
+    """
+    Deadline-aware facade over the KPI forecasters.
+
+    Background fits are de-duplicated per series, model and horizon, so
+    repeated requests while a model is training do not queue extra fits.
+    """
+
+    def __init__(
+        self,
+        latency_budget_seconds: float = 0.5,
+        max_workers: int = 2,
+        cache_ttl_seconds: int = 3600,
+        failure_ttl_seconds: int = 60,
+        cache: CacheManager | None = None,
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            latency_budget_seconds: How long a request waits for the model fit
+            max_workers: Background threads available for model fits
+            cache_ttl_seconds: How long a fitted forecast stays fresh
+            failure_ttl_seconds: How long a failed fit is remembered before retrying
+            cache: Cache for fitted forecasts (default: a private cache)
+        """
+        self.latency_budget_seconds = latency_budget_seconds
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self._cache = cache or CacheManager(default_ttl=cache_ttl_seconds, max_size=256)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="forecast")
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    def forecast(
+        self,
+        df: pd.DataFrame,
+        quarters_ahead: int = 8,
+        model_type: str = "gradient_boosting",
+        latency_budget_seconds: float | None = None,
+    ) -> ServedForecast:
+        """
+        Forecast a series within the latency budget.
+
+        Args:
+            df: DataFrame with year, quarter, value columns
+            quarters_ahead: Number of quarters to forecast
+            model_type: KPIForecaster model type to serve when ready
+            latency_budget_seconds: Override of the service budget
+
+        Returns:
+            ServedForecast from the requested model, or from the ensemble
+            fallback while the requested model trains
+        """
+        started = time.perf_counter()
+        budget = (
+            self.latency_budget_seconds
+            if latency_budget_seconds is None
+            else latency_budget_seconds
+        )
+        key = f"forecast:{model_type}:{quarters_ahead}:{series_fingerprint(df)}"
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return ServedForecast(
+                predictions=cached,
+                model_type=model_type,
+                requested_model=model_type,
+                from_cache=True,
+                elapsed_seconds=time.perf_counter() - started,
+            )
+
+        failure = self._cache.get(f"{key}:failed")
+        if failure is not None:
+            logger.debug(f"{model_type} fit failed recently, using {FALLBACK_MODEL}: {failure}")
+            return self._fallback(df, quarters_ahead, model_type, started, pending=False)
+
+        future = self._submit(key, df, model_type, quarters_ahead)
+        try:
+            predictions = future.result(timeout=max(0.0, budget))
+            return ServedForecast(
+                predictions=predictions,
+                model_type=model_type,
+                requested_model=model_type,
+                elapsed_seconds=time.perf_counter() - started,
+            )
+        except FutureTimeoutError:
+            pending = True
+        except (MLError, ValueError) as e:
+            logger.info(f"{model_type} forecast unavailable, using {FALLBACK_MODEL}: {e}")
+            pending = False
+
+        return self._fallback(df, quarters_ahead, model_type, started, pending)
+
+    def _fallback(
+        self,
+        df: pd.DataFrame,
+        quarters_ahead: int,
+        model_type: str,
+        started: float,
+        pending: bool,
+    ) -> ServedForecast:
+        """Serve the instant ensemble forecast in place of the requested model."""
+        predictions = EnsembleForecaster().fit(df).predict(quarters_ahead)
+        return ServedForecast(
+            predictions=predictions,
+            model_type=FALLBACK_MODEL,
+            requested_model=model_type,
+            pending=pending,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    def _submit(self, key: str, df: pd.DataFrame, model_type: str, quarters_ahead: int) -> Future:
+        """Start (or join) the background fit for a cache key."""
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._executor.submit(_fit_and_predict, df.copy(), model_type, quarters_ahead)
+            self._pending[key] = future
+        # Registered outside the lock: the callback runs inline if the fit already finished
+        future.add_done_callback(lambda f: self._on_fit_done(key, f))
+        return future
+
+    def _on_fit_done(self, key: str, future: Future) -> None:
+        """Cache a finished background fit so later requests are served from it."""
+        try:
+            if not future.cancelled():
+                error = future.exception()
+                if error is None:
+                    self._cache.set(key, future.result(), self.cache_ttl_seconds)
+                else:
+                    logger.debug(f"Background forecast {key} failed: {error}")
+                    self._cache.set(f"{key}:failed", str(error), self.failure_ttl_seconds)
+        finally:
+            # Only drop the in-flight entry once the result is in the cache
+            with self._idle:
+                self._pending.pop(key, None)
+                self._idle.notify_all()
+
+    def wait_pending(self, timeout: float | None = None) -> bool:
+        """
+        Wait for in-flight background fits to finish and be cached.
+
+        Returns:
+            True if none are left running
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def shutdown(self) -> None:
+        """Stop the background executor, abandoning queued fits."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global service instance
+_service_instance: ForecastService | None = None
+_service_lock = threading.Lock()
+
+
+def get_forecast_service() -> ForecastService:
+    """
+    Get the global forecast service instance.
+
+    Returns:
+        ForecastService configured from settings
+    """
+    global _service_instance
+    with _service_lock:
+        if _service_instance is None:
+            settings = get_settings()
+            _service_instance = ForecastService(
+                latency_budget_seconds=settings.forecast_latency_budget_seconds,
+                max_workers=settings.forecast_max_workers,
+                cache_ttl_seconds=settings.forecast_cache_ttl_seconds,
+                failure_ttl_seconds=settings.forecast_failure_ttl_seconds,
+            )
+        return _service_instance
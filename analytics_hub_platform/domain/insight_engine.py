@@ -12,7 +12,10 @@ Provides automated insight generation by combining:
 Generates prioritized, actionable insights with natural language summaries.
 """
 
+import contextvars
 import logging
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -22,15 +25,18 @@ import pandas as pd
 
 from analytics_hub_platform.domain.advanced_analytics import (
     PatternRecognitionResult,
+    PatternRecognizer,
+    PreparedSeries,
+    SeasonalityResult,
     TrendDirection,
     SeasonalityType,
-    analyze_patterns,
 )
 from analytics_hub_platform.domain.ml_services import (
+    AnomalyDetector,
     AnomalySeverity,
     AnomalyResult,
-    detect_kpi_anomalies,
 )
+from analytics_hub_platform.infrastructure.tracing import start_span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +127,8 @@ class InsightReport:
     by_priority: dict[str, int]
     by_type: dict[str, int]
     by_category: dict[str, int]
+    partial: bool = False  # True when the deadline expired before all KPIs finished
+    skipped_kpis: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -133,6 +141,8 @@ class InsightReport:
             "by_priority": self.by_priority,
             "by_type": self.by_type,
             "by_category": self.by_category,
+            "partial": self.partial,
+            "skipped_kpis": self.skipped_kpis,
         }
 
 
@@ -546,6 +556,8 @@ class InsightEngine:
         self.change_point_generator = ChangePointInsightGenerator()
         self.target_generator = TargetGapInsightGenerator()
         self.milestone_generator = MilestoneInsightGenerator()
+        self.pattern_recognizer = PatternRecognizer()
+        self.anomaly_detector = AnomalyDetector(zscore_threshold=2.5)
 
     def generate_insights(
         self,
@@ -556,10 +568,14 @@ class InsightEngine:
         target_value: float | None = None,
         higher_is_better: bool = True,
         region_id: str | None = None,
+        seasonality: SeasonalityResult | None = None,
     ) -> list[Insight]:
         """
         Generate all insights for a single KPI.
 
+        The series is sorted once into a PreparedSeries that is shared by
+        pattern recognition, anomaly detection and the value lookups below.
+
         Args:
             kpi_id: KPI identifier
             kpi_name: Human-readable KPI name
@@ -568,6 +584,7 @@ class InsightEngine:
             target_value: Optional target value for comparison
             higher_is_better: Whether higher values are better
             region_id: Optional region identifier
+            seasonality: Optional precomputed seasonality for this series
 
         Returns:
             List of Insight objects
@@ -583,8 +600,10 @@ class InsightEngine:
         if data.empty or len(data) < 4:
             return insights
 
+        series = PreparedSeries.from_frame(data)
+
         # Run pattern recognition
-        pattern_result = analyze_patterns(data)
+        pattern_result = self.pattern_recognizer.analyze(series, seasonality=seasonality)
 
         # Generate trend insights
         insights.extend(
@@ -609,29 +628,12 @@ class InsightEngine:
 
         # Run anomaly detection
         try:
-            anomaly_dicts = detect_kpi_anomalies(
-                df=data,
+            anomalies = self.anomaly_detector.detect_anomalies(
+                series,
                 kpi_id=kpi_id,
                 region_id=region_id or "all",
                 higher_is_better=higher_is_better,
             )
-            # Convert dicts back to AnomalyResult objects
-            anomalies = [
-                AnomalyResult(
-                    kpi_id=a["kpi_id"],
-                    region_id=a["region_id"],
-                    year=a["year"],
-                    quarter=a["quarter"],
-                    actual_value=a["actual_value"],
-                    expected_value=a["expected_value"],
-                    deviation=a["deviation"],
-                    z_score=a["z_score"],
-                    severity=AnomalySeverity(a["severity"]),
-                    direction=a["direction"],
-                    description=a["description"],
-                )
-                for a in anomaly_dicts
-            ]
             insights.extend(
                 self.anomaly_generator.generate(
                     kpi_id, kpi_name, cat_enum, anomalies, region_id
@@ -642,7 +644,7 @@ class InsightEngine:
 
         # Generate target gap insights
         if target_value is not None:
-            current_value = float(data.iloc[-1]["value"])
+            current_value = float(series.values[-1])
             insights.extend(
                 self.target_generator.generate(
                     kpi_id, kpi_name, cat_enum,
@@ -651,9 +653,9 @@ class InsightEngine:
             )
 
         # Generate milestone insights
-        if len(data) >= 2:
-            current_value = float(data.iloc[-1]["value"])
-            previous_value = float(data.iloc[-2]["value"])
+        if len(series) >= 2:
+            current_value = float(series.values[-1])
+            previous_value = float(series.values[-2])
             insights.extend(
                 self.milestone_generator.generate(
                     kpi_id, kpi_name, cat_enum,
@@ -663,34 +665,67 @@ class InsightEngine:
 
         return insights
 
+    @traced(attributes={"component": "insights"})
     def generate_report(
         self,
         kpis: list[dict[str, Any]],
         period: str = "Current",
+        max_workers: int | None = None,
+        deadline_seconds: float | None = None,
+        use_processes: bool = False,
+        chunk_size: int = 1,
     ) -> InsightReport:
         """
         Generate a complete insight report for multiple KPIs.
 
+        Each KPI configuration (one KPI, optionally for one region) is an
+        independent task. With ``max_workers`` > 1 the tasks are fanned out
+        over a thread pool (or a process pool with ``use_processes``) in
+        chunks of ``chunk_size``. If ``deadline_seconds`` expires first, the
+        report is built from the KPIs that finished and flagged as partial.
+
+        The deadline bounds how long the caller waits, not how long the work
+        runs: chunks not yet started are cancelled, but chunks still running
+        when it passes keep their pool threads (or processes) until they
+        finish, and their results are discarded.
+
         Args:
             kpis: List of KPI configurations with data
             period: Period label for the report
+            max_workers: Worker count for concurrent execution (None = serial)
+            deadline_seconds: Optional time budget for insight generation
+            use_processes: Use a process pool instead of threads
+            chunk_size: Number of KPI configurations per submitted task
 
         Returns:
             InsightReport with all insights and summary
         """
+        started = time.monotonic()
+        results: list[list[Insight] | None] = [None] * len(kpis)
+
+        if max_workers is None or max_workers <= 1:
+            for idx, kpi in enumerate(kpis):
+                if deadline_seconds is not None and time.monotonic() - started > deadline_seconds:
+                    break
+                results[idx] = self._generate_for_config(kpi)
+        else:
+            self._generate_concurrently(
+                kpis, results, max_workers, deadline_seconds, use_processes, max(1, chunk_size)
+            )
+
         all_insights: list[Insight] = []
+        skipped_kpis: list[str] = []
+        for kpi, insights in zip(kpis, results, strict=True):
+            if insights is None:
+                skipped_kpis.append(kpi.get("id", "unknown"))
+            else:
+                all_insights.extend(insights)
 
-        for kpi in kpis:
-            insights = self.generate_insights(
-                kpi_id=kpi.get("id", "unknown"),
-                kpi_name=kpi.get("name", "Unknown KPI"),
-                category=kpi.get("category", "economic"),
-                data=kpi.get("data", pd.DataFrame()),
-                target_value=kpi.get("target"),
-                higher_is_better=kpi.get("higher_is_better", True),
-                region_id=kpi.get("region_id"),
+        if skipped_kpis:
+            logger.warning(
+                f"Insight report deadline of {deadline_seconds}s reached; "
+                f"{len(skipped_kpis)}/{len(kpis)} KPI(s) skipped"
             )
-            all_insights.extend(insights)
 
         # Sort by priority
         priority_order = {
@@ -724,8 +759,71 @@ class InsightEngine:
             by_priority=by_priority,
             by_type=by_type,
             by_category=by_category,
+            partial=bool(skipped_kpis),
+            skipped_kpis=skipped_kpis,
         )
 
+    def _generate_for_config(self, kpi: dict[str, Any]) -> list[Insight]:
+        """Generate insights for one KPI configuration from generate_report."""
+        kpi_id = kpi.get("id", "unknown")
+        with start_span("InsightEngine.generate_insights", {"kpi_id": kpi_id}):
+            return self.generate_insights(
+                kpi_id=kpi_id,
+                kpi_name=kpi.get("name", "Unknown KPI"),
+                category=kpi.get("category", "economic"),
+                data=kpi.get("data", pd.DataFrame()),
+                target_value=kpi.get("target"),
+                higher_is_better=kpi.get("higher_is_better", True),
+                region_id=kpi.get("region_id"),
+                seasonality=kpi.get("seasonality"),
+            )
+
+    def _generate_concurrently(
+        self,
+        kpis: list[dict[str, Any]],
+        results: list[list[Insight] | None],
+        max_workers: int,
+        deadline_seconds: float | None,
+        use_processes: bool,
+        chunk_size: int,
+    ) -> None:
+        """Fan KPI configurations out over a pool, filling ``results`` in place."""
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="insight-engine"
+            )
+
+        futures: dict[Future, range] = {}
+        try:
+            for start in range(0, len(kpis), chunk_size):
+                indices = range(start, min(start + chunk_size, len(kpis)))
+                chunk = [kpis[i] for i in indices]
+                if use_processes:
+                    future = executor.submit(_generate_insights_chunk, chunk)
+                else:
+                    # Run in a copy of the caller's context so spans nest under the request
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        lambda c=chunk: [self._generate_for_config(k) for k in c],
+                    )
+                futures[future] = indices
+
+            done, _ = wait(futures, timeout=deadline_seconds)
+            for future in done:
+                try:
+                    chunk_results = future.result()
+                except Exception as e:
+                    logger.warning(f"Insight generation failed for KPI chunk: {e}")
+                    chunk_results = [[] for _ in futures[future]]
+                for idx, insights in zip(futures[future], chunk_results, strict=True):
+                    results[idx] = insights
+        finally:
+            # Do not block on stragglers once the deadline has passed
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _generate_summary(
         self,
         insights: list[Insight],
@@ -754,6 +852,12 @@ class InsightEngine:
         return " ".join(parts)
 
 
+def _generate_insights_chunk(kpis: list[dict[str, Any]]) -> list[list[Insight]]:
+    """Process-pool entry point: generate insights for a chunk of KPI configurations."""
+    engine = InsightEngine()
+    return [engine._generate_for_config(kpi) for kpi in kpis]
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -787,6 +891,8 @@ def generate_kpi_insights(
 def generate_insight_report(
     kpis: list[dict[str, Any]],
     period: str = "Current",
+    max_workers: int | None = None,
+    deadline_seconds: float | None = None,
 ) -> dict[str, Any]:
     """
     Convenience function to generate a full insight report.
@@ -794,5 +900,10 @@ def generate_insight_report(
     Returns report dictionary.
     """
     engine = InsightEngine()
-    report = engine.generate_report(kpis=kpis, period=period)
+    report = engine.generate_report(
+        kpis=kpis,
+        period=period,
+        max_workers=max_workers,
+        deadline_seconds=deadline_seconds,
+    )
     return report.to_dict()
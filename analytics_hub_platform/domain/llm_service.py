@@ -5,16 +5,37 @@ Eng. Sultan Albuqami
 
 This module provides LLM-based recommendation generation
 using OpenAI or Anthropic APIs with robust error handling.
+
+Recommendations for many scopes (e.g. regions) can be generated
+asynchronously: scopes are packed several to a prompt and the prompts
+run concurrently up to a limit, instead of one blocking call per scope.
+
+Prompt context is normalized (values rounded to a few significant digits,
+anomalies ranked and truncated) so requests for effectively identical
+states share a cache key. Responses are cached in memory and in an
+on-disk store that survives restarts.
+
+Recommendations can also be streamed: the response JSON is parsed
+incrementally and each summary, insight, recommendation and risk alert is
+emitted as soon as it is complete, so the UI can show content before the
+whole completion has arrived.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import math
 import os
+import queue
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import httpx
 
 # Type stubs for optional imports
 if TYPE_CHECKING:
@@ -48,11 +69,174 @@ except ImportError:
     APIError: Any = Exception  # type: ignore[misc]
     AnthropicTimeoutError: Any = Exception  # type: ignore[misc]
 
-from analytics_hub_platform.infrastructure.caching import get_cache_manager
+from analytics_hub_platform.infrastructure.caching import PersistentCache, get_cache_manager
+from analytics_hub_platform.infrastructure.observability import get_metrics, increment_counter
+from analytics_hub_platform.infrastructure.retry import retry_with_backoff_async
 from analytics_hub_platform.infrastructure.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# HTTP statuses worth retrying (rate limits and transient server errors)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class RetryableLLMError(Exception):
+    """Transient LLM API failure that may succeed on retry."""
+
+
+def _secret_value(value: Any) -> str:
+    """Return the plain string of an API key that may be a pydantic SecretStr."""
+    if value is None or isinstance(value, str):
+        return value or ""
+    return value.get_secret_value()
+
+
+# =============================================================================
+# CONTEXT NORMALIZATION
+# =============================================================================
+
+SEVERITY_RANK = {"critical": 0, "high": 1, "warning": 2, "medium": 3, "low": 4, "info": 5}
+
+
+def _round_significant(value: float, digits: int) -> float | None:
+    """Round to ``digits`` significant digits (NaN/inf become None)."""
+    if not math.isfinite(value):
+        return None
+    return float(f"{value:.{digits}g}")
+
+
+def _normalize_value(value: Any, digits: int) -> Any:
+    """Recursively round floats so rounding noise does not change the payload."""
+    if isinstance(value, float):
+        return _round_significant(value, digits)
+    if isinstance(value, dict):
+        return {str(k): _normalize_value(v, digits) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_value(v, digits) for v in value]
+    if hasattr(value, "item") and callable(value.item):  # NumPy scalars
+        return _normalize_value(value.item(), digits)
+    return value
+
+
+def _anomaly_rank(anomaly: dict[str, Any]) -> tuple:
+    """Most severe and largest deviations first, then a stable tiebreak."""
+    severity = str(anomaly.get("severity", "")).lower()
+    magnitude = anomaly.get("z_score") or anomaly.get("deviation_percent") or 0
+    try:
+        magnitude = abs(float(magnitude))
+    except (TypeError, ValueError):
+        magnitude = 0.0
+    return (
+        SEVERITY_RANK.get(severity, len(SEVERITY_RANK)),
+        -magnitude,
+        json.dumps(anomaly, sort_keys=True, default=str),
+    )
+
+
+def _forecast_rank(forecast: dict[str, Any]) -> tuple:
+    """Chronological order where periods are present."""
+    return (
+        forecast.get("year") or 0,
+        forecast.get("quarter") or 0,
+        json.dumps(forecast, sort_keys=True, default=str),
+    )
+
+
+def normalize_llm_context(
+    kpi_data: dict[str, Any],
+    anomalies: list[dict[str, Any]],
+    forecasts: list[dict[str, Any]],
+    significant_digits: int | None = None,
+    max_anomalies: int | None = None,
+    max_forecasts: int | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Canonical form of the recommendation context.
+
+    Floats are rounded to a few significant digits, anomalies are ordered by
+    severity and magnitude and truncated to the top N, and forecasts are
+    ordered chronologically and truncated. The result is used both for the
+    prompt and for the cache key, so a cached answer always corresponds to
+    the prompt that would have been sent.
+
+    Args:
+        kpi_data: KPI data dictionary
+        anomalies: Detected anomalies
+        forecasts: Forecast results
+        significant_digits: Digits kept (default: settings.llm_cache_significant_digits)
+        max_anomalies: Anomalies kept (default: settings.llm_max_anomalies)
+        max_forecasts: Forecasts kept (default: settings.llm_max_forecasts)
+
+    Returns:
+        Normalized (kpi_data, anomalies, forecasts)
+    """
+    settings = get_settings()
+    digits = significant_digits or settings.llm_cache_significant_digits
+    max_anomalies = settings.llm_max_anomalies if max_anomalies is None else max_anomalies
+    max_forecasts = settings.llm_max_forecasts if max_forecasts is None else max_forecasts
+
+    norm_kpi = _normalize_value(kpi_data, digits)
+    norm_anomalies = sorted((_normalize_value(a, digits) for a in anomalies), key=_anomaly_rank)
+    norm_forecasts = sorted((_normalize_value(f, digits) for f in forecasts), key=_forecast_rank)
+    return norm_kpi, norm_anomalies[:max_anomalies], norm_forecasts[:max_forecasts]
+
+
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+_response_store: PersistentCache | None = None
+_response_store_lock = threading.Lock()
+
+
+def get_llm_response_store() -> PersistentCache | None:
+    """
+    On-disk LLM response store configured by settings.llm_cache_path.
+
+    Returns:
+        PersistentCache, or None when persistence is disabled or unavailable
+    """
+    global _response_store
+    settings = get_settings()
+    if not settings.llm_cache_path:
+        return None
+
+    with _response_store_lock:
+        if _response_store is None or str(_response_store.path) != settings.llm_cache_path:
+            try:
+                _response_store = PersistentCache(
+                    settings.llm_cache_path, default_ttl=settings.llm_persistent_cache_ttl
+                )
+            except OSError as e:
+                logger.warning(f"LLM response store unavailable: {e}")
+                return None
+        return _response_store
+
+
+def get_llm_cache_stats() -> dict[str, Any]:
+    """
+    Hit counts and hit rate of the LLM response cache.
+
+    Returns:
+        Dictionary with memory_hits, disk_hits, misses, lookups and hit_rate (%)
+    """
+    metrics = get_metrics()
+    counts = {
+        tier: int(metrics.get_counter("llm_cache_lookups_total", {"result": tier}))
+        for tier in ("memory_hit", "disk_hit", "miss")
+    }
+    lookups = sum(counts.values())
+    hits = counts["memory_hit"] + counts["disk_hit"]
+    return {
+        "memory_hits": counts["memory_hit"],
+        "disk_hits": counts["disk_hit"],
+        "misses": counts["miss"],
+        "lookups": lookups,
+        "hit_rate": round(hits / lookups * 100, 2) if lookups else 0.0,
+    }
+
 
 @dataclass
 class Recommendation:
@@ -81,9 +265,156 @@ class LLMResponse:
     generated_at: datetime
 
 
+@dataclass
+class StreamEvent:
+    """One incremental piece of a streamed recommendation response."""
+
+    event: str  # executive_summary, key_insight, recommendation, risk_alert, error, done
+    data: Any
+
+    def to_sse(self) -> str:
+        """Encode the event as a server-sent events message."""
+        payload = json.dumps(self.data, default=str, ensure_ascii=False)
+        return f"event: {self.event}\ndata: {payload}\n\n"
+
+
+# Top-level response fields emitted while streaming, and their event names
+STREAM_EVENTS = {
+    "executive_summary": "executive_summary",
+    "key_insights": "key_insight",
+    "recommendations": "recommendation",
+    "risk_alerts": "risk_alert",
+}
+
+
+class IncrementalResponseParser:
+    """
+    Incremental parser for a streamed recommendation JSON object.
+
+    Text is fed as it arrives. The executive summary and every element of
+    the list fields are emitted as soon as their closing character is seen,
+    without waiting for the rest of the document. Text before the opening
+    brace (such as a markdown fence) and after the closing brace is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._started = False
+        self._finished = False
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._key: str | None = None
+        self._expect_value = False
+        self._element_start: int | None = None
+        self._recommendations = 0
+
+    def feed(self, text: str) -> list[StreamEvent]:
+        """
+        Consume the next piece of response text.
+
+        Args:
+            text: Newly received text
+
+        Returns:
+            Events completed by this piece (possibly none)
+        """
+        self._buffer += text
+        events: list[StreamEvent] = []
+
+        for i in range(self._pos, len(self._buffer)):
+            if self._finished:
+                break
+            char = self._buffer[i]
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._on_string(self._buffer[self._string_start : i + 1], events)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                if self._depth == 2 and self._element_start is None:
+                    self._element_start = i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 2 and self._element_start is not None:
+                    self._emit(self._buffer[self._element_start : i + 1], events)
+                    self._element_start = None
+                elif self._depth == 0:
+                    self._finished = True
+            elif self._depth == 1:
+                if char == ":":
+                    self._expect_value = True
+                elif char == ",":
+                    self._key = None
+                    self._expect_value = False
+
+        self._pos = len(self._buffer)
+        return events
+
+    def _on_string(self, raw: str, events: list[StreamEvent]) -> None:
+        """Handle a completed string literal: a key, a field value or a list element."""
+        if self._depth == 1:
+            if self._expect_value:
+                self._emit(raw, events)
+            else:
+                self._key = json.loads(raw)
+        elif self._depth == 2 and self._element_start is None:
+            self._emit(raw, events)
+
+    def _emit(self, raw: str, events: list[StreamEvent]) -> None:
+        """Decode a completed value of a streamed field and record its event."""
+        event = STREAM_EVENTS.get(self._key or "")
+        if event is None:
+            return
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+
+        if event == "recommendation":
+            if not isinstance(value, dict):
+                return
+            value = asdict(_recommendation_from_data(value, self._recommendations))
+            self._recommendations += 1
+        elif not isinstance(value, str):
+            return
+        events.append(StreamEvent(event, value))
+
+
+@dataclass
+class RecommendationRequest:
+    """Context for one scope (e.g. a region) in a batched recommendation run."""
+
+    request_id: str
+    kpi_data: dict[str, Any]
+    anomalies: list[dict[str, Any]] = field(default_factory=list)
+    forecasts: list[dict[str, Any]] = field(default_factory=list)
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    provider_name = "base"
+    cache_responses = True
+
     @abstractmethod
     def generate_recommendations(
         self,
@@ -94,6 +425,218 @@ class BaseLLMProvider(ABC):
     ) -> LLMResponse:
         pass
 
+    # -------------------------------------------------------------------------
+    # Async interface
+    # -------------------------------------------------------------------------
+
+    async def agenerate_recommendations(
+        self,
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        language: str = "en",
+    ) -> LLMResponse:
+        """
+        Async variant of generate_recommendations.
+
+        Runs the blocking call in a worker thread so the event loop stays
+        free; HTTP providers override this with native async calls.
+        """
+        return await asyncio.to_thread(
+            self.generate_recommendations, kpi_data, anomalies, forecasts, language
+        )
+
+    async def agenerate_batch(
+        self,
+        requests: list[RecommendationRequest],
+        language: str = "en",
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, LLMResponse]:
+        """
+        Generate recommendations for many scopes concurrently.
+
+        At most ``max_concurrency`` scopes are generated at once. HTTP
+        providers override this to pack ``batch_size`` scopes to a prompt.
+
+        Args:
+            requests: Scopes to generate recommendations for
+            language: Response language ("en" or "ar")
+            batch_size: Scopes per prompt, 1 disables batching (default: settings.llm_batch_size)
+            max_concurrency: Maximum concurrent API calls (default: settings.llm_max_concurrency)
+
+        Returns:
+            Mapping of request_id to LLMResponse
+        """
+        settings = get_settings()
+        batch_size = batch_size or settings.llm_batch_size
+        max_concurrency = max_concurrency or settings.llm_max_concurrency
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_single(request: RecommendationRequest) -> LLMResponse:
+            async with semaphore:
+                return await self.agenerate_recommendations(
+                    request.kpi_data, request.anomalies, request.forecasts, language
+                )
+
+        responses = await asyncio.gather(*(run_single(r) for r in requests))
+        return {r.request_id: resp for r, resp in zip(requests, responses, strict=True)}
+
+    # -------------------------------------------------------------------------
+    # Streaming interface
+    # -------------------------------------------------------------------------
+
+    def _streaming_available(self) -> bool:
+        """Whether the provider can stream its answer as it is generated."""
+        return False
+
+    @abstractmethod
+    async def _astream_content(
+        self,
+        client: httpx.AsyncClient,
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        language: str,
+    ) -> AsyncIterator[str]:
+        """Yield the raw response text for one request as it is generated."""
+        # The bare yield makes this an async generator, like its implementations
+        return
+        yield
+
+    async def astream_recommendations(
+        self,
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        language: str = "en",
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Stream recommendations as they are generated.
+
+        Yields an event for the executive summary and for each insight,
+        recommendation and risk alert as soon as it has been parsed, then a
+        final "done" event carrying the complete response dictionary. Cached
+        responses, and providers that cannot stream, are replayed at once.
+
+        Args:
+            kpi_data: Dictionary of KPI data
+            anomalies: List of detected anomalies
+            forecasts: List of forecast results
+            language: Response language ("en" or "ar")
+
+        Yields:
+            StreamEvent objects, ending with "done"
+        """
+        cache_key = self._get_cache_key(kpi_data, anomalies, forecasts, language)
+        cached = self._cached_response(cache_key) if self.cache_responses else None
+        if cached:
+            for event in _response_events(cached):
+                yield event
+            return
+
+        if not self._streaming_available():
+            response = await self.agenerate_recommendations(
+                kpi_data, anomalies, forecasts, language
+            )
+            for event in _response_events(response):
+                yield event
+            return
+
+        parser = IncrementalResponseParser()
+        chunks: list[str] = []
+        try:
+            async with httpx.AsyncClient(timeout=self._timeout_seconds()) as client:
+                async for text in self._astream_content(
+                    client, kpi_data, anomalies, forecasts, language
+                ):
+                    chunks.append(text)
+                    for event in parser.feed(text):
+                        yield event
+        except Exception as e:
+            logger.error(f"{self.provider_name} streaming request failed: {str(e)}, falling back")
+            yield StreamEvent("error", str(e))
+            fallback = self._fallback_response(language, error=str(e))
+            yield StreamEvent("done", _response_to_dict(fallback))
+            return
+
+        response = self._parse_response("".join(chunks), self.provider_name, self._model_name())
+        if self.cache_responses:
+            self._store_response(cache_key, response)
+        yield StreamEvent("done", _response_to_dict(response))
+
+    def _get_cache_key(
+        self,
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        language: str,
+    ) -> str:
+        """Generate cache key for request from the normalized context."""
+        norm_kpi, norm_anomalies, norm_forecasts = normalize_llm_context(
+            kpi_data, anomalies, forecasts
+        )
+        data_str = json.dumps(
+            {
+                "kpi": norm_kpi,
+                "anomalies": norm_anomalies,
+                "forecasts": norm_forecasts,
+                "language": language,
+                "provider": self.provider_name,
+                "model": self._model_name(),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return f"llm_recommendations_{hashlib.sha256(data_str.encode()).hexdigest()[:32]}"
+
+    def _request_cache_key(self, request: RecommendationRequest, language: str) -> str:
+        """Cache key of one scope (shared by single and batched calls)."""
+        return self._get_cache_key(
+            request.kpi_data, request.anomalies, request.forecasts, language
+        )
+
+    def _cached_response(self, cache_key: str) -> LLMResponse | None:
+        """Look a response up in memory, then on disk (promoting disk hits)."""
+        cache_manager = get_cache_manager()
+        cached = cache_manager.get(cache_key)
+        if cached:
+            increment_counter("llm_cache_lookups_total", labels={"result": "memory_hit"})
+            return cached
+
+        store = get_llm_response_store()
+        stored = store.get(cache_key) if store is not None else None
+        if stored:
+            try:
+                response = _response_from_dict(stored)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Discarding unreadable stored LLM response: {e}")
+            else:
+                increment_counter("llm_cache_lookups_total", labels={"result": "disk_hit"})
+                cache_manager.set(cache_key, response, ttl=get_settings().llm_cache_ttl)
+                return response
+
+        increment_counter("llm_cache_lookups_total", labels={"result": "miss"})
+        return None
+
+    def _store_response(self, cache_key: str, response: LLMResponse) -> None:
+        """Cache a successful response in memory and on disk."""
+        settings = get_settings()
+        get_cache_manager().set(cache_key, response, ttl=settings.llm_cache_ttl)
+        store = get_llm_response_store()
+        if store is not None:
+            store.set(cache_key, _response_to_dict(response))
+
+    def _timeout_seconds(self) -> float:
+        return float(getattr(self, "timeout", 30))
+
+    def _model_name(self) -> str:
+        return str(getattr(self, "model", "unknown"))
+
+    def _fallback_response(self, language: str, error: str | None = None) -> LLMResponse:
+        """Response used when the provider cannot answer."""
+        return MockLLMProvider().generate_recommendations({}, [], [], language)
+
     def _build_system_prompt(self, language: str) -> str:
         """Build the system prompt for recommendation generation."""
         if language == "ar":
@@ -154,53 +697,112 @@ Provide your response in JSON format with the following structure:
         else:
             prompt = "Analyze the following data and provide strategic recommendations:\n\n"
 
-        prompt += f"## KPI Data\n{json.dumps(kpi_data, indent=2, default=str)}\n\n"
+        return prompt + self._build_context_sections(kpi_data, anomalies, forecasts, "##")
+
+    @staticmethod
+    def _build_context_sections(
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        heading: str,
+    ) -> str:
+        """Format the normalized KPI data, anomalies and forecasts as prompt sections."""
+        kpi_data, anomalies, forecasts = normalize_llm_context(kpi_data, anomalies, forecasts)
+        sections = f"{heading} KPI Data\n{json.dumps(kpi_data, indent=2, default=str)}\n\n"
 
         if anomalies:
-            prompt += f"## Detected Anomalies\n{json.dumps(anomalies, indent=2, default=str)}\n\n"
+            sections += (
+                f"{heading} Detected Anomalies\n{json.dumps(anomalies, indent=2, default=str)}\n\n"
+            )
 
         if forecasts:
-            prompt += f"## Forecasts\n{json.dumps(forecasts, indent=2, default=str)}\n\n"
+            sections += f"{heading} Forecasts\n{json.dumps(forecasts, indent=2, default=str)}\n\n"
+
+        return sections
+
+    def _build_batch_system_prompt(self, language: str) -> str:
+        """System prompt asking for one answer object per scope."""
+        if language == "ar":
+            instruction = (
+                "\n\nستتلقى عدة نطاقات لكل منها معرّف. أعد كائن JSON واحداً يربط كل معرّف "
+                "نطاق بكائن له الهيكل أعلاه."
+            )
+        else:
+            instruction = (
+                "\n\nYou will receive several scopes, each with an id. Return a single JSON "
+                "object that maps every scope id to an object with the structure above."
+            )
+        return self._build_system_prompt(language) + instruction
+
+    def _build_batch_user_prompt(
+        self, requests: list[RecommendationRequest], language: str
+    ) -> str:
+        """User prompt with the context of several scopes."""
+        if language == "ar":
+            prompt = "حلل بيانات كل نطاق من النطاقات التالية وقدم توصيات استراتيجية لكل منها:\n\n"
+        else:
+            prompt = (
+                "Analyze the data of each of the following scopes and provide strategic "
+                "recommendations for each one:\n\n"
+            )
 
+        for request in requests:
+            prompt += f"## Scope: {request.request_id}\n\n"
+            prompt += self._build_context_sections(
+                request.kpi_data, request.anomalies, request.forecasts, "###"
+            )
         return prompt
 
+    @staticmethod
+    def _extract_json(content: str) -> Any:
+        """Extract the JSON payload from a (possibly fenced) response."""
+        if "```json" in content:
+            json_str = content.split("```json")[1].split("```")[0]
+        elif "```" in content:
+            json_str = content.split("```")[1].split("```")[0]
+        else:
+            json_str = content
+
+        return json.loads(json_str.strip())
+
+    @staticmethod
+    def _response_from_data(data: dict[str, Any], provider: str, model: str) -> LLMResponse:
+        """Build an LLMResponse from one parsed answer object."""
+        return LLMResponse(
+            executive_summary=data.get("executive_summary", ""),
+            key_insights=data.get("key_insights", []),
+            recommendations=[
+                _recommendation_from_data(rec, index)
+                for index, rec in enumerate(data.get("recommendations", []))
+            ],
+            risk_alerts=data.get("risk_alerts", []),
+            provider=provider,
+            model=model,
+            generated_at=datetime.now(),
+        )
+
+    def _parse_batch_response(
+        self, content: str, request_ids: list[str], provider: str, model: str
+    ) -> dict[str, LLMResponse]:
+        """
+        Parse a batched answer into one LLMResponse per scope.
+
+        Scopes missing from the answer are left out of the result.
+        """
+        data = self._extract_json(content)
+        if not isinstance(data, dict):
+            raise ValueError("Batched response is not a JSON object")
+
+        return {
+            request_id: self._response_from_data(data[request_id], provider, model)
+            for request_id in request_ids
+            if isinstance(data.get(request_id), dict)
+        }
+
     def _parse_response(self, content: str, provider: str, model: str) -> LLMResponse:
         """Parse LLM response into structured format."""
         try:
-            # Try to extract JSON from response
-            if "```json" in content:
-                json_str = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                json_str = content.split("```")[1].split("```")[0]
-            else:
-                json_str = content
-
-            data = json.loads(json_str.strip())
-
-            recommendations = []
-            for rec in data.get("recommendations", []):
-                recommendations.append(
-                    Recommendation(
-                        id=rec.get("id", f"rec_{len(recommendations)}"),
-                        title=rec.get("title", ""),
-                        description=rec.get("description", ""),
-                        priority=rec.get("priority", "medium"),
-                        category=rec.get("category", "economic"),
-                        impact=rec.get("impact", ""),
-                        timeline=rec.get("timeline", ""),
-                        kpis_affected=rec.get("kpis_affected", []),
-                    )
-                )
-
-            return LLMResponse(
-                executive_summary=data.get("executive_summary", ""),
-                key_insights=data.get("key_insights", []),
-                recommendations=recommendations,
-                risk_alerts=data.get("risk_alerts", []),
-                provider=provider,
-                model=model,
-                generated_at=datetime.now(),
-            )
+            return self._response_from_data(self._extract_json(content), provider, model)
         except Exception as e:
             # Return a basic response if parsing fails
             return LLMResponse(
@@ -214,7 +816,259 @@ Provide your response in JSON format with the following structure:
             )
 
 
-class OpenAIProvider(BaseLLMProvider):
+class HTTPLLMProvider(BaseLLMProvider):
+    """
+    Base class for providers whose API is called over HTTP.
+
+    Subclasses implement ``_acomplete`` and ``_astream_completion`` for one
+    prompt; the async single, batched and streaming paths are built on them.
+    Without an API key the blocking (fallback) path of BaseLLMProvider is
+    used instead.
+    """
+
+    api_key: Any = None
+
+    def _async_available(self) -> bool:
+        """Whether the provider can call its API natively with asyncio."""
+        return bool(self.api_key)
+
+    @abstractmethod
+    async def _acomplete(
+        self,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+    ) -> str:
+        """Send one prompt and return the response text."""
+
+    @abstractmethod
+    async def _astream_completion(
+        self,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Send one prompt and yield the response text as it arrives."""
+        # The bare yield makes this an async generator, like its implementations
+        return
+        yield
+
+    def _streaming_available(self) -> bool:
+        return self._async_available()
+
+    async def _astream_content(
+        self,
+        client: httpx.AsyncClient,
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        language: str,
+    ) -> AsyncIterator[str]:
+        """Stream the completion of the single-scope prompt."""
+        async for text in self._astream_completion(
+            client,
+            self._build_system_prompt(language),
+            self._build_user_prompt(kpi_data, anomalies, forecasts, language),
+            max_tokens=2000,
+        ):
+            yield text
+
+    async def agenerate_recommendations(
+        self,
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        language: str = "en",
+    ) -> LLMResponse:
+        """Async variant of generate_recommendations using the HTTP API."""
+        if not self._async_available():
+            return await super().agenerate_recommendations(kpi_data, anomalies, forecasts, language)
+
+        request = RecommendationRequest("single", kpi_data, anomalies, forecasts)
+        async with httpx.AsyncClient(timeout=self._timeout_seconds()) as client:
+            return await self._arequest_single(client, request, language)
+
+    async def agenerate_batch(
+        self,
+        requests: list[RecommendationRequest],
+        language: str = "en",
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> dict[str, LLMResponse]:
+        """
+        Generate recommendations for many scopes concurrently.
+
+        Scopes are packed ``batch_size`` to a prompt and at most
+        ``max_concurrency`` prompts are in flight at once. Cached scopes are
+        served without a call, and scopes missing from a batched answer are
+        retried on their own.
+
+        Args:
+            requests: Scopes to generate recommendations for
+            language: Response language ("en" or "ar")
+            batch_size: Scopes per prompt, 1 disables batching (default: settings.llm_batch_size)
+            max_concurrency: Maximum concurrent API calls (default: settings.llm_max_concurrency)
+
+        Returns:
+            Mapping of request_id to LLMResponse
+        """
+        if not self._async_available():
+            return await super().agenerate_batch(
+                requests, language, batch_size=batch_size, max_concurrency=max_concurrency
+            )
+
+        settings = get_settings()
+        batch_size = batch_size or settings.llm_batch_size
+        max_concurrency = max_concurrency or settings.llm_max_concurrency
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        results: dict[str, LLMResponse] = {}
+        pending: list[RecommendationRequest] = []
+        for request in requests:
+            cached = self._cached_response(self._request_cache_key(request, language))
+            if cached:
+                results[request.request_id] = cached
+            else:
+                pending.append(request)
+
+        batch_size = max(1, batch_size)
+        batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+
+        async with httpx.AsyncClient(timeout=self._timeout_seconds()) as client:
+
+            async def run_batch(batch: list[RecommendationRequest]) -> dict[str, LLMResponse]:
+                async with semaphore:
+                    if len(batch) == 1:
+                        return {
+                            batch[0].request_id: await self._arequest_single(
+                                client, batch[0], language
+                            )
+                        }
+                    answered = await self._arequest_batch(client, batch, language)
+                # Scopes the model skipped get their own call
+                for request in batch:
+                    if request.request_id not in answered:
+                        async with semaphore:
+                            answered[request.request_id] = await self._arequest_single(
+                                client, request, language
+                            )
+                return answered
+
+            for answered in await asyncio.gather(*(run_batch(b) for b in batches)):
+                results.update(answered)
+
+        logger.info(
+            f"Generated recommendations for {len(requests)} scope(s) with "
+            f"{len(batches)} batched prompt(s) ({len(requests) - len(pending)} cached)"
+        )
+        return {r.request_id: results[r.request_id] for r in requests}
+
+    async def _arequest_single(
+        self,
+        client: httpx.AsyncClient,
+        request: RecommendationRequest,
+        language: str,
+    ) -> LLMResponse:
+        """Generate (and cache) recommendations for one scope."""
+        cache_key = self._request_cache_key(request, language)
+        cached = self._cached_response(cache_key)
+        if cached:
+            return cached
+
+        try:
+            content = await self._acomplete_with_retry(
+                client,
+                self._build_system_prompt(language),
+                self._build_user_prompt(
+                    request.kpi_data, request.anomalies, request.forecasts, language
+                ),
+                max_tokens=2000,
+            )
+        except Exception as e:
+            logger.error(f"{self.provider_name} async request failed: {str(e)}, falling back")
+            return self._fallback_response(language, error=str(e))
+
+        result = self._parse_response(content, self.provider_name, self._model_name())
+        self._store_response(cache_key, result)
+        return result
+
+    async def _arequest_batch(
+        self,
+        client: httpx.AsyncClient,
+        batch: list[RecommendationRequest],
+        language: str,
+    ) -> dict[str, LLMResponse]:
+        """Generate recommendations for several scopes with one prompt."""
+        try:
+            content = await self._acomplete_with_retry(
+                client,
+                self._build_batch_system_prompt(language),
+                self._build_batch_user_prompt(batch, language),
+                max_tokens=min(2000 * len(batch), 8000),
+            )
+            answered = self._parse_batch_response(
+                content, [r.request_id for r in batch], self.provider_name, self._model_name()
+            )
+        except Exception as e:
+            logger.error(f"{self.provider_name} batched request failed: {str(e)}, falling back")
+            return {r.request_id: self._fallback_response(language, error=str(e)) for r in batch}
+
+        for request in batch:
+            if request.request_id in answered:
+                self._store_response(
+                    self._request_cache_key(request, language), answered[request.request_id]
+                )
+        return answered
+
+    async def _acomplete_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+    ) -> str:
+        """Call _acomplete, retrying transient failures with backoff."""
+        return await retry_with_backoff_async(
+            lambda: self._acomplete(client, system_prompt, user_prompt, max_tokens),
+            max_attempts=getattr(self, "max_retries", 0) + 1,
+            base_delay=0.5,
+            max_delay=8.0,
+            retryable_exceptions=(httpx.TransportError, RetryableLLMError),
+        )
+
+    @staticmethod
+    async def _apost_json(
+        client: httpx.AsyncClient, url: str, headers: dict[str, str], payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """POST a JSON payload, raising RetryableLLMError on transient statuses."""
+        response = await client.post(url, headers=headers, json=payload)
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise RetryableLLMError(f"HTTP {response.status_code} from {url}")
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    async def _astream_sse(
+        client: httpx.AsyncClient, url: str, headers: dict[str, str], payload: dict[str, Any]
+    ) -> AsyncIterator[dict[str, Any]]:
+        """POST a streaming request and yield the JSON data of each server-sent event."""
+        async with client.stream("POST", url, headers=headers, json=payload) as response:
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                raise RetryableLLMError(f"HTTP {response.status_code} from {url}")
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                if data:
+                    yield json.loads(data)
+
+
+class OpenAIProvider(HTTPLLMProvider):
     """
     OpenAI GPT provider with robust error handling.
 
@@ -223,20 +1077,30 @@ class OpenAIProvider(BaseLLMProvider):
     - Retry on rate limits
     - Graceful fallback on errors
     - Response caching
+    - Async calls over the REST API (any OpenAI-compatible base URL)
     """
 
+    provider_name = "openai"
+
     def __init__(
         self,
         api_key: str | None = None,
         model: str | None = None,
         timeout: int = 30,
         max_retries: int = 2,
+        base_url: str | None = None,
     ):
         settings = get_settings()
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY") or settings.llm_api_key
         self.model = model or os.environ.get("OPENAI_MODEL") or settings.llm_model_name or "gpt-4"
         self.timeout = timeout
         self.max_retries = max_retries
+        self.base_url = (
+            base_url
+            or os.environ.get("OPENAI_BASE_URL")
+            or settings.llm_base_url
+            or "https://api.openai.com/v1"
+        ).rstrip("/")
 
         if self.api_key and HAS_OPENAI:
             # Handle SecretStr type from pydantic settings
@@ -262,8 +1126,7 @@ class OpenAIProvider(BaseLLMProvider):
         try:
             # Check cache first
             cache_key = self._get_cache_key(kpi_data, anomalies, forecasts, language)
-            cache_manager = get_cache_manager()
-            cached = cache_manager.get(cache_key)
+            cached = self._cached_response(cache_key)
 
             if cached:
                 logger.info("Returning cached LLM response")
@@ -289,7 +1152,7 @@ class OpenAIProvider(BaseLLMProvider):
             result = self._parse_response(content or "", "openai", self.model)
 
             # Cache successful response
-            cache_manager.set(cache_key, result, ttl=3600)  # 1 hour
+            self._store_response(cache_key, result)
 
             return result
 
@@ -313,27 +1176,58 @@ class OpenAIProvider(BaseLLMProvider):
             logger.error(f"Unexpected error in OpenAI provider: {str(e)}, falling back")
             return self._fallback_response(language, error=str(e))
 
-    def _get_cache_key(
+    async def _acomplete(
         self,
-        kpi_data: dict[str, Any],
-        anomalies: list[dict[str, Any]],
-        forecasts: list[dict[str, Any]],
-        language: str,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
     ) -> str:
-        """Generate cache key for request."""
-        data_str = json.dumps(
+        """Chat completion over the REST API."""
+        data = await self._apost_json(
+            client,
+            f"{self.base_url}/chat/completions",
+            {"Authorization": f"Bearer {_secret_value(self.api_key)}"},
             {
-                "kpi": kpi_data,
-                "anomalies": anomalies,
-                "forecasts": forecasts,
-                "language": language,
-                "provider": "openai",
                 "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": 0.7,
+                "max_tokens": max_tokens,
             },
-            sort_keys=True,
-            default=str,
         )
-        return f"llm_recommendations_{hashlib.sha256(data_str.encode()).hexdigest()[:32]}"
+        return data["choices"][0]["message"]["content"] or ""
+
+    async def _astream_completion(
+        self,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Streamed chat completion over the REST API."""
+        events = self._astream_sse(
+            client,
+            f"{self.base_url}/chat/completions",
+            {"Authorization": f"Bearer {_secret_value(self.api_key)}"},
+            {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": 0.7,
+                "max_tokens": max_tokens,
+                "stream": True,
+            },
+        )
+        async for data in events:
+            for choice in data.get("choices", []):
+                text = (choice.get("delta") or {}).get("content")
+                if text:
+                    yield text
 
     def _fallback_response(self, language: str, error: str | None = None) -> LLMResponse:
         """Generate fallback response when API fails."""
@@ -349,7 +1243,7 @@ class OpenAIProvider(BaseLLMProvider):
         return response
 
 
-class AnthropicProvider(BaseLLMProvider):
+class AnthropicProvider(HTTPLLMProvider):
     """
     Anthropic Claude provider with robust error handling.
 
@@ -358,14 +1252,19 @@ class AnthropicProvider(BaseLLMProvider):
     - Retry on rate limits
     - Graceful fallback on errors
     - Response caching
+    - Async calls over the REST API
     """
 
+    provider_name = "anthropic"
+    api_version = "2023-06-01"
+
     def __init__(
         self,
         api_key: str | None = None,
         model: str | None = None,
         timeout: int = 30,
         max_retries: int = 2,
+        base_url: str | None = None,
     ):
         settings = get_settings()
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY") or settings.llm_api_key
@@ -377,6 +1276,12 @@ class AnthropicProvider(BaseLLMProvider):
         )
         self.timeout = timeout
         self.max_retries = max_retries
+        self.base_url = (
+            base_url
+            or os.environ.get("ANTHROPIC_BASE_URL")
+            or settings.llm_base_url
+            or "https://api.anthropic.com"
+        ).rstrip("/")
 
         if self.api_key and HAS_ANTHROPIC:
             self.client = anthropic.Anthropic(
@@ -400,8 +1305,7 @@ class AnthropicProvider(BaseLLMProvider):
         try:
             # Check cache first
             cache_key = self._get_cache_key(kpi_data, anomalies, forecasts, language)
-            cache_manager = get_cache_manager()
-            cached = cache_manager.get(cache_key)
+            cached = self._cached_response(cache_key)
 
             if cached:
                 logger.info("Returning cached LLM response")
@@ -426,7 +1330,7 @@ class AnthropicProvider(BaseLLMProvider):
             result = self._parse_response(content, "anthropic", self.model)
 
             # Cache successful response
-            cache_manager.set(cache_key, result, ttl=3600)  # 1 hour
+            self._store_response(cache_key, result)
 
             return result
 
@@ -442,27 +1346,52 @@ class AnthropicProvider(BaseLLMProvider):
             logger.error(f"Unexpected error in Anthropic provider: {str(e)}, falling back")
             return self._fallback_response(language, error=str(e))
 
-    def _get_cache_key(
+    async def _acomplete(
         self,
-        kpi_data: dict[str, Any],
-        anomalies: list[dict[str, Any]],
-        forecasts: list[dict[str, Any]],
-        language: str,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
     ) -> str:
-        """Generate cache key for request."""
-        data_str = json.dumps(
+        """Messages API call over REST."""
+        data = await self._apost_json(
+            client,
+            f"{self.base_url}/v1/messages",
+            {"x-api-key": _secret_value(self.api_key), "anthropic-version": self.api_version},
             {
-                "kpi": kpi_data,
-                "anomalies": anomalies,
-                "forecasts": forecasts,
-                "language": language,
-                "provider": "anthropic",
                 "model": self.model,
+                "max_tokens": max_tokens,
+                "system": system_prompt,
+                "messages": [{"role": "user", "content": user_prompt}],
             },
-            sort_keys=True,
-            default=str,
         )
-        return f"llm_recommendations_{hashlib.sha256(data_str.encode()).hexdigest()[:32]}"
+        return "".join(block.get("text", "") for block in data.get("content", []))
+
+    async def _astream_completion(
+        self,
+        client: httpx.AsyncClient,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """Streamed Messages API call over REST."""
+        events = self._astream_sse(
+            client,
+            f"{self.base_url}/v1/messages",
+            {"x-api-key": _secret_value(self.api_key), "anthropic-version": self.api_version},
+            {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "system": system_prompt,
+                "messages": [{"role": "user", "content": user_prompt}],
+                "stream": True,
+            },
+        )
+        async for data in events:
+            if data.get("type") == "content_block_delta":
+                text = data.get("delta", {}).get("text")
+                if text:
+                    yield text
 
     def _fallback_response(self, language: str, error: str | None = None) -> LLMResponse:
         """Generate fallback response when API fails."""
@@ -481,6 +1410,42 @@ class AnthropicProvider(BaseLLMProvider):
 class MockLLMProvider(BaseLLMProvider):
     """Mock LLM provider for development/testing."""
 
+    provider_name = "mock"
+    model = "mock-v1"
+    cache_responses = False
+
+    def __init__(self, stream_chunk_size: int = 24, stream_delay_seconds: float = 0.0):
+        """
+        Args:
+            stream_chunk_size: Characters per simulated streaming chunk
+            stream_delay_seconds: Pause between simulated streaming chunks
+        """
+        self.stream_chunk_size = max(1, stream_chunk_size)
+        self.stream_delay_seconds = stream_delay_seconds
+
+    def _streaming_available(self) -> bool:
+        return True
+
+    async def _astream_content(
+        self,
+        client: httpx.AsyncClient,
+        kpi_data: dict[str, Any],
+        anomalies: list[dict[str, Any]],
+        forecasts: list[dict[str, Any]],
+        language: str,
+    ) -> AsyncIterator[str]:
+        """Simulate a streamed completion by chunking the template response JSON."""
+        response = _response_to_dict(
+            self.generate_recommendations(kpi_data, anomalies, forecasts, language)
+        )
+        content = json.dumps(
+            {field: response[field] for field in STREAM_EVENTS}, ensure_ascii=False, indent=2
+        )
+        for start in range(0, len(content), self.stream_chunk_size):
+            if self.stream_delay_seconds:
+                await asyncio.sleep(self.stream_delay_seconds)
+            yield content[start : start + self.stream_chunk_size]
+
     def generate_recommendations(
         self,
         kpi_data: dict[str, Any],
@@ -632,6 +1597,61 @@ def generate_recommendations(
         language=language,
     )
 
+    return _response_to_dict(response)
+
+
+def stream_recommendations(
+    kpi_data: dict[str, Any],
+    anomalies: list[dict[str, Any]] | None = None,
+    forecasts: list[dict[str, Any]] | None = None,
+    language: str = "en",
+    provider: str = "auto",
+) -> Iterator[StreamEvent]:
+    """
+    Stream LLM recommendations to synchronous code such as a Streamlit render.
+
+    Args:
+        kpi_data: Dictionary of KPI data
+        anomalies: List of detected anomalies
+        forecasts: List of forecast results
+        language: Response language ("en" or "ar")
+        provider: LLM provider to use
+
+    Yields:
+        StreamEvent objects; the last one is "done" with the full response
+    """
+    llm = get_llm_service(provider)
+    yield from _iterate_async(
+        llm.astream_recommendations(kpi_data, anomalies or [], forecasts or [], language)
+    )
+
+
+def _recommendation_from_data(data: dict[str, Any], index: int) -> Recommendation:
+    """Build a Recommendation from one parsed answer object, filling defaults."""
+    return Recommendation(
+        id=data.get("id", f"rec_{index}"),
+        title=data.get("title", ""),
+        description=data.get("description", ""),
+        priority=data.get("priority", "medium"),
+        category=data.get("category", "economic"),
+        impact=data.get("impact", ""),
+        timeline=data.get("timeline", ""),
+        kpis_affected=data.get("kpis_affected", []),
+    )
+
+
+def _response_events(response: LLMResponse) -> list[StreamEvent]:
+    """Replay a complete response as the events a stream would have produced."""
+    events = [StreamEvent("executive_summary", response.executive_summary)]
+    events += [StreamEvent("key_insight", insight) for insight in response.key_insights]
+    events += [StreamEvent("recommendation", asdict(r)) for r in response.recommendations]
+    events += [StreamEvent("risk_alert", alert) for alert in response.risk_alerts]
+    events.append(StreamEvent("done", _response_to_dict(response)))
+    return events
+
+
+def _response_to_dict(response: LLMResponse) -> dict[str, Any]:
+    """Serialize an LLMResponse for the UI and API."""
     return {
         "executive_summary": response.executive_summary,
         "key_insights": response.key_insights,
@@ -641,3 +1661,40 @@ def generate_recommendations(
         "model": response.model,
         "generated_at": response.generated_at.isoformat(),
     }
+
+
+def _response_from_dict(data: dict[str, Any]) -> LLMResponse:
+    """Rebuild an LLMResponse serialized by _response_to_dict."""
+    return LLMResponse(
+        executive_summary=data["executive_summary"],
+        key_insights=list(data["key_insights"]),
+        recommendations=[Recommendation(**r) for r in data["recommendations"]],
+        risk_alerts=list(data["risk_alerts"]),
+        provider=data["provider"],
+        model=data["model"],
+        generated_at=datetime.fromisoformat(data["generated_at"]),
+    )
+
+
+def _iterate_async(iterator: AsyncIterator[T]) -> Iterator[T]:
+    """Consume an async iterator from sync code, yielding items as they arrive."""
+    items: queue.Queue[tuple[str, Any]] = queue.Queue()
+
+    async def pump() -> None:
+        try:
+            async for item in iterator:
+                items.put(("item", item))
+        except Exception as e:
+            items.put(("error", e))
+        finally:
+            items.put(("end", None))
+
+    # A private event loop in a worker thread works inside a running loop too
+    threading.Thread(target=asyncio.run, args=(pump(),), daemon=True).start()
+    while True:
+        kind, value = items.get()
+        if kind == "end":
+            return
+        if kind == "error":
+            raise value
+        yield value
@@ -16,6 +16,7 @@ Supports:
 - Gap analysis and recommendations
 - Benchmarking against targets
 - Roadmap generation
+- Batch scoring of many tenants/periods from a metrics matrix
 """
 
 import logging
@@ -24,6 +25,9 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 
 logger = logging.getLogger(__name__)
 
@@ -370,6 +374,15 @@ DIMENSION_CRITERIA: dict[CapabilityDimension, dict[str, Any]] = {
 }
 
 
+# Upper bounds (exclusive) of the 0-5 score band for levels 1-4; level 5 above
+LEVEL_SCORE_THRESHOLDS = (1.5, 2.5, 3.5, 4.5)
+
+
+def _scores_to_levels(scores: np.ndarray) -> np.ndarray:
+    """Vectorized MaturityAssessor._score_to_level returning level values."""
+    return np.digitize(scores, LEVEL_SCORE_THRESHOLDS) + 1
+
+
 # =============================================================================
 # DATA MODELS
 # =============================================================================
@@ -798,6 +811,96 @@ class MaturityAssessor:
 
         return assessment
 
+    def assess_batch(self, metrics: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score many assessments (e.g. every tenant and period) in one pass.
+
+        Vectorized equivalent of assess_from_metrics: each row holds the
+        metrics of one assessment under the same keys, and missing columns or
+        NaN values take the same defaults. Evidence, gaps and recommendations
+        are not generated; use assess_from_metrics for a full assessment.
+
+        Args:
+            metrics: One row per assessment, one column per platform metric
+
+        Returns:
+            DataFrame with the input index, one score column per dimension,
+            overall_score, overall_level and gaps_count (dimensions below
+            the target level)
+        """
+
+        def column(name: str, default: float) -> np.ndarray:
+            if name not in metrics:
+                return np.full(len(metrics), float(default))
+            values = pd.to_numeric(metrics[name], errors="coerce")
+            return values.fillna(default).to_numpy(dtype=float)
+
+        def score_or_features(name: str, per_feature: float, *flags: np.ndarray) -> np.ndarray:
+            # A zero score is inferred from the features available
+            score = column(name, 0)
+            return np.where(score == 0, 40 + per_feature * np.sum(flags, axis=0), score)
+
+        alignment = column("strategic_alignment_score", 0)
+        inferred_alignment = np.minimum(
+            100, 40 + column("kpi_count", 0) * 3 + 30 * column("has_vision2030_link", True)
+        )
+        raw_scores = {
+            CapabilityDimension.DATA_QUALITY: column("data_quality_score", 0),
+            CapabilityDimension.DATA_GOVERNANCE: column("governance_score", 0),
+            CapabilityDimension.ANALYTICS_CAPABILITY: score_or_features(
+                "analytics_score",
+                20,
+                column("has_forecasting", False),
+                column("has_anomaly_detection", False),
+                column("has_insights", False),
+            ),
+            CapabilityDimension.REPORTING: score_or_features(
+                "reporting_score",
+                20,
+                column("has_dashboards", True),
+                column("has_export", False),
+                column("has_alerts", False),
+            ),
+            CapabilityDimension.DECISION_SUPPORT: score_or_features(
+                "decision_support_score",
+                30,
+                column("has_recommendations", False),
+                column("has_llm_insights", False),
+            ),
+            CapabilityDimension.TECHNOLOGY: score_or_features(
+                "technology_score",
+                20,
+                column("has_api", True),
+                column("has_docker", False),
+                column("has_ci_cd", False),
+            ),
+            CapabilityDimension.ORGANIZATION: column("organization_score", 60),
+            CapabilityDimension.STRATEGIC_ALIGNMENT: np.where(
+                alignment == 0, inferred_alignment, alignment
+            ),
+        }
+
+        # Dimension scores are the level values (0-100 metric -> 0-5 band -> level)
+        levels = np.column_stack([_scores_to_levels(s / 20) for s in raw_scores.values()])
+
+        # Accumulated in the same order as calculate_overall_score, so scores on a
+        # level boundary round identically
+        weighted = np.zeros(len(metrics))
+        total_weight = 0.0
+        for k, dimension in enumerate(raw_scores):
+            weight = DIMENSION_CRITERIA[dimension]["weight"]
+            weighted += levels[:, k] * weight
+            total_weight += weight
+        overall = weighted / total_weight
+
+        result = pd.DataFrame(
+            levels.astype(float), index=metrics.index, columns=[d.value for d in raw_scores]
+        )
+        result["overall_score"] = overall
+        result["overall_level"] = np.clip(np.round(overall), 1, 5).astype(int)
+        result["gaps_count"] = (levels < self.target_level.value).sum(axis=1)
+        return result
+
     def create_manual_assessment(
         self,
         assessment_id: str,
@@ -1035,6 +1138,66 @@ class BenchmarkingService:
 
         return round(percentile, 1)
 
+    def calculate_percentiles(
+        self,
+        scores: pd.Series,
+        groups: pd.Series | None = None,
+    ) -> pd.Series:
+        """
+        Vectorized calculate_percentile for a whole set of overall scores.
+
+        Each score is ranked against the other scores in its group (e.g. all
+        tenants in the same period), with the same tie handling as
+        calculate_percentile.
+
+        Args:
+            scores: Overall scores, one per assessment
+            groups: Peer group of each score (default: one group)
+
+        Returns:
+            Percentiles (0-100) aligned with scores
+        """
+        if groups is None:
+            groups = pd.Series(0, index=scores.index)
+        grouped = scores.groupby(groups)
+        below = grouped.rank(method="min").to_numpy() - 1
+        peers = grouped.transform("size").to_numpy() - 1
+
+        percentile = np.where(peers > 0, below / np.maximum(peers, 1) * 100, 50.0)
+        return pd.Series(np.round(percentile, 1), index=scores.index, name="percentile")
+
+    def compare_scores_to_benchmarks(
+        self,
+        scores: pd.DataFrame,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Batch equivalent of compare_to_all_benchmarks for assess_batch output.
+
+        Args:
+            scores: Output of MaturityAssessor.assess_batch
+
+        Returns:
+            Mapping of benchmark ID to a DataFrame of gaps (benchmark minus
+            assessment) with an "overall" column and one column per dimension;
+            dimensions a benchmark does not score are NaN
+        """
+        dimensions = [d.value for d in CapabilityDimension]
+        comparisons = {}
+        for benchmark in self.benchmarks.values():
+            targets = pd.Series(
+                {d.value: v for d, v in benchmark.dimension_scores.items()},
+                index=dimensions,
+                dtype=float,
+            )
+            gaps = pd.DataFrame(
+                targets.to_numpy() - scores[dimensions].to_numpy(),
+                index=scores.index,
+                columns=dimensions,
+            )
+            gaps.insert(0, "overall", benchmark.overall_score - scores["overall_score"])
+            comparisons[benchmark.id] = gaps
+        return comparisons
+
     def create_historical_benchmark(
         self,
         assessment: MaturityAssessment,
@@ -1431,6 +1594,31 @@ def assess_platform_maturity(
     return assessor.assess_from_metrics(metrics)
 
 
+def assess_maturity_batch(
+    metrics: pd.DataFrame,
+    peer_group: str | None = None,
+    target_level: MaturityLevel = MaturityLevel.MANAGED,
+) -> pd.DataFrame:
+    """
+    Score a metrics matrix of many tenants/periods, e.g. for maturity time series.
+
+    Args:
+        metrics: One row per assessment (index e.g. tenant and period)
+        peer_group: Column of metrics whose values define the percentile peer
+            groups (e.g. "period"); all rows are peers when omitted
+        target_level: Target maturity level
+
+    Returns:
+        assess_batch scores with an added percentile column
+    """
+    scores = MaturityAssessor(target_level=target_level).assess_batch(metrics)
+    groups = metrics[peer_group] if peer_group else None
+    scores["percentile"] = BenchmarkingService().calculate_percentiles(
+        scores["overall_score"], groups
+    )
+    return scores
+
+
 def compare_to_benchmarks(
     assessment: MaturityAssessment,
 ) -> list[BenchmarkComparison]:
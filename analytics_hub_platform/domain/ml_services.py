@@ -7,8 +7,12 @@ This module provides ML-based forecasting and anomaly detection
 services for KPI time-series analysis.
 """
 
+import hashlib
 import logging
+import threading
 import warnings
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Any
@@ -24,6 +28,8 @@ from analytics_hub_platform.config.constants import (
     DEFAULT_ROLLING_WINDOW,
     ML_MIN_FORECAST_POINTS,
 )
+from analytics_hub_platform.domain.advanced_analytics import PreparedSeries, prepare_series
+from analytics_hub_platform.infrastructure.caching import get_cache
 from analytics_hub_platform.infrastructure.exceptions import (
     ConstantSeriesError,
     DataError,
@@ -31,10 +37,20 @@ from analytics_hub_platform.infrastructure.exceptions import (
     ModelNotFittedError,
 )
 from analytics_hub_platform.infrastructure.settings import get_settings
+from analytics_hub_platform.infrastructure.tracing import traced
 
 warnings.filterwarnings("ignore")
 logger = logging.getLogger(__name__)
 
+# Cache key prefix for per-tenant multivariate Isolation Forest models
+ISOLATION_FOREST_CACHE_PREFIX = "iforest"
+
+# Background Isolation Forest fits, at most one in flight per tenant
+_iforest_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iforest")
+_iforest_pending: dict[str, Future] = {}
+_iforest_lock = threading.Lock()
+_iforest_idle = threading.Condition(_iforest_lock)
+
 
 class AnomalySeverity(str, Enum):
     """Anomaly severity classification."""
@@ -142,6 +158,7 @@ class KPIForecaster:
             "diff_4",
         ]
 
+    @traced(attributes={"component": "ml"})
     def fit(self, df: pd.DataFrame) -> "KPIForecaster":
         """
         Fit the forecasting model with edge case handling.
@@ -363,7 +380,7 @@ class AnomalyDetector:
 
     def detect_anomalies(
         self,
-        df: pd.DataFrame,
+        df: pd.DataFrame | PreparedSeries,
         kpi_id: str,
         region_id: str,
         higher_is_better: bool = True,
@@ -372,7 +389,7 @@ class AnomalyDetector:
         Detect anomalies using Z-score method with edge case handling.
 
         Args:
-            df: DataFrame with year, quarter, value columns
+            df: DataFrame with year, quarter, value columns, or a PreparedSeries
             kpi_id: KPI identifier
             region_id: Region identifier
             higher_is_better: Whether higher values indicate better performance
@@ -384,75 +401,184 @@ class AnomalyDetector:
         if df.empty or len(df) < 4:
             return []
 
+        series = prepare_series(df)
+
         # Edge case: check for constant series (no variation to detect anomalies)
-        if df["value"].std() == 0:
+        observed = series.values[~np.isnan(series.values)]
+        if len(observed) > 1 and np.isfinite(observed).all() and np.std(observed, ddof=1) == 0:
             # All values are identical - no anomalies to detect
             return []
 
         # Edge case: filter out NaN/infinite values
-        df = df[df["value"].notna() & np.isfinite(df["value"])].copy()
+        series = series.subset(np.isfinite(series.values))
 
-        if df.empty or len(df) < 4:
+        if series.empty or len(series) < 4:
             return []
 
-        df = df.sort_values(["year", "quarter"]).reset_index(drop=True)
-        anomalies = []
+        values = series.values
+        mean, std = _preceding_window_stats(
+            values, np.arange(len(values)), self.rolling_window, self.use_rolling_stats
+        )
 
-        for i in range(len(df)):
-            row = df.iloc[i]
-            value = row["value"]
+        return self._build_zscore_results(
+            values=values,
+            mean=mean,
+            std=std,
+            years=series.years,
+            quarters=series.quarters,
+            kpi_ids=np.full(len(values), kpi_id, dtype=object),
+            region_ids=np.full(len(values), region_id, dtype=object),
+            higher_is_better=np.full(len(values), higher_is_better),
+        )
 
-            if self.use_rolling_stats and i >= self.rolling_window:
-                window_data = df.iloc[max(0, i - self.rolling_window) : i]["value"]
-                mean = window_data.mean()
-                std = window_data.std()
-            else:
-                if i < 2:
-                    continue
-                prior_data = df.iloc[:i]["value"]
-                mean = prior_data.mean()
-                std = prior_data.std()
+    def detect_anomalies_multi(
+        self,
+        df: pd.DataFrame,
+        kpi_columns: list[str],
+        region_column: str | None = "region",
+        higher_is_better: dict[str, bool] | None = None,
+        default_region: str = "national",
+    ) -> list[AnomalyResult]:
+        """
+        Detect Z-score anomalies for every KPI column x region in a wide frame.
 
-            if std == 0 or np.isnan(std):
-                continue
+        Each (KPI, region) series is scored exactly as ``detect_anomalies`` would
+        score it on its own, but all series are processed in a single vectorized
+        pass instead of one call per series.
 
-            z_score = (value - mean) / std
-            abs_z = abs(z_score)
+        Args:
+            df: Wide DataFrame with year, quarter, optional region and KPI columns
+            kpi_columns: KPI columns to scan (missing columns are ignored)
+            region_column: Column identifying the region, or None to treat the
+                frame as a single series per KPI
+            higher_is_better: Optional KPI -> direction mapping (defaults to True)
+            default_region: Region id used when there is no region column
+
+        Returns:
+            List of detected anomalies ordered by KPI, region and period
+        """
+        kpi_columns = [k for k in kpi_columns if k in df.columns]
+        if df.empty or not kpi_columns:
+            return []
+
+        higher_is_better = higher_is_better or {}
+        has_region = region_column is not None and region_column in df.columns
+        id_columns = ["year", "quarter"] + ([region_column] if has_region else [])
 
-            if abs_z >= self.zscore_threshold:
-                direction = "high" if z_score > 0 else "low"
+        long_df = df[id_columns + kpi_columns].melt(
+            id_vars=id_columns, value_vars=kpi_columns, var_name="kpi_id", value_name="value"
+        )
+        if not has_region:
+            long_df["region_id"] = default_region
+        else:
+            long_df = long_df.rename(columns={region_column: "region_id"})
+
+        long_df["value"] = pd.to_numeric(long_df["value"], errors="coerce")
+        long_df = long_df[np.isfinite(long_df["value"])]
+        if long_df.empty:
+            return []
 
-                if abs_z >= self.critical_threshold:
-                    severity = AnomalySeverity.CRITICAL
-                else:
-                    severity = AnomalySeverity.WARNING
+        kpi_codes = pd.Categorical(long_df["kpi_id"], categories=kpi_columns).codes
+        region_codes = pd.factorize(long_df["region_id"], sort=True)[0]
+        order = np.lexsort(
+            (
+                long_df["quarter"].to_numpy(),
+                long_df["year"].to_numpy(),
+                region_codes,
+                kpi_codes,
+            )
+        )
+        long_df = long_df.iloc[order]
+        series_codes = (
+            kpi_codes[order].astype(np.int64) * (region_codes.max() + 1) + region_codes[order]
+        )
 
-                deviation_pct = ((value - mean) / mean * 100) if mean != 0 else 0
+        # Position of each observation within its (KPI, region) series
+        n = len(long_df)
+        is_start = np.empty(n, dtype=bool)
+        is_start[0] = True
+        is_start[1:] = series_codes[1:] != series_codes[:-1]
+        start_idx = np.flatnonzero(is_start)
+        lengths = np.diff(np.append(start_idx, n))
+        positions = np.arange(n) - np.repeat(start_idx, lengths)
+
+        values = long_df["value"].to_numpy(dtype=float)
+        mean, std = _preceding_window_stats(
+            values, positions, self.rolling_window, self.use_rolling_stats
+        )
 
-                is_good = (direction == "high") if higher_is_better else (direction == "low")
-                desc_prefix = "Positive anomaly" if is_good else "Concerning anomaly"
+        # Series with fewer than 4 valid points are skipped, as in detect_anomalies
+        too_short = np.repeat(lengths < 4, lengths)
+        std[too_short] = np.nan
+
+        kpi_ids = long_df["kpi_id"].to_numpy(dtype=object)
+        return self._build_zscore_results(
+            values=values,
+            mean=mean,
+            std=std,
+            years=long_df["year"].to_numpy(),
+            quarters=long_df["quarter"].to_numpy(),
+            kpi_ids=kpi_ids,
+            region_ids=long_df["region_id"].to_numpy(dtype=object),
+            higher_is_better=np.array([higher_is_better.get(k, True) for k in kpi_ids]),
+        )
 
-                description = (
-                    f"{desc_prefix}: Value is {abs(deviation_pct):.1f}% "
-                    f"{'above' if direction == 'high' else 'below'} expected "
-                    f"(Z-score: {z_score:.2f})"
-                )
+    def _build_zscore_results(
+        self,
+        values: np.ndarray,
+        mean: np.ndarray,
+        std: np.ndarray,
+        years: np.ndarray,
+        quarters: np.ndarray,
+        kpi_ids: np.ndarray,
+        region_ids: np.ndarray,
+        higher_is_better: np.ndarray,
+    ) -> list[AnomalyResult]:
+        """Turn per-point window statistics into AnomalyResult records."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = (values - mean) / std
+        scored = np.isfinite(std) & (std != 0)
+        hits = np.flatnonzero(scored & (np.abs(z_scores) >= self.zscore_threshold))
 
-                anomalies.append(
-                    AnomalyResult(
-                        kpi_id=kpi_id,
-                        region_id=region_id,
-                        year=int(row["year"]),
-                        quarter=int(row["quarter"]),
-                        actual_value=round(value, 4),
-                        expected_value=round(mean, 4),
-                        deviation=round(value - mean, 4),
-                        z_score=round(z_score, 4),
-                        severity=severity,
-                        direction=direction,
-                        description=description,
-                    )
+        anomalies = []
+        for i in hits:
+            value = float(values[i])
+            mean_i = float(mean[i])
+            z_score = float(z_scores[i])
+            abs_z = abs(z_score)
+            direction = "high" if z_score > 0 else "low"
+
+            if abs_z >= self.critical_threshold:
+                severity = AnomalySeverity.CRITICAL
+            else:
+                severity = AnomalySeverity.WARNING
+
+            deviation_pct = ((value - mean_i) / mean_i * 100) if mean_i != 0 else 0
+
+            is_good = (direction == "high") if higher_is_better[i] else (direction == "low")
+            desc_prefix = "Positive anomaly" if is_good else "Concerning anomaly"
+
+            description = (
+                f"{desc_prefix}: Value is {abs(deviation_pct):.1f}% "
+                f"{'above' if direction == 'high' else 'below'} expected "
+                f"(Z-score: {z_score:.2f})"
+            )
+
+            anomalies.append(
+                AnomalyResult(
+                    kpi_id=kpi_ids[i],
+                    region_id=region_ids[i],
+                    year=int(years[i]),
+                    quarter=int(quarters[i]),
+                    actual_value=round(value, 4),
+                    expected_value=round(mean_i, 4),
+                    deviation=round(value - mean_i, 4),
+                    z_score=round(z_score, 4),
+                    severity=severity,
+                    direction=direction,
+                    description=description,
                 )
+            )
 
         return anomalies
 
@@ -472,6 +598,7 @@ class AnomalyDetector:
         kpi_id: str,
         region_id: str,
         contamination: float | None = None,
+        n_jobs: int | None = None,
     ) -> list[AnomalyResult]:
         """Detect anomalies using Isolation Forest for multivariate patterns."""
         if df.empty:
@@ -482,55 +609,602 @@ class AnomalyDetector:
             contamination if contamination is not None else settings.anomaly_if_contamination
         )
 
-        data = df.copy().reset_index(drop=True)
-        features = data[["year", "quarter", "value"]].astype(float)
+        features = df[["year", "quarter", "value"]].to_numpy(dtype=float)
         X = self.scaler.fit_transform(features)
 
         iso = IsolationForest(
             contamination=contamination_val,
             random_state=self.random_state,
             n_estimators=200,
+            n_jobs=n_jobs,
         )
         preds = iso.fit_predict(X)
 
-        anomalies: list[AnomalyResult] = []
-        mean_val = float(data["value"].mean())
-        std_val = float(data["value"].std() or 1.0)
+        values = features[:, 2]
+        mean_val = float(df["value"].mean())
+        std_val = float(df["value"].std() or 1.0)
+        flagged = np.flatnonzero(preds == -1)
 
-        for idx, pred in enumerate(preds):
-            if pred != -1:
-                continue
+        return [
+            self._isolation_forest_result(
+                kpi_id=kpi_id,
+                region_id=region_id,
+                year=int(features[idx, 0]),
+                quarter=int(features[idx, 1]),
+                actual=float(values[idx]),
+                mean_val=mean_val,
+                std_val=std_val,
+            )
+            for idx in flagged
+        ]
+
+    def detect_multivariate_anomalies(
+        self,
+        df: pd.DataFrame,
+        kpi_columns: list[str],
+        region_column: str | None = "region",
+        tenant_id: str | None = None,
+        contamination: float | None = None,
+        n_jobs: int | None = -1,
+        fit_in_background: bool = False,
+    ) -> list[AnomalyResult] | None:
+        """
+        Detect anomalies with one Isolation Forest over all KPIs of a tenant.
+
+        Instead of fitting a forest per (KPI, region) series, every row of the
+        wide frame becomes one sample whose features are the KPI values, a
+        time index and one-hot region indicators. A single forest is fitted and
+        all rows are scored in one vectorized call. Each flagged row is reported
+        against the KPI that deviates most from that region's own mean.
+
+        When ``tenant_id`` is given the fitted model is cached and reused until
+        the underlying data changes (or ``invalidate_isolation_forest_cache``
+        is called). With ``fit_in_background`` a missing model is fitted on a
+        background thread instead of inline, so request paths only ever score
+        a cached model.
+
+        Args:
+            df: Wide DataFrame with year, quarter, optional region and KPI columns
+            kpi_columns: KPI columns used as features (missing columns are ignored)
+            region_column: Column identifying the region, or None
+            tenant_id: Tenant identifier used as the model cache key
+            contamination: Expected anomaly share (defaults to settings)
+            n_jobs: Parallel jobs for fitting/scoring (-1 uses all cores)
+            fit_in_background: Schedule a missing model's fit instead of waiting
+                for it (requires ``tenant_id``)
+
+        Returns:
+            List of detected anomalies, one per flagged row, or None if the
+            model is still being fitted in the background
+        """
+        kpi_columns = [k for k in kpi_columns if k in df.columns]
+        if df.empty or not kpi_columns:
+            return []
+
+        settings = get_settings()
+        contamination_val = (
+            contamination if contamination is not None else settings.anomaly_if_contamination
+        )
+
+        values = df[kpi_columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        values[~np.isfinite(values)] = np.nan
+        observed = ~np.isnan(values).all(axis=0)
+        if not observed.any():
+            return []
+        kpi_columns = [k for k, keep in zip(kpi_columns, observed, strict=True) if keep]
+        values = values[:, observed]
+
+        # Impute gaps with column medians so every row can be scored
+        filled = np.where(np.isnan(values), np.nanmedian(values, axis=0), values)
+        time_idx = df["year"].to_numpy(dtype=float) * 4 + df["quarter"].to_numpy(dtype=float)
+        has_region = region_column is not None and region_column in df.columns
+        if has_region:
+            region_ids = df[region_column].astype(str).to_numpy(dtype=object)
+            region_features = pd.get_dummies(region_ids, dtype=float).to_numpy()
+        else:
+            region_ids = np.full(len(df), "national", dtype=object)
+            region_features = np.empty((len(df), 0))
+        X = np.column_stack([time_idx, filled, region_features])
+
+        model = self._get_isolation_forest(
+            X, tenant_id, contamination_val, n_jobs, fit_in_background and tenant_id is not None
+        )
+        if model is None:
+            return None
+        scaler, iso = model
+        preds = iso.predict(scaler.transform(X))
+        flagged = np.flatnonzero(preds == -1)
+        if flagged.size == 0:
+            return []
 
-            row = data.iloc[idx]
-            actual = float(row["value"])
-            z_score = (actual - mean_val) / std_val if std_val else 0.0
-            direction = "high" if actual >= mean_val else "low"
-            severity = (
-                AnomalySeverity.CRITICAL
-                if abs(z_score) >= self.critical_threshold
-                else AnomalySeverity.WARNING
+        # Per-region baselines, so a region's normal level is not itself an outlier
+        grouped = pd.DataFrame(values).groupby(region_ids)
+        mean = grouped.transform("mean").to_numpy()
+        std = grouped.transform("std").to_numpy()
+        std = np.where((std > 0) & np.isfinite(std), std, 1.0)
+        z = np.abs((values[flagged] - mean[flagged]) / std[flagged])
+        z[np.isnan(z)] = -1.0
+        drivers = z.argmax(axis=1)
+
+        years = df["year"].to_numpy()
+        quarters = df["quarter"].to_numpy()
+        return [
+            self._isolation_forest_result(
+                kpi_id=kpi_columns[col],
+                region_id=region_ids[row],
+                year=int(years[row]),
+                quarter=int(quarters[row]),
+                actual=float(filled[row, col]),
+                mean_val=float(mean[row, col]),
+                std_val=float(std[row, col]),
             )
+            for row, col in zip(flagged, drivers, strict=True)
+        ]
 
-            anomalies.append(
-                AnomalyResult(
-                    kpi_id=kpi_id,
-                    region_id=region_id,
-                    year=int(row["year"]),
-                    quarter=int(row["quarter"]),
-                    actual_value=round(actual, 4),
-                    expected_value=round(mean_val, 4),
-                    deviation=round(actual - mean_val, 4),
-                    z_score=round(z_score, 4),
-                    severity=severity,
-                    direction=direction,
-                    description=(
-                        f"IsolationForest anomaly: {direction} deviation (z={z_score:.2f})"
-                    ),
+    @traced(attributes={"component": "ml"})
+    def _get_isolation_forest(
+        self,
+        X: np.ndarray,
+        tenant_id: str | None,
+        contamination: float,
+        n_jobs: int | None,
+        background: bool = False,
+    ) -> tuple[StandardScaler, IsolationForest] | None:
+        """
+        Fit (or reuse a cached) scaler + Isolation Forest for a feature matrix.
+
+        With ``background`` a cache miss schedules the fit for the tenant and
+        returns None instead of fitting inline.
+        """
+        cache = get_cache() if tenant_id is not None else None
+        cache_key = f"{ISOLATION_FOREST_CACHE_PREFIX}:{tenant_id}"
+        fingerprint = hashlib.sha256(
+            X.tobytes() + repr((X.shape, contamination, self.random_state)).encode()
+        ).hexdigest()
+
+        if cache is not None:
+            entry = cache.get(cache_key)
+            if entry is not None and entry[0] == fingerprint:
+                return entry[1], entry[2]
+
+        if background and tenant_id is not None:
+            _submit_isolation_forest_fit(
+                tenant_id, fingerprint, X, contamination, self.random_state, n_jobs
+            )
+            return None
+
+        scaler, iso = _fit_isolation_forest(X, contamination, self.random_state, n_jobs)
+        if cache is not None:
+            cache.set(cache_key, (fingerprint, scaler, iso))
+        return scaler, iso
+
+    def _isolation_forest_result(
+        self,
+        kpi_id: str,
+        region_id: str,
+        year: int,
+        quarter: int,
+        actual: float,
+        mean_val: float,
+        std_val: float,
+    ) -> AnomalyResult:
+        """Build an AnomalyResult for a row flagged by Isolation Forest."""
+        z_score = (actual - mean_val) / std_val if std_val else 0.0
+        direction = "high" if actual >= mean_val else "low"
+        severity = (
+            AnomalySeverity.CRITICAL
+            if abs(z_score) >= self.critical_threshold
+            else AnomalySeverity.WARNING
+        )
+
+        return AnomalyResult(
+            kpi_id=kpi_id,
+            region_id=region_id,
+            year=year,
+            quarter=quarter,
+            actual_value=round(actual, 4),
+            expected_value=round(mean_val, 4),
+            deviation=round(actual - mean_val, 4),
+            z_score=round(z_score, 4),
+            severity=severity,
+            direction=direction,
+            description=(f"IsolationForest anomaly: {direction} deviation (z={z_score:.2f})"),
+        )
+
+
+def invalidate_isolation_forest_cache(tenant_id: str) -> None:
+    """
+    Drop the cached multivariate Isolation Forest for a tenant.
+
+    Call after new data is written so the next scan refits on fresh data.
+
+    Args:
+        tenant_id: Tenant identifier
+    """
+    get_cache().delete(f"{ISOLATION_FOREST_CACHE_PREFIX}:{tenant_id}")
+
+
+def wait_isolation_forest_fits(timeout: float | None = None) -> bool:
+    """
+    Wait for background Isolation Forest fits to finish and be cached.
+
+    Returns:
+        True if none are left running
+    """
+    with _iforest_idle:
+        return _iforest_idle.wait_for(lambda: not _iforest_pending, timeout)
+
+
+def _fit_isolation_forest(
+    X: np.ndarray,
+    contamination: float,
+    random_state: int | None,
+    n_jobs: int | None,
+) -> tuple[StandardScaler, IsolationForest]:
+    """Fit a scaler and a 200-tree Isolation Forest on a feature matrix."""
+    scaler = StandardScaler()
+    iso = IsolationForest(
+        contamination=contamination,
+        random_state=random_state,
+        n_estimators=200,
+        n_jobs=n_jobs,
+    )
+    iso.fit(scaler.fit_transform(X))
+    return scaler, iso
+
+
+def _submit_isolation_forest_fit(
+    tenant_id: str,
+    fingerprint: str,
+    X: np.ndarray,
+    contamination: float,
+    random_state: int | None,
+    n_jobs: int | None,
+) -> None:
+    """Start a background fit for a tenant unless one is already running."""
+    with _iforest_lock:
+        if tenant_id in _iforest_pending:
+            # A fit on stale data is superseded by the next request after it lands
+            return
+        future = _iforest_executor.submit(
+            _fit_isolation_forest, X.copy(), contamination, random_state, n_jobs
+        )
+        _iforest_pending[tenant_id] = future
+    # Registered outside the lock: the callback runs inline if the fit already finished
+    future.add_done_callback(lambda f: _on_isolation_forest_fit_done(tenant_id, fingerprint, f))
+
+
+def _on_isolation_forest_fit_done(tenant_id: str, fingerprint: str, future: Future) -> None:
+    """Cache a finished background fit so the next scan is served from it."""
+    try:
+        if not future.cancelled():
+            error = future.exception()
+            if error is None:
+                scaler, iso = future.result()
+                cache_key = f"{ISOLATION_FOREST_CACHE_PREFIX}:{tenant_id}"
+                get_cache().set(cache_key, (fingerprint, scaler, iso))
+            else:
+                logger.warning(f"Background Isolation Forest fit for {tenant_id} failed: {error}")
+    finally:
+        with _iforest_idle:
+            _iforest_pending.pop(tenant_id, None)
+            _iforest_idle.notify_all()
+
+
+def _preceding_window_stats(
+    values: np.ndarray,
+    positions: np.ndarray,
+    rolling_window: int,
+    use_rolling_stats: bool,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and sample std of the observations preceding each point.
+
+    ``values`` may hold several series back to back; ``positions`` gives the
+    index of each point within its own series so windows never cross series
+    boundaries. Points at position ``>= rolling_window`` use the trailing
+    rolling window (when enabled), points at position ``>= 2`` otherwise use
+    the expanding window of all prior values. Unscored points are NaN.
+
+    Expanding statistics come from prefix sums (centered on the first value of
+    each series to limit cancellation) and rolling statistics from a strided
+    sliding-window view, so the whole scan is O(n) NumPy work.
+    """
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n == 0:
+        return mean, std
+
+    rolling = (positions >= rolling_window) if use_rolling_stats else np.zeros(n, dtype=bool)
+    expanding = ~rolling & (positions >= 2)
+
+    if expanding.any():
+        starts = np.arange(n) - positions
+        centered = values - values[starts]
+        csum = np.concatenate(([0.0], np.cumsum(centered)))
+        csum_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+        idx = np.flatnonzero(expanding)
+        count = positions[idx].astype(float)
+        total = csum[idx] - csum[starts[idx]]
+        total_sq = csum_sq[idx] - csum_sq[starts[idx]]
+        variance = np.maximum((total_sq - total * total / count) / (count - 1), 0.0)
+
+        mean[idx] = values[starts[idx]] + total / count
+        std[idx] = np.sqrt(variance)
+
+    if rolling.any() and rolling_window >= 2:
+        windows = np.lib.stride_tricks.sliding_window_view(values, rolling_window)
+        idx = np.flatnonzero(rolling)
+        trailing = windows[idx - rolling_window]
+        mean[idx] = trailing.mean(axis=1)
+        std[idx] = trailing.std(axis=1, ddof=1)
+
+    return mean, std
+
+
+@dataclass
+class RunningStats:
+    """Welford running mean/variance for one KPI/region series."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    last_year: int | None = None
+    last_quarter: int | None = None
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (NaN with fewer than two observations)."""
+        if self.count < 2:
+            return float("nan")
+        return float(np.sqrt(self.m2 / (self.count - 1)))
+
+    def update(self, value: float, year: int, quarter: int) -> None:
+        """Fold one observation into the running statistics."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.last_year = year
+        self.last_quarter = quarter
+
+    def is_after(self, year: int, quarter: int) -> bool:
+        """Whether (year, quarter) is strictly later than the last observation."""
+        if self.last_year is None:
+            return True
+        return (year, quarter) > (self.last_year, self.last_quarter)
+
+
+class StreamingAnomalyDetector(AnomalyDetector):
+    """
+    Online Z-score anomaly detection for newly ingested periods.
+
+    Keeps Welford running statistics per (KPI, region) so that each new
+    observation is scored against the expanding mean/std of everything seen
+    before it in O(1), without rescanning history. Once a series has at least
+    four observations, scores match ``AnomalyDetector(use_rolling_stats=False)``
+    on the full series.
+
+    Rows that do not extend a series (backfills or corrections of earlier
+    periods) cannot be folded in incrementally; those series, and series with
+    no running state yet, are recomputed from full history instead.
+    """
+
+    def __init__(
+        self,
+        zscore_threshold: float = ANOMALY_ZSCORE_WARNING,
+        critical_threshold: float = ANOMALY_ZSCORE_CRITICAL,
+        state: dict[tuple[str, str], RunningStats] | None = None,
+        random_state: int | None = None,
+    ):
+        super().__init__(
+            zscore_threshold=zscore_threshold,
+            critical_threshold=critical_threshold,
+            use_rolling_stats=False,
+            random_state=random_state,
+        )
+        self.state: dict[tuple[str, str], RunningStats] = state if state is not None else {}
+
+    def update(
+        self,
+        new_rows: pd.DataFrame,
+        kpi_columns: list[str],
+        region_column: str = "region",
+        higher_is_better: dict[str, bool] | None = None,
+        history_loader: Callable[[], pd.DataFrame] | None = None,
+        recompute: set[tuple[str, str]] | None = None,
+    ) -> list[AnomalyResult]:
+        """
+        Score new rows and fold them into the running state.
+
+        Args:
+            new_rows: Wide DataFrame with year, quarter, region and KPI columns
+            kpi_columns: KPI columns to track
+            region_column: Column identifying the region
+            higher_is_better: Optional KPI -> direction mapping (defaults to True)
+            history_loader: Returns the full wide history (including ``new_rows``),
+                used to recompute series that cannot be updated incrementally
+            recompute: Extra (KPI, region) keys to force through the full recompute
+                path, e.g. series whose earlier values were replaced
+
+        Returns:
+            Anomalies found among ``new_rows``
+        """
+        kpi_columns = [k for k in kpi_columns if k in new_rows.columns]
+        if new_rows.empty or not kpi_columns:
+            return []
+
+        higher_is_better = higher_is_better or {}
+        long_df = new_rows[["year", "quarter", region_column] + kpi_columns].melt(
+            id_vars=["year", "quarter", region_column],
+            value_vars=kpi_columns,
+            var_name="kpi_id",
+            value_name="value",
+        )
+        long_df["value"] = pd.to_numeric(long_df["value"], errors="coerce")
+        long_df = long_df[np.isfinite(long_df["value"])]
+        long_df = long_df.sort_values(["kpi_id", region_column, "year", "quarter"])
+
+        # A series can be updated online only if all of its new rows come after
+        # the last observation already folded into its state.
+        recompute = set(recompute or ())
+        first_rows = long_df.groupby(["kpi_id", region_column], sort=False).head(1)
+        for kpi_id, region_id, year, quarter in first_rows[
+            ["kpi_id", region_column, "year", "quarter"]
+        ].itertuples(index=False):
+            stats = self.state.get((kpi_id, region_id))
+            if stats is None:
+                if history_loader is not None:
+                    recompute.add((kpi_id, region_id))
+            elif not stats.is_after(int(year), int(quarter)):
+                recompute.add((kpi_id, region_id))
+
+        anomalies: list[AnomalyResult] = []
+        online = long_df
+        if recompute:
+            keys = pd.MultiIndex.from_frame(long_df[["kpi_id", region_column]])
+            needs_recompute = keys.isin(list(recompute))
+            online = long_df[~needs_recompute]
+            anomalies.extend(
+                self._recompute(
+                    long_df[needs_recompute],
+                    recompute,
+                    region_column,
+                    higher_is_better,
+                    history_loader,
+                )
+            )
+
+        for kpi_id, region_id, year, quarter, value in online[
+            ["kpi_id", region_column, "year", "quarter", "value"]
+        ].itertuples(index=False):
+            stats = self.state.setdefault((kpi_id, region_id), RunningStats())
+            anomalies.extend(
+                self._build_zscore_results(
+                    values=np.array([value], dtype=float),
+                    mean=np.array([stats.mean if stats.count >= 2 else np.nan]),
+                    std=np.array([stats.std]),
+                    years=np.array([year]),
+                    quarters=np.array([quarter]),
+                    kpi_ids=np.array([kpi_id], dtype=object),
+                    region_ids=np.array([region_id], dtype=object),
+                    higher_is_better=np.array([higher_is_better.get(kpi_id, True)]),
                 )
             )
+            stats.update(float(value), int(year), int(quarter))
 
         return anomalies
 
+    def rebuild(
+        self,
+        history: pd.DataFrame,
+        kpi_columns: list[str],
+        region_column: str = "region",
+        keys: set[tuple[str, str]] | None = None,
+    ) -> None:
+        """
+        Rebuild running state from full history.
+
+        Args:
+            history: Wide DataFrame with year, quarter, region and KPI columns
+            kpi_columns: KPI columns to track
+            region_column: Column identifying the region
+            keys: Restrict the rebuild to these (KPI, region) series
+        """
+        kpi_columns = [k for k in kpi_columns if k in history.columns]
+        if history.empty or not kpi_columns:
+            return
+
+        long_df = history[["year", "quarter", region_column] + kpi_columns].melt(
+            id_vars=["year", "quarter", region_column],
+            value_vars=kpi_columns,
+            var_name="kpi_id",
+            value_name="value",
+        )
+        long_df["value"] = pd.to_numeric(long_df["value"], errors="coerce")
+        long_df = long_df[np.isfinite(long_df["value"])]
+
+        for (kpi_id, region_id), group in long_df.groupby(["kpi_id", region_column]):
+            if keys is not None and (kpi_id, region_id) not in keys:
+                continue
+            group = group.sort_values(["year", "quarter"])
+            values = group["value"].to_numpy(dtype=float)
+            last = group.iloc[-1]
+            mean = float(values.mean())
+            self.state[(kpi_id, region_id)] = RunningStats(
+                count=len(values),
+                mean=mean,
+                m2=float(((values - mean) ** 2).sum()),
+                last_year=int(last["year"]),
+                last_quarter=int(last["quarter"]),
+            )
+
+    def _recompute(
+        self,
+        new_long: pd.DataFrame,
+        keys: set[tuple[str, str]],
+        region_column: str,
+        higher_is_better: dict[str, bool],
+        history_loader: Callable[[], pd.DataFrame] | None,
+    ) -> list[AnomalyResult]:
+        """Full-history fallback for series that cannot be updated online."""
+        kpi_columns = sorted({kpi_id for kpi_id, _ in keys})
+        if history_loader is None:
+            logger.warning(
+                "No history available to recompute %d backfilled series; "
+                "scoring against new rows only",
+                len(keys),
+            )
+            history = new_long.pivot_table(
+                index=["year", "quarter", region_column], columns="kpi_id", values="value"
+            ).reset_index()
+        else:
+            history = history_loader()
+
+        regions = {region_id for _, region_id in keys}
+        history = history[history[region_column].isin(regions)]
+        for key in keys:
+            self.state.pop(key, None)
+        self.rebuild(history, kpi_columns, region_column, keys=keys)
+
+        new_periods = set(
+            new_long[["kpi_id", region_column, "year", "quarter"]].itertuples(
+                index=False, name=None
+            )
+        )
+        return [
+            a
+            for a in self.detect_anomalies_multi(
+                history, kpi_columns, region_column, higher_is_better
+            )
+            if (a.kpi_id, a.region_id) in keys
+            and (a.kpi_id, a.region_id, a.year, a.quarter) in new_periods
+        ]
+
+    def get_state(self) -> list[dict[str, Any]]:
+        """Serialize running state as a list of records."""
+        return [
+            {"kpi_id": kpi_id, "region": region_id, **asdict(stats)}
+            for (kpi_id, region_id), stats in self.state.items()
+        ]
+
+    @classmethod
+    def from_state(cls, records: list[dict[str, Any]], **kwargs: Any) -> "StreamingAnomalyDetector":
+        """Create a detector from records produced by ``get_state``."""
+        state = {
+            (r["kpi_id"], r["region"]): RunningStats(
+                count=int(r["count"]),
+                mean=float(r["mean"]),
+                m2=float(r["m2"]),
+                last_year=r.get("last_year"),
+                last_quarter=r.get("last_quarter"),
+            )
+            for r in records
+        }
+        return cls(state=state, **kwargs)
+
 
 # Service functions for easy access
 def forecast_kpi(
@@ -10,7 +10,7 @@ Services are the primary interface for UI and API layers.
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 import yaml
@@ -28,6 +28,11 @@ from analytics_hub_platform.domain.models import (
     RegionalComparison,
     TimeSeriesPoint,
 )
+from analytics_hub_platform.infrastructure.tracing import traced
+
+if TYPE_CHECKING:
+    from analytics_hub_platform.domain.insight_engine import InsightReport
+    from analytics_hub_platform.domain.ml_services import AnomalyResult
 
 
 @lru_cache(maxsize=1)
@@ -56,6 +61,7 @@ def _get_kpi_higher_is_better(kpi_id: str, catalog: dict[str, Any]) -> bool:
     return True
 
 
+@traced(attributes={"component": "services"})
 def get_executive_snapshot(
     df: pd.DataFrame, filters: FilterParams, language: str = "en"
 ) -> dict[str, Any]:
@@ -203,6 +209,7 @@ def get_executive_snapshot(
     return snapshot
 
 
+@traced(attributes={"component": "services"})
 def get_sustainability_summary(
     df: pd.DataFrame, filters: FilterParams, language: str = "en"
 ) -> dict[str, Any]:
@@ -259,6 +266,7 @@ def get_sustainability_summary(
     }
 
 
+@traced(attributes={"component": "services"})
 def get_kpi_timeseries(
     df: pd.DataFrame, kpi_id: str, filters: FilterParams, years: list[int] | None = None
 ) -> list[TimeSeriesPoint]:
@@ -315,6 +323,7 @@ def get_kpi_timeseries(
     return timeseries
 
 
+@traced(attributes={"component": "services"})
 def get_regional_comparison(
     df: pd.DataFrame, kpi_id: str, filters: FilterParams, language: str = "en"
 ) -> RegionalComparison:
@@ -388,6 +397,7 @@ def get_regional_comparison(
     )
 
 
+@traced(attributes={"component": "services"})
 def get_data_quality_metrics(df: pd.DataFrame, filters: FilterParams) -> dict[str, Any]:
     """
     Get data quality metrics for analyst view.
@@ -476,6 +486,7 @@ def get_data_quality_metrics(df: pd.DataFrame, filters: FilterParams) -> dict[st
     }
 
 
+@traced(attributes={"component": "services"})
 def get_available_periods(df: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Get list of available time periods in the data.
@@ -505,6 +516,7 @@ def get_available_periods(df: pd.DataFrame) -> list[dict[str, Any]]:
     return result
 
 
+@traced(attributes={"component": "services"})
 def get_available_regions(df: pd.DataFrame) -> list[str]:
     """
     Get list of available regions in the data.
@@ -519,3 +531,129 @@ def get_available_regions(df: pd.DataFrame) -> list[str]:
         return []
 
     return sorted(df["region"].unique().tolist())
+
+
+@traced(attributes={"component": "services"})
+def get_analytics_insights(
+    df: pd.DataFrame,
+    filters: FilterParams,
+    max_workers: int | None = None,
+    deadline_seconds: float | None = None,
+) -> "InsightReport":
+    """
+    Run the insight engine over every catalog KPI up to the selected period.
+
+    Each KPI's national (or filtered-region) quarterly series is analyzed as
+    an independent task, so the report can be fanned out across workers and
+    cut short at a deadline.
+
+    Args:
+        df: DataFrame with indicator data
+        filters: Filter parameters (year/quarter bound the history, region filters it)
+        max_workers: Worker count for concurrent generation (None = serial)
+        deadline_seconds: Optional time budget; the report is marked partial if exceeded
+
+    Returns:
+        InsightReport with prioritized insights
+    """
+    from analytics_hub_platform.domain.advanced_analytics import compute_seasonal_indices
+    from analytics_hub_platform.domain.insight_engine import InsightEngine
+
+    catalog = _load_kpi_catalog()
+    data = df
+
+    if filters.year is not None and filters.quarter is not None:
+        data = data[
+            (data["year"] < filters.year)
+            | ((data["year"] == filters.year) & (data["quarter"] <= filters.quarter))
+        ]
+
+    region_id = None
+    if filters.region and filters.region != "all":
+        region_id = filters.region
+        data = data[data["region"] == region_id]
+
+    catalog_kpis = [k for k in catalog.get("kpis", []) if k.get("id") in data.columns]
+    grouped = (
+        data.groupby(["year", "quarter"])[[k["id"] for k in catalog_kpis]]
+        .mean()
+        .reset_index()
+        .sort_values(["year", "quarter"])
+    )
+    # Seasonality for every KPI from one groupby over the aggregated frame
+    seasonality = compute_seasonal_indices(
+        grouped, [k["id"] for k in catalog_kpis], region_column=None
+    )
+
+    kpi_configs = [
+        {
+            "id": kpi["id"],
+            "name": kpi.get("display_name_en", kpi["id"]),
+            "category": kpi.get("category", "economic"),
+            "higher_is_better": kpi.get("higher_is_better") is not False,
+            "data": grouped[["year", "quarter", kpi["id"]]]
+            .rename(columns={kpi["id"]: "value"})
+            .dropna(),
+            "region_id": region_id,
+            "seasonality": seasonality.get((kpi["id"], None)),
+        }
+        for kpi in catalog_kpis
+    ]
+
+    period = f"Q{filters.quarter} {filters.year}" if filters.year else "Current"
+    return InsightEngine().generate_report(
+        kpi_configs,
+        period=period,
+        max_workers=max_workers,
+        deadline_seconds=deadline_seconds,
+    )
+
+
+@traced(attributes={"component": "services"})
+def get_multivariate_anomalies(
+    df: pd.DataFrame,
+    filters: FilterParams,
+    n_jobs: int | None = -1,
+    fit_in_background: bool = False,
+) -> list["AnomalyResult"] | None:
+    """
+    Flag region-periods whose combination of KPI values is unusual.
+
+    One Isolation Forest is fitted over every catalog KPI and region of the
+    tenant's full history. The fitted model is cached per tenant until the
+    data changes (ingestion also invalidates it), so repeated requests only
+    score rows. Results are limited to the selected period and region.
+
+    Args:
+        df: DataFrame with the tenant's indicator data
+        filters: Filter parameters (tenant keys the model cache; year/quarter
+            and region select the rows reported)
+        n_jobs: Parallel jobs for fitting and scoring (-1 uses all cores)
+        fit_in_background: Fit a missing model on a background thread and
+            return None instead of fitting inline (for request paths)
+
+    Returns:
+        Anomalies for the selected rows, largest deviation first, or None
+        while the model is being fitted in the background
+    """
+    from analytics_hub_platform.domain.ml_services import AnomalyDetector
+
+    catalog = _load_kpi_catalog()
+    kpi_ids = [k["id"] for k in catalog.get("kpis", []) if k.get("id") in df.columns]
+    # Fit on the whole history so the cached model is shared by every period filter
+    anomalies = AnomalyDetector().detect_multivariate_anomalies(
+        df,
+        kpi_ids,
+        region_column="region",
+        tenant_id=filters.tenant_id,
+        n_jobs=n_jobs,
+        fit_in_background=fit_in_background,
+    )
+    if anomalies is None:
+        return None
+
+    if filters.year is not None and filters.quarter is not None:
+        anomalies = [a for a in anomalies if (a.year, a.quarter) == (filters.year, filters.quarter)]
+    if filters.region and filters.region != "all":
+        anomalies = [a for a in anomalies if a.region_id == filters.region]
+    return sorted(anomalies, key=lambda a: abs(a.z_score), reverse=True)
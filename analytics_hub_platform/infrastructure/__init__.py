@@ -11,7 +11,7 @@ This module contains infrastructure components:
 - Logging configuration
 """
 
-from analytics_hub_platform.infrastructure.caching import CacheManager, get_cache
+from analytics_hub_platform.infrastructure.caching import CacheManager, PersistentCache, get_cache
 from analytics_hub_platform.infrastructure.db_init import get_engine, initialize_database
 from analytics_hub_platform.infrastructure.logging_config import get_logger, setup_logging
 from analytics_hub_platform.infrastructure.repository import Repository, get_repository
@@ -26,6 +26,7 @@ __all__ = [
     "Repository",
     "get_repository",
     "CacheManager",
+    "PersistentCache",
     "get_cache",
     "RateLimiter",
     "get_rate_limiter",
@@ -5,18 +5,28 @@ Eng. Sultan Albuqami
 
 Thread-safe in-memory caching for frequently accessed data.
 Designed to be replaced with Redis or similar in production.
+
+PersistentCache is a small SQLite-backed store for JSON values that must
+survive restarts (e.g. LLM responses).
 """
 
 import hashlib
 import json
+import logging
+import sqlite3
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from functools import wraps
+from pathlib import Path
 from typing import Any
 
 from analytics_hub_platform.infrastructure.settings import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 class CacheEntry:
     """A single cache entry with expiration."""
@@ -247,6 +257,110 @@ def cached(ttl: int | None = None, key_prefix: str = ""):
     return decorator
 
 
+class PersistentCache:
+    """
+    On-disk key/value cache for JSON-serializable values with TTL.
+
+    Each operation opens its own SQLite connection, so one instance can be
+    shared across threads. Failures to read or write are logged and treated
+    as misses: the cache never breaks the caller.
+    """
+
+    def __init__(self, path: str | Path, default_ttl: int = 3600):
+        """
+        Initialize the store, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+            default_ttl: Default time-to-live in seconds
+        """
+        self.path = Path(path)
+        self._default_ttl = default_ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and always closing it."""
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a value from the store.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value or None if not found/expired
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] < time.time():
+                    conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    return None
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Persistent cache read failed for {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional TTL override in seconds
+        """
+        expires_at = time.time() + (ttl or self._default_ttl)
+        try:
+            payload = json.dumps(value, default=str)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, payload, expires_at),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Persistent cache write failed for {key}: {e}")
+
+    def delete(self, key: str) -> bool:
+        """Delete a key; returns True if it existed."""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,)).rowcount > 0
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries; returns the number removed."""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM cache_entries WHERE expires_at < ?", (time.time(),)
+            ).rowcount
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+
 # Global cache instance
 _cache_instance: CacheManager | None = None
 
@@ -11,17 +11,24 @@ Provides functionality for:
 
 import io
 import uuid
+from dataclasses import asdict
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from pydantic import BaseModel, Field
+from sqlalchemy import delete, select
 
 from analytics_hub_platform.infrastructure.db_init import (
+    anomaly_stream_state,
     get_engine,
     sustainability_indicators,
 )
 from analytics_hub_platform.infrastructure.prod_logging import get_correlated_logger
 
+if TYPE_CHECKING:
+    from analytics_hub_platform.domain.ml_services import StreamingAnomalyDetector
+
 logger = get_correlated_logger("analytics_hub.ingestion")
 
 
@@ -61,6 +68,16 @@ INDICATOR_COLUMNS = [
     "air_quality_index",
 ]
 
+# Indicators where a lower value is the better outcome (for anomaly wording)
+LOWER_IS_BETTER_INDICATORS = [
+    "unemployment_rate",
+    "skills_gap_index",
+    "co2_index",
+    "co2_total",
+    "energy_intensity",
+    "air_quality_index",
+]
+
 # Valid ranges for each field (min, max)
 FIELD_RANGES: dict[str, tuple[float, float]] = {
     "year": (2020, 2030),
@@ -144,6 +161,7 @@ class IngestionResult(BaseModel):
     rows_updated: int = 0
     rows_skipped: int = 0
     validation: ValidationResult = Field(default_factory=ValidationResult)
+    anomalies: list[dict[str, Any]] = Field(default_factory=list)
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     message: str = ""
 
@@ -483,17 +501,31 @@ def insert_data(
     Returns:
         Tuple of (inserted, updated, skipped) counts
     """
-    engine = get_engine()
+    statuses = _upsert_rows(df, replace_existing)
 
-    inserted = 0
-    updated = 0
-    skipped = 0
+    inserted = statuses.count("inserted")
+    updated = statuses.count("updated")
+    skipped = statuses.count("skipped")
+
+    logger.info(f"Database operation complete: {inserted} inserted, {updated} updated, {skipped} skipped")
+    return inserted, updated, skipped
+
+
+def _upsert_rows(df: pd.DataFrame, replace_existing: bool) -> list[str]:
+    """
+    Write rows to the database.
+
+    Returns:
+        Per-row status ("inserted", "updated" or "skipped"), aligned with df
+    """
+    engine = get_engine()
+    statuses: list[str] = []
 
     with engine.begin() as conn:
         for _, row in df.iterrows():
             try:
                 # Check if record exists
-                from sqlalchemy import and_, select
+                from sqlalchemy import and_
 
                 existing = conn.execute(
                     select(sustainability_indicators).where(
@@ -516,22 +548,145 @@ def insert_data(
                             .where(sustainability_indicators.c.id == existing.id)
                             .values(**row.dropna().to_dict())
                         )
-                        updated += 1
+                        statuses.append("updated")
                     else:
-                        skipped += 1
+                        statuses.append("skipped")
                 else:
                     # Insert new record
                     conn.execute(
                         sustainability_indicators.insert().values(**row.dropna().to_dict())
                     )
-                    inserted += 1
+                    statuses.append("inserted")
 
             except Exception as e:
                 logger.error(f"Failed to insert row: {e}")
-                skipped += 1
+                statuses.append("skipped")
 
-    logger.info(f"Database operation complete: {inserted} inserted, {updated} updated, {skipped} skipped")
-    return inserted, updated, skipped
+    return statuses
+
+
+# =============================================================================
+# INCREMENTAL ANOMALY DETECTION
+# =============================================================================
+
+
+def load_anomaly_detector(tenant_id: str) -> "StreamingAnomalyDetector":
+    """
+    Load the persisted streaming anomaly detector for a tenant.
+
+    Args:
+        tenant_id: Tenant identifier
+
+    Returns:
+        StreamingAnomalyDetector with the tenant's running statistics
+    """
+    from analytics_hub_platform.domain.ml_services import StreamingAnomalyDetector
+
+    engine = get_engine()
+    anomaly_stream_state.create(engine, checkfirst=True)
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(anomaly_stream_state).where(anomaly_stream_state.c.tenant_id == tenant_id)
+        ).mappings()
+        records = [dict(r) for r in rows]
+
+    return StreamingAnomalyDetector.from_state(records)
+
+
+def save_anomaly_detector(tenant_id: str, detector: "StreamingAnomalyDetector") -> None:
+    """
+    Persist a tenant's streaming anomaly detector state.
+
+    Args:
+        tenant_id: Tenant identifier
+        detector: Detector whose running statistics should be stored
+    """
+    engine = get_engine()
+    anomaly_stream_state.create(engine, checkfirst=True)
+    now = datetime.now(timezone.utc)
+
+    with engine.begin() as conn:
+        conn.execute(
+            delete(anomaly_stream_state).where(anomaly_stream_state.c.tenant_id == tenant_id)
+        )
+        records = [
+            {**record, "tenant_id": tenant_id, "updated_at": now}
+            for record in detector.get_state()
+        ]
+        if records:
+            conn.execute(anomaly_stream_state.insert(), records)
+
+
+def _load_tenant_history(tenant_id: str) -> pd.DataFrame:
+    """Load all indicator rows for a tenant (full-recompute fallback)."""
+    with get_engine().connect() as conn:
+        return pd.read_sql(
+            select(sustainability_indicators).where(
+                sustainability_indicators.c.tenant_id == tenant_id
+            ),
+            conn,
+        )
+
+
+def detect_ingested_anomalies(
+    prepared_df: pd.DataFrame,
+    statuses: list[str],
+    tenant_id: str,
+) -> list[dict[str, Any]]:
+    """
+    Score newly written rows for anomalies without rescanning history.
+
+    Inserted rows that extend a series are scored against the persisted
+    running statistics in O(new rows). Updated rows and backfilled periods
+    trigger a full recompute of the affected series.
+
+    Args:
+        prepared_df: DataFrame that was written to the database
+        statuses: Per-row status from the write ("inserted", "updated", "skipped")
+        tenant_id: Tenant identifier
+
+    Returns:
+        List of anomaly dictionaries for the written rows
+    """
+    status = pd.Series(statuses, index=prepared_df.index)
+    written = prepared_df[status != "skipped"]
+    if written.empty:
+        return []
+
+    kpi_columns = [c for c in INDICATOR_COLUMNS + ["sustainability_index"] if c in written.columns]
+    updated_regions = set(written.loc[status[status != "skipped"] == "updated", "region"])
+    recompute = {(kpi, region) for kpi in kpi_columns for region in updated_regions}
+
+    detector = load_anomaly_detector(tenant_id)
+    anomalies = detector.update(
+        written,
+        kpi_columns,
+        higher_is_better=dict.fromkeys(LOWER_IS_BETTER_INDICATORS, False),
+        history_loader=lambda: _load_tenant_history(tenant_id),
+        recompute=recompute,
+    )
+    save_anomaly_detector(tenant_id, detector)
+
+    logger.info(f"Anomaly scan on {len(written)} ingested rows: {len(anomalies)} anomalies")
+    return [asdict(a) for a in anomalies]
+
+
+def recompute_anomaly_state(tenant_id: str) -> None:
+    """
+    Rebuild a tenant's running anomaly statistics from full history.
+
+    Use after bulk backfills or data corrections made outside ``ingest_file``.
+
+    Args:
+        tenant_id: Tenant identifier
+    """
+    from analytics_hub_platform.domain.ml_services import StreamingAnomalyDetector
+
+    history = _load_tenant_history(tenant_id)
+    detector = StreamingAnomalyDetector()
+    detector.rebuild(history, INDICATOR_COLUMNS + ["sustainability_index"])
+    save_anomaly_detector(tenant_id, detector)
 
 
 # =============================================================================
@@ -546,6 +701,7 @@ def ingest_file(
     source_system: str = "manual_upload",
     replace_existing: bool = False,
     validate_only: bool = False,
+    detect_anomalies: bool = True,
 ) -> IngestionResult:
     """
     Main entry point for data ingestion.
@@ -557,6 +713,7 @@ def ingest_file(
         source_system: Source system identifier
         replace_existing: If True, update existing records
         validate_only: If True, only validate without inserting
+        detect_anomalies: If True, score the written rows for anomalies
 
     Returns:
         IngestionResult with operation details
@@ -588,17 +745,36 @@ def ingest_file(
     # Step 3: Prepare and insert
     try:
         prepared_df = prepare_for_insert(df, tenant_id, batch_id, source_system)
-        inserted, updated, skipped = insert_data(prepared_df, replace_existing)
+        statuses = _upsert_rows(prepared_df, replace_existing)
 
+        inserted = statuses.count("inserted")
+        updated = statuses.count("updated")
         result.rows_inserted = inserted
         result.rows_updated = updated
-        result.rows_skipped = skipped
+        result.rows_skipped = statuses.count("skipped")
         result.success = True
         result.message = f"Successfully processed {inserted + updated} rows"
+        logger.info(
+            f"Database operation complete: {inserted} inserted, {updated} updated, "
+            f"{result.rows_skipped} skipped"
+        )
 
     except Exception as e:
         logger.error(f"Ingestion failed: {e}")
         result.message = f"Ingestion failed: {e}"
+        return result
+
+    if inserted or updated:
+        from analytics_hub_platform.domain.ml_services import invalidate_isolation_forest_cache
+
+        invalidate_isolation_forest_cache(tenant_id)
+
+    if detect_anomalies:
+        try:
+            result.anomalies = detect_ingested_anomalies(prepared_df, statuses, tenant_id)
+        except Exception as e:
+            # Anomaly scoring must never fail an otherwise successful load
+            logger.warning(f"Anomaly detection on ingested rows failed: {e}")
 
     return result
 
@@ -150,6 +150,22 @@ audit_log = Table(
 )
 
 
+# Running anomaly-detection statistics (for incremental scoring on ingest)
+anomaly_stream_state = Table(
+    "anomaly_stream_state",
+    metadata,
+    Column("tenant_id", String(50), primary_key=True),
+    Column("kpi_id", String(100), primary_key=True),
+    Column("region", String(100), primary_key=True),
+    Column("count", Integer, nullable=False, default=0),
+    Column("mean", Float, nullable=False, default=0.0),
+    Column("m2", Float, nullable=False, default=0.0),
+    Column("last_year", Integer),
+    Column("last_quarter", Integer),
+    Column("updated_at", DateTime, default=utc_now, onupdate=utc_now),
+)
+
+
 # ============================================
 # ENGINE MANAGEMENT
 # ============================================
@@ -10,37 +10,104 @@ FastAPI middleware for:
 - Error tracking
 """
 
+import itertools
 import time
 import uuid
+from functools import lru_cache
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
 
 from analytics_hub_platform.infrastructure.observability import (
     clear_correlation_id,
+    decrement_gauge,
     get_context_logger,
+    get_metrics,
     increment_counter,
+    increment_gauge,
     observe_histogram,
     set_correlation_id,
-    set_gauge,
+)
+from analytics_hub_platform.infrastructure.settings import get_settings
+from analytics_hub_platform.infrastructure.tracing import (
+    SpanKind,
+    SpanStatus,
+    parse_traceparent,
+    start_span,
+    trace_id_from_correlation_id,
 )
 
 logger = get_context_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def normalize_path(path: str) -> str:
+    """
+    Normalize path for metric labels.
+
+    Replaces dynamic segments (IDs, etc.) with placeholders
+    to avoid high-cardinality labels.
+    """
+    parts = path.strip("/").split("/")
+    normalized = []
+
+    for part in parts:
+        # Replace numeric IDs
+        if part.isdigit():
+            normalized.append("{id}")
+        # Replace UUIDs
+        elif len(part) == 36 and part.count("-") == 4:
+            normalized.append("{uuid}")
+        else:
+            normalized.append(part)
+
+    return "/" + "/".join(normalized) if normalized else "/"
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
     Middleware for logging HTTP requests and responses.
 
     Features:
     - Assigns correlation ID to each request
-    - Logs request start and completion
+    - Logs request start and completion (optionally sampled)
     - Records timing metrics
-    - Tracks error rates
+    - Tracks error rates and requests in flight
+    - Opens the root server span of the request trace (continuing an
+      incoming W3C traceparent, else keyed by the correlation ID)
+
+    With sample_rate N > 1 only every Nth request is logged in full; failed
+    (status >= 400 or exception) and slow requests are always logged.
+    Metrics are recorded for every request regardless of sampling.
     """
 
     # Paths to exclude from detailed logging
-    EXCLUDE_PATHS = {"/health", "/metrics", "/favicon.ico"}
+    EXCLUDE_PATHS = {"/health", "/health/live", "/health/ready", "/metrics", "/favicon.ico"}
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: int | None = None,
+        slow_threshold_ms: float | None = None,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            sample_rate: Log 1 in N successful requests (default: settings)
+            slow_threshold_ms: Always log requests slower than this (default: settings)
+        """
+        super().__init__(app)
+        settings = get_settings()
+        self.sample_rate = max(1, sample_rate or settings.request_log_sample_rate)
+        threshold_ms = (
+            slow_threshold_ms if slow_threshold_ms is not None else settings.request_log_slow_ms
+        )
+        self._slow_threshold = threshold_ms / 1000
+        self._requests_seen = itertools.count()
+        get_metrics().register_gauge("http_requests_active", multiprocess_mode="sum")
 
     async def dispatch(
         self,
@@ -48,79 +115,81 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         call_next: RequestResponseEndpoint,
     ) -> Response:
         # Skip excluded paths
-        if request.url.path in self.EXCLUDE_PATHS:
+        path = request.url.path
+        if path in self.EXCLUDE_PATHS:
             return await call_next(request)
 
         # Get or create correlation ID
-        correlation_id = request.headers.get("X-Correlation-ID")
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
-
+        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
         set_correlation_id(correlation_id)
 
-        # Extract request info
         method = request.method
-        path = request.url.path
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("User-Agent", "")[:100]
-
-        # Log request start
-        logger.info(
-            f"Request started: {method} {path}",
-            method=method,
-            path=path,
-            client_ip=client_ip,
-            user_agent=user_agent,
-        )
+        normalized_path = normalize_path(path)
+        method_labels = {"method": method}
+        sampled = next(self._requests_seen) % self.sample_rate == 0
+
+        if sampled:
+            logger.info(
+                f"Request started: {method} {path}",
+                method=method,
+                path=path,
+                client_ip=request.client.host if request.client else "unknown",
+                user_agent=request.headers.get("User-Agent", "")[:100],
+            )
 
-        # Increment request counter
         increment_counter(
             "http_requests_total",
-            labels={"method": method, "path": self._normalize_path(path)},
+            labels={"method": method, "path": normalized_path},
         )
-
-        # Track active requests
-        set_gauge("http_requests_active", 1, labels={"method": method})
+        increment_gauge("http_requests_active", labels=method_labels)
 
         # Process request
+        remote_parent = parse_traceparent(request.headers.get("traceparent"))
+        trace_id, parent_span_id = remote_parent or (
+            trace_id_from_correlation_id(correlation_id),
+            None,
+        )
         start_time = time.perf_counter()
         try:
-            response = await call_next(request)
+            with start_span(
+                f"{method} {normalized_path}",
+                {"http.method": method, "http.route": normalized_path, "http.target": path},
+                kind=SpanKind.SERVER,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+            ) as span:
+                response = await call_next(request)
+                span.set_attribute("http.status_code", response.status_code)
+                if response.status_code >= 500:
+                    span.set_status(SpanStatus.ERROR)
             status_code = response.status_code
 
             # Track response metrics
             elapsed = time.perf_counter() - start_time
-
-            observe_histogram(
-                "http_request_duration_seconds",
-                elapsed,
-                labels={
-                    "method": method,
-                    "path": self._normalize_path(path),
-                    "status": str(status_code),
-                },
-            )
+            status_labels = {
+                "method": method,
+                "path": normalized_path,
+                "status": str(status_code),
+            }
+            observe_histogram("http_request_duration_seconds", elapsed, labels=status_labels)
 
             # Log request completion
-            log_level = "info" if status_code < 400 else "warning" if status_code < 500 else "error"
-            getattr(logger, log_level)(
-                f"Request completed: {method} {path} - {status_code} ({elapsed * 1000:.1f}ms)",
-                method=method,
-                path=path,
-                status_code=status_code,
-                duration_ms=round(elapsed * 1000, 2),
-            )
+            if sampled or status_code >= 400 or elapsed >= self._slow_threshold:
+                log_level = (
+                    "info" if status_code < 400 else "warning" if status_code < 500 else "error"
+                )
+                getattr(logger, log_level)(
+                    f"Request completed: {method} {path} - {status_code} ({elapsed * 1000:.1f}ms)",
+                    method=method,
+                    path=path,
+                    status_code=status_code,
+                    duration_ms=round(elapsed * 1000, 2),
+                    sampled=sampled,
+                )
 
             # Track errors
             if status_code >= 400:
-                increment_counter(
-                    "http_errors_total",
-                    labels={
-                        "method": method,
-                        "path": self._normalize_path(path),
-                        "status": str(status_code),
-                    },
-                )
+                increment_counter("http_errors_total", labels=status_labels)
 
             # Add correlation ID to response headers
             response.headers["X-Correlation-ID"] = correlation_id
@@ -143,7 +212,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 "http_errors_total",
                 labels={
                     "method": method,
-                    "path": self._normalize_path(path),
+                    "path": normalized_path,
                     "status": "500",
                     "exception": type(e).__name__,
                 },
@@ -153,29 +222,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         finally:
             clear_correlation_id()
-            set_gauge("http_requests_active", 0, labels={"method": method})
-
-    def _normalize_path(self, path: str) -> str:
-        """
-        Normalize path for metric labels.
-
-        Replaces dynamic segments (IDs, etc.) with placeholders
-        to avoid high-cardinality labels.
-        """
-        parts = path.strip("/").split("/")
-        normalized = []
-
-        for part in parts:
-            # Replace numeric IDs
-            if part.isdigit():
-                normalized.append("{id}")
-            # Replace UUIDs
-            elif len(part) == 36 and part.count("-") == 4:
-                normalized.append("{uuid}")
-            else:
-                normalized.append(part)
-
-        return "/" + "/".join(normalized) if normalized else "/"
+            decrement_gauge("http_requests_active", labels=method_labels)
 
 
 class MetricsMiddleware(BaseHTTPMiddleware):
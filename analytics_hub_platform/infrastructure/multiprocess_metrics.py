@@ -0,0 +1,411 @@
+"""
+Multi-process Metrics Module
+Sustainable Economic Development Analytics Hub
+
+Aggregates metrics across worker processes (gunicorn/uvicorn --workers).
+
+Each worker mirrors its counters, gauges and histogram buckets into a
+memory-mapped file named after its PID in a shared directory, and a scrape
+in any worker reads and combines every file. Files of workers that have
+exited are folded into an archive file (counters and histograms, so totals
+stay monotonic) or dropped (gauges, which describe live processes only).
+"""
+
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from analytics_hub_platform.infrastructure.observability import HistogramSnapshot
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:  # pragma: no cover - Windows
+    HAS_FCNTL = False
+
+logger = logging.getLogger(__name__)
+
+# Multi-process aggregation modes for gauges
+GAUGE_MODES = ("all", "sum", "max", "min")
+
+WORKER_FILE_PREFIX = "metrics_"
+ARCHIVE_FILE = "archive.db"
+LOCK_FILE = "archive.lock"
+
+_INITIAL_SIZE = 64 * 1024
+_HEADER = struct.Struct("<I4x")  # Bytes in use (header included)
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+
+CounterMap = dict[str, dict[str, float]]
+GaugeMap = dict[str, dict[str, float]]
+HistogramMap = dict[str, dict[str, HistogramSnapshot]]
+
+
+# =============================================================================
+# MEMORY-MAPPED VALUE FILE
+# =============================================================================
+
+
+def _entry_layout(key: bytes) -> tuple[int, int]:
+    """Return (value offset, entry size) of an entry relative to its start."""
+    value_offset = _KEY_LENGTH.size + len(key)
+    value_offset += -value_offset % 8  # Keep float64 values 8-byte aligned
+    return value_offset, value_offset + _VALUE.size
+
+
+def _iter_entries(buffer: bytes | mmap.mmap) -> Iterator[tuple[str, int]]:
+    """Yield (key, value position) for every entry in a value file buffer."""
+    if len(buffer) < _HEADER.size:
+        return
+    used = min(_HEADER.unpack_from(buffer, 0)[0], len(buffer))
+    pos = _HEADER.size
+    while pos + _KEY_LENGTH.size <= used:
+        (length,) = _KEY_LENGTH.unpack_from(buffer, pos)
+        key = bytes(buffer[pos + _KEY_LENGTH.size : pos + _KEY_LENGTH.size + length])
+        value_offset, size = _entry_layout(key)
+        if pos + size > used:
+            break
+        yield key.decode("utf-8"), pos + value_offset
+        pos += size
+
+
+def read_value_file(path: str | Path) -> dict[str, float]:
+    """
+    Read every value of a file written by MmapValueFile.
+
+    Safe while the owner keeps writing: entries are only counted as present
+    once the header has been advanced past them.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return {}
+    return {key: _VALUE.unpack_from(data, pos)[0] for key, pos in _iter_entries(data)}
+
+
+class MmapValueFile:
+    """
+    Memory-mapped file of named float64 values.
+
+    New keys are appended; existing values are overwritten in place, so a
+    write is a dictionary lookup and an 8-byte store. Not thread-safe:
+    callers serialize writes.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Open (or create) a value file.
+
+        Args:
+            path: File location
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "a+b")  # noqa: SIM115 - kept open for the mmap
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _INITIAL_SIZE:
+            self._file.truncate(_INITIAL_SIZE)
+            size = _INITIAL_SIZE
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+
+        self._used = _HEADER.unpack_from(self._mmap, 0)[0] or _HEADER.size
+        _HEADER.pack_into(self._mmap, 0, self._used)
+        self._positions = dict(_iter_entries(self._mmap))
+
+    def write(self, key: str, value: float) -> None:
+        """Set the value of a key."""
+        pos = self._positions.get(key)
+        if pos is None:
+            pos = self._append(key)
+        _VALUE.pack_into(self._mmap, pos, value)
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode("utf-8")
+        value_offset, size = _entry_layout(encoded)
+        if self._used + size > len(self._mmap):
+            self._grow(self._used + size)
+
+        start = self._used
+        _KEY_LENGTH.pack_into(self._mmap, start, len(encoded))
+        self._mmap[start + _KEY_LENGTH.size : start + _KEY_LENGTH.size + len(encoded)] = encoded
+        _VALUE.pack_into(self._mmap, start + value_offset, 0.0)
+
+        # Publish the entry to readers only once it is complete
+        self._used += size
+        _HEADER.pack_into(self._mmap, 0, self._used)
+        self._positions[key] = start + value_offset
+        return start + value_offset
+
+    def _grow(self, needed: int) -> None:
+        size = len(self._mmap)
+        while size < needed:
+            size *= 2
+        self._mmap.close()
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._mmap.close()
+        self._file.close()
+
+
+# =============================================================================
+# KEY ENCODING
+# =============================================================================
+
+
+def _encode_key(kind: str, name: str, labels: str, extra: str = "") -> str:
+    return json.dumps([kind, name, labels, extra], separators=(",", ":"))
+
+
+def _histogram_values(snapshot: HistogramSnapshot) -> Iterator[tuple[str, float]]:
+    """Flatten a histogram into (extra, value) pairs stored in a value file."""
+    for bound, count in zip(snapshot.bounds, snapshot.counts, strict=False):
+        yield f"le={bound!r}", float(count)
+    yield "le=+Inf", float(snapshot.counts[-1])
+    yield "sum", snapshot.sum
+    yield "min", snapshot.min
+    yield "max", snapshot.max
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists but belongs to another user
+    return True
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+
+class MultiprocessMetricsStore:
+    """
+    Shared-directory metrics store for one worker process.
+
+    The worker writes snapshots of its own metrics with write_snapshot;
+    collect aggregates the files of all workers.
+    """
+
+    def __init__(self, directory: str | Path, pid: int | None = None):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory shared by all workers
+            pid: Worker process ID (default: the current process)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.pid = pid if pid is not None else os.getpid()
+        self._lock = threading.Lock()
+        self._file = MmapValueFile(self._worker_path(self.pid))
+
+    def _worker_path(self, pid: int) -> Path:
+        return self.directory / f"{WORKER_FILE_PREFIX}{pid}.db"
+
+    def write_snapshot(
+        self,
+        counters: CounterMap,
+        gauges: GaugeMap,
+        histograms: HistogramMap,
+        gauge_modes: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Mirror this worker's current metric values into its file.
+
+        Args:
+            counters: Counter values by name and label key
+            gauges: Gauge values by name and label key
+            histograms: Histogram snapshots by name and label key
+            gauge_modes: Aggregation mode per gauge name (default "all")
+        """
+        gauge_modes = gauge_modes or {}
+        with self._lock:
+            for name, series in counters.items():
+                for labels, value in series.items():
+                    self._file.write(_encode_key("counter", name, labels), value)
+            for name, series in gauges.items():
+                mode = gauge_modes.get(name, "all")
+                for labels, value in series.items():
+                    self._file.write(_encode_key("gauge", name, labels, mode), value)
+            for name, series in histograms.items():
+                for labels, snapshot in series.items():
+                    for extra, value in _histogram_values(snapshot):
+                        self._file.write(_encode_key("histogram", name, labels, extra), value)
+
+    def clear(self) -> None:
+        """Discard this worker's file (e.g. after a metrics reset)."""
+        with self._lock:
+            self._file.close()
+            self._worker_path(self.pid).unlink(missing_ok=True)
+            self._file = MmapValueFile(self._worker_path(self.pid))
+
+    def close(self) -> None:
+        """Close this worker's file, leaving it for aggregation."""
+        with self._lock:
+            self._file.close()
+
+    @contextmanager
+    def _archive_lock(self, shared: bool = False) -> Iterator[None]:
+        """
+        Lock the archive across processes.
+
+        Archiving takes the lock exclusively; scrapes take it shared so a
+        worker file cannot move into the archive while they read.
+        """
+        with open(self.directory / LOCK_FILE, "a+b") as lock_file:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _worker_files(self) -> dict[int, Path]:
+        files = {}
+        for path in self.directory.glob(f"{WORKER_FILE_PREFIX}*.db"):
+            try:
+                files[int(path.stem[len(WORKER_FILE_PREFIX) :])] = path
+            except ValueError:
+                continue
+        return files
+
+    def cleanup_dead_workers(self) -> int:
+        """
+        Fold the files of exited workers into the archive and delete them.
+
+        Counters and histogram buckets are added to the archive; gauges are
+        dropped. Returns the number of worker files removed.
+        """
+        dead = {
+            pid: path
+            for pid, path in self._worker_files().items()
+            if pid != self.pid and not _process_alive(pid)
+        }
+        if not dead:
+            return 0
+
+        with self._archive_lock():
+            archive_path = self.directory / ARCHIVE_FILE
+            archived = read_value_file(archive_path)
+            for path in dead.values():
+                for key, value in read_value_file(path).items():
+                    kind, _, _, extra = json.loads(key)
+                    if kind == "gauge":
+                        continue
+                    if key not in archived:
+                        archived[key] = value
+                    elif extra == "min":
+                        archived[key] = min(archived[key], value)
+                    elif extra == "max":
+                        archived[key] = max(archived[key], value)
+                    else:
+                        archived[key] += value
+
+            # Write the new archive beside the old one and swap atomically
+            tmp_path = archive_path.with_suffix(".tmp")
+            tmp_path.unlink(missing_ok=True)
+            tmp_file = MmapValueFile(tmp_path)
+            for key, value in archived.items():
+                tmp_file.write(key, value)
+            tmp_file.close()
+            os.replace(tmp_path, archive_path)
+
+            for path in dead.values():
+                path.unlink(missing_ok=True)
+
+        logger.info(f"Archived metrics of {len(dead)} exited worker(s)")
+        return len(dead)
+
+    def collect(self) -> tuple[CounterMap, GaugeMap, HistogramMap]:
+        """
+        Aggregate the metrics of all workers (live and archived).
+
+        Returns:
+            Counters, gauges and histograms in the MetricsCollector layout
+        """
+        self.cleanup_dead_workers()
+
+        counters: CounterMap = defaultdict(lambda: defaultdict(float))
+        gauge_values: dict[tuple[str, str, str], list[tuple[int, float]]] = defaultdict(list)
+        histogram_parts: dict[tuple[str, str], dict[str, float]] = defaultdict(dict)
+
+        # Read worker files and the archive as one snapshot: a worker archived
+        # between the two reads would otherwise be counted twice
+        with self._archive_lock(shared=True):
+            sources = [(pid, read_value_file(path)) for pid, path in self._worker_files().items()]
+            sources.append((-1, read_value_file(self.directory / ARCHIVE_FILE)))
+
+        for pid, values in sources:
+            for key, value in values.items():
+                kind, name, labels, extra = json.loads(key)
+                if kind == "counter":
+                    counters[name][labels] += value
+                elif kind == "gauge":
+                    gauge_values[(name, labels, extra)].append((pid, value))
+                elif kind == "histogram":
+                    parts = histogram_parts[(name, labels)]
+                    if extra not in parts:
+                        parts[extra] = value
+                    elif extra == "min":
+                        parts[extra] = min(parts[extra], value)
+                    elif extra == "max":
+                        parts[extra] = max(parts[extra], value)
+                    else:
+                        parts[extra] += value
+
+        gauges: GaugeMap = defaultdict(dict)
+        for (name, labels, mode), values in gauge_values.items():
+            if mode == "all":
+                for pid, value in values:
+                    pid_label = f"pid={pid}"
+                    gauges[name][f"{labels},{pid_label}" if labels else pid_label] = value
+            elif mode == "max":
+                gauges[name][labels] = max(v for _, v in values)
+            elif mode == "min":
+                gauges[name][labels] = min(v for _, v in values)
+            else:
+                gauges[name][labels] = sum(v for _, v in values)
+
+        histograms: HistogramMap = defaultdict(dict)
+        for (name, labels), parts in histogram_parts.items():
+            histograms[name][labels] = _snapshot_from_parts(parts)
+
+        return (
+            {name: dict(series) for name, series in counters.items()},
+            dict(gauges),
+            dict(histograms),
+        )
+
+
+def _snapshot_from_parts(parts: dict[str, float]) -> HistogramSnapshot:
+    """Rebuild a HistogramSnapshot from its flattened values."""
+    bounds = sorted(
+        float(extra[3:]) for extra in parts if extra.startswith("le=") and extra != "le=+Inf"
+    )
+    counts = [int(parts.get(f"le={bound!r}", 0)) for bound in bounds]
+    counts.append(int(parts.get("le=+Inf", 0)))
+    return HistogramSnapshot(
+        bounds=tuple(bounds),
+        counts=counts,
+        count=sum(counts),
+        sum=parts.get("sum", 0.0),
+        min=parts.get("min", math.inf),
+        max=parts.get("max", -math.inf),
+    )
@@ -10,21 +10,45 @@ Provides observability infrastructure:
 - Health check utilities
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import math
+import os
+import queue
 import threading
 import time
 import uuid
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any
+from itertools import accumulate
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from analytics_hub_platform.infrastructure.settings import get_settings
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if TYPE_CHECKING:
+    from analytics_hub_platform.infrastructure.multiprocess_metrics import (
+        MultiprocessMetricsStore,
+    )
+
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # CORRELATION ID MANAGEMENT
 # =============================================================================
@@ -81,6 +105,24 @@ def correlation_context(correlation_id: str | None = None):
 # =============================================================================
 
 
+# One preconfigured encoder: json.dumps with keyword options builds a new one per call.
+# check_circular stays on so self-referencing extras raise ValueError (stringified below).
+_JSON_ENCODER = json.JSONEncoder(default=str, ensure_ascii=False)
+
+
+def _encode_json_stdlib(data: dict[str, Any]) -> str:
+    return _JSON_ENCODER.encode(data)
+
+if HAS_ORJSON:
+
+    def encode_log_json(data: dict[str, Any]) -> str:
+        """Serialize a log record dict (orjson; unknown types rendered with str)."""
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+else:
+    encode_log_json = _encode_json_stdlib
+
+
 class StructuredLogFormatter(logging.Formatter):
     """
     JSON formatter for structured logging.
@@ -92,47 +134,66 @@ class StructuredLogFormatter(logging.Formatter):
     - message: Log message
     - correlation_id: Request correlation ID
     - extra: Additional context
+
+    Settings are read once at construction. Extras are serialized in one
+    pass, with a per-field fallback only when the whole record fails.
     """
 
-    RESERVED_ATTRS = {
-        "name",
-        "msg",
-        "args",
-        "created",
-        "filename",
-        "funcName",
-        "levelname",
-        "levelno",
-        "lineno",
-        "module",
-        "msecs",
-        "pathname",
-        "process",
-        "processName",
-        "relativeCreated",
-        "stack_info",
-        "exc_info",
-        "exc_text",
-        "thread",
-        "threadName",
-        "message",
-        "asctime",
-    }
+    RESERVED_ATTRS = frozenset(
+        {
+            "name",
+            "msg",
+            "args",
+            "created",
+            "filename",
+            "funcName",
+            "levelname",
+            "levelno",
+            "lineno",
+            "module",
+            "msecs",
+            "pathname",
+            "process",
+            "processName",
+            "relativeCreated",
+            "stack_info",
+            "exc_info",
+            "exc_text",
+            "thread",
+            "threadName",
+            "taskName",
+            "message",
+            "asctime",
+            "correlation_id",  # Emitted as a top-level field
+        }
+    )
+
+    def __init__(self, include_location: bool | None = None):
+        """
+        Initialize the formatter.
+
+        Args:
+            include_location: Add file/line/function (default: settings.debug)
+        """
+        super().__init__()
+        if include_location is None:
+            include_location = get_settings().debug
+        self.include_location = include_location
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         # Base log structure
-        log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+        log_data: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "correlation_id": get_correlation_id(),
+            # Prefer the ID captured in the logging thread (records may be formatted elsewhere)
+            "correlation_id": getattr(record, "correlation_id", None) or get_correlation_id(),
         }
 
         # Add location info in debug mode
-        settings = get_settings()
-        if settings.debug:
+        if self.include_location:
             log_data["location"] = {
                 "file": record.filename,
                 "line": record.lineno,
@@ -140,24 +201,30 @@ class StructuredLogFormatter(logging.Formatter):
             }
 
         # Add exception info if present
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_data["exception"] = record.exc_text
 
         # Add extra fields
-        extra = {}
-        for key, value in record.__dict__.items():
-            if key not in self.RESERVED_ATTRS:
-                try:
-                    # Ensure value is JSON serializable
-                    json.dumps(value)
-                    extra[key] = value
-                except (TypeError, ValueError):
-                    extra[key] = str(value)
-
+        extra = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in self.RESERVED_ATTRS
+        }
         if extra:
             log_data["extra"] = extra
 
-        return json.dumps(log_data, default=str)
+        try:
+            return encode_log_json(log_data)
+        except (TypeError, ValueError):
+            # E.g. non-string dict keys: stringify the offending extras only
+            for key, value in extra.items():
+                try:
+                    encode_log_json({"value": value})
+                except (TypeError, ValueError):
+                    extra[key] = str(value)
+            return encode_log_json(log_data)
 
 
 class ContextLogger:
@@ -174,6 +241,8 @@ class ContextLogger:
 
     def _log(self, level: int, message: str, **kwargs):
         """Log with extra context."""
+        if not self._logger.isEnabledFor(level):
+            return
         extra = {"correlation_id": get_correlation_id()}
         extra.update(kwargs)
         self._logger.log(level, message, extra=extra)
@@ -208,6 +277,8 @@ def get_context_logger(name: str) -> ContextLogger:
 def setup_structured_logging(
     level: str | None = None,
     json_format: bool = True,
+    async_logging: bool | None = None,
+    log_file: str | None = None,
 ) -> None:
     """
     Configure structured JSON logging.
@@ -215,36 +286,227 @@ def setup_structured_logging(
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         json_format: Use JSON format (True) or plain text (False)
+        async_logging: Format and write records on a background thread
+            (default: settings.log_async); see AsyncLogPipeline
+        log_file: Also write to this file (default: settings.log_file)
     """
     import sys
 
     settings = get_settings()
     level = level or settings.log_level
     numeric_level = getattr(logging, level.upper(), logging.INFO)
+    if async_logging is None:
+        async_logging = settings.log_async
+    log_file = log_file or settings.log_file
 
+    if json_format:
+        formatter: logging.Formatter = StructuredLogFormatter(include_location=settings.debug)
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(name)s (%(correlation_id)s): %(message)s"
+        )
+
+    stop_async_logging()
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     root_logger.handlers = []
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(numeric_level)
-
-    if json_format:
-        handler.setFormatter(StructuredLogFormatter())
+    if async_logging:
+        handlers: list[logging.Handler] = [
+            BatchingStreamHandler(sys.stdout, batch_size=settings.log_batch_size)
+        ]
+        if log_file:
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+            handlers.append(BatchingFileHandler(log_file, batch_size=settings.log_batch_size))
     else:
-        handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s [%(levelname)s] %(name)s (%(correlation_id)s): %(message)s"
-            )
-        )
-
-    root_logger.addHandler(handler)
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if log_file:
+            Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+            handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+
+    for handler in handlers:
+        handler.setLevel(numeric_level)
+        handler.setFormatter(formatter)
+
+    if async_logging:
+        global _async_pipeline
+        _async_pipeline = AsyncLogPipeline(handlers, queue_size=settings.log_queue_size)
+        _async_pipeline.start()
+        root_logger.addHandler(_async_pipeline.queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Quiet noisy libraries
     for lib in ["urllib3", "httpx", "sqlalchemy", "uvicorn.access"]:
         logging.getLogger(lib).setLevel(logging.WARNING)
 
 
+# =============================================================================
+# ASYNC LOG PIPELINE
+# =============================================================================
+
+
+class _BatchingMixin:
+    """Buffer formatted records and write them in one call per batch."""
+
+    terminator = "\n"
+
+    def _init_batching(self, batch_size: int) -> None:
+        self.batch_size = max(1, batch_size)
+        self._buffer: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record))  # type: ignore[attr-defined]
+        except Exception:  # noqa: BLE001 - same contract as logging.StreamHandler
+            self.handleError(record)  # type: ignore[attr-defined]
+            return
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:  # type: ignore[attr-defined]
+            stream = self.stream  # type: ignore[attr-defined]
+            if self._buffer and stream is not None:
+                data = self.terminator.join(self._buffer) + self.terminator
+                self._buffer.clear()
+                stream.write(data)
+            if stream is not None and hasattr(stream, "flush"):
+                stream.flush()
+
+
+class BatchingStreamHandler(_BatchingMixin, logging.StreamHandler):
+    """StreamHandler that writes records in batches (flushed by AsyncLogPipeline)."""
+
+    def __init__(self, stream: Any = None, batch_size: int = 256):
+        logging.StreamHandler.__init__(self, stream)
+        self._init_batching(batch_size)
+
+
+class BatchingFileHandler(_BatchingMixin, logging.FileHandler):
+    """FileHandler that writes records in batches (flushed by AsyncLogPipeline)."""
+
+    def __init__(self, filename: str | Path, batch_size: int = 256):
+        logging.FileHandler.__init__(self, filename, encoding="utf-8")
+        self._init_batching(batch_size)
+
+
+class _EnqueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that does the minimum in the logging thread.
+
+    The stock QueueHandler formats the record before enqueueing; here only
+    the message is resolved and the correlation ID captured (it lives in a
+    thread-local), leaving JSON encoding to the listener thread. Records are
+    dropped, not blocked on, when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if getattr(record, "correlation_id", None) is None:
+            record.correlation_id = get_correlation_id()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers once the queue runs dry."""
+
+    def __init__(self, log_queue: queue.Queue, handlers: list[logging.Handler]):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+
+    def enqueue_sentinel(self) -> None:
+        # Block rather than fail when stopping with a full queue; the thread is draining it
+        self.queue.put(self._sentinel)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            self.flush()
+
+    def flush(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+
+class AsyncLogPipeline:
+    """
+    Moves log formatting and I/O off the calling thread.
+
+    Loggers hand records to a QueueHandler (a non-blocking put); a
+    QueueListener thread formats them and writes them through batching
+    handlers, one write per batch or whenever the queue drains.
+
+    Example:
+        pipeline = AsyncLogPipeline([BatchingStreamHandler(sys.stdout)])
+        pipeline.start()
+        logging.getLogger().addHandler(pipeline.queue_handler)
+        ...
+        pipeline.stop()  # Drains the queue and flushes
+    """
+
+    def __init__(self, handlers: list[logging.Handler], queue_size: int = 10000):
+        """
+        Initialize the pipeline.
+
+        Args:
+            handlers: Output handlers run on the listener thread
+            queue_size: Maximum records waiting (0 for unbounded); extra records are dropped
+        """
+        self.handlers = handlers
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.queue_handler = _EnqueueHandler(self._queue)
+        self._listener = _BatchingQueueListener(self._queue, handlers)
+        self._running = False
+
+    @property
+    def dropped(self) -> int:
+        """Records discarded because the queue was full."""
+        return self.queue_handler.dropped
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if not self._running:
+            self._listener.start()
+            self._running = True
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Process every queued record, flush and close the handlers."""
+        if not self._running:
+            return
+        self._running = False
+        atexit.unregister(self.stop)
+        self._listener.stop()
+        self._listener.flush()
+        for handler in self.handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+
+
+_async_pipeline: AsyncLogPipeline | None = None
+
+
+def stop_async_logging() -> None:
+    """Drain and stop the pipeline started by setup_structured_logging, if any."""
+    global _async_pipeline
+    if _async_pipeline is not None:
+        logging.getLogger().removeHandler(_async_pipeline.queue_handler)
+        _async_pipeline.stop()
+        _async_pipeline = None
+
+
 # =============================================================================
 # METRICS COLLECTION
 # =============================================================================
@@ -260,6 +522,137 @@ class MetricPoint:
     labels: dict[str, str] = field(default_factory=dict)
 
 
+# Prometheus client default bucket upper bounds (seconds); +Inf is implicit
+DEFAULT_HISTOGRAM_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class _HistogramShard:
+    """Fixed-bucket histogram recorded by a single thread."""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def absorb(self, other: "_HistogramShard") -> None:
+        """Add another shard's observations (same bounds) into this one."""
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Merged state of a fixed-bucket histogram at scrape time."""
+
+    bounds: tuple[float, ...]
+    counts: list[int]  # Per bucket (not cumulative); the last one is +Inf
+    count: int = 0
+    sum: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    @classmethod
+    def merge(cls, shards: list[_HistogramShard]) -> "HistogramSnapshot":
+        """Combine the per-thread shards of one histogram series."""
+        snapshot = cls(bounds=shards[0].bounds, counts=[0] * (len(shards[0].bounds) + 1))
+        for shard in shards:
+            # list() copies atomically under the GIL while the owner keeps recording
+            for i, n in enumerate(list(shard.counts)):
+                snapshot.counts[i] += n
+            snapshot.sum += shard.sum
+            snapshot.min = min(snapshot.min, shard.min)
+            snapshot.max = max(snapshot.max, shard.max)
+        snapshot.count = sum(snapshot.counts)
+        return snapshot
+
+    def cumulative_counts(self) -> list[int]:
+        """Counts of observations <= each bound (Prometheus "le" buckets)."""
+        return list(accumulate(self.counts))
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by linear interpolation inside its bucket.
+
+        Same estimate as Prometheus histogram_quantile, with the observed
+        min/max as the outer edges of the first and +Inf buckets.
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        below = 0
+        for i, n in enumerate(self.counts):
+            if n and below + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else self.min
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * max(0.0, rank - below) / n
+            below += n
+        return self.max
+
+    def to_stats(self) -> dict[str, float]:
+        """Summary statistics in the get_histogram_stats format."""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.sum / self.count,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _ThreadShard:
+    """Counters and histograms recorded by one thread, merged on scrape."""
+
+    __slots__ = ("owner", "counters", "histograms")
+
+    def __init__(self, owner: threading.Thread | None = None) -> None:
+        self.owner = owner
+        self.counters: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.histograms: dict[str, dict[str, _HistogramShard]] = defaultdict(dict)
+
+    def absorb(self, other: "_ThreadShard") -> None:
+        """Fold the metrics of a shard whose thread has exited into this one."""
+        for name, series in other.counters.items():
+            for key, value in series.items():
+                self.counters[name][key] += value
+        for name, series in other.histograms.items():
+            for key, histogram in series.items():
+                target = self.histograms[name].get(key)
+                if target is None:
+                    target = self.histograms[name][key] = _HistogramShard(histogram.bounds)
+                target.absorb(histogram)
+
+
 class MetricsCollector:
     """
     Thread-safe metrics collector.
@@ -267,7 +660,19 @@ class MetricsCollector:
     Collects:
     - Counters (monotonically increasing values)
     - Gauges (point-in-time values)
-    - Histograms (distribution of values)
+    - Histograms (fixed Prometheus-style buckets)
+
+    Counters and histograms are recorded without locks into a per-thread
+    shard; readers merge the shards. Shards of exited threads (request
+    worker pools, Streamlit script threads) are folded into one retired
+    shard whenever a thread registers or a reader scrapes. Histograms keep
+    cumulative bucket counts, so recording is O(1) in the number of
+    observations and quantiles are estimated from the buckets without
+    sorting.
+
+    With a multi-process directory configured (settings.metrics_multiprocess_dir),
+    each worker also mirrors its metrics into a per-PID file and scrapes
+    aggregate every worker, so one /metrics response covers the whole server.
     """
 
     _instance = None
@@ -285,18 +690,181 @@ class MetricsCollector:
         if self._initialized:
             return
 
-        self._counters: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
         self._gauges: dict[str, dict[str, float]] = defaultdict(dict)
-        self._histograms: dict[str, dict[str, list[float]]] = defaultdict(lambda: defaultdict(list))
+        self._histogram_buckets: dict[str, tuple[float, ...]] = {}
+        self._local = threading.local()
+        self._shards: list[_ThreadShard] = []
+        self._retired = _ThreadShard()  # Metrics of threads that have exited
         self._data_lock = threading.Lock()
+        self._gauge_modes: dict[str, str] = {}
+        self._multiprocess: MultiprocessMetricsStore | None = None
+        self._sync_interval = 1.0
+        self._sync_stop = threading.Event()
         self._initialized = True
 
+        settings = get_settings()
+        if settings.metrics_multiprocess_dir:
+            self.enable_multiprocess(
+                settings.metrics_multiprocess_dir, settings.metrics_sync_interval_seconds
+            )
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+        atexit.register(self.sync_multiprocess)
+
     def _label_key(self, labels: dict[str, str]) -> str:
         """Create a consistent key from labels."""
         if not labels:
             return ""
         return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
 
+    def _shard(self) -> _ThreadShard:
+        """The calling thread's shard (registered on first use)."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _ThreadShard(threading.current_thread())
+            with self._data_lock:
+                self._retire_dead_shards()
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _all_shards(self) -> list[_ThreadShard]:
+        with self._data_lock:
+            self._retire_dead_shards()
+            return [self._retired, *self._shards]
+
+    def _retire_dead_shards(self) -> None:
+        """Fold shards of exited threads into the retired shard (caller holds _data_lock)."""
+        live = []
+        for shard in self._shards:
+            if shard.owner is None or shard.owner.is_alive():
+                live.append(shard)
+            else:
+                # The owner can no longer record, so its shard is safe to read fully
+                self._retired.absorb(shard)
+        self._shards = live
+
+    def register_histogram(self, name: str, buckets: tuple[float, ...]) -> None:
+        """
+        Use custom bucket upper bounds for a histogram.
+
+        Must be called before the first observation of the histogram.
+
+        Args:
+            name: Histogram name
+            buckets: Increasing upper bounds (+Inf is added automatically)
+        """
+        self._histogram_buckets[name] = tuple(sorted(float(b) for b in buckets))
+
+    def register_gauge(self, name: str, multiprocess_mode: str = "all") -> None:
+        """
+        Choose how a gauge is combined across worker processes.
+
+        Args:
+            name: Gauge name
+            multiprocess_mode: "all" (one series per PID), "sum", "max" or "min";
+                only live workers are included
+        """
+        from analytics_hub_platform.infrastructure.multiprocess_metrics import GAUGE_MODES
+
+        if multiprocess_mode not in GAUGE_MODES:
+            raise ValueError(f"Unknown gauge mode {multiprocess_mode!r}; use one of {GAUGE_MODES}")
+        self._gauge_modes[name] = multiprocess_mode
+
+    # =========================================================================
+    # MULTI-PROCESS AGGREGATION
+    # =========================================================================
+
+    @property
+    def multiprocess_enabled(self) -> bool:
+        """Whether metrics are aggregated across worker processes."""
+        return self._multiprocess is not None
+
+    def enable_multiprocess(self, directory: str, sync_interval: float = 1.0) -> None:
+        """
+        Aggregate metrics across worker processes through a shared directory.
+
+        Call before workers are forked (or in each worker); a forked child
+        reopens its own file automatically.
+
+        Args:
+            directory: Directory shared by all workers of the server
+            sync_interval: Seconds between background syncs of this worker's file
+        """
+        from analytics_hub_platform.infrastructure.multiprocess_metrics import (
+            MultiprocessMetricsStore,
+        )
+
+        self.disable_multiprocess()
+        self._multiprocess = MultiprocessMetricsStore(directory)
+        self._sync_interval = sync_interval
+        self._start_sync_thread()
+        logger.info(f"Multi-process metrics enabled in {directory} (pid {os.getpid()})")
+
+    def disable_multiprocess(self) -> None:
+        """Stop mirroring metrics to the shared directory."""
+        if self._multiprocess is None:
+            return
+        self._sync_stop.set()
+        self.sync_multiprocess()
+        self._multiprocess.close()
+        self._multiprocess = None
+
+    def _start_sync_thread(self) -> None:
+        self._sync_stop = threading.Event()
+        thread = threading.Thread(
+            target=self._sync_loop, args=(self._sync_stop,), name="metrics-sync", daemon=True
+        )
+        thread.start()
+
+    def _sync_loop(self, stop: threading.Event) -> None:
+        while not stop.wait(self._sync_interval):
+            try:
+                self.sync_multiprocess()
+            except Exception as e:  # noqa: BLE001 - keep the sync thread alive
+                logger.warning(f"Metrics sync failed: {e}")
+
+    def sync_multiprocess(self) -> None:
+        """Write this worker's current metrics to its shared file."""
+        store = self._multiprocess
+        if store is None:
+            return
+        with self._data_lock:
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+        store.write_snapshot(
+            self._merged_counters(), gauges, self._merged_histograms(), self._gauge_modes
+        )
+
+    def _after_fork(self) -> None:
+        """Start a forked worker with empty metrics and its own file."""
+        self._data_lock = threading.Lock()
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _ThreadShard()
+        self._gauges = defaultdict(dict)
+        if self._multiprocess is not None:
+            from analytics_hub_platform.infrastructure.multiprocess_metrics import (
+                MultiprocessMetricsStore,
+            )
+
+            self._multiprocess = MultiprocessMetricsStore(self._multiprocess.directory)
+            self._start_sync_thread()
+
+    def _collect(
+        self,
+    ) -> tuple[
+        dict[str, dict[str, float]],
+        dict[str, dict[str, float]],
+        dict[str, dict[str, HistogramSnapshot]],
+    ]:
+        """Counters, gauges and histograms of this process or of all workers."""
+        if self._multiprocess is not None:
+            self.sync_multiprocess()
+            return self._multiprocess.collect()
+        with self._data_lock:
+            gauges = {name: dict(series) for name, series in self._gauges.items()}
+        return self._merged_counters(), gauges, self._merged_histograms()
+
     def increment_counter(
         self,
         name: str,
@@ -304,9 +872,8 @@ class MetricsCollector:
         labels: dict[str, str] | None = None,
     ) -> None:
         """Increment a counter metric."""
-        with self._data_lock:
-            key = self._label_key(labels or {})
-            self._counters[name][key] += value
+        key = self._label_key(labels or {})
+        self._shard().counters[name][key] += value
 
     def set_gauge(
         self,
@@ -319,6 +886,27 @@ class MetricsCollector:
             key = self._label_key(labels or {})
             self._gauges[name][key] = value
 
+    def increment_gauge(
+        self,
+        name: str,
+        value: float = 1.0,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Add to a gauge metric (e.g. requests in flight)."""
+        key = self._label_key(labels or {})
+        with self._data_lock:
+            series = self._gauges[name]
+            series[key] = series.get(key, 0.0) + value
+
+    def decrement_gauge(
+        self,
+        name: str,
+        value: float = 1.0,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Subtract from a gauge metric."""
+        self.increment_gauge(name, -value, labels)
+
     def observe_histogram(
         self,
         name: str,
@@ -326,18 +914,24 @@ class MetricsCollector:
         labels: dict[str, str] | None = None,
     ) -> None:
         """Add observation to histogram."""
-        with self._data_lock:
-            key = self._label_key(labels or {})
-            self._histograms[name][key].append(value)
-            # Keep only last 1000 observations per bucket
-            if len(self._histograms[name][key]) > 1000:
-                self._histograms[name][key] = self._histograms[name][key][-1000:]
+        key = self._label_key(labels or {})
+        series = self._shard().histograms[name]
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = _HistogramShard(
+                self._histogram_buckets.get(name, DEFAULT_HISTOGRAM_BUCKETS)
+            )
+            series[key] = histogram
+        histogram.observe(value)
 
     def get_counter(self, name: str, labels: dict[str, str] | None = None) -> float:
         """Get counter value."""
-        with self._data_lock:
-            key = self._label_key(labels or {})
-            return self._counters[name].get(key, 0.0)
+        key = self._label_key(labels or {})
+        return sum(
+            shard.counters[name].get(key, 0.0)
+            for shard in self._all_shards()
+            if name in shard.counters
+        )
 
     def get_gauge(self, name: str, labels: dict[str, str] | None = None) -> float | None:
         """Get gauge value."""
@@ -345,84 +939,110 @@ class MetricsCollector:
             key = self._label_key(labels or {})
             return self._gauges[name].get(key)
 
+    def get_histogram(
+        self,
+        name: str,
+        labels: dict[str, str] | None = None,
+    ) -> HistogramSnapshot | None:
+        """Get the merged buckets of one histogram series."""
+        key = self._label_key(labels or {})
+        parts = [
+            shard.histograms[name][key]
+            for shard in self._all_shards()
+            if key in shard.histograms.get(name, {})
+        ]
+        return HistogramSnapshot.merge(parts) if parts else None
+
     def get_histogram_stats(
         self,
         name: str,
         labels: dict[str, str] | None = None,
     ) -> dict[str, float]:
-        """Get histogram statistics."""
-        with self._data_lock:
-            key = self._label_key(labels or {})
-            values = self._histograms[name].get(key, [])
-
-            if not values:
-                return {"count": 0}
-
-            sorted_values = sorted(values)
-            count = len(values)
-
-            return {
-                "count": count,
-                "sum": sum(values),
-                "min": sorted_values[0],
-                "max": sorted_values[-1],
-                "avg": sum(values) / count,
-                "p50": sorted_values[int(count * 0.5)],
-                "p90": sorted_values[int(count * 0.9)],
-                "p99": sorted_values[min(int(count * 0.99), count - 1)],
-            }
+        """Get histogram statistics (quantiles estimated from the buckets)."""
+        snapshot = self.get_histogram(name, labels)
+        return snapshot.to_stats() if snapshot else {"count": 0}
+
+    def _merged_counters(self) -> dict[str, dict[str, float]]:
+        merged: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for shard in self._all_shards():
+            # dict() copies atomically under the GIL while the owner keeps recording
+            for name, series in dict(shard.counters).items():
+                for key, value in dict(series).items():
+                    merged[name][key] += value
+        return {name: dict(series) for name, series in merged.items()}
+
+    def _merged_histograms(self) -> dict[str, dict[str, HistogramSnapshot]]:
+        parts: dict[str, dict[str, list[_HistogramShard]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for shard in self._all_shards():
+            for name, series in dict(shard.histograms).items():
+                for key, histogram in dict(series).items():
+                    parts[name][key].append(histogram)
+        return {
+            name: {key: HistogramSnapshot.merge(shards) for key, shards in series.items()}
+            for name, series in parts.items()
+        }
 
     def get_all_metrics(self) -> dict[str, Any]:
-        """Get all metrics in a structured format."""
-        with self._data_lock:
-            return {
-                "counters": dict(self._counters),
-                "gauges": dict(self._gauges),
-                "histograms": {
-                    name: {
-                        key: self.get_histogram_stats(
-                            name, dict(item.split("=") for item in key.split(",")) if key else None
-                        )
-                        for key in buckets
-                    }
-                    for name, buckets in self._histograms.items()
-                },
-            }
+        """Get all metrics in a structured format (all workers in multi-process mode)."""
+        counters, gauges, histograms = self._collect()
+        return {
+            "counters": counters,
+            "gauges": gauges,
+            "histograms": {
+                name: {key: snapshot.to_stats() for key, snapshot in series.items()}
+                for name, series in histograms.items()
+            },
+        }
+
+    @staticmethod
+    def _prometheus_labels(labels_str: str, **extra: str) -> str:
+        """Render a label key (and extra labels) as a Prometheus label set."""
+        pairs = [item.split("=", 1) for item in labels_str.split(",")] if labels_str else []
+        pairs += [[k, v] for k, v in extra.items()]
+        if not pairs:
+            return ""
+        rendered = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in pairs)
+        return f"{{{rendered}}}"
 
     def export_prometheus(self) -> str:
-        """Export metrics in Prometheus format."""
+        """Export metrics in Prometheus text exposition format."""
         lines = []
-
-        with self._data_lock:
-            # Counters
-            for name, buckets in self._counters.items():
-                for labels_str, value in buckets.items():
-                    labels_part = f"{{{labels_str}}}" if labels_str else ""
-                    lines.append(f"{name}_total{labels_part} {value}")
-
-            # Gauges
-            for name, buckets in self._gauges.items():
-                for labels_str, value in buckets.items():
-                    labels_part = f"{{{labels_str}}}" if labels_str else ""
-                    lines.append(f"{name}{labels_part} {value}")
-
-            # Histograms (simplified)
-            for name, buckets in self._histograms.items():
-                for labels_str, values in buckets.items():
-                    if not values:
-                        continue
-                    labels_part = f"{{{labels_str}}}" if labels_str else ""
-                    lines.append(f"{name}_count{labels_part} {len(values)}")
-                    lines.append(f"{name}_sum{labels_part} {sum(values)}")
+        labels = self._prometheus_labels
+        counters, gauges, histograms = self._collect()
+
+        for name, series in counters.items():
+            lines.append(f"# TYPE {name}_total counter")
+            for labels_str, value in series.items():
+                lines.append(f"{name}_total{labels(labels_str)} {value}")
+
+        for name, series in gauges.items():
+            lines.append(f"# TYPE {name} gauge")
+            for labels_str, value in series.items():
+                lines.append(f"{name}{labels(labels_str)} {value}")
+
+        for name, series in histograms.items():
+            lines.append(f"# TYPE {name} histogram")
+            for labels_str, snapshot in series.items():
+                cumulative = snapshot.cumulative_counts()
+                for bound, count in zip(snapshot.bounds, cumulative, strict=False):
+                    lines.append(f"{name}_bucket{labels(labels_str, le=repr(bound))} {count}")
+                lines.append(f"{name}_bucket{labels(labels_str, le='+Inf')} {cumulative[-1]}")
+                lines.append(f"{name}_sum{labels(labels_str)} {snapshot.sum}")
+                lines.append(f"{name}_count{labels(labels_str)} {snapshot.count}")
 
         return "\n".join(lines)
 
     def reset(self) -> None:
         """Reset all metrics (mainly for testing)."""
         with self._data_lock:
-            self._counters.clear()
+            for shard in (self._retired, *self._shards):
+                shard.counters.clear()
+                shard.histograms.clear()
             self._gauges.clear()
-            self._histograms.clear()
+        if self._multiprocess is not None:
+            self._multiprocess.clear()
 
 
 def get_metrics() -> MetricsCollector:
@@ -441,6 +1061,16 @@ def set_gauge(name: str, value: float, labels: dict[str, str] | None = None):
     get_metrics().set_gauge(name, value, labels)
 
 
+def increment_gauge(name: str, value: float = 1.0, labels: dict[str, str] | None = None):
+    """Add to a gauge value."""
+    get_metrics().increment_gauge(name, value, labels)
+
+
+def decrement_gauge(name: str, value: float = 1.0, labels: dict[str, str] | None = None):
+    """Subtract from a gauge value."""
+    get_metrics().decrement_gauge(name, value, labels)
+
+
 def observe_histogram(name: str, value: float, labels: dict[str, str] | None = None):
     """Observe histogram value."""
     get_metrics().observe_histogram(name, value, labels)
@@ -514,62 +1144,189 @@ class HealthCheckResult:
     message: str = ""
     latency_ms: float = 0.0
     details: dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+
+
+@dataclass
+class _RegisteredCheck:
+    func: Callable[[], HealthCheckResult]
+    timeout_seconds: float
+    readiness: bool
 
 
 class HealthChecker:
     """
     Health check manager for monitoring service dependencies.
 
+    Checks run concurrently on a small thread pool, each bounded by its own
+    timeout, and results are cached for a short TTL so frequent probes do
+    not hit dependencies on every call. Concurrent callers share a check
+    that is already running, and a check that hung past its timeout is not
+    started again until it finishes, so stuck dependencies cannot exhaust
+    the pool.
+
     Example:
         checker = HealthChecker()
-        checker.register("database", check_database_health)
+        checker.register("database", check_database_health, timeout_seconds=2.0)
         checker.register("cache", check_cache_health)
 
         results = checker.check_all()
     """
 
-    def __init__(self):
-        self._checks: dict[str, Callable[[], HealthCheckResult]] = {}
-
-    def register(self, name: str, check_func: Callable[[], HealthCheckResult]) -> None:
-        """Register a health check function."""
-        self._checks[name] = check_func
-
-    def check(self, name: str) -> HealthCheckResult:
-        """Run a specific health check."""
-        if name not in self._checks:
-            return HealthCheckResult(
-                name=name,
-                healthy=False,
-                message=f"Unknown health check: {name}",
+    def __init__(
+        self,
+        cache_ttl_seconds: float | None = None,
+        timeout_seconds: float | None = None,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize the health checker.
+
+        Args:
+            cache_ttl_seconds: How long results are reused (default: settings; 0 disables)
+            timeout_seconds: Default per-check timeout (default: settings)
+            max_workers: Threads running checks concurrently
+        """
+        settings = get_settings()
+        self.cache_ttl_seconds = (
+            cache_ttl_seconds
+            if cache_ttl_seconds is not None
+            else settings.health_cache_ttl_seconds
+        )
+        self.timeout_seconds = (
+            timeout_seconds
+            if timeout_seconds is not None
+            else settings.health_check_timeout_seconds
+        )
+        self.max_workers = max_workers
+        self._checks: dict[str, _RegisteredCheck] = {}
+        self._cache: dict[str, tuple[float, HealthCheckResult]] = {}
+        self._inflight: dict[str, tuple[float, Future]] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def register(
+        self,
+        name: str,
+        check_func: Callable[[], HealthCheckResult],
+        timeout_seconds: float | None = None,
+        readiness: bool = True,
+    ) -> None:
+        """
+        Register a health check function.
+
+        Args:
+            name: Check name
+            check_func: Callable returning a HealthCheckResult
+            timeout_seconds: Per-check timeout (default: the checker's)
+            readiness: Whether the check gates readiness (False: informational)
+        """
+        with self._lock:
+            self._checks[name] = _RegisteredCheck(
+                func=check_func,
+                timeout_seconds=timeout_seconds or self.timeout_seconds,
+                readiness=readiness,
             )
+            self._cache.pop(name, None)
 
+    def _run(self, name: str, check_func: Callable[[], HealthCheckResult]) -> HealthCheckResult:
+        """Run one check, timing it and converting exceptions to failures."""
         start = time.perf_counter()
         try:
-            result = self._checks[name]()
+            result = check_func()
             result.latency_ms = (time.perf_counter() - start) * 1000
-            return result
         except Exception as e:
-            return HealthCheckResult(
+            result = HealthCheckResult(
                 name=name,
                 healthy=False,
                 message=str(e),
                 latency_ms=(time.perf_counter() - start) * 1000,
             )
+        if self.cache_ttl_seconds > 0:
+            with self._lock:
+                self._cache[name] = (time.monotonic() + self.cache_ttl_seconds, result)
+        return result
+
+    def _cached(self, name: str) -> HealthCheckResult | None:
+        entry = self._cache.get(name)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return replace(entry[1], cached=True)
+
+    def _start(self, names: list[str]) -> dict[str, tuple[float, Future]]:
+        """Submit checks that are not already running; return every check's future."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="health-check"
+                )
+            started = {}
+            for name in names:
+                running = self._inflight.get(name)
+                if running is None or running[1].done():
+                    check = self._checks[name]
+                    future = self._executor.submit(self._run, name, check.func)
+                    running = (time.monotonic() + check.timeout_seconds, future)
+                    self._inflight[name] = running
+                started[name] = running
+            return started
+
+    def _collect(self, name: str, deadline: float, future: Future) -> HealthCheckResult:
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            timeout = self._checks[name].timeout_seconds
+            return HealthCheckResult(
+                name=name,
+                healthy=False,
+                message=f"Health check timed out after {timeout:g}s",
+                latency_ms=timeout * 1000,
+            )
 
-    def check_all(self) -> dict[str, HealthCheckResult]:
-        """Run all registered health checks."""
-        return {name: self.check(name) for name in self._checks}
+    def check(self, name: str, use_cache: bool = True) -> HealthCheckResult:
+        """Run a specific health check."""
+        if name not in self._checks:
+            return HealthCheckResult(
+                name=name,
+                healthy=False,
+                message=f"Unknown health check: {name}",
+            )
+        return self.check_all([name], use_cache=use_cache)[name]
+
+    def check_all(
+        self, names: list[str] | None = None, use_cache: bool = True
+    ) -> dict[str, HealthCheckResult]:
+        """
+        Run registered health checks concurrently.
+
+        Args:
+            names: Checks to run (default: all registered)
+            use_cache: Reuse results younger than the cache TTL
+
+        Returns:
+            Results keyed by check name, in registration order
+        """
+        names = list(self._checks) if names is None else names
+        results: dict[str, HealthCheckResult | None] = dict.fromkeys(names)
+        if use_cache:
+            with self._lock:
+                for name in names:
+                    results[name] = self._cached(name)
+
+        stale = [name for name, result in results.items() if result is None]
+        if stale:
+            for name, (deadline, future) in self._start(stale).items():
+                results[name] = self._collect(name, deadline, future)
+        return results  # type: ignore[return-value]
 
     def is_healthy(self) -> bool:
-        """Check if all health checks pass."""
-        results = self.check_all()
-        return all(r.healthy for r in results.values())
+        """Check if all readiness checks pass."""
+        return self.get_summary()["status"] == "healthy"
 
-    def get_summary(self) -> dict[str, Any]:
-        """Get summary of all health checks."""
-        results = self.check_all()
-        all_healthy = all(r.healthy for r in results.values())
+    def get_summary(self, use_cache: bool = True) -> dict[str, Any]:
+        """Get summary of all health checks (only readiness checks set the status)."""
+        results = self.check_all(use_cache=use_cache)
+        all_healthy = all(r.healthy for name, r in results.items() if self._checks[name].readiness)
 
         return {
             "status": "healthy" if all_healthy else "unhealthy",
@@ -579,22 +1336,43 @@ class HealthChecker:
                     "healthy": r.healthy,
                     "message": r.message,
                     "latency_ms": round(r.latency_ms, 2),
+                    "cached": r.cached,
                     "details": r.details,
                 }
                 for name, r in results.items()
             },
         }
 
+    def clear_cache(self) -> None:
+        """Drop cached results so the next call re-runs every check."""
+        with self._lock:
+            self._cache.clear()
+
+
+def check_database() -> HealthCheckResult:
+    """Database connectivity check (SELECT 1 on a pooled connection)."""
+    from analytics_hub_platform.infrastructure.db_init import check_database_health
+
+    health = check_database_health()
+    return HealthCheckResult(
+        name="database",
+        healthy=health["status"] == "healthy",
+        message=health["message"],
+        details={k: health[k] for k in ("pool_size", "checked_out", "overflow")},
+    )
+
 
 # Global health checker instance
 _health_checker: HealthChecker | None = None
 
 
 def get_health_checker() -> HealthChecker:
-    """Get or create the global health checker."""
+    """Get or create the global health checker (with the database check registered)."""
     global _health_checker
     if _health_checker is None:
-        _health_checker = HealthChecker()
+        checker = HealthChecker()
+        checker.register("database", check_database)
+        _health_checker = checker
     return _health_checker
 
 
@@ -4,19 +4,19 @@ Sustainable Economic Development Analytics Hub
 Eng. Sultan Albuqami
 
 Production-ready rate limiting with:
-- Sliding window algorithm (more accurate than fixed window)
+- Sliding window counter (more accurate than fixed window, O(1) per check)
 - Token bucket for burst handling
 - Per-user and per-IP limiting
 - FastAPI middleware integration
-- Thread-safe implementation
+- Thread-safe implementation with striped locks and idle-key eviction
 """
 
 import logging
+import math
 import threading
 import time
-from collections import defaultdict
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from functools import wraps
 from typing import Any, Optional
 
@@ -40,13 +40,48 @@ class RateLimitConfig:
             self.burst_size = self.max_requests
 
 
-@dataclass
 class RateLimitState:
-    """Internal state for rate limiting."""
+    """
+    Internal state for one rate-limited key.
+
+    Holds the request counts of the current and previous fixed windows
+    (for the sliding-window estimate) and the token bucket level, so each
+    key costs a few numbers instead of a timestamp per request.
+    """
 
-    timestamps: list = field(default_factory=list)
-    tokens: float = -1.0  # -1 indicates uninitialized
-    last_update: float = field(default_factory=time.time)
+    __slots__ = ("window_start", "current_count", "previous_count", "tokens", "last_update")
+
+    def __init__(self, window_start: float, tokens: float, now: float):
+        self.window_start = window_start
+        self.current_count = 0
+        self.previous_count = 0
+        self.tokens = tokens
+        self.last_update = now
+
+
+class _Stripe:
+    """
+    One lock and the keys hashed to it, in two generations.
+
+    Keys live in ``current``; at each rotation ``previous`` is dropped
+    wholesale and ``current`` takes its place. A key found in ``previous``
+    moves back to ``current``, so only keys untouched for a full rotation
+    period are discarded.
+    """
+
+    __slots__ = ("lock", "current", "previous", "rotated_at")
+
+    def __init__(self, now: float) -> None:
+        self.lock = threading.Lock()
+        self.current: dict[str, RateLimitState] = {}
+        self.previous: dict[str, RateLimitState] = {}
+        self.rotated_at = now
+
+    def get(self, key: str) -> RateLimitState | None:
+        state = self.current.get(key)
+        if state is None:
+            state = self.previous.get(key)
+        return state
 
 
 class SlidingWindowRateLimiter:
@@ -54,24 +89,43 @@ class SlidingWindowRateLimiter:
     Sliding window rate limiter with token bucket for burst handling.
 
     Combines two algorithms:
-    1. Sliding window log - tracks exact request timestamps
+    1. Sliding window counter - the previous fixed window's count, weighted
+       by how much of it still overlaps the sliding window, plus the current
+       window's count (the two-bucket approximation of a sliding log)
     2. Token bucket - allows controlled bursts
 
-    Thread-safe implementation suitable for multi-threaded servers.
+    Every check is O(1) and each key stores a few numbers. Keys idle for two
+    windows are indistinguishable from new ones and are evicted by rotating
+    generations, so memory is bounded by the keys active in the last four
+    windows. State is split across lock stripes, so threads working on
+    different keys rarely contend.
 
     For production at scale, replace with Redis-based implementation.
     """
 
-    def __init__(self, config: RateLimitConfig):
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        stripes: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize rate limiter.
 
         Args:
             config: Rate limit configuration
+            stripes: Number of lock stripes (rounded up to a power of two)
+            clock: Time source in seconds (monotonic by default)
         """
         self.config = config
-        self._states: dict[str, RateLimitState] = defaultdict(RateLimitState)
-        self._lock = threading.RLock()
+        self._clock = clock
+        self._window = float(config.window_seconds)
+        self._burst = float(config.burst_size)
+        self._idle_ttl = 2 * self._window
+        n_stripes = 1 << max(0, stripes - 1).bit_length()
+        now = clock()
+        self._stripes = [_Stripe(now) for _ in range(n_stripes)]
+        self._stripe_mask = n_stripes - 1
 
         # Token refill rate (tokens per second)
         self._refill_rate = config.max_requests / config.window_seconds
@@ -82,23 +136,52 @@ class SlidingWindowRateLimiter:
             return f"{self.config.key_prefix}:{identifier}"
         return identifier
 
-    def _cleanup_timestamps(self, state: RateLimitState, now: float) -> None:
-        """Remove timestamps outside the window."""
-        cutoff = now - self.config.window_seconds
-        state.timestamps = [ts for ts in state.timestamps if ts > cutoff]
+    def _stripe(self, key: str) -> _Stripe:
+        return self._stripes[hash(key) & self._stripe_mask]
 
-    def _initialize_tokens(self, state: RateLimitState) -> None:
-        """Initialize tokens to burst size if uninitialized."""
-        if state.tokens < 0:
-            state.tokens = float(self.config.burst_size)
+    def _rotate(self, stripe: _Stripe, now: float) -> None:
+        """Age out generations whose rotation period (the idle TTL) has passed."""
+        periods = int((now - stripe.rotated_at) // self._idle_ttl)
+        if periods < 1:
+            return
+        stripe.previous = stripe.current if periods == 1 else {}
+        stripe.current = {}
+        stripe.rotated_at += periods * self._idle_ttl
+
+    def _advance(self, state: RateLimitState, now: float) -> None:
+        """Roll the fixed windows forward and refill tokens up to now."""
+        elapsed_windows = int((now - state.window_start) // self._window)
+        if elapsed_windows >= 1:
+            state.previous_count = state.current_count if elapsed_windows == 1 else 0
+            state.current_count = 0
+            state.window_start += elapsed_windows * self._window
 
-    def _refill_tokens(self, state: RateLimitState, now: float) -> None:
-        """Refill tokens based on elapsed time."""
-        self._initialize_tokens(state)
         elapsed = now - state.last_update
-        state.tokens = min(self.config.burst_size, state.tokens + elapsed * self._refill_rate)
+        state.tokens = min(self._burst, state.tokens + elapsed * self._refill_rate)
         state.last_update = now
 
+    def _estimate(self, state: RateLimitState, now: float) -> float:
+        """Approximate requests in the sliding window ending now."""
+        overlap = 1.0 - (now - state.window_start) / self._window
+        return state.previous_count * overlap + state.current_count
+
+    def _retry_after(self, state: RateLimitState, now: float) -> int:
+        """Seconds until the sliding-window estimate leaves room for one request."""
+        target = self.config.max_requests - 1
+        if state.current_count <= target and state.previous_count > 0:
+            # Previous window's weight must decay until the estimate fits
+            offset = self._window * (1.0 - (target - state.current_count) / state.previous_count)
+            wait = state.window_start + offset - now
+        else:
+            # Current window alone is full: wait until it has slid out enough
+            offset = self._window * (1.0 - target / max(state.current_count, 1))
+            wait = state.window_start + self._window + offset - now
+        return max(1, int(wait) + 1)
+
+    def _new_state(self, now: float) -> RateLimitState:
+        window_start = (now // self._window) * self._window
+        return RateLimitState(window_start=window_start, tokens=self._burst, now=now)
+
     def check(self, identifier: str) -> tuple[bool, int, int]:
         """
         Check if request would be allowed (non-consuming).
@@ -110,26 +193,20 @@ class SlidingWindowRateLimiter:
             Tuple of (allowed, remaining, retry_after_seconds)
         """
         key = self._get_key(identifier)
-        now = time.time()
-
-        with self._lock:
-            state = self._states[key]
-            self._cleanup_timestamps(state, now)
-            self._refill_tokens(state, now)
-
-            current_count = len(state.timestamps)
-            remaining = max(0, self.config.max_requests - current_count)
-
-            if current_count >= self.config.max_requests:
-                # Calculate retry after
-                if state.timestamps:
-                    oldest = min(state.timestamps)
-                    retry_after = int(oldest + self.config.window_seconds - now) + 1
-                else:
-                    retry_after = self.config.window_seconds
-                return False, 0, max(1, retry_after)
+        stripe = self._stripe(key)
+        now = self._clock()
 
-            return True, remaining, 0
+        with stripe.lock:
+            state = stripe.get(key)
+            if state is None or now - state.last_update > self._idle_ttl:
+                return True, self.config.max_requests, 0
+            self._advance(state, now)
+
+            current_count = self._estimate(state, now)
+            if current_count + 1 > self.config.max_requests:
+                return False, 0, self._retry_after(state, now)
+
+            return True, self.config.max_requests - math.ceil(current_count), 0
 
     def acquire(self, identifier: str) -> tuple[bool, int, int]:
         """
@@ -142,22 +219,21 @@ class SlidingWindowRateLimiter:
             Tuple of (acquired, remaining, retry_after_seconds)
         """
         key = self._get_key(identifier)
-        now = time.time()
-
-        with self._lock:
-            state = self._states[key]
-            self._cleanup_timestamps(state, now)
-            self._refill_tokens(state, now)
-
-            current_count = len(state.timestamps)
-
-            if current_count >= self.config.max_requests:
-                if state.timestamps:
-                    oldest = min(state.timestamps)
-                    retry_after = int(oldest + self.config.window_seconds - now) + 1
-                else:
-                    retry_after = self.config.window_seconds
-                return False, 0, max(1, retry_after)
+        stripe = self._stripe(key)
+        now = self._clock()
+
+        with stripe.lock:
+            if now - stripe.rotated_at >= self._idle_ttl:
+                self._rotate(stripe, now)
+            state = stripe.current.get(key)
+            if state is None:
+                state = stripe.previous.pop(key, None) or self._new_state(now)
+                stripe.current[key] = state
+            self._advance(state, now)
+
+            current_count = self._estimate(state, now)
+            if current_count + 1 > self.config.max_requests:
+                return False, 0, self._retry_after(state, now)
 
             # Check token bucket for burst protection
             if state.tokens < 1.0:
@@ -165,9 +241,9 @@ class SlidingWindowRateLimiter:
                 return False, 0, max(1, retry_after)
 
             # Acquire slot
-            state.timestamps.append(now)
+            state.current_count += 1
             state.tokens -= 1.0
-            remaining = max(0, self.config.max_requests - len(state.timestamps))
+            remaining = max(0, self.config.max_requests - math.ceil(current_count + 1))
 
             return True, remaining, 0
 
@@ -203,27 +279,60 @@ class SlidingWindowRateLimiter:
     def reset(self, identifier: str) -> None:
         """Reset rate limit state for an identifier."""
         key = self._get_key(identifier)
-        with self._lock:
-            if key in self._states:
-                del self._states[key]
+        stripe = self._stripe(key)
+        with stripe.lock:
+            stripe.current.pop(key, None)
+            stripe.previous.pop(key, None)
+
+    def purge_idle(self) -> int:
+        """
+        Evict every idle key now with a full scan.
+
+        Rotation evicts idle keys as traffic arrives; this is for callers
+        that want memory back immediately (e.g. after a burst of one-off
+        identifiers).
+
+        Returns:
+            Number of keys removed
+        """
+        now = self._clock()
+        removed = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                for generation in (stripe.current, stripe.previous):
+                    idle = [
+                        key
+                        for key, state in generation.items()
+                        if now - state.last_update > self._idle_ttl
+                    ]
+                    for key in idle:
+                        del generation[key]
+                    removed += len(idle)
+        return removed
+
+    @property
+    def tracked_keys(self) -> int:
+        """Number of keys currently holding state."""
+        return sum(len(stripe.current) + len(stripe.previous) for stripe in self._stripes)
 
     def get_stats(self, identifier: str) -> dict[str, Any]:
         """Get rate limit statistics for debugging."""
         key = self._get_key(identifier)
-        now = time.time()
+        stripe = self._stripe(key)
+        now = self._clock()
 
-        with self._lock:
-            state = self._states.get(key)
-            if not state:
+        with stripe.lock:
+            state = stripe.get(key)
+            if not state or now - state.last_update > self._idle_ttl:
                 return {
                     "current_count": 0,
                     "remaining": self.config.max_requests,
-                    "tokens": float(self.config.burst_size),
+                    "tokens": self._burst,
                     "window_seconds": self.config.window_seconds,
                 }
 
-            self._cleanup_timestamps(state, now)
-            current_count = len(state.timestamps)
+            self._advance(state, now)
+            current_count = math.ceil(self._estimate(state, now))
 
             return {
                 "current_count": current_count,
@@ -25,6 +25,7 @@ from analytics_hub_platform.infrastructure.db_init import (
     tenants,
     users,
 )
+from analytics_hub_platform.infrastructure.tracing import traced
 
 
 class Repository:
@@ -48,6 +49,7 @@ class Repository:
     # INDICATOR DATA METHODS
     # ============================================
 
+    @traced(attributes={"component": "repository"})
     def get_all_indicators(
         self, tenant_id: str, filters: FilterParams | None = None
     ) -> pd.DataFrame:
@@ -83,6 +85,7 @@ class Repository:
 
         return df
 
+    @traced(attributes={"component": "repository"})
     def get_latest_snapshot(
         self, tenant_id: str, filters: FilterParams | None = None
     ) -> pd.DataFrame:
@@ -137,6 +140,7 @@ class Repository:
 
         return df
 
+    @traced(attributes={"component": "repository"})
     def get_indicator_timeseries(
         self,
         tenant_id: str,
@@ -185,6 +189,7 @@ class Repository:
 
         return df
 
+    @traced(attributes={"component": "repository"})
     def get_regional_data(self, tenant_id: str, year: int, quarter: int) -> pd.DataFrame:
         """
         Get data for all regions in a specific period.
@@ -214,6 +219,7 @@ class Repository:
 
         return df
 
+    @traced(attributes={"component": "repository"})
     def get_available_periods(self, tenant_id: str) -> list[dict[str, Any]]:
         """
         Get list of available time periods.
@@ -247,6 +253,7 @@ class Repository:
 
         return periods
 
+    @traced(attributes={"component": "repository"})
     def get_available_regions(self, tenant_id: str) -> list[str]:
         """
         Get list of available regions.
@@ -274,6 +281,7 @@ class Repository:
     # TENANT METHODS
     # ============================================
 
+    @traced(attributes={"component": "repository"})
     def get_tenant(self, tenant_id: str) -> Tenant | None:
         """
         Get tenant by ID.
@@ -302,6 +310,7 @@ class Repository:
 
         return None
 
+    @traced(attributes={"component": "repository"})
     def get_all_tenants(self, active_only: bool = True) -> list[Tenant]:
         """
         Get all tenants.
@@ -340,6 +349,7 @@ class Repository:
     # USER METHODS
     # ============================================
 
+    @traced(attributes={"component": "repository"})
     def get_user(self, user_id: str) -> User | None:
         """
         Get user by ID.
@@ -373,6 +383,7 @@ class Repository:
 
         return None
 
+    @traced(attributes={"component": "repository"})
     def get_users_by_tenant(self, tenant_id: str, active_only: bool = True) -> list[User]:
         """
         Get all users for a tenant.
@@ -417,6 +428,7 @@ class Repository:
     # AGGREGATION METHODS
     # ============================================
 
+    @traced(attributes={"component": "repository"})
     def get_national_aggregates(
         self, tenant_id: str, year: int, quarter: int
     ) -> dict[str, float | None]:
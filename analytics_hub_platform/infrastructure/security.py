@@ -77,6 +77,7 @@ class RBACManager:
             "export_excel",
             "manage_users",
             "manage_settings",
+            "run_profiler",
         ],
         UserRole.VIEWER: [
             "view_executive_dashboard",
@@ -455,6 +456,7 @@ PERMISSIONS = {
     "manage_tenants": [UserRole.ADMIN],
     "view_raw_data": [UserRole.ANALYST, UserRole.ADMIN],
     "view_data_quality": [UserRole.DIRECTOR, UserRole.ANALYST, UserRole.ADMIN],
+    "run_profiler": [UserRole.ADMIN],
 }
 
 
@@ -472,8 +474,23 @@ def has_permission(user: User, permission: str) -> bool:
     if not user.is_active:
         return False
 
-    allowed_roles = PERMISSIONS.get(permission, [])
-    return user.role in allowed_roles
+    return role_has_permission(user.role, permission)
+
+
+def role_has_permission(role: UserRole, permission: str) -> bool:
+    """
+    Check if a role grants a specific permission.
+
+    For callers without a User model (e.g. Streamlit sessions).
+
+    Args:
+        role: User role
+        permission: Permission name
+
+    Returns:
+        True if the role has the permission
+    """
+    return role in PERMISSIONS.get(permission, [])
 
 
 def require_permission(permission: str):
@@ -87,6 +87,9 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     log_file: str | None = None
+    log_async: bool = False  # Format/write logs on a background thread
+    log_batch_size: int = 256  # Records per write in async mode
+    log_queue_size: int = 10000  # Async queue bound; records beyond it are dropped
 
     # Caching
     cache_enabled: bool = True
@@ -97,6 +100,16 @@ class Settings(BaseSettings):
     anomaly_if_contamination: float = 0.1
     synthetic_seed: int = 42
 
+    # Insight engine (request-time report generation)
+    insights_max_workers: int = 4
+    insights_deadline_seconds: float = 5.0
+
+    # Request-time forecasting (ForecastService)
+    forecast_latency_budget_seconds: float = 0.5
+    forecast_max_workers: int = 2
+    forecast_cache_ttl_seconds: int = 3600
+    forecast_failure_ttl_seconds: int = 60  # Failed fits fall back without retrying
+
     # JWT Configuration
     # SECURITY: In production, JWT_SECRET_KEY MUST be set via environment variable
     # The default value is only for development/testing
@@ -118,11 +131,40 @@ class Settings(BaseSettings):
     llm_timeout: int = 30  # API timeout in seconds
     llm_max_retries: int = 2  # Maximum retry attempts
     llm_cache_ttl: int = 3600  # Cache TTL in seconds (1 hour)
+    llm_base_url: str | None = None  # Override API base URL (gateways, local stubs)
+    llm_batch_size: int = 4  # Scopes packed into one prompt by batched generation
+    llm_max_concurrency: int = 4  # Concurrent API calls for batched generation
+    llm_cache_path: str | None = "data/llm_cache.db"  # On-disk response store (None disables)
+    llm_persistent_cache_ttl: int = 86400  # On-disk response TTL in seconds (1 day)
+    llm_cache_significant_digits: int = 3  # Digits kept when normalizing prompt context
+    llm_max_anomalies: int = 10  # Most severe anomalies included in a prompt
+    llm_max_forecasts: int = 12  # Forecast points included in a prompt
 
     # Default tenant
     default_tenant_id: str = "mep-sa-001"
     default_tenant_name: str = "Eng. Sultan Albuqami"
 
+    # Request logging (RequestLoggingMiddleware)
+    request_log_sample_rate: int = 1  # Log 1 in N successful requests (1 = all)
+    request_log_slow_ms: float = 1000.0  # Requests slower than this are always logged
+
+    # Metrics (multi-process aggregation across server workers)
+    metrics_multiprocess_dir: str | None = None  # Shared directory (None: per-process only)
+    metrics_sync_interval_seconds: float = 1.0  # How often a worker writes its file
+
+    # Tracing (spans exported as OTLP/JSON)
+    tracing_exporter: str | None = None  # "file", "otlp" or "memory" (None disables tracing)
+    tracing_sample_rate: float = 1.0  # Fraction of requests traced
+    tracing_file_path: str = "logs/traces.jsonl"  # File exporter output
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"  # OTLP/HTTP collector
+
+    # Sampling profiler (admin endpoint and Diagnostics page)
+    profiler_max_seconds: float = 60.0  # Longest profile a single request may run
+
+    # Health checks (readiness probe)
+    health_check_timeout_seconds: float = 2.0  # Per-check timeout
+    health_cache_ttl_seconds: float = 5.0  # Results reused for this long (0 disables)
+
     # API
     api_host: str = "0.0.0.0"  # nosec B104 - Intentional for container deployment
     api_port: int = 8000
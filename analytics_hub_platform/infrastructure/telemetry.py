@@ -8,13 +8,22 @@ Provides event capture for:
 - Preset usage
 - Filter changes
 - Performance metrics
+
+The log and file backends buffer events in memory for a background thread,
+so tracking never does file or database I/O on a Streamlit rerun. The
+thread appends each batch to the JSONL file (file backend) and merges it
+into per-minute SQLite rollups (telemetry_rollups.py) that the Diagnostics
+page queries for trends.
 """
 
+import atexit
 import json
 import logging
 import os
+import threading
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -23,6 +32,8 @@ from typing import Any
 
 import streamlit as st
 
+from analytics_hub_platform.infrastructure.telemetry_rollups import TelemetryRollupStore
+
 
 # =============================================================================
 # TELEMETRY CONFIGURATION
@@ -43,6 +54,26 @@ TELEMETRY_ENABLED = os.getenv("TELEMETRY_ENABLED", "true").lower() == "true"
 TELEMETRY_BACKEND = TelemetryBackend(os.getenv("TELEMETRY_BACKEND", "log"))
 TELEMETRY_FILE_PATH = os.getenv("TELEMETRY_FILE", "logs/telemetry.jsonl")
 
+# File backend buffering and rotation
+TELEMETRY_BUFFER_SIZE = int(os.getenv("TELEMETRY_BUFFER_SIZE", "10000"))  # Max events held
+TELEMETRY_FLUSH_EVENTS = int(os.getenv("TELEMETRY_FLUSH_EVENTS", "200"))  # Flush at this many
+TELEMETRY_FLUSH_INTERVAL = float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "5.0"))  # ...or seconds
+TELEMETRY_MAX_FILE_BYTES = int(os.getenv("TELEMETRY_MAX_FILE_BYTES", str(10 * 1024 * 1024)))
+TELEMETRY_BACKUP_COUNT = int(os.getenv("TELEMETRY_BACKUP_COUNT", "5"))
+# Rollup database; unset = telemetry_rollups.db beside the event file, "" = disabled
+TELEMETRY_ROLLUP_DB = os.getenv("TELEMETRY_ROLLUP_DB")
+TELEMETRY_ROLLUP_RETENTION_DAYS = int(os.getenv("TELEMETRY_ROLLUP_RETENTION_DAYS", "180"))
+
+
+class TelemetryDropPolicy(Enum):
+    """What to discard when the event buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+TELEMETRY_DROP_POLICY = TelemetryDropPolicy(os.getenv("TELEMETRY_DROP_POLICY", "drop_oldest"))
+
 
 # =============================================================================
 # EVENT MODELS
@@ -107,6 +138,14 @@ class TelemetryCollector:
     Collects and dispatches telemetry events.
 
     Thread-safe, singleton pattern for Streamlit apps.
+
+    With the log and file backends, track() appends to a bounded buffer
+    (the log backend also logs the event immediately). A daemon thread
+    drains the buffer when it reaches flush_events or every flush_interval
+    seconds (and at interpreter exit): the file backend appends it to the
+    JSONL file, rotating at max_file_bytes, and both backends merge it into
+    the rollups. When the buffer is full, events are dropped according to
+    the drop policy and counted in get_stats().
     """
 
     _instance: "TelemetryCollector | None" = None
@@ -125,8 +164,28 @@ class TelemetryCollector:
         self._enabled = TELEMETRY_ENABLED
         self._backend = TELEMETRY_BACKEND
         self._file_path = Path(TELEMETRY_FILE_PATH)
-        self._buffer: list[TelemetryEvent] = []
-        self._buffer_size = 10
+        self._buffer: deque[TelemetryEvent] = deque()
+        self._buffer_size = TELEMETRY_BUFFER_SIZE
+        self._flush_events = TELEMETRY_FLUSH_EVENTS
+        self._flush_interval = TELEMETRY_FLUSH_INTERVAL
+        self._max_file_bytes = TELEMETRY_MAX_FILE_BYTES
+        self._backup_count = TELEMETRY_BACKUP_COUNT
+        self._drop_policy = TELEMETRY_DROP_POLICY
+        self._lock = threading.Lock()  # Guards the buffer and stats
+        self._write_lock = threading.Lock()  # Serializes file writes and rotation
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._rollups_enabled = TELEMETRY_ROLLUP_DB != ""
+        self._rollup_path = Path(TELEMETRY_ROLLUP_DB) if TELEMETRY_ROLLUP_DB else None
+        self._rollup_store: TelemetryRollupStore | None = None
+        self._stats = {
+            "written": 0,
+            "dropped": 0,
+            "flushes": 0,
+            "write_errors": 0,
+            "rotations": 0,
+        }
         self._initialized = True
 
         # Ensure log directory exists
@@ -250,11 +309,11 @@ class TelemetryCollector:
 
     def _dispatch(self, event: TelemetryEvent):
         """Dispatch event to configured backend."""
+        if self._backend == TelemetryBackend.NONE:
+            return
         if self._backend == TelemetryBackend.LOG:
             self._dispatch_to_log(event)
-        elif self._backend == TelemetryBackend.FILE:
-            self._dispatch_to_file(event)
-        # TelemetryBackend.NONE does nothing
+        self._buffer_event(event)
 
     def _dispatch_to_log(self, event: TelemetryEvent):
         """Write event to application log."""
@@ -265,19 +324,148 @@ class TelemetryCollector:
             },
         )
 
-    def _dispatch_to_file(self, event: TelemetryEvent):
-        """Write event to JSONL file."""
-        try:
-            with open(self._file_path, "a", encoding="utf-8") as f:
-                f.write(event.to_json() + "\n")
-        except Exception as e:
-            self._logger.error(f"Failed to write telemetry event: {e}")
+    def _buffer_event(self, event: TelemetryEvent):
+        """Buffer event for the background writer (JSONL file and rollups)."""
+        with self._lock:
+            if len(self._buffer) >= self._buffer_size:
+                self._stats["dropped"] += 1
+                if self._drop_policy == TelemetryDropPolicy.DROP_NEWEST:
+                    return
+                self._buffer.popleft()
+            self._buffer.append(event)
+            pending = len(self._buffer)
+
+        if self._flush_thread is None:
+            self._start_flush_thread()
+        if pending >= self._flush_events:
+            self._wake.set()
+
+    def _start_flush_thread(self):
+        """Start the background writer (on the first buffered event)."""
+        with self._lock:
+            if self._flush_thread is not None:
+                return
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="telemetry-flush", daemon=True
+            )
+            self._flush_thread.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self):
+        """Flush on size trigger (wake) or every flush interval until closed."""
+        while not self._stop.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # noqa: BLE001 - the writer thread must outlive a bad batch
+                self._logger.error(f"Telemetry flush failed: {e}")
 
     def flush(self):
-        """Flush any buffered events."""
-        # Currently events are written immediately
-        # Future: batch writes for performance
-        pass
+        """Write buffered events to the telemetry file (file backend) and the rollups."""
+        with self._write_lock:
+            with self._lock:
+                if not self._buffer:
+                    return
+                events, self._buffer = self._buffer, deque()
+
+            events, data = self._serialize(events)
+            if not events:
+                return
+            if self._backend == TelemetryBackend.FILE and not self._write(events, data):
+                return
+            self._roll_up(events)
+
+    def _write(self, events: list[TelemetryEvent], data: bytes) -> bool:
+        """Append a serialized batch to the telemetry file; False if it was lost."""
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._rotate_if_needed(len(data))
+            with open(self._file_path, "ab") as f:
+                f.write(data)
+        except OSError as e:
+            self._logger.error(f"Failed to write {len(events)} telemetry events: {e}")
+            with self._lock:
+                self._stats["write_errors"] += 1
+                self._stats["dropped"] += len(events)
+            return False
+
+        with self._lock:
+            self._stats["written"] += len(events)
+            self._stats["flushes"] += 1
+        return True
+
+    def _serialize(self, events: deque[TelemetryEvent]) -> tuple[list[TelemetryEvent], bytes]:
+        """Encode events as JSONL, dropping (and counting) any that cannot be serialized."""
+        serialized: list[TelemetryEvent] = []
+        lines: list[str] = []
+        for event in events:
+            try:
+                lines.append(event.to_json() + "\n")
+            except Exception as e:  # noqa: BLE001 - one bad event must not lose the batch
+                self._logger.error(f"Dropping unserializable {event.event_type} event: {e}")
+                continue
+            serialized.append(event)
+
+        if len(serialized) < len(events):
+            with self._lock:
+                self._stats["dropped"] += len(events) - len(serialized)
+        return serialized, "".join(lines).encode("utf-8")
+
+    @property
+    def rollup_store(self) -> TelemetryRollupStore | None:
+        """Per-minute rollup store (None when telemetry or TELEMETRY_ROLLUP_DB is off)."""
+        if not self._enabled or self._backend == TelemetryBackend.NONE:
+            return None
+        if self._rollup_store is None and self._rollups_enabled:
+            path = self._rollup_path or self._file_path.with_name("telemetry_rollups.db")
+            self._rollup_store = TelemetryRollupStore(path)
+            self._rollup_store.prune(TELEMETRY_ROLLUP_RETENTION_DAYS)
+        return self._rollup_store
+
+    def _roll_up(self, events: list[TelemetryEvent]):
+        """Merge a flushed batch into the rollups; failures never lose the raw events."""
+        try:
+            store = self.rollup_store
+            if store is not None:
+                store.add_events(events)
+        except Exception as e:  # noqa: BLE001 - rollups are best effort
+            self._logger.error(f"Failed to roll up {len(events)} telemetry events: {e}")
+
+    def _rotate_if_needed(self, incoming_bytes: int):
+        """Rotate telemetry.jsonl -> .1 -> .2 ... when the next write would exceed the limit."""
+        if self._max_file_bytes <= 0:
+            return
+        try:
+            size = self._file_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size == 0 or size + incoming_bytes <= self._max_file_bytes:
+            return
+
+        for index in range(self._backup_count - 1, 0, -1):
+            source = self._file_path.with_name(f"{self._file_path.name}.{index}")
+            if source.exists():
+                os.replace(source, self._file_path.with_name(f"{self._file_path.name}.{index + 1}"))
+        if self._backup_count > 0:
+            os.replace(self._file_path, self._file_path.with_name(f"{self._file_path.name}.1"))
+        else:
+            self._file_path.unlink()
+        with self._lock:
+            self._stats["rotations"] += 1
+
+    def close(self):
+        """Stop the background writer and flush remaining events."""
+        self._stop.set()
+        self._wake.set()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=5)
+        self.flush()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Buffer and writer counters ("written" counts events appended to the file)."""
+        with self._lock:
+            return {**self._stats, "buffered": len(self._buffer), "capacity": self._buffer_size}
 
 
 # =============================================================================
@@ -368,9 +556,12 @@ def get_telemetry_stats() -> dict:
     Get telemetry statistics for the current session.
     Useful for diagnostics.
     """
-    return {
+    stats = {
         "enabled": TELEMETRY_ENABLED,
         "backend": TELEMETRY_BACKEND.value,
         "session_id": st.session_state.get("telemetry_session_id", "N/A"),
         "pages_viewed": list(st.session_state.get("page_view_tracked", [])),
     }
+    if TelemetryCollector._instance is not None:
+        stats["writer"] = TelemetryCollector._instance.get_stats()
+    return stats
@@ -0,0 +1,322 @@
+"""
+Telemetry Rollups Module
+Sustainable Economic Development Analytics Hub
+
+Aggregates telemetry events into per-minute rollups persisted in SQLite:
+event counts and latency histograms by event type and page. Rollups are
+merged incrementally as the telemetry writer flushes each batch, so trend
+queries over weeks read a few thousand rows instead of the raw event log.
+"""
+
+import logging
+import sqlite3
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from analytics_hub_platform.infrastructure.observability import HistogramSnapshot
+
+if TYPE_CHECKING:
+    from analytics_hub_platform.infrastructure.telemetry import TelemetryEvent
+
+logger = logging.getLogger(__name__)
+
+# Latency bucket upper bounds in milliseconds; +Inf is implicit
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS telemetry_rollups (
+        minute INTEGER NOT NULL,
+        event_type TEXT NOT NULL,
+        page TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        duration_count INTEGER NOT NULL,
+        duration_sum_ms REAL NOT NULL,
+        duration_min_ms REAL,
+        duration_max_ms REAL,
+        PRIMARY KEY (minute, event_type, page)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS telemetry_latency_buckets (
+        minute INTEGER NOT NULL,
+        event_type TEXT NOT NULL,
+        page TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (minute, event_type, page, bucket)
+    )
+    """,
+)
+
+_UPSERT_ROLLUP = """
+    INSERT INTO telemetry_rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (minute, event_type, page) DO UPDATE SET
+        count = count + excluded.count,
+        duration_count = duration_count + excluded.duration_count,
+        duration_sum_ms = duration_sum_ms + excluded.duration_sum_ms,
+        duration_min_ms = MIN(COALESCE(duration_min_ms, excluded.duration_min_ms),
+                              COALESCE(excluded.duration_min_ms, duration_min_ms)),
+        duration_max_ms = MAX(COALESCE(duration_max_ms, excluded.duration_max_ms),
+                              COALESCE(excluded.duration_max_ms, duration_max_ms))
+"""
+
+_UPSERT_BUCKET = """
+    INSERT INTO telemetry_latency_buckets VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (minute, event_type, page, bucket) DO UPDATE SET
+        count = count + excluded.count
+"""
+
+
+def _epoch_minute(timestamp: str) -> int:
+    """Minutes since the Unix epoch for an ISO 8601 timestamp."""
+    moment = datetime.fromisoformat(timestamp)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp()) // 60
+
+
+def _minute_bounds(since: datetime, until: datetime | None) -> tuple[int, int]:
+    until = until or datetime.now(timezone.utc)
+    return int(since.timestamp()) // 60, int(until.timestamp()) // 60
+
+
+class _MinuteRollup:
+    """In-memory aggregate of one (minute, event type, page) cell."""
+
+    __slots__ = (
+        "count",
+        "duration_count",
+        "duration_sum",
+        "duration_min",
+        "duration_max",
+        "buckets",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration_count = 0
+        self.duration_sum = 0.0
+        self.duration_min: float | None = None
+        self.duration_max: float | None = None
+        self.buckets: dict[int, int] = defaultdict(int)
+
+    def add(self, duration_ms: float | None) -> None:
+        self.count += 1
+        if duration_ms is None:
+            return
+        self.duration_count += 1
+        self.duration_sum += duration_ms
+        if self.duration_min is None or duration_ms < self.duration_min:
+            self.duration_min = duration_ms
+        if self.duration_max is None or duration_ms > self.duration_max:
+            self.duration_max = duration_ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+
+class TelemetryRollupStore:
+    """
+    SQLite store of per-minute telemetry rollups.
+
+    Each operation opens its own connection, so one instance can be shared
+    by the telemetry flush thread and Streamlit script threads.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Initialize the store, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and always closing it."""
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # INGESTION
+    # =========================================================================
+
+    def add_events(self, events: Iterable["TelemetryEvent"]) -> int:
+        """
+        Merge a batch of events into the rollups.
+
+        Args:
+            events: Telemetry events (any order)
+
+        Returns:
+            Number of events rolled up
+        """
+        cells: dict[tuple[int, str, str], _MinuteRollup] = defaultdict(_MinuteRollup)
+        added = 0
+        for event in events:
+            try:
+                minute = _epoch_minute(event.timestamp)
+            except ValueError:
+                logger.warning(f"Skipping telemetry event with bad timestamp: {event.timestamp}")
+                continue
+            cells[(minute, event.event_type, event.page or "unknown")].add(event.duration_ms)
+            added += 1
+
+        if cells:
+            self._merge(cells)
+        return added
+
+    def _merge(self, cells: dict[tuple[int, str, str], _MinuteRollup]) -> None:
+        rollup_rows = [
+            (*key, c.count, c.duration_count, c.duration_sum, c.duration_min, c.duration_max)
+            for key, c in cells.items()
+        ]
+        bucket_rows = [
+            (*key, bucket, n) for key, c in cells.items() for bucket, n in c.buckets.items()
+        ]
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(_UPSERT_ROLLUP, rollup_rows)
+            conn.executemany(_UPSERT_BUCKET, bucket_rows)
+
+    def prune(self, older_than_days: int) -> int:
+        """
+        Delete rollups older than a retention window.
+
+        Returns:
+            Number of per-minute rows removed
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        cutoff_minute = int(cutoff.timestamp()) // 60
+        with self._write_lock, self._connect() as conn:
+            conn.execute("DELETE FROM telemetry_latency_buckets WHERE minute < ?", (cutoff_minute,))
+            deleted = conn.execute(
+                "DELETE FROM telemetry_rollups WHERE minute < ?", (cutoff_minute,)
+            )
+            return deleted.rowcount
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def query_counts(
+        self,
+        since: datetime,
+        until: datetime | None = None,
+        resolution_minutes: int = 1440,
+        by: str = "event_type",
+    ) -> pd.DataFrame:
+        """
+        Event counts per period.
+
+        Args:
+            since: Start of the window (timezone-aware)
+            until: End of the window (default: now)
+            resolution_minutes: Period length (60 = hourly, 1440 = daily)
+            by: Grouping column ("event_type" or "page")
+
+        Returns:
+            DataFrame with columns period (UTC datetime), <by>, count
+        """
+        if by not in ("event_type", "page"):
+            raise ValueError(f"Cannot group telemetry rollups by {by!r}")
+        start, end = _minute_bounds(since, until)
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                f"SELECT (minute / ?) * ? AS minute, {by}, SUM(count) AS count "  # nosec B608
+                "FROM telemetry_rollups WHERE minute BETWEEN ? AND ? "
+                f"GROUP BY 1, {by} ORDER BY 1, {by}",
+                conn,
+                params=(resolution_minutes, resolution_minutes, start, end),
+            )
+        df.insert(0, "period", pd.to_datetime(df.pop("minute") * 60, unit="s", utc=True))
+        return df
+
+    def query_latency(
+        self,
+        since: datetime,
+        until: datetime | None = None,
+        by: str = "page",
+    ) -> pd.DataFrame:
+        """
+        Latency summary of timed events, with quantiles estimated from the buckets.
+
+        Args:
+            since: Start of the window (timezone-aware)
+            until: End of the window (default: now)
+            by: Grouping column ("page" or "event_type")
+
+        Returns:
+            DataFrame with columns <by>, count, avg_ms, p50_ms, p95_ms, max_ms
+            (slowest p95 first)
+        """
+        if by not in ("event_type", "page"):
+            raise ValueError(f"Cannot group telemetry rollups by {by!r}")
+        start, end = _minute_bounds(since, until)
+        with self._connect() as conn:
+            totals = conn.execute(
+                f"SELECT {by}, SUM(duration_count), SUM(duration_sum_ms), "  # nosec B608
+                "MIN(duration_min_ms), MAX(duration_max_ms) FROM telemetry_rollups "
+                f"WHERE minute BETWEEN ? AND ? AND duration_count > 0 GROUP BY {by}",
+                (start, end),
+            ).fetchall()
+            bucket_rows = conn.execute(
+                f"SELECT {by}, bucket, SUM(count) FROM telemetry_latency_buckets "  # nosec B608
+                f"WHERE minute BETWEEN ? AND ? GROUP BY {by}, bucket",
+                (start, end),
+            ).fetchall()
+
+        buckets: dict[str, list[int]] = defaultdict(lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+        for key, bucket, n in bucket_rows:
+            buckets[key][bucket] = n
+
+        rows = []
+        for key, count, total, low, high in totals:
+            snapshot = HistogramSnapshot(
+                bounds=LATENCY_BUCKETS_MS,
+                counts=buckets[key],
+                count=count,
+                sum=total,
+                min=low,
+                max=high,
+            )
+            rows.append(
+                {
+                    by: key,
+                    "count": count,
+                    "avg_ms": total / count,
+                    "p50_ms": snapshot.quantile(0.5),
+                    "p95_ms": snapshot.quantile(0.95),
+                    "max_ms": high,
+                }
+            )
+        columns = [by, "count", "avg_ms", "p50_ms", "p95_ms", "max_ms"]
+        df = pd.DataFrame(rows, columns=columns)
+        return df.sort_values("p95_ms", ascending=False, ignore_index=True)
@@ -2760,7 +2760,7 @@ def _render_ml_forecast_section(
     _render_section_title("🔮 KPI Forecasting", "ML-powered predictions for key indicators")
 
     try:
-        from analytics_hub_platform.domain.ml_services import KPIForecaster
+        from analytics_hub_platform.domain.forecasting.service import get_forecast_service
 
         # Select KPI to forecast
         forecast_kpis = [
@@ -2806,9 +2806,15 @@ def _render_ml_forecast_section(
 
         # Generate forecast
         with st.spinner("Generating forecast..."):
-            forecaster = KPIForecaster(model_type=model_type)
-            forecaster.fit(hist_df)
-            predictions = forecaster.predict(quarters_ahead=periods)
+            result = get_forecast_service().forecast(
+                hist_df, quarters_ahead=periods, model_type=model_type
+            )
+        predictions = result.predictions
+        if result.pending:
+            st.caption(
+                f"⏳ Showing a quick ensemble forecast while the "
+                f"{model_type.replace('_', ' ')} model trains; refresh to see it."
+            )
 
         # Build visualization
         fig = go.Figure()
@@ -2905,17 +2911,13 @@ def _render_anomaly_section(
         anomaly_kpis = ["sustainability_index", "gdp_growth", "unemployment_rate", "co2_index"]
         available_kpis = [k for k in anomaly_kpis if k in df.columns]
 
-        all_anomalies = []
-
-        for kpi in available_kpis:
-            kpi_df = df.groupby(["year", "quarter"]).agg({kpi: "mean"}).reset_index()
-            kpi_df = kpi_df.rename(columns={kpi: "value"}).dropna()
-            kpi_df = kpi_df.sort_values(["year", "quarter"])
-
-            if len(kpi_df) >= 4:
-                higher_is_better = kpi not in ["unemployment_rate", "co2_index"]
-                anomalies = detector.detect_anomalies(kpi_df, kpi, "national", higher_is_better)
-                all_anomalies.extend(anomalies)
+        national_df = df.groupby(["year", "quarter"])[available_kpis].mean().reset_index()
+        all_anomalies = detector.detect_anomalies_multi(
+            national_df,
+            available_kpis,
+            region_column=None,
+            higher_is_better={"unemployment_rate": False, "co2_index": False},
+        )
 
         # Sort by severity and recency
         critical = [a for a in all_anomalies if a.severity == AnomalySeverity.CRITICAL]
@@ -3011,6 +3013,50 @@ def _render_anomaly_section(
         st.warning(f"⚠️ Anomaly detection unavailable: {str(e)}")
 
 
+def _stream_llm_recommendations(kpi_data: dict, language: str) -> dict:
+    """
+    Stream LLM recommendations into a live preview and return the full result.
+
+    The preview shows the summary, insights and recommendations as soon as
+    each has been generated; it is cleared once the complete response is in.
+    """
+    from analytics_hub_platform.domain.llm_service import stream_recommendations
+
+    preview = st.empty()
+    partial: dict = {"executive_summary": "", "key_insights": [], "recommendations": []}
+    result: dict = {}
+
+    for event in stream_recommendations(kpi_data=kpi_data, language=language, provider="auto"):
+        if event.event == "done":
+            result = event.data
+            break
+        if event.event == "executive_summary":
+            partial["executive_summary"] = event.data
+        elif event.event == "key_insight":
+            partial["key_insights"].append(event.data)
+        elif event.event == "recommendation":
+            partial["recommendations"].append(event.data)
+        else:
+            continue
+
+        lines = []
+        if partial["executive_summary"]:
+            lines.append(f"**📋 Executive Summary**\n\n{partial['executive_summary']}")
+        if partial["key_insights"]:
+            lines.append("**💡 Key Insights**")
+            lines.extend(f"• {insight}" for insight in partial["key_insights"])
+        if partial["recommendations"]:
+            lines.append("**📌 Strategic Recommendations**")
+            lines.extend(
+                f"- **{rec['title']}**: {rec['description']}"
+                for rec in partial["recommendations"]
+            )
+        preview.markdown("\n\n".join(lines) + "\n\n_Generating…_")
+
+    preview.empty()
+    return result
+
+
 def _render_llm_recommendations_section(snapshot: dict, theme, language: str) -> None:
     """Render the LLM-powered recommendations section."""
 
@@ -3021,18 +3067,12 @@ def _render_llm_recommendations_section(snapshot: dict, theme, language: str) ->
     # Auto-generate recommendations on first load
     if "ai_recommendations" not in st.session_state:
         try:
-            from analytics_hub_platform.domain.llm_service import generate_recommendations
-
             kpi_data = {
                 "period": f"Q{snapshot.get('quarter', 4)} {snapshot.get('year', 2024)}",
                 "metrics": snapshot.get("metrics", {}),
             }
 
-            result = generate_recommendations(
-                kpi_data=kpi_data,
-                language=language,
-                provider="auto",
-            )
+            result = _stream_llm_recommendations(kpi_data, language)
 
             st.session_state["ai_recommendations"] = result
 
@@ -3081,21 +3121,14 @@ def _render_llm_recommendations_section(snapshot: dict, theme, language: str) ->
     # Button to regenerate
     if st.button("🔄 Regenerate AI Recommendations", key="generate_llm_recs"):
         try:
-            from analytics_hub_platform.domain.llm_service import generate_recommendations
-
-            with st.spinner("Generating AI recommendations..."):
-                kpi_data = {
-                    "period": f"Q{snapshot.get('quarter', 4)} {snapshot.get('year', 2024)}",
-                    "metrics": snapshot.get("metrics", {}),
-                }
+            kpi_data = {
+                "period": f"Q{snapshot.get('quarter', 4)} {snapshot.get('year', 2024)}",
+                "metrics": snapshot.get("metrics", {}),
+            }
 
-                result = generate_recommendations(
-                    kpi_data=kpi_data,
-                    language=language,
-                    provider="auto",
-                )
+            result = _stream_llm_recommendations(kpi_data, language)
 
-                st.session_state["ai_recommendations"] = result
+            st.session_state["ai_recommendations"] = result
 
         except Exception as e:
             st.error(f"Failed to regenerate recommendations: {str(e)}")
@@ -49,9 +49,11 @@ except ImportError:
     dataframe_to_rows: Any = None
 
 from analytics_hub_platform.config.branding import BRANDING
+from analytics_hub_platform.infrastructure.tracing import traced
 from analytics_hub_platform.ui.theme import get_theme
 
 
+@traced(attributes={"component": "export"})
 def generate_excel_workbook(
     data: pd.DataFrame,
     title: str = "Sustainability Analytics Data",
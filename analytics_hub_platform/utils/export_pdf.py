@@ -59,9 +59,11 @@ except ImportError:
     TableStyle: Any = None  # type: ignore[misc]
 
 from analytics_hub_platform.config.branding import BRANDING
+from analytics_hub_platform.infrastructure.tracing import traced
 from analytics_hub_platform.ui.theme import get_theme
 
 
+@traced(attributes={"component": "export"})
 def generate_pdf_report(
     data: pd.DataFrame,
     title: str = "Sustainability Analytics Report",
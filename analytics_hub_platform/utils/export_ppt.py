@@ -36,6 +36,7 @@ except ImportError:
     Pt: Any = None  # type: ignore[misc]
 
 from analytics_hub_platform.config.branding import BRANDING
+from analytics_hub_platform.infrastructure.tracing import traced
 from analytics_hub_platform.ui.theme import get_theme
 
 
@@ -298,6 +299,7 @@ def _add_thank_you_slide(
 # =============================================================================
 
 
+@traced(attributes={"component": "export"})
 def generate_ppt_presentation(
     data: pd.DataFrame,
     title: str = "Sustainability Analytics Report",
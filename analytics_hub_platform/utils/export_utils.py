@@ -15,6 +15,8 @@ from typing import Any
 
 import pandas as pd
 
+from analytics_hub_platform.infrastructure.tracing import traced
+
 # Optional imports with fallbacks
 try:
     from reportlab.lib import colors
@@ -49,6 +51,7 @@ except ImportError:
 # =============================================================================
 
 
+@traced(attributes={"component": "export"})
 def export_dataframe_to_csv(
     df: pd.DataFrame,
     filename: str = "export.csv",
@@ -208,6 +211,7 @@ def get_png_download_button_html(
 # =============================================================================
 
 
+@traced(attributes={"component": "export"})
 def generate_executive_brief_pdf(
     title: str = "Sustainability Dashboard Executive Brief",
     date: str | None = None,
@@ -385,7 +385,7 @@ with main_col:
         section_header("KPI Forecasting", "ML-powered predictions for key indicators", "🔮")
 
         try:
-            from analytics_hub_platform.domain.ml_services import KPIForecaster
+            from analytics_hub_platform.domain.forecasting.service import get_forecast_service
 
             forecast_kpis = [
                 "sustainability_index", "gdp_growth",
@@ -423,9 +423,15 @@ with main_col:
 
                 if len(hist_df) >= 8:
                     with st.spinner("Generating forecast..."):
-                        forecaster = KPIForecaster(model_type=model_type)
-                        forecaster.fit(hist_df)
-                        predictions = forecaster.predict(quarters_ahead=periods)
+                        result = get_forecast_service().forecast(
+                            hist_df, quarters_ahead=periods, model_type=model_type
+                        )
+                    predictions = result.predictions
+                    if result.pending:
+                        st.caption(
+                            f"⏳ Showing a quick ensemble forecast while the "
+                            f"{model_type.replace('_', ' ')} model trains; refresh to see it."
+                        )
 
                     # Use extracted component for forecast visualization
                     hist_df = add_period_column(hist_df)
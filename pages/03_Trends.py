@@ -9,6 +9,7 @@ Displays:
 - Volatility and variance analysis
 """
 
+import pandas as pd
 import streamlit as st
 
 # Page configuration
@@ -44,6 +45,7 @@ from analytics_hub_platform.app.styles.tokens import colors
 from analytics_hub_platform.ui.theme import get_dark_theme
 from analytics_hub_platform.utils.dataframe_adapter import add_period_column
 from analytics_hub_platform.domain.ml_services import AnomalyDetector, AnomalySeverity
+from analytics_hub_platform.domain.advanced_analytics import analyze_trends
 
 
 # Initialize page (session state, database, theme)
@@ -143,6 +145,27 @@ with main_col:
                     trend_color=colors.accent_primary,
                 )
 
+        spacer("md")
+
+        # Trend statistics for every indicator in one vectorized call
+        with card_container("Trend Summary", "Linear trend fitted to each indicator"):
+            trend_stats = analyze_trends(trend_df, list(kpi_options), region_column=None)
+            if len(trend_stats) > 0:
+                summary_df = trend_stats.to_frame()
+                summary_df = summary_df[summary_df["n_obs"] > 0]
+                summary_table = pd.DataFrame(
+                    {
+                        "Indicator": [kpi_options[k] for k in summary_df.index],
+                        "Direction": summary_df["direction"].str.title().to_numpy(),
+                        "Annual Change": summary_df["annual_change_rate"].round(3).to_numpy(),
+                        "R²": summary_df["r_squared"].round(2).to_numpy(),
+                        "p-value": summary_df["p_value"].round(4).to_numpy(),
+                    }
+                )
+                st.dataframe(summary_table, width="stretch", hide_index=True)
+            else:
+                st.info("No indicator data available for trend analysis")
+
         spacer("lg")
 
         # Section 1.5: Early Warning System
@@ -159,16 +182,15 @@ with main_col:
             ]
             available_anomaly_kpis = [k for k in anomaly_kpis if k in df.columns]
 
-            all_anomalies = []
-            for kpi in available_anomaly_kpis:
-                kpi_df = df.groupby(["year", "quarter"]).agg({kpi: "mean"}).reset_index()
-                kpi_df = kpi_df.rename(columns={kpi: "value"}).dropna()
-                kpi_df = kpi_df.sort_values(["year", "quarter"])
-
-                if len(kpi_df) >= 4:
-                    higher_is_better = kpi not in ["unemployment_rate", "co2_index"]
-                    anomalies = detector.detect_anomalies(kpi_df, kpi, "national", higher_is_better)
-                    all_anomalies.extend(anomalies)
+            national_df = (
+                df.groupby(["year", "quarter"])[available_anomaly_kpis].mean().reset_index()
+            )
+            all_anomalies = detector.detect_anomalies_multi(
+                national_df,
+                available_anomaly_kpis,
+                region_column=None,
+                higher_is_better={"unemployment_rate": False, "co2_index": False},
+            )
 
             critical = [a for a in all_anomalies if a.severity == AnomalySeverity.CRITICAL]
             warnings = [a for a in all_anomalies if a.severity == AnomalySeverity.WARNING]
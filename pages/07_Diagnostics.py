@@ -8,6 +8,8 @@ Production smoke-check panel showing:
 - Cache statistics
 - System resource signals
 - Last data refresh timestamp
+- Usage and performance trends (telemetry rollups)
+- Live sampling profiler (admins only)
 - Correlation ID for request tracing
 """
 
@@ -15,7 +17,7 @@ import os
 import platform
 import sys
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import streamlit as st
@@ -181,6 +183,59 @@ def get_last_data_refresh() -> dict:
     return result
 
 
+def get_telemetry_trends(days: int) -> dict:
+    """Get usage and latency trends from the per-minute telemetry rollups."""
+    from analytics_hub_platform.infrastructure.telemetry import get_telemetry_collector
+
+    result: dict = {"available": False}
+
+    try:
+        store = get_telemetry_collector().rollup_store
+        if store is None:
+            result["error"] = (
+                "Telemetry rollups are disabled "
+                "(TELEMETRY_ENABLED, TELEMETRY_BACKEND=none or TELEMETRY_ROLLUP_DB)"
+            )
+            return result
+
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        result["counts"] = store.query_counts(since, resolution_minutes=60 if days <= 2 else 1440)
+        result["latency"] = store.query_latency(since)
+        result["available"] = True
+    except Exception as e:
+        result["error"] = str(e)
+
+    return result
+
+
+def can_run_profiler() -> bool:
+    """Check the run_profiler permission (everyone when auth is disabled locally)."""
+    from analytics_hub_platform.domain.models import UserRole
+    from analytics_hub_platform.infrastructure.security import role_has_permission
+    from analytics_hub_platform.infrastructure.streamlit_auth import (
+        get_current_user,
+        is_auth_enabled,
+    )
+
+    if not is_auth_enabled():
+        role = UserRole.ADMIN
+    else:
+        user = get_current_user()
+        role = UserRole.ADMIN if user and user["is_admin"] else UserRole.VIEWER
+    return role_has_permission(role, "run_profiler")
+
+
+def run_profile(seconds: float, interval_ms: float, include_idle: bool) -> dict:
+    """Profile this Streamlit server process; returns the result or an error."""
+    from analytics_hub_platform.infrastructure.profiler import ProfilerBusyError, SamplingProfiler
+
+    try:
+        profiler = SamplingProfiler(interval_ms=interval_ms, include_idle=include_idle)
+        return {"result": profiler.run(seconds)}
+    except ProfilerBusyError as e:
+        return {"error": e.message}
+
+
 def render_diagnostics_page():
     """Render the diagnostics page."""
     st.set_page_config(
@@ -262,6 +317,86 @@ def render_diagnostics_page():
 
     st.divider()
 
+    # Usage & Performance Trends
+    st.subheader("📈 Usage & Performance Trends")
+    window = st.selectbox(
+        "Window",
+        options=[1, 7, 30, 90],
+        index=1,
+        format_func=lambda days: f"Last {days} day{'s' if days > 1 else ''}",
+    )
+    trends = get_telemetry_trends(window)
+
+    if not trends["available"]:
+        st.info(trends.get("error", "No telemetry rollups available"))
+    elif trends["counts"].empty:
+        st.info("No telemetry events recorded in this window")
+    else:
+        counts = trends["counts"]
+        usage = counts.pivot_table(
+            index="period", columns="event_type", values="count", aggfunc="sum", fill_value=0
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Events", f"{int(counts['count'].sum()):,}")
+        with col2:
+            page_views = counts.loc[counts["event_type"] == "page_view", "count"].sum()
+            st.metric("Page Views", f"{int(page_views):,}")
+        st.line_chart(usage)
+
+        if not trends["latency"].empty:
+            st.write("**Latency by Page (slowest p95 first):**")
+            st.dataframe(trends["latency"].round(1), width="stretch", hide_index=True)
+
+    st.divider()
+
+    # Live Profiler
+    st.subheader("🔬 Live Profiler")
+
+    if not can_run_profiler():
+        st.info("Profiling requires the administrator role")
+    else:
+        from analytics_hub_platform.infrastructure.settings import get_settings
+
+        st.caption(
+            "Samples every thread's stack in this server process and produces a "
+            "collapsed-stack file for flamegraph.pl or speedscope."
+        )
+        max_seconds = int(get_settings().profiler_max_seconds)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            seconds = st.slider("Duration (s)", 1, max_seconds, min(10, max_seconds))
+        with col2:
+            interval_ms = st.selectbox("Interval (ms)", options=[5, 10, 20, 50], index=1)
+        with col3:
+            include_idle = st.checkbox("Include idle threads", value=False)
+
+        if st.button("▶️ Run Profile"):
+            with st.spinner(f"Profiling for {seconds}s..."):
+                st.session_state.last_profile = run_profile(seconds, interval_ms, include_idle)
+
+        profile = st.session_state.get("last_profile")
+        if profile and "error" in profile:
+            st.warning(profile["error"])
+        elif profile:
+            result = profile["result"]
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Samples", f"{result.samples:,}")
+            with col2:
+                st.metric("Idle Samples Skipped", f"{result.idle_samples:,}")
+            st.write("**Top Functions (self samples):**")
+            for label, count in result.top_functions(10):
+                st.write(f"  - `{label}`: {count} ({count / max(result.samples, 1):.0%})")
+            st.download_button(
+                "⬇️ Download Collapsed Stacks",
+                data=result.to_collapsed(),
+                file_name=f"profile-{result.started_at:%Y%m%dT%H%M%SZ}.collapsed",
+                mime="text/plain",
+            )
+
+    st.divider()
+
     # System Resources
     st.subheader("💻 System Resources")
     resources = get_system_resources()
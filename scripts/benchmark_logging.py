@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Structured Logging Throughput Benchmark
+Sustainable Economic Development Analytics Hub
+
+Compares synchronous structured logging (StructuredLogFormatter on a
+StreamHandler, as set up by setup_structured_logging) with the queue-based
+AsyncLogPipeline. For each mode it reports the caller-side cost per record
+- what a request thread pays - and end-to-end records/sec until every
+record has been written. Output goes to os.devnull unless --file is given.
+
+The "enqueue only" row logs with the listener paused: the floor of what a
+caller pays. With the listener running, CPU-bound formatting still competes
+for the GIL, so the async gain is largest when writes block (slow disks,
+pipes to log collectors).
+
+Usage:
+    python scripts/benchmark_logging.py
+    python scripts/benchmark_logging.py --records 200000 --threads 8 --file /tmp/bench.log
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path (one level above scripts/)
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from analytics_hub_platform.infrastructure.observability import (  # noqa: E402
+    HAS_ORJSON,
+    AsyncLogPipeline,
+    BatchingFileHandler,
+    StructuredLogFormatter,
+    correlation_context,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Structured logging throughput benchmark")
+    parser.add_argument("--records", type=int, default=50000, help="Records per mode")
+    parser.add_argument("--threads", type=int, default=4, help="Threads logging concurrently")
+    parser.add_argument("--batch-size", type=int, default=256, help="Records per async write")
+    parser.add_argument(
+        "--file", type=Path, default=None, help="Write logs here (default: devnull)"
+    )
+    return parser.parse_args()
+
+
+def _log_from_threads(logger: logging.Logger, records: int, threads: int) -> float:
+    """Log records from several threads; return the mean caller time per record (us)."""
+    per_thread = records // threads
+    caller_seconds = [0.0] * threads
+
+    def worker(index: int) -> None:
+        with correlation_context(f"bench-{index}"):
+            start = time.perf_counter()
+            for i in range(per_thread):
+                logger.info(
+                    "Request completed: GET /api/v1/indicators",
+                    extra={"status_code": 200, "duration_ms": 12.5, "sequence": i},
+                )
+            caller_seconds[index] = time.perf_counter() - start
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return sum(caller_seconds) / (per_thread * threads) * 1e6
+
+
+def _bench_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def run_sync(path: str, records: int, threads: int) -> tuple[float, float]:
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(StructuredLogFormatter(include_location=False))
+    logger = _bench_logger("bench.sync", handler)
+
+    start = time.perf_counter()
+    caller_us = _log_from_threads(logger, records, threads)
+    handler.close()
+    return caller_us, records / (time.perf_counter() - start)
+
+
+def run_async(
+    path: str, records: int, threads: int, batch_size: int, paused: bool = False
+) -> tuple[float, float]:
+    handler = BatchingFileHandler(path, batch_size=batch_size)
+    handler.setFormatter(StructuredLogFormatter(include_location=False))
+    pipeline = AsyncLogPipeline([handler], queue_size=0)
+    logger = _bench_logger("bench.async", pipeline.queue_handler)
+
+    if not paused:
+        pipeline.start()
+    start = time.perf_counter()
+    caller_us = _log_from_threads(logger, records, threads)
+    pipeline.start()
+    pipeline.stop()  # Waits until every record is written
+    return caller_us, records / (time.perf_counter() - start)
+
+
+def main() -> int:
+    args = parse_args()
+    path = str(args.file) if args.file else os.devnull
+
+    print("=" * 60)
+    print("Structured Logging Throughput")
+    print("=" * 60)
+    print(f"Records: {args.records}  Threads: {args.threads}  Output: {path}")
+    print(f"JSON encoder: {'orjson' if HAS_ORJSON else 'json (stdlib)'}")
+    print()
+
+    for label, (caller_us, rate) in (
+        ("sync handler", run_sync(path, args.records, args.threads)),
+        ("async pipeline", run_async(path, args.records, args.threads, args.batch_size)),
+        (
+            "enqueue only",
+            run_async(path, args.records, args.threads, args.batch_size, paused=True),
+        ),
+    ):
+        print(f"{label:<16} caller {caller_us:7.1f} us/record   end-to-end {rate:10,.0f} records/s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""
+Request Middleware Benchmark
+Sustainable Economic Development Analytics Hub
+
+Measures the per-request overhead of RequestLoggingMiddleware by driving a
+trivial ASGI endpoint in-process (no sockets), with and without the
+middleware and at several log sampling rates. A pass-through
+BaseHTTPMiddleware is measured too, separating Starlette's own
+per-middleware cost from the work done in dispatch. Logs are formatted as JSON
+and written to os.devnull, so formatting cost is included but terminal
+output is not.
+
+Usage:
+    python scripts/benchmark_middleware.py
+    python scripts/benchmark_middleware.py --requests 50000 --sample-rates 1 10 100
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+# Add project root to path (one level above scripts/)
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from analytics_hub_platform.infrastructure.middleware import (  # noqa: E402
+    RequestLoggingMiddleware,
+)
+from analytics_hub_platform.infrastructure.observability import (  # noqa: E402
+    StructuredLogFormatter,
+    get_metrics,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="RequestLoggingMiddleware overhead benchmark")
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight at once")
+    parser.add_argument(
+        "--sample-rates",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Log sampling rates to measure (1 = log every request)",
+    )
+    return parser.parse_args()
+
+
+async def _endpoint(request):
+    return PlainTextResponse("ok")
+
+
+class PassThroughMiddleware(BaseHTTPMiddleware):
+    """Does nothing; measures the BaseHTTPMiddleware machinery alone."""
+
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+def build_app(sample_rate: int | None = None, passthrough: bool = False) -> Starlette:
+    """Create the benchmark app, optionally wrapped in a middleware."""
+    app = Starlette(routes=[Route("/api/v1/indicators/{id}", _endpoint)])
+    if passthrough:
+        app.add_middleware(PassThroughMiddleware)
+    elif sample_rate is not None:
+        app.add_middleware(RequestLoggingMiddleware, sample_rate=sample_rate)
+    return app
+
+
+async def _request(app: Starlette, index: int) -> None:
+    """Send one GET through the ASGI interface."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": f"/api/v1/indicators/{index % 100}",
+        "raw_path": f"/api/v1/indicators/{index % 100}".encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"benchmark")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        return None
+
+    await app(scope, receive, send)
+
+
+async def run_scenario(app: Starlette, requests: int, concurrency: int) -> float:
+    """Return the mean wall time per request in microseconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(index: int) -> None:
+        async with semaphore:
+            await _request(app, index)
+
+    await asyncio.gather(*(bounded(i) for i in range(min(requests, 200))))  # Warm-up
+    start = time.perf_counter()
+    await asyncio.gather(*(bounded(i) for i in range(requests)))
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> int:
+    args = parse_args()
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = []
+    handler = logging.FileHandler(os.devnull)
+    handler.setFormatter(StructuredLogFormatter())
+    root_logger.addHandler(handler)
+    root_logger.setLevel(logging.INFO)
+
+    print("=" * 60)
+    print("RequestLoggingMiddleware Overhead")
+    print("=" * 60)
+    print(f"Requests: {args.requests}  Concurrency: {args.concurrency}")
+    print()
+
+    baseline = asyncio.run(run_scenario(build_app(None), args.requests, args.concurrency))
+    print(f"{'no middleware':<24} {baseline:8.1f} us/request")
+    passthrough = asyncio.run(
+        run_scenario(build_app(passthrough=True), args.requests, args.concurrency)
+    )
+    print(f"{'pass-through':<24} {passthrough:8.1f} us/request  (+{passthrough - baseline:.1f} us)")
+
+    for rate in args.sample_rates:
+        get_metrics().reset()
+        mean_us = asyncio.run(run_scenario(build_app(rate), args.requests, args.concurrency))
+        label = f"sample 1 in {rate}"
+        print(
+            f"{label:<24} {mean_us:8.1f} us/request  (+{mean_us - passthrough:.1f} us in dispatch)"
+        )
+
+    active = get_metrics().get_gauge("http_requests_active", {"method": "GET"})
+    print()
+    print(f"http_requests_active after run: {active}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+"""
+Local LLM Stub Server
+Sustainable Economic Development Analytics Hub
+
+A tiny HTTP server speaking just enough of the OpenAI chat completions and
+Anthropic messages APIs to exercise the async LLM providers in tests. It
+answers batched prompts with one recommendation object per "## Scope: <id>"
+section and records request counts and peak concurrency. Requests with
+"stream": true are answered as server-sent events in small text chunks.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+SCOPE_PATTERN = re.compile(r"^## Scope: (.+)$", re.MULTILINE)
+
+
+def _answer_for(scope: str | None) -> dict[str, Any]:
+    label = scope or "national"
+    return {
+        "executive_summary": f"Summary for {label}",
+        "key_insights": [f"Insight for {label}"],
+        "recommendations": [
+            {
+                "id": "rec_1",
+                "title": f"Recommendation for {label}",
+                "description": "Stub recommendation",
+                "priority": "high",
+                "category": "economic",
+                "impact": "Stub impact",
+                "timeline": "12 months",
+                "kpis_affected": ["gdp_growth"],
+            }
+        ],
+        "risk_alerts": [],
+    }
+
+
+class LLMStubServer:
+    """Threaded stub server; use as a context manager."""
+
+    def __init__(
+        self,
+        delay_seconds: float = 0.0,
+        fail_first: int = 0,
+        drop_scopes: set[str] | None = None,
+        chunk_size: int = 16,
+    ):
+        """
+        Args:
+            delay_seconds: Time each request takes (to observe concurrency)
+            fail_first: Number of initial requests answered with HTTP 503
+            drop_scopes: Scope ids left out of batched answers
+            chunk_size: Characters of answer text per streamed event
+        """
+        self.delay_seconds = delay_seconds
+        self.fail_first = fail_first
+        self.drop_scopes = drop_scopes or set()
+        self.chunk_size = chunk_size
+        self.requests: list[dict[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "LLMStubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, path: str, payload: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Build the response for one API call."""
+        with self._lock:
+            self.requests.append(payload)
+            if len(self.requests) <= self.fail_first:
+                return 503, {"error": "overloaded"}
+
+        if path.endswith("/v1/messages"):
+            prompt = payload["messages"][0]["content"]
+        else:
+            prompt = payload["messages"][-1]["content"]
+
+        scopes = SCOPE_PATTERN.findall(prompt)
+        if scopes:
+            answer: dict[str, Any] = {
+                scope: _answer_for(scope) for scope in scopes if scope not in self.drop_scopes
+            }
+        else:
+            answer = _answer_for(None)
+        text = json.dumps(answer)
+
+        if path.endswith("/v1/messages"):
+            return 200, {"content": [{"type": "text", "text": text}]}
+        return 200, {"choices": [{"message": {"role": "assistant", "content": text}}]}
+
+    def stream_events(self, path: str, body: dict[str, Any]) -> list[dict[str, Any]]:
+        """Split a complete answer into the streaming events of each API."""
+        if path.endswith("/v1/messages"):
+            text = body["content"][0]["text"]
+        else:
+            text = body["choices"][0]["message"]["content"]
+        chunks = [text[i : i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+
+        if path.endswith("/v1/messages"):
+            return (
+                [{"type": "message_start"}]
+                + [{"type": "content_block_delta", "delta": {"text": c}} for c in chunks]
+                + [{"type": "message_stop"}]
+            )
+        return [{"choices": [{"delta": {"content": c}}]} for c in chunks]
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 - http.server API
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+
+                with stub._lock:
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.delay_seconds)
+                    status, body = stub.respond(self.path, payload)
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+                if payload.get("stream") and status == 200:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.end_headers()
+                    for event in stub.stream_events(self.path, body):
+                        self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                        self.wfile.flush()
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    return
+
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
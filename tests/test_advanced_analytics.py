@@ -22,16 +22,20 @@ from analytics_hub_platform.domain.advanced_analytics import (
     TrendDirection,
     SeasonalityType,
     ChangePointType,
+    ChangePointMethod,
     TrendAnalyzer,
     SeasonalityAnalyzer,
     ChangePointDetector,
     PatternRecognizer,
+    PreparedSeries,
     LinearForecaster,
     ExponentialSmoothingForecaster,
     EnsembleForecaster,
     analyze_patterns,
     analyze_trend,
+    analyze_trends,
     analyze_seasonality,
+    compute_seasonal_indices,
     detect_change_points,
     forecast_ensemble,
 )
@@ -39,9 +43,17 @@ from analytics_hub_platform.domain.ml_services import (
     KPIForecaster,
     AnomalyDetector,
     AnomalySeverity,
+    StreamingAnomalyDetector,
+    invalidate_isolation_forest_cache,
     forecast_kpi,
     detect_kpi_anomalies,
 )
+from analytics_hub_platform.domain.forecasting.backtesting import (
+    backtest_series,
+    run_backtest,
+    split_indicator_series,
+)
+from analytics_hub_platform.domain.forecasting.service import ForecastService
 
 
 # =============================================================================
@@ -259,6 +271,75 @@ class TestTrendAnalyzer:
         # Annual rate should be ~4x quarterly slope
         assert abs(result.annual_change_rate - result.slope * 4) < 0.01
 
+    def test_batch_matches_linregress(self):
+        """Test batch statistics match scipy linregress on each row's observed points."""
+        from scipy import stats as scipy_stats
+
+        rng = np.random.default_rng(5)
+        values = rng.normal(50, 5, (6, 20)) + np.outer(rng.normal(0, 2, 6), np.arange(20))
+        values[1, [3, 7]] = np.nan
+
+        result = TrendAnalyzer().analyze_batch(values)
+
+        for i, row in enumerate(values):
+            observed = np.isfinite(row)
+            expected = scipy_stats.linregress(np.arange(20)[observed], row[observed])
+            assert result.slope[i] == pytest.approx(expected.slope)
+            assert result.intercept[i] == pytest.approx(expected.intercept)
+            assert result.r_squared[i] == pytest.approx(expected.rvalue**2)
+            assert result.p_value[i] == pytest.approx(expected.pvalue, abs=1e-12)
+            assert result.std_err[i] == pytest.approx(expected.stderr)
+        assert result.n_obs.tolist() == [20, 18, 20, 20, 20, 20]
+
+    def test_batch_directions_match_analyze(self):
+        """Test batch directions agree with per-series analysis."""
+        analyzer = TrendAnalyzer()
+        rng = np.random.default_rng(9)
+        values = np.vstack([
+            100 + 2.0 * np.arange(20) + rng.normal(0, 1, 20),
+            100 - 2.0 * np.arange(20) + rng.normal(0, 1, 20),
+        ])
+        frames = [
+            pd.DataFrame({
+                "year": 2020 + np.arange(20) // 4,
+                "quarter": np.arange(20) % 4 + 1,
+                "value": row,
+            })
+            for row in values
+        ]
+
+        result = analyzer.analyze_batch(values, series_ids=["up", "down"])
+
+        assert list(result.direction) == [analyzer.analyze(f).direction.value for f in frames]
+        assert result.to_frame().loc["up", "direction"] == TrendDirection.INCREASING.value
+
+    def test_batch_insufficient_and_flat_series(self):
+        """Test short and constant rows get the stable defaults."""
+        values = np.array([[1.0, 2.0, np.nan, np.nan, np.nan], [3.0] * 5])
+
+        result = TrendAnalyzer().analyze_batch(values)
+
+        assert list(result.direction) == [TrendDirection.STABLE.value] * 2
+        assert result.slope.tolist() == [0.0, 0.0]
+        assert result.p_value.tolist() == [1.0, 1.0]
+
+    def test_analyze_trends_wide_frame(self):
+        """Test analyze_trends keys results by KPI and region and aligns gaps."""
+        base = pd.DataFrame({
+            "year": np.repeat(np.arange(2020, 2025), 4),
+            "quarter": np.tile([1, 2, 3, 4], 5),
+            "gdp": np.arange(20.0),
+            "co2": np.arange(20.0)[::-1],
+        })
+        df = pd.concat([base.assign(region="A"), base.assign(region="B").iloc[2:]])
+
+        frame = analyze_trends(df, ["gdp", "co2", "missing"]).to_frame()
+
+        assert list(frame.index) == [("gdp", "A"), ("gdp", "B"), ("co2", "A"), ("co2", "B")]
+        assert frame["slope"].tolist() == pytest.approx([1.0, 1.0, -1.0, -1.0])
+        assert frame.loc[("gdp", "B"), "n_obs"] == 18
+        assert frame.loc[("co2", "A"), "direction"] == TrendDirection.DECREASING.value
+
 
 class TestAnalyzeTrendConvenience:
     """Tests for analyze_trend convenience function."""
@@ -325,6 +406,65 @@ class TestSeasonalityAnalyzer:
         avg_index = sum(result.quarterly_indices.values()) / 4
         assert 0.9 < avg_index < 1.1
 
+    def test_analyze_frame_matches_per_series(self):
+        """Test tenant-wide seasonality matches analyzing each series alone."""
+        rng = np.random.default_rng(11)
+        rows = []
+        for region, amplitude in [("north", 0.3), ("south", 0.0)]:
+            for year in range(2019, 2024):
+                for quarter in range(1, 5):
+                    rows.append({
+                        "region": region,
+                        "year": year,
+                        "quarter": quarter,
+                        "gdp": 100 * (1 + amplitude * (quarter == 3)) + rng.normal(0, 1),
+                        "jobs": np.nan if year == 2019 else 50 + quarter + rng.normal(0, 1),
+                    })
+        df = pd.DataFrame(rows)
+        analyzer = SeasonalityAnalyzer()
+
+        results = analyzer.analyze_frame(df, ["gdp", "jobs"])
+
+        assert set(results) == {(k, r) for k in ["gdp", "jobs"] for r in ["north", "south"]}
+        for (kpi, region), result in results.items():
+            series = df[df["region"] == region][["year", "quarter", kpi]]
+            expected = analyzer.analyze(series.rename(columns={kpi: "value"}).dropna())
+            assert result == expected
+        assert results[("gdp", "north")].peak_quarter == 3
+
+    def test_compute_seasonal_indices_cached(self, seasonal_data, monkeypatch):
+        """Test results are reused for the same data version."""
+        calls = []
+        original = SeasonalityAnalyzer.analyze_frame
+
+        def counting(self, *args, **kwargs):
+            calls.append(1)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(SeasonalityAnalyzer, "analyze_frame", counting)
+        df = seasonal_data.rename(columns={"value": "kpi"})
+
+        first = compute_seasonal_indices(df, ["kpi"], region_column=None)
+        second = compute_seasonal_indices(df, ["kpi"], region_column=None)
+
+        assert first is second
+        assert len(calls) == 1
+        assert first[("kpi", None)] == SeasonalityAnalyzer().analyze(seasonal_data)
+
+    @pytest.mark.parametrize("filter_kwargs", [{"region": "Nowhere"}, {"year": 2010}])
+    def test_insights_for_empty_filter_result(self, seasonal_data, filter_kwargs):
+        """Test filters matching no rows give an empty report, not a KeyError."""
+        from analytics_hub_platform.domain.models import FilterParams
+        from analytics_hub_platform.domain.services import get_analytics_insights
+
+        df = seasonal_data.rename(columns={"value": "gdp_growth"}).assign(region="Riyadh")
+        filters = FilterParams(tenant_id="test", **{"year": 2023, "quarter": 4, **filter_kwargs})
+
+        report = get_analytics_insights(df, filters)
+
+        assert report.total_count == 0
+        assert not report.partial
+
 
 class TestAnalyzeSeasonalityConvenience:
     """Tests for analyze_seasonality convenience function."""
@@ -382,6 +522,102 @@ class TestChangePointDetector:
         if change_points:
             assert change_points[0].description
             assert "shift" in change_points[0].description.lower()
+            cp = change_points[0]
+            assert f"{cp.year} Q{cp.quarter}" in cp.description
+
+    def test_window_scan_matches_reference(self):
+        """Test the prefix-sum window scan matches a direct per-index computation."""
+        rng = np.random.default_rng(7)
+        values = np.concatenate([rng.normal(10, 1, 30), rng.normal(14, 1, 30)])
+        values[5] = np.nan
+        df = pd.DataFrame({
+            "year": 2000 + np.arange(60) // 4,
+            "quarter": np.arange(60) % 4 + 1,
+            "value": values,
+        })
+        detector = ChangePointDetector(min_segment_size=4)
+        series = PreparedSeries.from_frame(df)
+
+        expected = []
+        for i in range(4, 56):
+            before, after = values[i - 4 : i], values[i : i + 4]
+            pooled_std = np.std(np.concatenate([before, after]))
+            z = abs(after.mean() - before.mean()) / (pooled_std / 2)
+            if z > detector.significance_threshold:
+                expected.append(
+                    detector._make_change_point(series, i, before.mean(), after.mean(), z)
+                )
+
+        assert detector.detect(df) == detector._filter_overlapping(expected)
+
+    @pytest.mark.parametrize(
+        "method", [ChangePointMethod.PELT, ChangePointMethod.BINARY_SEGMENTATION]
+    )
+    def test_segmentation_methods_find_level_shift(self, method):
+        """Test PELT and binary segmentation locate the 2022 Q3 shift."""
+        rng = np.random.default_rng(11)
+        df = pd.DataFrame({
+            "year": 2020 + np.arange(20) // 4,
+            "quarter": np.arange(20) % 4 + 1,
+            "value": np.where(np.arange(20) < 10, 100.0, 150.0) + rng.normal(0, 2, 20),
+        })
+
+        change_points = ChangePointDetector(method=method).detect(df)
+
+        assert [(cp.year, cp.quarter) for cp in change_points] == [(2022, 3)]
+        assert change_points[0].magnitude == pytest.approx(50, abs=5)
+
+    def test_segmentation_penalty_suppresses_changes(self, change_point_data):
+        """Test a large penalty leaves the series as a single segment."""
+        detector = ChangePointDetector(method="pelt", penalty=1e9)
+        assert detector.detect(change_point_data) == []
+
+    def test_pelt_matches_binary_segmentation_on_long_series(self):
+        """Test both segmentation methods agree on a long multi-shift series."""
+        rng = np.random.default_rng(3)
+        levels = np.repeat([0.0, 5.0, -3.0, 2.0], 250)
+        df = pd.DataFrame({
+            "year": np.arange(1000) // 4,
+            "quarter": np.arange(1000) % 4 + 1,
+            "value": levels + rng.normal(0, 1, 1000),
+        })
+
+        pelt = ChangePointDetector(method="pelt").detect(df)
+        binseg = ChangePointDetector(method="binary_segmentation").detect(df)
+
+        assert [cp.index for cp in pelt] == [250, 500, 750]
+        assert [cp.index for cp in binseg] == [250, 500, 750]
+
+    def test_pelt_is_optimal_against_exhaustive_dp(self):
+        """Test PELT pruning never loses the optimum found by an unpruned DP."""
+        rng = np.random.default_rng(7)
+
+        def segment_cost(values, start, end):
+            segment = values[start:end]
+            return float(((segment - segment.mean()) ** 2).sum())
+
+        # A small penalty makes many short segments competitive, where pruning
+        # candidates before min_segment_size has elapsed used to lose the optimum
+        penalty = 1.0
+        for _ in range(500):
+            n = int(rng.integers(8, 30))
+            m = int(rng.integers(2, 5))
+            values = rng.normal(0, 1, n)
+            detector = ChangePointDetector(method="pelt", min_segment_size=m, penalty=penalty)
+
+            best = [0.0] + [np.inf] * n
+            for t in range(m, n + 1):
+                for s in range(0, t - m + 1):
+                    if s == 0 or s >= m:
+                        cost = best[s] + segment_cost(values, s, t) + (penalty if s else 0)
+                        best[t] = min(best[t], cost)
+
+            bounds = [0, *detector._pelt(values), n]
+            found = sum(
+                segment_cost(values, a, b) for a, b in zip(bounds[:-1], bounds[1:], strict=True)
+            )
+            found += penalty * (len(bounds) - 2)
+            assert found == pytest.approx(best[n], rel=1e-9, abs=1e-9)
 
 
 class TestDetectChangePointsConvenience:
@@ -440,6 +676,25 @@ class TestPatternRecognizer:
         result = analyze_patterns(volatile_data)
         assert result.volatility > 0.2  # High volatility data
 
+    def test_uses_precomputed_seasonality(self, seasonal_data):
+        """Test a precomputed seasonality result is used as-is."""
+        precomputed = SeasonalityAnalyzer()._no_seasonality_result("precomputed")
+
+        result = PatternRecognizer().analyze(seasonal_data, seasonality=precomputed)
+
+        assert result.seasonality is precomputed
+
+    def test_prepared_series_matches_dataframe(self, change_point_data):
+        """Test a PreparedSeries gives the same results as an unsorted frame."""
+        shuffled = change_point_data.sample(frac=1, random_state=0)
+        series = PreparedSeries.from_frame(shuffled)
+
+        assert list(series.years) == sorted(series.years)
+        assert analyze_patterns(series) == analyze_patterns(shuffled)
+        assert AnomalyDetector().detect_anomalies(
+            series, "kpi", "region"
+        ) == AnomalyDetector().detect_anomalies(shuffled, "kpi", "region")
+
 
 # =============================================================================
 # LINEAR FORECASTER TESTS
@@ -496,6 +751,18 @@ class TestLinearForecaster:
         with pytest.raises(ValueError, match="at least 2"):
             forecaster.fit(tiny_data)
 
+    def test_forecast_continues_fitted_line(self):
+        """Test forecasts extend the fitted line from the last observation."""
+        df = pd.DataFrame({
+            "year": np.repeat(np.arange(2020, 2025), 4),
+            "quarter": np.tile([1, 2, 3, 4], 5),
+            "value": 10.0 + 2.0 * np.arange(20),
+        })
+        predictions = LinearForecaster().fit(df).predict(quarters_ahead=2)
+
+        assert [p["predicted_value"] for p in predictions] == pytest.approx([50.0, 52.0])
+        assert (predictions[0]["year"], predictions[0]["quarter"]) == (2025, 1)
+
 
 # =============================================================================
 # EXPONENTIAL SMOOTHING TESTS
@@ -590,6 +857,214 @@ class TestEnsembleForecaster:
         expected_avg = (linear + exp) / 2
         assert abs(ensemble - expected_avg) < 0.01
 
+    def test_custom_weights(self, upward_trend_data):
+        """Test ensemble weights are normalized and applied."""
+        forecaster = EnsembleForecaster(weights={"linear": 3, "exponential_smoothing": 1})
+        forecaster.fit(upward_trend_data)
+        comparison = forecaster.compare_methods(quarters_ahead=1)
+
+        linear = comparison.method_results["linear"][0]["predicted_value"]
+        exp = comparison.method_results["exponential_smoothing"][0]["predicted_value"]
+        ensemble = comparison.consensus_forecast[0]["predicted_value"]
+
+        assert comparison.method_weights == {"linear": 0.75, "exponential_smoothing": 0.25}
+        assert ensemble == pytest.approx(0.75 * linear + 0.25 * exp, abs=1e-3)
+
+
+class TestBatchForecasting:
+    """Tests for the array-native fit_many/predict_many fast paths."""
+
+    @pytest.mark.parametrize(
+        "forecaster_cls",
+        [LinearForecaster, ExponentialSmoothingForecaster, EnsembleForecaster],
+    )
+    def test_matches_per_series_forecasts(self, forecaster_cls):
+        """Test batch forecasts match fit/predict on each series."""
+        rng = np.random.default_rng(7)
+        values = rng.normal(100, 5, (20, 16)) + np.arange(16) * rng.normal(0, 2, (20, 1))
+        values[:5, :4] = np.nan  # Shorter series padded at the start
+
+        batch = forecaster_cls().fit_many(values).predict_many(quarters_ahead=3)
+
+        assert len(batch) == 20
+        for i, row in enumerate(values):
+            idx = np.flatnonzero(np.isfinite(row))
+            df = pd.DataFrame({"year": 2020 + idx // 4, "quarter": idx % 4 + 1, "value": row[idx]})
+            predictions = forecaster_cls().fit(df).predict(quarters_ahead=3)
+
+            for key, column in [
+                ("predicted_value", batch.predicted),
+                ("confidence_lower", batch.lower),
+                ("confidence_upper", batch.upper),
+            ]:
+                assert [p[key] for p in predictions] == pytest.approx(column[i], abs=1e-3)
+
+    def test_short_series_and_gaps(self):
+        """Test rows with under two points are NaN and gaps are skipped."""
+        values = np.array([
+            [np.nan, np.nan, np.nan, 5.0],
+            [1.0, np.nan, 3.0, 4.0],
+        ])
+
+        linear = LinearForecaster().fit_many(values).predict_many(quarters_ahead=1)
+        smoothed = ExponentialSmoothingForecaster(alpha=0.5).fit_many(values).predict_many(1)
+
+        assert np.isnan(linear.predicted[0]).all()
+        assert linear.predicted[1, 0] == pytest.approx(5.0)
+        assert smoothed.predicted[1, 0] == pytest.approx(0.5 * 4.0 + 0.25 * 3.0 + 0.25 * 1.0)
+
+    def test_predict_many_without_fit_raises(self):
+        """Test predict_many requires fit_many."""
+        with pytest.raises(ValueError, match="fit_many"):
+            EnsembleForecaster().predict_many()
+
+
+class TestBacktesting:
+    """Tests for walk-forward forecaster backtesting."""
+
+    @staticmethod
+    def _series(values):
+        n = len(values)
+        return pd.DataFrame({
+            "year": 2015 + np.arange(n) // 4,
+            "quarter": np.arange(n) % 4 + 1,
+            "value": values,
+        })
+
+    def test_backtest_series_scores_each_method(self):
+        """Test rolling-origin scoring of a perfectly linear series."""
+        df = self._series(100.0 + 2.0 * np.arange(20))
+
+        scores = backtest_series(
+            "kpi", df, methods=["linear", "exponential_smoothing"], min_train_size=8, step=4
+        )
+        by_method = {s.method: s for s in scores}
+
+        assert by_method["linear"].n_origins == 3  # origins 8, 12, 16
+        assert by_method["linear"].n_forecasts == 12
+        assert by_method["linear"].mape == pytest.approx(0.0, abs=1e-6)
+        assert by_method["exponential_smoothing"].mape > 1.0
+        assert by_method["linear"].fit_seconds >= 0
+
+    def test_run_backtest_weights_and_choices(self):
+        """Test weights favour the more accurate method and short series are skipped."""
+        series = {
+            "trend": self._series(100.0 + 2.0 * np.arange(20)),
+            "short": self._series([1.0, 2.0, 3.0]),
+        }
+
+        report = run_backtest(
+            series, methods=["linear", "exponential_smoothing"], min_train_size=8, step=4
+        )
+        weights = report.ensemble_weights()
+
+        assert report.skipped_series == ["short"]
+        assert weights["linear"] > weights["exponential_smoothing"]
+        assert sum(weights.values()) == pytest.approx(1.0, abs=1e-3)
+        assert report.best_methods() == {"trend": "linear"}
+        assert list(report.summary().index) == ["linear", "exponential_smoothing"]
+
+    def test_failures_are_counted(self):
+        """Test models that cannot fit a window are recorded as failures."""
+        df = self._series([5.0] * 6 + list(np.arange(6.0, 12.0)))
+
+        scores = backtest_series("flat", df, methods=["gradient_boosting"], min_train_size=6)
+
+        assert scores[0].failures >= 1  # Constant training window is rejected
+
+    def test_unknown_method_rejected(self):
+        """Test unknown methods raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown"):
+            run_backtest({"s": self._series(np.arange(12.0))}, methods=["prophet"])
+
+    def test_split_indicator_series(self):
+        """Test wide frames are split per KPI and region."""
+        df = pd.DataFrame({
+            "year": [2020, 2020, 2020, 2020],
+            "quarter": [1, 1, 2, 2],
+            "region": ["A", "B", "A", "B"],
+            "gdp": [1.0, 3.0, 2.0, np.nan],
+        })
+
+        regional = split_indicator_series(df, ["gdp"])
+        national = split_indicator_series(df, ["gdp"], region_column=None)
+
+        assert set(regional) == {"gdp/A", "gdp/B"}
+        assert regional["gdp/B"]["value"].tolist() == [3.0]
+        assert national["gdp"]["value"].tolist() == [2.0, 2.0]
+
+
+class TestForecastService:
+    """Tests for the deadline-aware forecasting facade."""
+
+    @staticmethod
+    def _series(n=24, seed=3):
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({
+            "year": 2018 + np.arange(n) // 4,
+            "quarter": np.arange(n) % 4 + 1,
+            "value": 50 + np.arange(n) + rng.normal(0, 1, n),
+        })
+
+    def test_falls_back_then_serves_cached_model(self):
+        """Test an exhausted budget returns the ensemble and caches the model fit."""
+        service = ForecastService(latency_budget_seconds=0.0)
+        df = self._series()
+        try:
+            first = service.forecast(df, quarters_ahead=4)
+            assert first.model_type == "ensemble"
+            assert first.is_fallback
+            assert len(first.predictions) == 4
+
+            assert service.wait_pending(timeout=60)
+            # Same observations in a different row order hit the cache
+            second = service.forecast(df.sample(frac=1, random_state=0), quarters_ahead=4)
+            assert second.model_type == "gradient_boosting"
+            assert second.from_cache
+            assert not second.pending
+        finally:
+            service.shutdown()
+
+    def test_waits_within_budget(self):
+        """Test the requested model is served directly when it fits in the budget."""
+        service = ForecastService(latency_budget_seconds=60)
+        try:
+            result = service.forecast(self._series(), quarters_ahead=2)
+            assert result.model_type == "gradient_boosting"
+            assert not result.from_cache
+        finally:
+            service.shutdown()
+
+    def test_model_errors_fall_back_without_pending(self):
+        """Test series the model rejects are served by the ensemble."""
+        df = self._series()
+        df["value"] = 10.0  # Constant series: gradient boosting refuses to fit
+        service = ForecastService(latency_budget_seconds=60)
+        try:
+            result = service.forecast(df, quarters_ahead=2)
+            assert result.model_type == "ensemble"
+            assert not result.pending
+            assert result.predictions[0]["confidence_lower"] == pytest.approx(10.0)
+        finally:
+            service.shutdown()
+
+    def test_failed_fit_not_resubmitted(self, monkeypatch):
+        """Test a failing series is not refit on every request until the failure expires."""
+        df = self._series()
+        df["value"] = 10.0
+        service = ForecastService(latency_budget_seconds=60, failure_ttl_seconds=60)
+        submits = []
+        submit = service._executor.submit
+        monkeypatch.setattr(
+            service._executor, "submit", lambda *args: submits.append(args) or submit(*args)
+        )
+        try:
+            for _ in range(3):
+                assert service.forecast(df, quarters_ahead=2).model_type == "ensemble"
+            assert len(submits) == 1
+        finally:
+            service.shutdown()
+
 
 class TestForecastEnsembleConvenience:
     """Tests for forecast_ensemble convenience function."""
@@ -706,6 +1181,253 @@ class TestAnomalyDetector:
         # Should return a list of anomalies
         assert isinstance(anomalies, list)
 
+    @pytest.mark.parametrize("use_rolling_stats", [True, False])
+    def test_vectorized_stats_match_pandas(self, use_rolling_stats):
+        """Test window statistics match a per-row pandas mean/std computation."""
+        np.random.seed(7)
+        values = 1e6 + np.random.normal(0, 50, 30)
+        values[18] += 600
+        df = pd.DataFrame({
+            "year": [2015 + i // 4 for i in range(30)],
+            "quarter": [(i % 4) + 1 for i in range(30)],
+            "value": values,
+        })
+        detector = AnomalyDetector(
+            zscore_threshold=2.0, rolling_window=6, use_rolling_stats=use_rolling_stats
+        )
+        anomalies = detector.detect_anomalies(df, kpi_id="TEST", region_id="TEST")
+
+        assert anomalies
+        for anomaly in anomalies:
+            i = (anomaly.year - 2015) * 4 + anomaly.quarter - 1
+            if use_rolling_stats and i >= 6:
+                prior = pd.Series(values[i - 6 : i])
+            else:
+                prior = pd.Series(values[:i])
+            expected_z = (values[i] - prior.mean()) / prior.std()
+            assert anomaly.expected_value == pytest.approx(prior.mean(), abs=1e-4)
+            assert anomaly.z_score == pytest.approx(expected_z, abs=1e-4)
+
+    def test_multi_series_matches_single_series(self, anomaly_data):
+        """Test multi-series scan returns the same anomalies as per-series calls."""
+        wide = pd.concat(
+            [
+                anomaly_data.assign(region="Riyadh", kpi_a=anomaly_data["value"], kpi_b=1.0),
+                anomaly_data.assign(
+                    region="Makkah", kpi_a=anomaly_data["value"][::-1].values, kpi_b=2.0
+                ),
+            ]
+        ).drop(columns="value")
+        detector = AnomalyDetector(zscore_threshold=2.0)
+
+        multi = detector.detect_anomalies_multi(
+            wide, ["kpi_a", "kpi_b"], higher_is_better={"kpi_a": False}
+        )
+
+        expected = []
+        for region in ["Makkah", "Riyadh"]:
+            series = wide[wide["region"] == region].rename(columns={"kpi_a": "value"})
+            expected.extend(detector.detect_anomalies(series, "kpi_a", region, False))
+
+        assert multi == expected
+        assert all(a.kpi_id == "kpi_a" for a in multi)
+
+    def test_multi_series_without_region_column(self, anomaly_data):
+        """Test multi-series scan on a national frame with no region column."""
+        wide = anomaly_data.rename(columns={"value": "gdp_growth"})
+        detector = AnomalyDetector(zscore_threshold=2.0)
+
+        anomalies = detector.detect_anomalies_multi(
+            wide, ["gdp_growth", "missing_kpi"], region_column=None
+        )
+
+        assert anomalies
+        assert {a.region_id for a in anomalies} == {"national"}
+
+
+class TestMultivariateIsolationForest:
+    """Tests for the shared per-tenant Isolation Forest."""
+
+    @pytest.fixture
+    def tenant_frame(self):
+        """Wide frame for three regions with one injected GDP outlier."""
+        rng = np.random.default_rng(5)
+        rows = []
+        for region in ["Riyadh", "Makkah", "Eastern"]:
+            for i in range(28):
+                rows.append({
+                    "region": region,
+                    "year": 2019 + i // 4,
+                    "quarter": (i % 4) + 1,
+                    "gdp_growth": rng.normal(3, 0.3),
+                    "unemployment_rate": rng.normal(8, 0.2),
+                })
+        df = pd.DataFrame(rows)
+        df.loc[40, "gdp_growth"] = 12.0
+        return df
+
+    def test_flags_injected_outlier(self, tenant_frame):
+        """Test the outlier row is flagged and attributed to the deviating KPI."""
+        detector = AnomalyDetector()
+        anomalies = detector.detect_multivariate_anomalies(
+            tenant_frame, ["gdp_growth", "unemployment_rate"], n_jobs=1
+        )
+
+        outlier = tenant_frame.loc[40]
+        hits = [
+            a for a in anomalies
+            if (a.region_id, a.year, a.quarter)
+            == (outlier["region"], outlier["year"], outlier["quarter"])
+        ]
+        assert len(hits) == 1
+        assert hits[0].kpi_id == "gdp_growth"
+        assert hits[0].direction == "high"
+        assert hits[0].severity == AnomalySeverity.CRITICAL
+
+    def test_model_cached_until_data_changes(self, tenant_frame):
+        """Test the fitted forest is reused for identical data and refit on new data."""
+        from analytics_hub_platform.infrastructure.caching import get_cache
+
+        tenant_id = "test_iforest_tenant"
+        cache_key = f"iforest:{tenant_id}"
+        kpis = ["gdp_growth", "unemployment_rate"]
+        detector = AnomalyDetector()
+
+        detector.detect_multivariate_anomalies(tenant_frame, kpis, tenant_id=tenant_id)
+        first_model = get_cache().get(cache_key)[2]
+        detector.detect_multivariate_anomalies(tenant_frame, kpis, tenant_id=tenant_id)
+        assert get_cache().get(cache_key)[2] is first_model
+
+        changed = tenant_frame.copy()
+        changed.loc[0, "gdp_growth"] = 5.0
+        detector.detect_multivariate_anomalies(changed, kpis, tenant_id=tenant_id)
+        assert get_cache().get(cache_key)[2] is not first_model
+
+        invalidate_isolation_forest_cache(tenant_id)
+        assert get_cache().get(cache_key) is None
+
+    def test_service_reports_selected_period(self, tenant_frame):
+        """Test the dashboard service returns only the selected period and region."""
+        from analytics_hub_platform.domain.models import FilterParams
+        from analytics_hub_platform.domain.services import get_multivariate_anomalies
+
+        outlier = tenant_frame.loc[40]
+        filters = FilterParams(
+            tenant_id="test_iforest_service",
+            year=int(outlier["year"]),
+            quarter=int(outlier["quarter"]),
+        )
+
+        anomalies = get_multivariate_anomalies(tenant_frame, filters, n_jobs=1)
+        assert anomalies[0].region_id == outlier["region"]
+        assert anomalies[0].kpi_id == "gdp_growth"
+        assert all((a.year, a.quarter) == (filters.year, filters.quarter) for a in anomalies)
+
+        filters.region = "Riyadh"
+        assert all(
+            a.region_id == "Riyadh" for a in get_multivariate_anomalies(tenant_frame, filters)
+        )
+
+    def test_background_fit_keeps_request_path_to_scoring(self, tenant_frame):
+        """Test a missing model is fitted off-thread and served once cached."""
+        from analytics_hub_platform.domain.ml_services import wait_isolation_forest_fits
+        from analytics_hub_platform.domain.models import FilterParams
+        from analytics_hub_platform.domain.services import get_multivariate_anomalies
+
+        outlier = tenant_frame.loc[40]
+        filters = FilterParams(
+            tenant_id="test_iforest_background",
+            year=int(outlier["year"]),
+            quarter=int(outlier["quarter"]),
+        )
+        invalidate_isolation_forest_cache(filters.tenant_id)
+
+        assert get_multivariate_anomalies(tenant_frame, filters, fit_in_background=True) is None
+        assert wait_isolation_forest_fits(timeout=30)
+
+        anomalies = get_multivariate_anomalies(tenant_frame, filters, fit_in_background=True)
+        assert anomalies == get_multivariate_anomalies(tenant_frame, filters, n_jobs=1)
+        assert anomalies[0].region_id == outlier["region"]
+
+
+class TestStreamingAnomalyDetector:
+    """Tests for incremental anomaly detection on newly ingested rows."""
+
+    @pytest.fixture
+    def regional_history(self):
+        """Wide frame with two regions and an outlier in 2023 Q1 for Riyadh."""
+        np.random.seed(11)
+        rows = []
+        for region in ["Riyadh", "Makkah"]:
+            for i in range(20):
+                value = 50 + np.random.normal(0, 2)
+                if region == "Riyadh" and i == 12:
+                    value = 90
+                rows.append({
+                    "region": region,
+                    "year": 2020 + i // 4,
+                    "quarter": (i % 4) + 1,
+                    "gdp_growth": value,
+                })
+        return pd.DataFrame(rows)
+
+    def test_incremental_matches_batch(self, regional_history):
+        """Test quarter-by-quarter updates match batch expanding-window scoring."""
+        batch = AnomalyDetector(use_rolling_stats=False).detect_anomalies_multi(
+            regional_history, ["gdp_growth"]
+        )
+        batch = [a for a in batch if a.year * 4 + a.quarter >= 2020 * 4 + 4]
+
+        detector = StreamingAnomalyDetector()
+        streamed = []
+        for _, rows in regional_history.groupby(["year", "quarter"]):
+            streamed.extend(detector.update(rows, ["gdp_growth"]))
+
+        def key(a):
+            return (a.region_id, a.year, a.quarter)
+
+        streamed_by_key = {key(a): a for a in streamed}
+        assert sorted(streamed_by_key) == sorted(key(a) for a in batch)
+        for expected in batch:
+            got = streamed_by_key[key(expected)]
+            assert got.z_score == pytest.approx(expected.z_score, abs=1e-3)
+        assert ("Riyadh", 2023, 1) in [(a.region_id, a.year, a.quarter) for a in streamed]
+
+    def test_state_round_trip(self, regional_history):
+        """Test running state survives serialization."""
+        detector = StreamingAnomalyDetector()
+        detector.rebuild(regional_history, ["gdp_growth"])
+
+        restored = StreamingAnomalyDetector.from_state(detector.get_state())
+
+        assert restored.state == detector.state
+        assert restored.state[("gdp_growth", "Riyadh")].count == 20
+
+    def test_backfill_triggers_recompute(self, regional_history):
+        """Test rows for already-seen periods fall back to a full recompute."""
+        detector = StreamingAnomalyDetector()
+        detector.rebuild(regional_history, ["gdp_growth"])
+
+        corrected = regional_history.copy()
+        mask = (corrected["region"] == "Makkah") & (corrected["year"] == 2023)
+        corrected.loc[mask & (corrected["quarter"] == 2), "gdp_growth"] = 150.0
+        loader_calls = []
+
+        def history_loader():
+            loader_calls.append(True)
+            return corrected
+
+        anomalies = detector.update(
+            corrected[mask & (corrected["quarter"] == 2)],
+            ["gdp_growth"],
+            history_loader=history_loader,
+        )
+
+        assert loader_calls == [True]
+        assert [(a.region_id, a.year, a.quarter) for a in anomalies] == [("Makkah", 2023, 2)]
+        makkah = corrected[corrected["region"] == "Makkah"]["gdp_growth"]
+        assert detector.state[("gdp_growth", "Makkah")].mean == pytest.approx(makkah.mean())
+
 
 class TestAnomalyConvenienceFunctions:
     """Tests for anomaly detection convenience functions."""
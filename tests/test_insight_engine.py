@@ -10,6 +10,8 @@ Comprehensive tests covering:
 - Integration with pattern recognition
 """
 
+import threading
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -609,6 +611,48 @@ class TestInsightEngine:
         priority_values = [priority_order[p] for p in priorities]
         assert priority_values == sorted(priority_values)
 
+    def test_concurrent_report_matches_serial(self, upward_trend_data, seasonal_data):
+        """Test fanning KPIs out over a pool yields the same insights."""
+        engine = InsightEngine()
+        kpis = [
+            {"id": f"kpi_{i}", "name": f"KPI {i}", "data": data, "target": 150.0}
+            for i, data in enumerate([upward_trend_data, seasonal_data] * 3)
+        ]
+
+        serial = engine.generate_report(kpis)
+        concurrent = engine.generate_report(kpis, max_workers=4, chunk_size=2)
+
+        def key(insight):
+            return (insight.kpi_id, insight.type, insight.title)
+
+        assert not concurrent.partial
+        assert concurrent.skipped_kpis == []
+        assert sorted(map(key, concurrent.insights)) == sorted(map(key, serial.insights))
+
+    def test_deadline_returns_partial_report(self, upward_trend_data, monkeypatch):
+        """Test an expired deadline flags the report and lists skipped KPIs."""
+        engine = InsightEngine()
+        kpis = [{"id": f"kpi_{i}", "name": f"KPI {i}", "data": upward_trend_data} for i in range(3)]
+        release = threading.Event()
+        generate = engine._generate_for_config
+
+        def blocking_generate(kpi):
+            # kpi_1 cannot finish before the deadline, however slow the machine
+            if kpi["id"] == "kpi_1":
+                release.wait()
+            return generate(kpi)
+
+        monkeypatch.setattr(engine, "_generate_for_config", blocking_generate)
+        try:
+            report = engine.generate_report(kpis, max_workers=3, deadline_seconds=2.0)
+        finally:
+            release.set()
+
+        assert report.partial
+        assert report.skipped_kpis == ["kpi_1"]
+        assert {insight.kpi_id for insight in report.insights} <= {"kpi_0", "kpi_2"}
+        assert report.to_dict()["partial"] is True
+
 
 class TestInsightConvenienceFunctions:
     """Tests for convenience functions."""
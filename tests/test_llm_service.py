@@ -0,0 +1,360 @@
+"""
+LLM Service Tests
+Sustainable Economic Development Analytics Hub
+
+Tests for async, batched and streamed recommendation generation against a
+local stub server, and for the normalized, persistent response cache.
+"""
+
+import asyncio
+import inspect
+import time
+
+import pytest
+
+from analytics_hub_platform.domain.llm_service import (
+    AnthropicProvider,
+    HTTPLLMProvider,
+    IncrementalResponseParser,
+    MockLLMProvider,
+    OpenAIProvider,
+    RecommendationRequest,
+    get_llm_cache_stats,
+    normalize_llm_context,
+    stream_recommendations,
+)
+from analytics_hub_platform.infrastructure.caching import PersistentCache, get_cache_manager
+from analytics_hub_platform.infrastructure.settings import get_settings
+from tests.llm_stub_server import LLMStubServer
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(tmp_path, monkeypatch):
+    """LLM responses are cached globally and on disk; isolate each test."""
+    monkeypatch.setattr(get_settings(), "llm_cache_path", str(tmp_path / "llm_cache.db"))
+    get_cache_manager().clear()
+    yield
+    get_cache_manager().clear()
+
+
+def _regions(n: int) -> list[RecommendationRequest]:
+    return [
+        RecommendationRequest(
+            request_id=f"region_{i}",
+            kpi_data={"region": f"region_{i}", "metrics": {"gdp_growth": 2.0 + i}},
+        )
+        for i in range(n)
+    ]
+
+
+class TestAsyncBatching:
+    """Tests for BaseLLMProvider.agenerate_batch."""
+
+    @pytest.mark.parametrize("provider_cls", [OpenAIProvider, AnthropicProvider])
+    def test_batches_and_limits_concurrency(self, provider_cls):
+        """Test 13 regions take ceil(13/4) prompts with bounded concurrency."""
+        with LLMStubServer(delay_seconds=0.05) as stub:
+            provider = provider_cls(api_key="test-key", base_url=stub.url, max_retries=0)
+            results = asyncio.run(
+                provider.agenerate_batch(_regions(13), batch_size=4, max_concurrency=2)
+            )
+
+        assert len(stub.requests) == 4
+        assert stub.max_in_flight <= 2
+        assert list(results) == [f"region_{i}" for i in range(13)]
+        assert results["region_7"].executive_summary == "Summary for region_7"
+        assert results["region_7"].provider == provider_cls.provider_name
+
+    def test_cached_scopes_skip_the_api(self):
+        """Test a repeated batch is served from the cache."""
+        with LLMStubServer() as stub:
+            provider = OpenAIProvider(api_key="test-key", base_url=stub.url)
+            asyncio.run(provider.agenerate_batch(_regions(3), batch_size=3))
+            again = asyncio.run(provider.agenerate_batch(_regions(3), batch_size=3))
+
+        assert len(stub.requests) == 1
+        assert again["region_2"].executive_summary == "Summary for region_2"
+
+    def test_missing_scopes_requested_individually(self):
+        """Test scopes dropped from a batched answer get their own call."""
+        with LLMStubServer(drop_scopes={"region_1"}) as stub:
+            provider = OpenAIProvider(api_key="test-key", base_url=stub.url)
+            results = asyncio.run(provider.agenerate_batch(_regions(3), batch_size=3))
+
+        assert len(stub.requests) == 2
+        assert results["region_1"].executive_summary == "Summary for national"
+
+    def test_transient_errors_are_retried(self, monkeypatch):
+        """Test 503 answers are retried with backoff."""
+        monkeypatch.setattr(
+            "analytics_hub_platform.infrastructure.retry.calculate_delay", lambda *a, **k: 0.0
+        )
+        with LLMStubServer(fail_first=1) as stub:
+            provider = OpenAIProvider(api_key="test-key", base_url=stub.url, max_retries=2)
+            response = asyncio.run(provider.agenerate_recommendations({"metrics": {}}, [], []))
+
+        assert len(stub.requests) == 2
+        assert response.provider == "openai"
+
+    def test_unreachable_api_falls_back(self):
+        """Test connection failures produce the fallback response."""
+        provider = OpenAIProvider(
+            api_key="test-key", base_url="http://127.0.0.1:9", timeout=1, max_retries=0
+        )
+
+        results = asyncio.run(provider.agenerate_batch(_regions(2), batch_size=2))
+
+        assert {r.provider for r in results.values()} == {"openai_fallback"}
+
+    def test_mock_provider_runs_concurrently(self, monkeypatch):
+        """Test providers without async support use worker threads."""
+        provider = MockLLMProvider()
+        original = provider.generate_recommendations
+
+        def slow(*args, **kwargs):
+            time.sleep(0.1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(provider, "generate_recommendations", slow)
+        started = time.perf_counter()
+        results = asyncio.run(provider.agenerate_batch(_regions(4), max_concurrency=4))
+
+        assert len(results) == 4
+        assert time.perf_counter() - started < 0.35
+
+    def test_http_providers_must_implement_acomplete(self):
+        """Test the async HTTP call is an abstract method, not a runtime stub."""
+
+        class IncompleteProvider(HTTPLLMProvider):
+            def generate_recommendations(self, kpi_data, anomalies, forecasts, language="en"):
+                return MockLLMProvider().generate_recommendations(kpi_data, [], [], language)
+
+        with pytest.raises(TypeError, match="_acomplete"):
+            IncompleteProvider()
+        assert not hasattr(MockLLMProvider(), "_acomplete")
+
+
+class TestResponseCache:
+    """Tests for context normalization and the persistent response store."""
+
+    def test_rounding_noise_shares_cache_key(self):
+        """Test values equal after normalization map to one key."""
+        provider = OpenAIProvider(api_key="test-key")
+        anomalies = [
+            {"kpi_id": "gdp", "severity": "warning", "z_score": 2.6},
+            {"kpi_id": "jobs", "severity": "critical", "z_score": -3.1},
+        ]
+
+        key = provider._get_cache_key({"gdp_growth": 2.34567}, anomalies, [], "en")
+        noisy = provider._get_cache_key(
+            {"gdp_growth": 2.3456700000001}, list(reversed(anomalies)), [], "en"
+        )
+        different = provider._get_cache_key({"gdp_growth": 2.5}, anomalies, [], "en")
+
+        assert key == noisy
+        assert key != different
+
+    def test_normalize_ranks_and_truncates(self):
+        """Test anomalies are ranked by severity and magnitude, forecasts by period."""
+        anomalies = [
+            {"kpi_id": "a", "severity": "low", "z_score": 5.0},
+            {"kpi_id": "b", "severity": "critical", "z_score": 2.5},
+            {"kpi_id": "c", "severity": "critical", "z_score": -4.0},
+        ]
+        forecasts = [{"year": 2025, "quarter": q, "value": 1.23456} for q in (3, 1, 2)]
+
+        kpi, top, periods = normalize_llm_context(
+            {"x": float("nan"), "y": 123456.7},
+            anomalies,
+            forecasts,
+            max_anomalies=2,
+            max_forecasts=2,
+        )
+
+        assert kpi == {"x": None, "y": 123000.0}
+        assert [a["kpi_id"] for a in top] == ["c", "b"]
+        assert [(f["quarter"], f["value"]) for f in periods] == [(1, 1.23), (2, 1.23)]
+
+    def test_responses_survive_memory_cache_loss(self):
+        """Test a restart (empty memory cache) is served from the disk store."""
+        with LLMStubServer() as stub:
+            provider = OpenAIProvider(api_key="test-key", base_url=stub.url)
+            asyncio.run(provider.agenerate_recommendations({"gdp_growth": 2.0}, [], []))
+            before = get_llm_cache_stats()
+
+            get_cache_manager().clear()
+            response = asyncio.run(
+                provider.agenerate_recommendations({"gdp_growth": 2.0000001}, [], [])
+            )
+            after = get_llm_cache_stats()
+
+        assert len(stub.requests) == 1
+        assert response.executive_summary == "Summary for national"
+        assert response.recommendations[0].kpis_affected == ["gdp_growth"]
+        assert after["disk_hits"] == before["disk_hits"] + 1
+        assert after["hit_rate"] > 0
+
+
+async def _collect(stream) -> list:
+    return [event async for event in stream]
+
+
+class TestStreaming:
+    """Tests for incremental parsing and streamed recommendations."""
+
+    def test_parser_emits_items_as_they_complete(self):
+        """Test each element is emitted once its closing character arrives."""
+        parser = IncrementalResponseParser()
+        document = (
+            '```json\n{"executive_summary": "Growth \\"steady\\"", "key_insights": ["a", "b"],'
+            ' "recommendations": [{"title": "Diversify", "kpis_affected": ["gdp"]}],'
+            ' "risk_alerts": ["oil"]}\n```'
+        )
+
+        emitted = []  # (characters fed, event)
+        for position, char in enumerate(document, start=1):
+            emitted += [(position, event) for event in parser.feed(char)]
+
+        assert [e.event for _, e in emitted] == [
+            "executive_summary",
+            "key_insight",
+            "key_insight",
+            "recommendation",
+            "risk_alert",
+        ]
+        assert emitted[0][1].data == 'Growth "steady"'
+        assert emitted[0][0] == document.index(', "key_insights"')
+        assert emitted[3][1].data["id"] == "rec_0"
+        assert emitted[3][1].data["priority"] == "medium"
+
+    @pytest.mark.parametrize("provider_cls", [OpenAIProvider, AnthropicProvider])
+    def test_provider_streams_then_caches(self, provider_cls):
+        """Test SSE deltas become events and the full response is cached."""
+        with LLMStubServer(chunk_size=7) as stub:
+            provider = provider_cls(api_key="test-key", base_url=stub.url)
+            events = asyncio.run(_collect(provider.astream_recommendations({"x": 1}, [], [])))
+            replayed = asyncio.run(_collect(provider.astream_recommendations({"x": 1}, [], [])))
+
+        assert len(stub.requests) == 1
+        assert stub.requests[0]["stream"] is True
+        assert [e.event for e in events] == [
+            "executive_summary",
+            "key_insight",
+            "recommendation",
+            "done",
+        ]
+        assert events[-1].data["executive_summary"] == "Summary for national"
+        assert [e.event for e in replayed] == [e.event for e in events]
+
+    def test_stream_failure_falls_back(self):
+        """Test a failed stream reports the error and ends with the fallback."""
+        with LLMStubServer(fail_first=1) as stub:
+            provider = OpenAIProvider(api_key="test-key", base_url=stub.url)
+            events = asyncio.run(_collect(provider.astream_recommendations({}, [], [])))
+
+        assert [e.event for e in events] == ["error", "done"]
+        assert events[-1].data["provider"] == "openai_fallback"
+
+    def test_http_providers_must_implement_streaming(self):
+        """Test the streamed HTTP call is an abstract async generator."""
+
+        class NonStreamingProvider(HTTPLLMProvider):
+            def generate_recommendations(self, kpi_data, anomalies, forecasts, language="en"):
+                return MockLLMProvider().generate_recommendations(kpi_data, [], [], language)
+
+            async def _acomplete(self, client, system_prompt, user_prompt, max_tokens):
+                return ""
+
+        with pytest.raises(TypeError, match="_astream_completion"):
+            NonStreamingProvider()
+        assert inspect.isasyncgenfunction(HTTPLLMProvider._astream_completion)
+        assert not hasattr(MockLLMProvider(), "_astream_completion")
+
+    def test_mock_stream_from_sync_code(self):
+        """Test the mock provider streams through the synchronous helper."""
+        events = list(stream_recommendations({"x": 1}, language="ar", provider="mock"))
+
+        assert events[0].event == "executive_summary"
+        assert events[-1].event == "done"
+        assert events[-1].data["provider"] == "mock"
+        assert [e.data for e in events if e.event == "risk_alert"] == (
+            events[-1].data["risk_alerts"]
+        )
+        assert events[0].to_sse().startswith("event: executive_summary\ndata: ")
+
+
+class TestPersistentCache:
+    """Tests for the SQLite-backed PersistentCache."""
+
+    def test_round_trip_and_expiry(self, tmp_path):
+        """Test values persist across instances and expire by TTL."""
+        path = tmp_path / "store.db"
+        PersistentCache(path).set("key", {"values": [1, 2.5]})
+        PersistentCache(path).set("stale", "old", ttl=-1)
+
+        store = PersistentCache(path)
+        assert store.get("key") == {"values": [1, 2.5]}
+        assert store.get("stale") is None
+        assert store.get("missing") is None
+        assert len(store) == 1
+
+    def test_unreadable_file_is_a_miss(self, tmp_path):
+        """Test a corrupt database degrades to cache misses."""
+        path = tmp_path / "store.db"
+        store = PersistentCache(path)
+        path.write_bytes(b"not a database" * 100)
+
+        assert store.get("key") is None
+        store.set("key", "value")  # Logged, not raised
+
+
+class TestStreamingEndpoint:
+    """Tests for the server-sent events recommendations endpoint."""
+
+    def test_endpoint_streams_sse(self, monkeypatch):
+        """Test /dashboard/recommendations/stream emits SSE events ending with done."""
+        import numpy as np
+        import pandas as pd
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from analytics_hub_platform.api import dashboard_router
+        from analytics_hub_platform.api.dependencies import (
+            get_current_tenant,
+            get_indicator_repository,
+        )
+
+        rng = np.random.default_rng(7)
+        df = pd.DataFrame(
+            {
+                "year": [2025, 2025, 2026, 2026],
+                "quarter": [3, 4, 3, 4],
+                "region": ["Riyadh"] * 4,
+                "gdp_growth": rng.uniform(2.0, 5.0, 4),
+                "sustainability_index": rng.uniform(60, 85, 4),
+            }
+        )
+
+        class StubRepository:
+            def get_all_indicators(self, tenant_id):
+                return df
+
+        monkeypatch.setattr(dashboard_router, "get_llm_service", lambda: MockLLMProvider())
+        app = FastAPI()
+        app.include_router(dashboard_router.create_dashboard_router())
+        app.dependency_overrides[get_current_tenant] = lambda: "test"
+        app.dependency_overrides[get_indicator_repository] = lambda: StubRepository()
+
+        with TestClient(app) as client:
+            response = client.get("/dashboard/recommendations/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            line.removeprefix("event: ")
+            for line in response.text.splitlines()
+            if line.startswith("event: ")
+        ]
+        assert events[0] == "executive_summary"
+        assert events[-1] == "done"
+        assert "recommendation" in events
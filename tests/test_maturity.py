@@ -8,9 +8,13 @@ Comprehensive tests for:
 - Maturity assessor (manual and automated)
 - Benchmarking service
 - Roadmap generation
+- Batch scoring
 - Convenience functions
 """
 
+import numpy as np
+import pandas as pd
+import pytest
 
 from analytics_hub_platform.domain.maturity_model import (
     # Enums
@@ -32,6 +36,7 @@ from analytics_hub_platform.domain.maturity_model import (
     BenchmarkingService,
     RoadmapGenerator,
     # Convenience functions
+    assess_maturity_batch,
     assess_platform_maturity,
     compare_to_benchmarks,
     generate_improvement_roadmap,
@@ -1300,3 +1305,91 @@ class TestMaturityModelIntegration:
         )
         assert alignment_dim_low is not None
         assert alignment_dim_low.score < 3.0
+
+
+# =============================================================================
+# BATCH SCORING TESTS
+# =============================================================================
+
+
+def _metrics_matrix(n_tenants: int = 20, n_periods: int = 4) -> pd.DataFrame:
+    """Random metrics for every tenant and period, exercising the inference rules."""
+    rng = np.random.default_rng(11)
+    n = n_tenants * n_periods
+    return pd.DataFrame(
+        {
+            "tenant_id": np.repeat([f"tenant_{i}" for i in range(n_tenants)], n_periods),
+            "period": np.tile([f"2025Q{q + 1}" for q in range(n_periods)], n_tenants),
+            "data_quality_score": rng.integers(0, 101, n),
+            "governance_score": rng.integers(0, 101, n),
+            "analytics_score": rng.choice([0, 55, 90], n),
+            "has_forecasting": rng.random(n) > 0.5,
+            "has_insights": rng.random(n) > 0.5,
+            "decision_support_score": rng.choice([0, 35], n),
+            "has_llm_insights": rng.random(n) > 0.5,
+            "has_docker": rng.random(n) > 0.5,
+            "organization_score": rng.choice([np.nan, 25, 95], n),
+            "kpi_count": rng.integers(0, 25, n),
+        }
+    )
+
+
+class TestBatchScoring:
+    """Tests for vectorized batch scoring."""
+
+    def test_assess_batch_matches_assess_from_metrics(self):
+        """Test every row scores exactly like the per-assessment path."""
+        metrics = _metrics_matrix()
+        assessor = MaturityAssessor(target_level=MaturityLevel.MANAGED)
+
+        scores = assessor.assess_batch(metrics)
+
+        for i, record in enumerate(metrics.to_dict("records")):
+            row = {k: v for k, v in record.items() if not (isinstance(v, float) and np.isnan(v))}
+            expected = assessor.assess_from_metrics(row)
+            assert scores["overall_score"].iloc[i] == expected.overall_score
+            assert scores["overall_level"].iloc[i] == expected.overall_level.value
+            assert scores["gaps_count"].iloc[i] == len(expected.weaknesses)
+            for dim_assessment in expected.dimension_assessments:
+                assert scores[dim_assessment.dimension.value].iloc[i] == dim_assessment.score
+
+    def test_percentiles_match_calculate_percentile(self):
+        """Test grouped percentiles rank each tenant against its period peers."""
+        metrics = _metrics_matrix(n_tenants=8, n_periods=2)
+        service = BenchmarkingService()
+
+        scores = assess_maturity_batch(metrics, peer_group="period")
+
+        assessments = [
+            MaturityAssessment(
+                id=str(i),
+                name="",
+                description="",
+                status=AssessmentStatus.COMPLETED,
+                assessor="Test",
+                overall_score=score,
+            )
+            for i, score in enumerate(scores["overall_score"])
+        ]
+        for i, period in enumerate(metrics["period"]):
+            peers = [
+                a for j, a in enumerate(assessments)
+                if j != i and metrics["period"].iloc[j] == period
+            ]
+            expected = service.calculate_percentile(assessments[i], peers)
+            assert scores["percentile"].iloc[i] == expected
+
+    def test_benchmark_gaps_match_comparisons(self):
+        """Test batch benchmark gaps equal BenchmarkComparison gaps."""
+        metrics = _metrics_matrix(n_tenants=3, n_periods=1)
+        assessor = MaturityAssessor()
+        service = BenchmarkingService()
+
+        gaps = service.compare_scores_to_benchmarks(assessor.assess_batch(metrics))
+
+        assessment = assessor.assess_from_metrics(metrics.iloc[0].dropna().to_dict())
+        for comparison in service.compare_to_all_benchmarks(assessment):
+            frame = gaps[comparison.benchmark.id]
+            assert frame["overall"].iloc[0] == pytest.approx(comparison.overall_gap)
+            for dimension, gap in comparison.dimension_gaps.items():
+                assert frame[dimension.value].iloc[0] == pytest.approx(gap)
@@ -0,0 +1,505 @@
+"""
+Tests for observability module.
+
+Tests metrics collection: counters, fixed-bucket histograms, the
+Prometheus export, multi-process aggregation, the request middleware and
+the structured log pipeline.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from analytics_hub_platform.api.routers import create_api_router
+from analytics_hub_platform.infrastructure import multiprocess_metrics, observability
+from analytics_hub_platform.infrastructure.middleware import RequestLoggingMiddleware
+from analytics_hub_platform.infrastructure.multiprocess_metrics import (
+    ARCHIVE_FILE,
+    MmapValueFile,
+    MultiprocessMetricsStore,
+    read_value_file,
+)
+from analytics_hub_platform.infrastructure.observability import (
+    DEFAULT_HISTOGRAM_BUCKETS,
+    AsyncLogPipeline,
+    BatchingFileHandler,
+    HealthChecker,
+    HealthCheckResult,
+    HistogramSnapshot,
+    StructuredLogFormatter,
+    correlation_context,
+    get_metrics,
+)
+
+
+@pytest.fixture
+def metrics():
+    """The global collector, reset around each test."""
+    collector = get_metrics()
+    collector.reset()
+    yield collector
+    collector.reset()
+
+
+class TestHistograms:
+    """Test fixed-bucket histogram recording."""
+
+    def test_counts_are_cumulative_not_windowed(self, metrics):
+        """Test count and sum cover every observation, not a recent window."""
+        for i in range(5000):
+            metrics.observe_histogram("latency", (i % 100) / 100)
+
+        snapshot = metrics.get_histogram("latency")
+
+        assert snapshot.count == 5000
+        assert snapshot.sum == pytest.approx(50 * sum(i / 100 for i in range(100)))
+        assert snapshot.bounds == DEFAULT_HISTOGRAM_BUCKETS
+        assert snapshot.cumulative_counts()[-1] == 5000
+
+    def test_quantiles_estimated_from_buckets(self, metrics):
+        """Test quantiles fall inside the bucket holding the true value."""
+        metrics.register_histogram("size", (10, 20, 30, 40))
+        for value in range(1, 41):
+            metrics.observe_histogram("size", value)
+
+        stats = metrics.get_histogram_stats("size")
+
+        assert stats["min"] == 1 and stats["max"] == 40
+        assert 10 < stats["p50"] <= 20
+        assert 30 < stats["p90"] <= 40
+        assert stats["p99"] <= 40
+        assert metrics.get_histogram_stats("missing") == {"count": 0}
+
+    def test_concurrent_recording_is_exact(self, metrics):
+        """Test per-thread shards merge to exact totals."""
+
+        def record():
+            for _ in range(10_000):
+                metrics.increment_counter("requests", labels={"method": "GET"})
+                metrics.observe_histogram("duration", 0.02, labels={"method": "GET"})
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.get_counter("requests", {"method": "GET"}) == 80_000
+        assert metrics.get_histogram_stats("duration", {"method": "GET"})["count"] == 80_000
+        all_metrics = metrics.get_all_metrics()
+        assert all_metrics["histograms"]["duration"]["method=GET"]["count"] == 80_000
+
+    def test_exited_thread_shards_are_folded(self, metrics):
+        """Test short-lived threads do not leave a shard each behind."""
+
+        def record():
+            metrics.increment_counter("jobs")
+            metrics.observe_histogram("job_seconds", 0.5)
+
+        threads = [threading.Thread(target=record) for _ in range(200)]
+        for thread in threads:
+            thread.start()
+            thread.join()
+
+        assert metrics.get_counter("jobs") == 200
+        assert metrics.get_histogram("job_seconds").count == 200
+        assert not any(shard.owner in threads for shard in metrics._shards)
+
+
+class TestPrometheusExport:
+    """Test the Prometheus text format."""
+
+    def test_histogram_bucket_lines(self, metrics):
+        """Test _bucket, _sum and _count lines with quoted labels."""
+        metrics.register_histogram("http_seconds", (0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 3.0):
+            metrics.observe_histogram("http_seconds", value, labels={"path": "/api"})
+        metrics.increment_counter("http_requests", 4, labels={"path": "/api"})
+
+        lines = metrics.export_prometheus().splitlines()
+
+        assert "# TYPE http_seconds histogram" in lines
+        assert 'http_seconds_bucket{path="/api",le="0.1"} 1' in lines
+        assert 'http_seconds_bucket{path="/api",le="1.0"} 3' in lines
+        assert 'http_seconds_bucket{path="/api",le="+Inf"} 4' in lines
+        assert 'http_seconds_count{path="/api"} 4' in lines
+        assert 'http_seconds_sum{path="/api"} 4.25' in lines
+        assert 'http_requests_total{path="/api"} 4.0' in lines
+
+
+def _exited_pid() -> int:
+    """PID of a process that has already exited."""
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def _record_in_worker(directory: str) -> None:
+    """Worker process body: record metrics and sync them before exiting."""
+    collector = get_metrics()
+    collector.enable_multiprocess(directory, sync_interval=60)
+    collector.increment_counter("jobs", 3, labels={"kind": "etl"})
+    collector.observe_histogram("job_seconds", 0.2)
+    collector.set_gauge("queue_depth", 7)
+    collector.disable_multiprocess()
+
+
+class TestMultiprocess:
+    """Test aggregation of per-worker metric files."""
+
+    def test_value_file_roundtrip_and_growth(self, tmp_path):
+        """Test values update in place and survive the file growing."""
+        values = MmapValueFile(tmp_path / "values.db")
+        for i in range(5000):
+            values.write(f"key-{i}", float(i))
+        values.write("key-7", 70.0)
+        values.close()
+
+        stored = read_value_file(tmp_path / "values.db")
+
+        assert len(stored) == 5000
+        assert stored["key-7"] == 70.0
+        assert stored["key-4999"] == 4999.0
+
+    def test_workers_are_summed(self, tmp_path):
+        """Test counters, histograms and gauge modes combine across workers."""
+        snapshot = HistogramSnapshot(bounds=(1.0,), counts=[2, 1], count=3, sum=4.0, min=0.5, max=3)
+        stores = [MultiprocessMetricsStore(tmp_path, pid=pid) for pid in (1, 2)]
+        for value, store in enumerate(stores, start=1):
+            store.write_snapshot(
+                {"requests": {"path=/a": 10.0 * value}},
+                {"active": {"": value}, "workers": {"": 1.0}},
+                {"latency": {"": snapshot}},
+                gauge_modes={"active": "max"},
+            )
+
+        counters, gauges, histograms = stores[0].collect()
+
+        assert counters["requests"]["path=/a"] == 30.0
+        assert gauges["active"] == {"": 2}
+        assert gauges["workers"] == {"pid=1": 1.0, "pid=2": 1.0}
+        assert histograms["latency"][""].counts == [4, 2]
+        assert histograms["latency"][""].sum == 8.0
+
+    def test_dead_worker_archived(self, tmp_path):
+        """Test an exited worker's counters survive in the archive; gauges do not."""
+        dead = MultiprocessMetricsStore(tmp_path, pid=_exited_pid())
+        dead.write_snapshot({"requests": {"": 5.0}}, {"active": {"": 1.0}}, {})
+        dead.close()
+        live = MultiprocessMetricsStore(tmp_path)
+        live.write_snapshot({"requests": {"": 2.0}}, {}, {})
+
+        counters, gauges, _ = live.collect()
+
+        assert counters["requests"][""] == 7.0
+        assert "active" not in gauges
+        assert (tmp_path / ARCHIVE_FILE).exists()
+        assert not dead._worker_path(dead.pid).exists()
+
+    def test_worker_archived_during_collect_counted_once(self, tmp_path, monkeypatch):
+        """Test another worker's cleanup cannot archive a file mid-scrape."""
+        exiting = MultiprocessMetricsStore(tmp_path, pid=_exited_pid())
+        exiting.write_snapshot({"requests": {"": 5.0}}, {}, {})
+        exiting.close()
+        scraper = MultiprocessMetricsStore(tmp_path)
+        other = MultiprocessMetricsStore(tmp_path, pid=1)
+        exited = threading.Event()
+        cleaner = threading.Thread(target=other.cleanup_dead_workers)
+        monkeypatch.setattr(
+            multiprocess_metrics,
+            "_process_alive",
+            lambda pid: not (pid == exiting.pid and exited.is_set()),
+        )
+        read = multiprocess_metrics.read_value_file
+
+        def read_then_exit(path):
+            values = read(path)
+            if path == exiting._worker_path(exiting.pid) and not exited.is_set():
+                # The worker exits right after the scrape read its file
+                exited.set()
+                cleaner.start()
+                cleaner.join(timeout=0.5)
+            return values
+
+        monkeypatch.setattr(multiprocess_metrics, "read_value_file", read_then_exit)
+        counters, _, _ = scraper.collect()
+        cleaner.join()
+
+        assert counters["requests"][""] == 5.0
+        assert not exiting._worker_path(exiting.pid).exists()
+        assert scraper.collect()[0]["requests"][""] == 5.0
+
+    def test_scrape_covers_other_processes(self, metrics, tmp_path):
+        """Test the collector's export includes a separate worker process."""
+        worker = multiprocessing.get_context("spawn").Process(
+            target=_record_in_worker, args=(str(tmp_path),)
+        )
+        worker.start()
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+        metrics.enable_multiprocess(str(tmp_path), sync_interval=60)
+        try:
+            metrics.increment_counter("jobs", 1, labels={"kind": "etl"})
+            lines = metrics.export_prometheus().splitlines()
+        finally:
+            metrics.disable_multiprocess()
+
+        assert 'jobs_total{kind="etl"} 4.0' in lines
+        assert "job_seconds_count 1" in lines
+        assert not any(line.startswith("queue_depth") for line in lines)
+
+
+class TestRequestLoggingMiddleware:
+    """Test request gauges and sampled request logging."""
+
+    @staticmethod
+    def _app(sample_rate: int, release: asyncio.Event | None = None) -> Starlette:
+        async def ok(request):
+            if release is not None:
+                await release.wait()
+            return PlainTextResponse("ok")
+
+        async def fail(request):
+            return PlainTextResponse("no", status_code=503)
+
+        app = Starlette(routes=[Route("/ok", ok), Route("/fail", fail)])
+        app.add_middleware(RequestLoggingMiddleware, sample_rate=sample_rate)
+        return app
+
+    def test_active_gauge_counts_concurrent_requests(self, metrics):
+        """Test http_requests_active rises per request in flight and returns to zero."""
+
+        async def scenario():
+            release = asyncio.Event()
+            transport = httpx.ASGITransport(app=self._app(1, release))
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                pending = [asyncio.create_task(client.get("/ok")) for _ in range(5)]
+                for _ in range(100):
+                    await asyncio.sleep(0.01)
+                    if metrics.get_gauge("http_requests_active", {"method": "GET"}) == 5:
+                        break
+                in_flight = metrics.get_gauge("http_requests_active", {"method": "GET"})
+                release.set()
+                await asyncio.gather(*pending)
+            return in_flight
+
+        assert asyncio.run(scenario()) == 5
+        assert metrics.get_gauge("http_requests_active", {"method": "GET"}) == 0
+        assert metrics.get_counter("http_requests_total", {"method": "GET", "path": "/ok"}) == 5
+
+    def test_sampling_keeps_errors(self, metrics, caplog):
+        """Test 1-in-N logging of successes while every error is logged."""
+        caplog.set_level(logging.INFO, logger="analytics_hub_platform.infrastructure.middleware")
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=self._app(3))
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                for _ in range(6):
+                    await client.get("/ok")
+                for _ in range(2):
+                    await client.get("/fail")
+
+        asyncio.run(scenario())
+        completed = [r.getMessage() for r in caplog.records if "completed" in r.getMessage()]
+
+        assert sum("/ok" in message for message in completed) == 2
+        assert sum("/fail" in message for message in completed) == 2
+        durations = metrics.get_histogram_stats(
+            "http_request_duration_seconds", {"method": "GET", "path": "/ok", "status": "200"}
+        )
+        assert durations["count"] == 6
+
+
+class TestStructuredLogging:
+    """Test the JSON formatter and the queue-based log pipeline."""
+
+    @staticmethod
+    def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+        logger = logging.getLogger(name)
+        logger.handlers = [handler]
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        return logger
+
+    def test_formatter_handles_unserializable_extras(self):
+        """Test odd extras are stringified rather than breaking the record."""
+        formatter = StructuredLogFormatter(include_location=False)
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello %s", ("x",), None)
+        record.region_scores = {("riyadh", 2024): 0.8}
+        record.when = threading.Event()
+
+        data = json.loads(formatter.format(record))
+
+        assert data["message"] == "hello x"
+        assert data["extra"]["region_scores"] == str({("riyadh", 2024): 0.8})
+        assert "Event" in data["extra"]["when"]
+
+    @pytest.mark.parametrize("encoder", ["stdlib", "default"])
+    def test_formatter_stringifies_self_referencing_extras(self, encoder, monkeypatch):
+        """Test a circular extra is stringified instead of raising from format()."""
+        if encoder == "stdlib":
+            monkeypatch.setattr(observability, "encode_log_json", observability._encode_json_stdlib)
+        formatter = StructuredLogFormatter(include_location=False)
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "loop", (), None)
+        cycle: dict = {"name": "node"}
+        cycle["self"] = cycle
+        record.node = cycle
+
+        data = json.loads(formatter.format(record))
+
+        assert data["extra"]["node"] == str(cycle)
+
+    def test_pipeline_writes_every_record_in_order(self, tmp_path):
+        """Test records reach the file in order, with the caller's correlation ID."""
+        log_file = tmp_path / "app.log"
+        handler = BatchingFileHandler(log_file, batch_size=50)
+        handler.setFormatter(StructuredLogFormatter(include_location=False))
+        pipeline = AsyncLogPipeline([handler])
+        logger = self._logger("test.pipeline", pipeline.queue_handler)
+
+        pipeline.start()
+        with correlation_context("req-42"):
+            for i in range(1000):
+                logger.info("record %d", i)
+        pipeline.stop()
+
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [r["message"] for r in records] == [f"record {i}" for i in range(1000)]
+        assert {r["correlation_id"] for r in records} == {"req-42"}
+        assert pipeline.dropped == 0
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        """Test a full queue counts dropped records rather than blocking callers."""
+        handler = BatchingFileHandler(tmp_path / "app.log")
+        handler.setFormatter(StructuredLogFormatter(include_location=False))
+        pipeline = AsyncLogPipeline([handler], queue_size=10)
+        logger = self._logger("test.pipeline.full", pipeline.queue_handler)
+
+        for i in range(25):  # Listener not started yet
+            logger.info("record %d", i)
+        pipeline.start()
+        pipeline.stop()
+
+        assert pipeline.dropped == 15
+        assert len((tmp_path / "app.log").read_text().splitlines()) == 10
+
+
+class TestHealthChecker:
+    """Test concurrent, time-bounded and cached health checks."""
+
+    @staticmethod
+    def _check(name: str, delay: float = 0.0, healthy: bool = True, calls: list | None = None):
+        def run() -> HealthCheckResult:
+            if calls is not None:
+                calls.append(name)
+            time.sleep(delay)
+            return HealthCheckResult(name=name, healthy=healthy)
+
+        return run
+
+    def test_checks_run_concurrently(self):
+        """Test total time is bounded by the slowest check, not the sum."""
+        checker = HealthChecker(cache_ttl_seconds=0, timeout_seconds=5)
+        for name in ("database", "cache", "llm"):
+            checker.register(name, self._check(name, delay=0.2))
+
+        start = time.perf_counter()
+        results = checker.check_all()
+        elapsed = time.perf_counter() - start
+
+        assert list(results) == ["database", "cache", "llm"]
+        assert all(r.healthy for r in results.values())
+        assert elapsed < 0.5
+
+    def test_timeout_fails_check_without_piling_up(self):
+        """Test a hung check times out and is not restarted while still running."""
+        calls: list[str] = []
+        checker = HealthChecker(cache_ttl_seconds=0)
+        checker.register("slow", self._check("slow", delay=0.5, calls=calls), timeout_seconds=0.05)
+        checker.register("fast", self._check("fast"))
+
+        start = time.perf_counter()
+        results = checker.check_all()
+        assert time.perf_counter() - start < 0.3
+        assert not results["slow"].healthy
+        assert "timed out" in results["slow"].message
+        assert results["fast"].healthy
+
+        assert not checker.check("slow").healthy
+        assert calls == ["slow"]
+
+    def test_results_cached_for_ttl(self):
+        """Test repeated probes reuse a fresh result instead of re-running the check."""
+        calls: list[str] = []
+        checker = HealthChecker(cache_ttl_seconds=60)
+        checker.register("database", self._check("database", calls=calls))
+
+        first = checker.check_all()["database"]
+        summary = checker.get_summary()
+        assert checker.is_healthy()
+
+        assert calls == ["database"]
+        assert not first.cached
+        assert summary["checks"]["database"]["cached"] is True
+
+        checker.check_all(use_cache=False)
+        assert calls == ["database", "database"]
+
+    def test_exceptions_and_informational_checks(self):
+        """Test raising checks fail, and non-readiness checks do not gate status."""
+
+        def broken() -> HealthCheckResult:
+            raise ConnectionError("refused")
+
+        checker = HealthChecker(cache_ttl_seconds=0)
+        checker.register("database", self._check("database"))
+        checker.register("llm", broken, readiness=False)
+
+        summary = checker.get_summary()
+        assert summary["status"] == "healthy"
+        assert summary["checks"]["llm"] == {
+            "healthy": False,
+            "message": "refused",
+            "latency_ms": summary["checks"]["llm"]["latency_ms"],
+            "cached": False,
+            "details": {},
+        }
+
+        checker.register("cache", broken)
+        assert not checker.is_healthy()
+        assert checker.check("unknown").message == "Unknown health check: unknown"
+
+    def test_liveness_and_readiness_endpoints(self, monkeypatch):
+        """Test liveness skips dependency checks and readiness reports 503 on failure."""
+        calls: list[str] = []
+        checker = HealthChecker(cache_ttl_seconds=0)
+        checker.register("database", self._check("database", calls=calls))
+        monkeypatch.setattr(observability, "_health_checker", checker)
+
+        app = FastAPI()
+        app.include_router(create_api_router())
+        client = TestClient(app)
+
+        assert client.get("/health/live").status_code == 200
+        assert calls == []
+
+        ready = client.get("/health/ready")
+        assert ready.status_code == 200
+        assert ready.json()["checks"]["database"]["healthy"] is True
+
+        checker.register("cache", self._check("cache", healthy=False))
+        assert client.get("/health/ready").status_code == 503
@@ -0,0 +1,163 @@
+"""
+Tests for the sampling profiler.
+
+Tests stack sampling, the collapsed-stack output and the admin-only
+profiling endpoint.
+"""
+
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from analytics_hub_platform.api.routers import create_api_router
+from analytics_hub_platform.infrastructure.profiler import (
+    ProfilerBusyError,
+    SamplingProfiler,
+    is_profiling,
+)
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+
+@pytest.fixture
+def busy_thread():
+    """A thread spinning in _busy_loop until the test ends."""
+    stop = threading.Event()
+    thread = threading.Thread(target=_busy_loop, args=(stop,), name="busy-worker")
+    thread.start()
+    yield thread
+    stop.set()
+    thread.join()
+
+
+class TestSamplingProfiler:
+    """Test stack sampling and collapsed-stack output."""
+
+    def test_samples_busy_thread(self, busy_thread):
+        """Test the busy function dominates the profile of its thread."""
+        result = SamplingProfiler(interval_ms=2).run(0.3)
+
+        assert result.samples > 0
+        busy = sum(n for stack, n in result.stacks.items() if "_busy_loop" in stack)
+        assert busy > 10
+        # Other threads left over from earlier tests may also be sampled
+        worker_stack = max(
+            (stack for stack in result.stacks if stack.startswith("thread:busy-worker;")),
+            key=result.stacks.__getitem__,
+        )
+        assert worker_stack.rsplit(";", 1)[-1].startswith(("_busy_loop", "<genexpr>"))
+
+    def test_collapsed_format(self, busy_thread):
+        """Test each line is "root;...;leaf count", outermost frame first."""
+        result = SamplingProfiler(interval_ms=2).run(0.2)
+
+        lines = result.to_collapsed().splitlines()
+        assert lines
+        counts = []
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            frames = stack.split(";")
+            assert frames[0].startswith("thread:")
+            counts.append(int(count))
+        assert sum(counts) == result.samples
+        assert counts == sorted(counts, reverse=True)
+
+        busy_stack = next(line for line in lines if "_busy_loop" in line)
+        frames = busy_stack.rsplit(" ", 1)[0].split(";")
+        assert frames[0] == "thread:busy-worker"
+        assert frames.index(next(f for f in frames if f.startswith("_busy_loop"))) > 1
+
+    def test_idle_threads_skipped_by_default(self):
+        """Test threads blocked on an Event are excluded unless requested."""
+        release = threading.Event()
+        waiter = threading.Thread(target=release.wait, name="idle-waiter")
+        waiter.start()
+        try:
+            quiet = SamplingProfiler(interval_ms=5).run(0.1)
+            verbose = SamplingProfiler(interval_ms=5, include_idle=True).run(0.1)
+        finally:
+            release.set()
+            waiter.join()
+
+        assert not any("idle-waiter" in stack for stack in quiet.stacks)
+        assert quiet.idle_samples > 0
+        assert any("idle-waiter" in stack for stack in verbose.stacks)
+
+    def test_busy_function_named_like_idle_one_is_sampled(self):
+        """Test idle frames are matched by module, not by function name alone."""
+        stop = []
+
+        def get():
+            # No calls in the loop, so "get" itself is always the leaf frame
+            while not stop:
+                pass
+
+        worker = threading.Thread(target=get, name="busy-get")
+        worker.start()
+        try:
+            result = SamplingProfiler(interval_ms=2).run(0.2)
+        finally:
+            stop.append(True)
+            worker.join()
+
+        assert any(stack.startswith("thread:busy-get;") for stack in result.stacks)
+
+    def test_one_profile_at_a_time(self):
+        """Test a concurrent profile request is rejected."""
+        started = threading.Thread(target=SamplingProfiler().run, args=(0.5,))
+        started.start()
+        try:
+            for _ in range(100):
+                if is_profiling():
+                    break
+                time.sleep(0.005)
+            with pytest.raises(ProfilerBusyError):
+                SamplingProfiler().run(0.1)
+        finally:
+            started.join()
+        assert not is_profiling()
+
+
+class TestProfileEndpoint:
+    """Test the admin-only /admin/profile endpoint."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.include_router(create_api_router())
+        return TestClient(app)
+
+    def test_admin_receives_collapsed_stacks(self, client, busy_thread):
+        """Test an admin gets a downloadable collapsed-stack file."""
+        response = client.post(
+            "/admin/profile",
+            params={"seconds": 0.2, "interval_ms": 2},
+            headers={"X-User-ID": "admin"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "attachment" in response.headers["content-disposition"]
+        assert int(response.headers["x-profile-samples"]) > 0
+        assert "_busy_loop" in response.text
+
+    @pytest.mark.parametrize("user_id", ["analyst", "director", "minister"])
+    def test_non_admin_forbidden(self, client, user_id):
+        """Test RBAC rejects roles without the run_profiler permission."""
+        response = client.post(
+            "/admin/profile", params={"seconds": 0.1}, headers={"X-User-ID": user_id}
+        )
+        assert response.status_code == 403
+
+    def test_duration_capped(self, client):
+        """Test durations beyond profiler_max_seconds are rejected."""
+        response = client.post(
+            "/admin/profile", params={"seconds": 3600}, headers={"X-User-ID": "admin"}
+        )
+        assert response.status_code == 400
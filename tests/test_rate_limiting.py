@@ -0,0 +1,186 @@
+"""
+Tests for rate limiting module.
+
+Tests the sliding-window counter, token bucket bursts, idle-key eviction
+and thread safety of SlidingWindowRateLimiter.
+"""
+
+import threading
+
+import pytest
+
+from analytics_hub_platform.infrastructure.exceptions import RateLimitError
+from analytics_hub_platform.infrastructure.rate_limiting import (
+    RateLimitConfig,
+    SlidingWindowRateLimiter,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _limiter(clock, max_requests=10, window_seconds=60, burst_size=None, stripes=4):
+    config = RateLimitConfig(
+        max_requests=max_requests, window_seconds=window_seconds, burst_size=burst_size
+    )
+    return SlidingWindowRateLimiter(config, stripes=stripes, clock=clock)
+
+
+class TestSlidingWindow:
+    """Test the two-bucket sliding window estimate."""
+
+    def test_allows_up_to_limit_then_denies(self, clock):
+        """Test max_requests are admitted within a window and the next is refused."""
+        limiter = _limiter(clock)
+
+        results = [limiter.acquire("user-1") for _ in range(10)]
+        assert all(acquired for acquired, _, _ in results)
+        assert [remaining for _, remaining, _ in results] == list(range(9, -1, -1))
+
+        acquired, remaining, retry_after = limiter.acquire("user-1")
+        assert not acquired
+        assert remaining == 0
+        assert 1 <= retry_after <= 60
+        assert limiter.acquire("user-2")[0]
+
+    def test_previous_window_weight_decays(self, clock):
+        """Test capacity returns gradually as the previous window slides out."""
+        clock.now = 6000.0  # Window boundary
+        limiter = _limiter(clock)
+        for _ in range(10):
+            assert limiter.acquire("k")[0]
+
+        clock.advance(60)  # Next window: previous count weighs 100%
+        assert not limiter.acquire("k")[0]
+
+        clock.advance(15)  # 75% overlap -> estimate 7.5, room for 2 more
+        assert limiter.acquire("k")[0]
+        assert limiter.acquire("k")[0]
+        acquired, _, retry_after = limiter.acquire("k")
+        assert not acquired
+        assert retry_after >= 1
+
+        clock.advance(120)  # Two full windows later the key starts fresh
+        assert limiter.get_stats("k")["current_count"] == 0
+
+    def test_retry_after_is_accurate(self, clock):
+        """Test a denied caller succeeds once retry_after has elapsed."""
+        clock.now = 6000.0
+        limiter = _limiter(clock)
+        for _ in range(10):
+            limiter.acquire("k")
+        clock.advance(30)
+
+        acquired, _, retry_after = limiter.acquire("k")
+        assert not acquired
+        clock.advance(retry_after)
+        assert limiter.acquire("k")[0]
+
+    def test_check_does_not_consume(self, clock):
+        """Test check reports capacity without using it or creating state."""
+        limiter = _limiter(clock)
+
+        assert limiter.check("new") == (True, 10, 0)
+        assert limiter.tracked_keys == 0
+
+        for _ in range(10):
+            limiter.acquire("k")
+        assert limiter.check("k")[0] is False
+        assert limiter.get_stats("k")["current_count"] == 10
+
+    def test_token_bucket_limits_bursts(self, clock):
+        """Test burst_size caps back-to-back requests below the window limit."""
+        limiter = _limiter(clock, max_requests=60, window_seconds=60, burst_size=3)
+
+        assert [limiter.acquire("k")[0] for _ in range(4)] == [True, True, True, False]
+        clock.advance(1)  # Refill rate is 1 token/second
+        assert limiter.acquire("k")[0]
+
+    def test_acquire_or_raise(self, clock):
+        """Test exceeding the limit raises RateLimitError with retry details."""
+        limiter = _limiter(clock, max_requests=1)
+        limiter.acquire_or_raise("k")
+
+        with pytest.raises(RateLimitError) as exc_info:
+            limiter.acquire_or_raise("k")
+        assert exc_info.value.details["limit"] == 1
+        assert exc_info.value.details["retry_after"] >= 1
+
+
+class TestMemoryBounds:
+    """Test idle keys are evicted and state stays bounded."""
+
+    def test_idle_keys_evicted_as_new_keys_arrive(self, clock):
+        """Test idle keys are dropped by generation rotation when their stripe is touched."""
+        limiter = _limiter(clock, stripes=1)
+        for i in range(1000):
+            limiter.acquire(f"ip-{i}")
+        assert limiter.tracked_keys == 1000
+
+        clock.advance(121)  # One rotation: kept in the previous generation
+        limiter.acquire("fresh")
+        assert limiter.tracked_keys == 1001
+
+        clock.advance(120)  # Second rotation drops them
+        limiter.acquire("fresh")
+        assert limiter.tracked_keys == 1
+
+    def test_active_keys_survive_eviction(self, clock):
+        """Test recently used keys keep their counts while idle ones go."""
+        limiter = _limiter(clock, stripes=1)
+        for _ in range(10):
+            limiter.acquire("busy")
+        limiter.acquire("idle")
+
+        clock.advance(100)
+        limiter.acquire("busy")  # Denied, but touched
+        clock.advance(30)
+        assert limiter.purge_idle() == 1
+        assert limiter.tracked_keys == 1
+        assert limiter.get_stats("busy")["current_count"] > 0
+
+    def test_reset(self, clock):
+        """Test reset clears a key's state."""
+        limiter = _limiter(clock, max_requests=1)
+        limiter.acquire("k")
+        limiter.reset("k")
+        assert limiter.acquire("k")[0]
+
+
+class TestThreadSafety:
+    """Test concurrent acquisition never over-admits."""
+
+    def test_concurrent_acquire_respects_limit(self):
+        """Test threads racing on shared keys admit exactly the limit per key."""
+        limiter = SlidingWindowRateLimiter(
+            RateLimitConfig(max_requests=50, window_seconds=3600), stripes=8
+        )
+        admitted = [0] * 8
+
+        def worker(index: int) -> None:
+            for i in range(200):
+                if limiter.acquire(f"key-{i % 4}")[0]:
+                    admitted[index] += 1
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(admitted) == 4 * 50
@@ -6,14 +6,17 @@ Tests event capture, timing utilities, and telemetry backends.
 
 import json
 import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
+import pandas.testing as pd_testing
 import pytest
 
 from analytics_hub_platform.infrastructure.telemetry import (
     EventType,
     TelemetryBackend,
     TelemetryCollector,
+    TelemetryDropPolicy,
     TelemetryEvent,
     TimingContext,
     get_telemetry_collector,
@@ -21,6 +24,15 @@ from analytics_hub_platform.infrastructure.telemetry import (
     init_telemetry,
     timed,
 )
+from analytics_hub_platform.infrastructure.telemetry_rollups import TelemetryRollupStore
+
+
+@pytest.fixture(autouse=True)
+def rollup_db(tmp_path):
+    """Keep collector rollups out of the working directory."""
+    path = tmp_path / "telemetry_rollups.db"
+    with patch("analytics_hub_platform.infrastructure.telemetry.TELEMETRY_ROLLUP_DB", str(path)):
+        yield path
 
 
 class TestTelemetryEvent:
@@ -202,6 +214,7 @@ class TestTelemetryCollectorMocked:
 
         yield collector
 
+        collector.close()
         TelemetryCollector._instance = None
 
     def test_track_page_view(self, enabled_collector):
@@ -525,3 +538,226 @@ class TestEventTypeMappings:
         collector.track_export("report", "pdf")
 
         TelemetryCollector._instance = None
+
+
+class TestBufferedFileWriter:
+    """Test buffering, background flushing, drop policy and rotation."""
+
+    @pytest.fixture
+    def file_collector(self, tmp_path):
+        """File-backend collector writing to a temporary file."""
+        mock_session = MagicMock()
+        mock_session.get.return_value = "test_session"
+        mock_session.__contains__ = lambda self, x: True
+        mock_session.__getitem__ = MagicMock(return_value="test-session-id")
+
+        with patch("analytics_hub_platform.infrastructure.telemetry.st") as mock:
+            mock.session_state = mock_session
+            TelemetryCollector._instance = None
+            collector = TelemetryCollector()
+            collector._enabled = True
+            collector._backend = TelemetryBackend.FILE
+            collector._file_path = tmp_path / "telemetry.jsonl"
+            collector._flush_interval = 60
+            yield collector
+            collector.close()
+            TelemetryCollector._instance = None
+
+    @staticmethod
+    def _pages(path):
+        return [json.loads(line)["page"] for line in path.read_text().splitlines()]
+
+    def test_events_buffered_until_flush(self, file_collector):
+        """Test tracking does no file I/O until the buffer is flushed."""
+        for i in range(10):
+            file_collector.track(EventType.PAGE_VIEW, page=f"page-{i}")
+
+        assert not file_collector._file_path.exists()
+        assert file_collector.get_stats()["buffered"] == 10
+
+        file_collector.flush()
+
+        assert self._pages(file_collector._file_path) == [f"page-{i}" for i in range(10)]
+        assert file_collector.get_stats()["written"] == 10
+
+    def test_size_trigger_flushes_in_background(self, file_collector):
+        """Test reaching flush_events wakes the background writer."""
+        file_collector._flush_events = 5
+        for i in range(5):
+            file_collector.track(EventType.FILTER_CHANGE, page=f"page-{i}")
+
+        deadline = time.monotonic() + 5
+        while file_collector.get_stats()["written"] < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert file_collector.get_stats()["written"] == 5
+        assert len(self._pages(file_collector._file_path)) == 5
+
+    @pytest.mark.parametrize(
+        "policy, kept",
+        [
+            (TelemetryDropPolicy.DROP_OLDEST, ["page-2", "page-3", "page-4"]),
+            (TelemetryDropPolicy.DROP_NEWEST, ["page-0", "page-1", "page-2"]),
+        ],
+    )
+    def test_drop_policy_when_full(self, file_collector, policy, kept):
+        """Test a full buffer drops events per policy and counts them."""
+        file_collector._buffer_size = 3
+        file_collector._drop_policy = policy
+        for i in range(5):
+            file_collector.track(EventType.PAGE_VIEW, page=f"page-{i}")
+
+        file_collector.flush()
+
+        assert self._pages(file_collector._file_path) == kept
+        assert file_collector.get_stats()["dropped"] == 2
+
+    def test_rotation_keeps_backup_count(self, file_collector):
+        """Test the file rotates at max size, keeping backup_count old files."""
+        file_collector._max_file_bytes = 600
+        file_collector._backup_count = 2
+        for i in range(12):
+            file_collector.track(EventType.PAGE_VIEW, page=f"page-{i}")
+            file_collector.flush()
+
+        path = file_collector._file_path
+        assert path.with_name("telemetry.jsonl.1").exists()
+        assert path.with_name("telemetry.jsonl.2").exists()
+        assert not path.with_name("telemetry.jsonl.3").exists()
+        assert path.stat().st_size <= 600
+        assert self._pages(path)[-1] == "page-11"
+        assert file_collector.get_stats()["rotations"] >= 2
+
+    def test_unserializable_event_does_not_stop_writer(self, file_collector):
+        """Test a bad event is dropped while its batch and later events are written."""
+        file_collector._flush_events = 3
+        file_collector.track(EventType.PAGE_VIEW, page="page-0")
+        file_collector.track(EventType.PAGE_VIEW, page="bad", properties={(1, 2): "tuple key"})
+        file_collector.track(EventType.PAGE_VIEW, page="page-1")
+        for i in range(2, 5):
+            file_collector.track(EventType.PAGE_VIEW, page=f"page-{i}")
+
+        deadline = time.monotonic() + 5
+        while file_collector.get_stats()["written"] < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        stats = file_collector.get_stats()
+        assert file_collector._flush_thread.is_alive()
+        assert stats["written"] == 5
+        assert stats["dropped"] == 1
+        assert stats["buffered"] == 0
+        assert self._pages(file_collector._file_path) == [f"page-{i}" for i in range(5)]
+
+    def test_flush_updates_rollups(self, file_collector):
+        """Test flushed batches are merged into the per-minute rollups."""
+        for i in range(6):
+            file_collector.track(EventType.PAGE_VIEW, page="Dashboard")
+            file_collector.track_performance("render", duration_ms=40.0 + i)
+            file_collector.flush()
+
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+        counts = file_collector.rollup_store.query_counts(since)
+        assert dict(zip(counts["event_type"], counts["count"], strict=True)) == {
+            "page_view": 6,
+            "performance": 6,
+        }
+
+    def test_log_backend_feeds_rollups(self, file_collector):
+        """Test rollups are populated without the file backend, skipping bad events."""
+        file_collector._backend = TelemetryBackend.LOG
+        file_collector.track(EventType.PAGE_VIEW, page="Dashboard")
+        file_collector.track(EventType.PAGE_VIEW, page="bad", properties={(1, 2): "tuple key"})
+        file_collector.flush()
+
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+        counts = file_collector.rollup_store.query_counts(since)
+        assert list(counts["count"]) == [1]
+        assert not file_collector._file_path.exists()
+        assert file_collector.get_stats()["dropped"] == 1
+
+    def test_none_backend_has_no_rollups(self, file_collector):
+        """Test the none backend neither buffers events nor opens a rollup store."""
+        file_collector._backend = TelemetryBackend.NONE
+        file_collector.track(EventType.PAGE_VIEW, page="Dashboard")
+
+        assert file_collector.get_stats()["buffered"] == 0
+        assert file_collector.rollup_store is None
+
+
+class TestTelemetryRollups:
+    """Test per-minute rollups and their trend queries."""
+
+    START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    @classmethod
+    def _events(cls, days: int = 14) -> list[TelemetryEvent]:
+        events = []
+        for day in range(days):
+            for i in range(day + 1):  # day + 1 page views on each day
+                moment = cls.START + timedelta(days=day, minutes=i)
+                events.append(
+                    TelemetryEvent("page_view", timestamp=moment.isoformat(), page="KPIs")
+                )
+            events.append(
+                TelemetryEvent(
+                    "performance",
+                    timestamp=(cls.START + timedelta(days=day)).isoformat(),
+                    page="Trends" if day % 2 else "Dashboard",
+                    duration_ms=30.0 if day % 2 else 800.0,
+                )
+            )
+        return events
+
+    def test_daily_counts(self, tmp_path):
+        """Test counts roll up to daily periods by event type."""
+        store = TelemetryRollupStore(tmp_path / "rollups.db")
+        assert store.add_events(self._events()) == sum(range(1, 15)) + 14
+
+        counts = store.query_counts(self.START, self.START + timedelta(days=14))
+        page_views = counts[counts["event_type"] == "page_view"]
+
+        assert list(page_views["count"]) == list(range(1, 15))
+        assert page_views["period"].iloc[3] == self.START + timedelta(days=3)
+
+    def test_incremental_batches_match_single_batch(self, tmp_path):
+        """Test merging batch by batch gives the same rollups as one batch."""
+        events = self._events()
+        whole = TelemetryRollupStore(tmp_path / "whole.db")
+        whole.add_events(events)
+        incremental = TelemetryRollupStore(tmp_path / "incremental.db")
+        for start in range(0, len(events), 7):
+            incremental.add_events(events[start : start + 7])
+
+        end = self.START + timedelta(days=14)
+        for store_query in ("query_counts", "query_latency"):
+            expected = getattr(whole, store_query)(self.START, end)
+            actual = getattr(incremental, store_query)(self.START, end)
+            pd_testing.assert_frame_equal(actual, expected)
+
+    def test_latency_by_page(self, tmp_path):
+        """Test latency quantiles are estimated per page from the buckets."""
+        store = TelemetryRollupStore(tmp_path / "rollups.db")
+        store.add_events(self._events())
+
+        latency = store.query_latency(self.START, self.START + timedelta(days=14))
+
+        assert list(latency["page"]) == ["Dashboard", "Trends"]
+        dashboard = latency.iloc[0]
+        assert dashboard["count"] == 7
+        assert dashboard["avg_ms"] == 800.0
+        assert dashboard["p95_ms"] == 800.0
+        assert latency.iloc[1]["max_ms"] == 30.0
+
+    def test_prune_drops_old_minutes(self, tmp_path):
+        """Test retention pruning removes rollups older than the window."""
+        store = TelemetryRollupStore(tmp_path / "rollups.db")
+        now = datetime.now(timezone.utc)
+        store.add_events(
+            [
+                TelemetryEvent("page_view", timestamp=(now - timedelta(days=d)).isoformat())
+                for d in (1, 2, 100, 200)
+            ]
+        )
+
+        assert store.prune(older_than_days=30) == 2
+        assert store.query_counts(now - timedelta(days=365))["count"].sum() == 2
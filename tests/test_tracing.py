@@ -0,0 +1,301 @@
+"""
+Tests for tracing module.
+
+Tests span nesting, context propagation, OTLP export and the middleware
+server span.
+"""
+
+import asyncio
+import contextvars
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pandas as pd
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from analytics_hub_platform.domain.insight_engine import InsightEngine
+from analytics_hub_platform.infrastructure.middleware import RequestLoggingMiddleware
+from analytics_hub_platform.infrastructure.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    SpanKind,
+    SpanStatus,
+    configure_tracing,
+    get_current_span,
+    get_tracer,
+    parse_traceparent,
+    spans_to_otlp,
+    start_span,
+    trace_id_from_correlation_id,
+    traced,
+)
+
+
+@pytest.fixture
+def exporter():
+    """Route the global tracer to an in-memory exporter for one test."""
+    memory = InMemorySpanExporter()
+    tracer = configure_tracing(memory)
+    yield memory
+    tracer.force_flush()
+    configure_tracing(None)
+
+
+def _finished(exporter: InMemorySpanExporter):
+    """Wait for export, then index the finished spans by name."""
+    assert get_tracer().force_flush()
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+class TestSpans:
+    """Test span creation, nesting and sampling."""
+
+    def test_nested_spans_share_trace_and_link_parents(self, exporter):
+        """Test child spans inherit the trace ID and point at their parent."""
+        with start_span("root", {"tenant": "t1"}) as root:
+            with start_span("child") as child:
+                assert get_current_span() is child
+                with start_span("grandchild"):
+                    pass
+            assert get_current_span() is root
+        assert get_current_span() is None
+
+        spans = _finished(exporter)
+        assert set(spans) == {"root", "child", "grandchild"}
+        assert {s.trace_id for s in spans.values()} == {root.trace_id}
+        assert spans["root"].parent_span_id is None
+        assert spans["child"].parent_span_id == root.span_id
+        assert spans["grandchild"].parent_span_id == child.span_id
+        assert spans["root"].attributes == {"tenant": "t1"}
+        assert spans["root"].duration_ms >= spans["child"].duration_ms
+
+    def test_exception_marks_span_failed(self, exporter):
+        """Test an escaping exception is recorded and re-raised."""
+        with pytest.raises(ValueError), start_span("failing"):
+            raise ValueError("boom")
+
+        span = _finished(exporter)["failing"]
+        assert span.status == SpanStatus.ERROR
+        assert span.events[0]["attributes"]["exception.type"] == "ValueError"
+
+    def test_disabled_tracer_is_noop(self):
+        """Test spans are not recorded without an exporter."""
+        configure_tracing(None)
+        with start_span("ignored") as span:
+            span.set_attribute("key", "value")
+            assert not span.recording
+            assert get_current_span() is None
+
+    def test_sampled_out_trace_records_nothing(self, exporter):
+        """Test children of a sampled-out root are not recorded either."""
+        configure_tracing(exporter, sample_rate=0.0)
+        with start_span("root"), start_span("child") as child:
+            assert not child.recording
+        assert _finished(exporter) == {}
+
+    def test_root_span_uses_given_trace_id(self, exporter):
+        """Test a root span continues a remote trace."""
+        trace_id, parent_id = parse_traceparent(
+            "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        )
+        with start_span("server", trace_id=trace_id, parent_span_id=parent_id):
+            pass
+
+        span = _finished(exporter)["server"]
+        assert span.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert span.parent_span_id == "00f067aa0ba902b7"
+
+    def test_trace_id_helpers_reject_invalid_input(self):
+        """Test malformed traceparent headers and non-UUID correlation IDs."""
+        assert parse_traceparent(None) is None
+        assert parse_traceparent("00-xyz-00f067aa0ba902b7-01") is None
+        assert parse_traceparent(f"00-{'0' * 32}-00f067aa0ba902b7-01") is None
+        assert trace_id_from_correlation_id("not-a-uuid") is None
+        assert (
+            trace_id_from_correlation_id("4BF92F35-77B3-4DA6-A3CE-929D0E0E4736")
+            == "4bf92f3577b34da6a3ce929d0e0e4736"
+        )
+
+
+class TestPropagation:
+    """Test spans follow async tasks, decorated functions and worker threads."""
+
+    def test_traced_decorator_sync_and_async(self, exporter):
+        """Test @traced opens a child span for sync and async functions."""
+
+        @traced(attributes={"component": "test"})
+        def load():
+            return get_current_span().name
+
+        @traced("fetch")
+        async def fetch():
+            await asyncio.sleep(0)
+            return get_current_span().name
+
+        async def scenario():
+            with start_span("request"):
+                return load(), await asyncio.gather(fetch(), fetch())
+
+        sync_name, async_names = asyncio.run(scenario())
+
+        assert sync_name.endswith("load")
+        assert async_names == ["fetch", "fetch"]
+        _finished(exporter)
+        spans = exporter.get_finished_spans()
+        root = next(s for s in spans if s.name == "request")
+        assert len(spans) == 4
+        assert all(s.parent_span_id == root.span_id for s in spans if s is not root)
+
+    def test_span_ending_after_root_is_exported_alone(self, exporter):
+        """Test work outliving its root span is still exported."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            release = threading.Event()
+            with start_span("root"):
+
+                def straggler():
+                    with start_span("late"):
+                        release.wait(timeout=5)
+
+                future = pool.submit(contextvars.copy_context().run, straggler)
+            release.set()
+            future.result()
+
+        spans = _finished(exporter)
+        assert spans["late"].parent_span_id == spans["root"].span_id
+
+    def test_concurrent_roots_sharing_trace_id_export_separately(self, exporter):
+        """Test two in-flight roots with one trace ID keep their own spans."""
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        batches: list[list[str]] = []
+        export = exporter.export
+        exporter.export = lambda spans: (batches.append([s.name for s in spans]), export(spans))
+        both_open = threading.Barrier(2)
+
+        def request(name: str) -> None:
+            with start_span(name, trace_id=trace_id):
+                both_open.wait(timeout=5)
+                with start_span(f"{name}.child"):
+                    pass
+                both_open.wait(timeout=5)
+
+        threads = [threading.Thread(target=request, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        spans = _finished(exporter)
+        assert sorted(sorted(batch) for batch in batches) == [["a", "a.child"], ["b", "b.child"]]
+        assert spans["a.child"].parent_span_id == spans["a"].span_id
+        assert spans["b.child"].parent_span_id == spans["b"].span_id
+        assert get_tracer().get_stats()["open_traces"] == 0
+
+    def test_insight_engine_workers_nest_under_caller(self, exporter):
+        """Test per-KPI spans from the thread pool join the caller's trace."""
+        data = pd.DataFrame(
+            {
+                "year": [2022] * 4 + [2023] * 4,
+                "quarter": [1, 2, 3, 4] * 2,
+                "value": [10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 30.0],
+            }
+        )
+        kpis = [{"id": f"kpi_{i}", "name": f"KPI {i}", "data": data} for i in range(4)]
+
+        with start_span("request") as root:
+            InsightEngine().generate_report(kpis, max_workers=2)
+
+        _finished(exporter)
+        spans = exporter.get_finished_spans()
+        per_kpi = [s for s in spans if s.name == "InsightEngine.generate_insights"]
+        assert sorted(s.attributes["kpi_id"] for s in per_kpi) == [f"kpi_{i}" for i in range(4)]
+        assert {s.trace_id for s in spans} == {root.trace_id}
+        report_span = next(s for s in spans if s.name == "InsightEngine.generate_report")
+        assert all(s.parent_span_id == report_span.span_id for s in per_kpi)
+
+
+class TestExport:
+    """Test OTLP/JSON encoding and the exporters."""
+
+    def test_otlp_encoding(self, exporter):
+        """Test spans encode to the OTLP/JSON ExportTraceServiceRequest shape."""
+        attributes = {"rows": 3, "ratio": 0.5, "ok": True, "name": "x"}
+        with start_span("root", attributes), start_span("child"):
+            pass
+
+        _finished(exporter)
+        payload = spans_to_otlp(exporter.get_finished_spans(), service_name="hub")
+        resource_spans = payload["resourceSpans"][0]
+        assert {"key": "service.name", "value": {"stringValue": "hub"}} in (
+            resource_spans["resource"]["attributes"]
+        )
+        encoded = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+        root = encoded["root"]
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert "parentSpanId" not in root
+        assert encoded["child"]["parentSpanId"] == root["spanId"]
+        assert root["kind"] == 1
+        assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+        values = {a["key"]: a["value"] for a in root["attributes"]}
+        assert values == {
+            "rows": {"intValue": "3"},
+            "ratio": {"doubleValue": 0.5},
+            "ok": {"boolValue": True},
+            "name": {"stringValue": "x"},
+        }
+
+    def test_file_exporter_writes_one_request_per_trace(self, tmp_path):
+        """Test the file exporter appends a JSON line per finished trace."""
+        path = tmp_path / "traces.jsonl"
+        tracer = configure_tracing(FileSpanExporter(path))
+        try:
+            for name in ("first", "second"):
+                with start_span(name), start_span(f"{name}.child"):
+                    pass
+            assert tracer.force_flush()
+        finally:
+            configure_tracing(None)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        names = [
+            [s["name"] for s in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+            for line in lines
+        ]
+        assert names == [["first.child", "first"], ["second.child", "second"]]
+
+
+class TestMiddlewareSpan:
+    """Test the request server span opened by RequestLoggingMiddleware."""
+
+    def test_server_span_wraps_endpoint(self, exporter):
+        """Test endpoint spans nest under a server span keyed by the correlation ID."""
+
+        async def ok(request):
+            with start_span("handler"):
+                return PlainTextResponse("ok")
+
+        app = Starlette(routes=[Route("/items/{id}", ok)])
+        app.add_middleware(RequestLoggingMiddleware)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get(
+                    "/items/42",
+                    headers={"X-Correlation-ID": "4bf92f35-77b3-4da6-a3ce-929d0e0e4736"},
+                )
+
+        response = asyncio.run(scenario())
+
+        assert response.status_code == 200
+        spans = _finished(exporter)
+        server = spans["GET /items/{id}"]
+        assert server.kind == SpanKind.SERVER
+        assert server.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert server.attributes["http.status_code"] == 200
+        assert spans["handler"].parent_span_id == server.span_id